@@ -8,6 +8,8 @@ import type { ImageJobStatus } from './contracts/imageContract.js';
 
 const GENERATED_DIR = join(process.cwd(), 'public', 'generated');
 const DAILY_QUOTA = Number(process.env.IMAGE_DAILY_QUOTA) || 50;
+const WORKER_POLL_MS = 100;
+const WORKER_TIMEOUT_MS = Number(process.env.THUMBNAIL_WORKER_TIMEOUT_MS) || 60_000;
 
 export interface ImageJob {
   id: string;
@@ -116,6 +118,110 @@ export async function findOrCreateJob(
   return { job: existing[0], created: false };
 }
 
+interface WorkerJob {
+  jobId: string;
+  status: ImageJobStatus;
+  imageUrl: string | null;
+  error: string | null;
+}
+
+async function workerRequest<T>(url: string, init?: RequestInit): Promise<T> {
+  const res = await fetch(url, init);
+  if (!res.ok) {
+    throw new Error(`Thumbnail worker returned ${res.status} for ${init?.method ?? 'GET'} ${url}`);
+  }
+  return (await res.json()) as T;
+}
+
+/**
+ * POST the job. A 503 means the worker's render queue is full: wait the
+ * Retry-After interval and resubmit, as long as that stays inside `deadline`.
+ */
+async function submitWorkerJob(url: string, payload: string, deadline: number): Promise<WorkerJob> {
+  for (;;) {
+    const res = await fetch(url, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: payload,
+    });
+    if (res.status === 503) {
+      const retryAfterMs = (Number(res.headers.get('Retry-After')) || 1) * 1000;
+      if (Date.now() + retryAfterMs < deadline) {
+        await res.body?.cancel();
+        await new Promise((resolve) => setTimeout(resolve, retryAfterMs));
+        continue;
+      }
+    }
+    if (!res.ok) {
+      throw new Error(`Thumbnail worker returned ${res.status} for POST ${url}`);
+    }
+    return (await res.json()) as WorkerJob;
+  }
+}
+
+/** Render through frontend/scripts/thumbnail_worker.py and return the PNG bytes. */
+async function renderWithWorker(
+  baseUrl: string,
+  key: string,
+  title: string,
+  category: string,
+  provider: string
+): Promise<Buffer> {
+  const deadline = Date.now() + WORKER_TIMEOUT_MS;
+  let job = await submitWorkerJob(
+    `${baseUrl}/jobs`,
+    JSON.stringify({ title, category, provider, cache_key: key }),
+    deadline
+  );
+
+  while (job.status !== 'completed') {
+    if (job.status === 'failed') {
+      throw new Error(job.error ?? 'Thumbnail worker failed');
+    }
+    if (Date.now() > deadline) {
+      throw new Error('Thumbnail worker timed out');
+    }
+    await new Promise((resolve) => setTimeout(resolve, WORKER_POLL_MS));
+    job = await workerRequest<WorkerJob>(`${baseUrl}/jobs/${job.jobId}`);
+  }
+
+  const res = await fetch(`${baseUrl}${job.imageUrl}`);
+  if (!res.ok) {
+    throw new Error(`Thumbnail worker returned ${res.status} for ${job.imageUrl}`);
+  }
+  return Buffer.from(await res.arrayBuffer());
+}
+
+async function generateWithOpenAI(title: string, category: string, provider: string): Promise<Buffer> {
+  const apiKey = process.env.OPENAI_API_KEY;
+  if (!apiKey) {
+    throw new Error('Image generation unavailable (no OPENAI_API_KEY)');
+  }
+
+  const prompt =
+    `Casino game thumbnail for "${title}" (${category} game by ${provider}). ` +
+    'Dark, luxurious casino aesthetic with gold accents. ' +
+    'Professional iGaming art style, vibrant colors, no text.';
+
+  const { default: OpenAI } = await import('openai');
+  const openai = new OpenAI({ apiKey });
+
+  const response = await openai.images.generate({
+    model: 'dall-e-3',
+    prompt,
+    n: 1,
+    size: '1024x1024',
+    quality: 'standard',
+    response_format: 'b64_json',
+  });
+
+  const b64 = response.data?.[0]?.b64_json;
+  if (!b64) {
+    throw new Error('No image data returned from OpenAI');
+  }
+  return Buffer.from(b64, 'base64');
+}
+
 /** Run the actual image generation in the background. */
 export async function processJob(jobId: string): Promise<void> {
   const pool = getPool();
@@ -133,37 +239,14 @@ export async function processJob(jobId: string): Promise<void> {
   const filename = `${key}.png`;
 
   try {
-    const apiKey = process.env.OPENAI_API_KEY;
-    if (!apiKey) {
-      throw new Error('Image generation unavailable (no OPENAI_API_KEY)');
-    }
-
-    const prompt =
-      `Casino game thumbnail for "${title}" (${category} game by ${provider}). ` +
-      'Dark, luxurious casino aesthetic with gold accents. ' +
-      'Professional iGaming art style, vibrant colors, no text.';
+    const workerUrl = process.env.THUMBNAIL_WORKER_URL;
+    logger.info('image_job_generating', { jobId, title, category, provider, worker: !!workerUrl });
 
-    const { default: OpenAI } = await import('openai');
-    const openai = new OpenAI({ apiKey });
-
-    logger.info('image_job_generating', { jobId, title, category, provider });
-
-    const response = await openai.images.generate({
-      model: 'dall-e-3',
-      prompt,
-      n: 1,
-      size: '1024x1024',
-      quality: 'standard',
-      response_format: 'b64_json',
-    });
-
-    const b64 = response.data?.[0]?.b64_json;
-    if (!b64) {
-      throw new Error('No image data returned from OpenAI');
-    }
+    const buffer = workerUrl
+      ? await renderWithWorker(workerUrl.replace(/\/+$/, ''), key, title, category, provider)
+      : await generateWithOpenAI(title, category, provider);
 
     ensureDir();
-    const buffer = Buffer.from(b64, 'base64');
     await writeFile(join(GENERATED_DIR, filename), buffer);
 
     const imageUrl = `/generated/${filename}`;
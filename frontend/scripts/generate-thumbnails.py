@@ -1,18 +1,32 @@
 #!/usr/bin/env python3
-"""Generate unique casino game thumbnail SVGs and convert to PNG."""
+"""Generate unique casino game thumbnail SVGs and convert to PNG.
 
+SVGs are built in memory and rasterized in a process pool. Every PNG is
+cached on disk under the SHA-256 of its SVG text, so re-running after a
+catalogue change only renders the games whose SVG actually changed.
+
+Usage:
+  python3 frontend/scripts/generate-thumbnails.py
+  python3 frontend/scripts/generate-thumbnails.py --only book-of-dead --only starburst
+"""
+
+import argparse
+import filecmp
+import hashlib
 import os
 import math
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     import cairosvg
-except ImportError:
-    print("Installing cairosvg...")
-    os.system("pip3 install cairosvg")
-    import cairosvg
+except (ImportError, OSError):  # keep generate_svg() importable; main() reports it
+    cairosvg = None
 
 OUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'public', 'games')
-os.makedirs(OUT_DIR, exist_ok=True)
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '.cache', 'thumbnails')
+WIDTH, HEIGHT = 800, 600
 
 # ── Game theme definitions ──────────────────────────────────────────
 
@@ -609,26 +623,92 @@ def generate_svg(game):
 
 # ── Generate all ────────────────────────────────────────────────────
 
-print(f"Generating {len(GAMES)} thumbnails...")
-
-for game in GAMES:
-    slug = game["slug"]
-    svg_path = os.path.join(OUT_DIR, f"{slug}.svg")
-    png_path = os.path.join(OUT_DIR, f"{slug}.png")
+def svg_hash(svg):
+    """Cache key: the SVG text plus the raster size it is rendered at."""
+    h = hashlib.sha256(svg.encode('utf-8'))
+    h.update(f"@{WIDTH}x{HEIGHT}".encode('ascii'))
+    return h.hexdigest()
+
+
+def render_png(svg):
+    """Rasterize one SVG. Top-level so it can run in a worker process."""
+    return cairosvg.svg2png(bytestring=svg.encode('utf-8'),
+                            output_width=WIDTH, output_height=HEIGHT)
+
+
+def write_atomic(path, data):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def install(cached, png_path):
+    """Copy a cached PNG into place unless the output is already identical."""
+    if os.path.exists(png_path) and filecmp.cmp(cached, png_path, shallow=False):
+        return False
+    shutil.copyfile(cached, png_path)
+    return True
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render game thumbnails to PNG.")
+    parser.add_argument('--only', action='append', metavar='SLUG', default=[],
+                        help="render only this game (repeatable)")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument('--force', action='store_true',
+                        help="ignore the cache and re-render every selected game")
+    parser.add_argument('--out-dir', default=OUT_DIR)
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    args = parser.parse_args(argv)
+
+    known = {g["slug"] for g in GAMES}
+    unknown = [slug for slug in args.only if slug not in known]
+    if unknown:
+        parser.error(f"unknown slug(s): {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    games = [g for g in GAMES if not args.only or g["slug"] in args.only]
+    out_dir = os.path.abspath(args.out_dir)
+    cache_dir = os.path.abspath(args.cache_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    print(f"Generating {len(games)} thumbnails...")
+
+    pending = []  # (slug, cache key, svg)
+    for game in games:
+        slug = game["slug"]
+        svg = generate_svg(game)
+        key = svg_hash(svg)
+        cached = os.path.join(cache_dir, f"{key}.png")
+        if not args.force and os.path.exists(cached):
+            changed = install(cached, os.path.join(out_dir, f"{slug}.png"))
+            print(f"  {slug}.png (cached{'' if changed else ', unchanged'})")
+            continue
+        pending.append((slug, key, svg))
+
+    if pending and cairosvg is None:
+        sys.exit("cairosvg is required to render thumbnails: pip install cairosvg")
+
+    svgs = [svg for _slug, _key, svg in pending]
+    if len(pending) > 1 and args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(pending))) as pool:
+            pngs = list(pool.map(render_png, svgs))
+    else:
+        pngs = [render_png(svg) for svg in svgs]
 
-    svg = generate_svg(game)
-    with open(svg_path, 'w') as f:
-        f.write(svg)
+    for (slug, key, _svg), png in zip(pending, pngs):
+        write_atomic(os.path.join(cache_dir, f"{key}.png"), png)
+        write_atomic(os.path.join(out_dir, f"{slug}.png"), png)
+        print(f"  {slug}.png ({len(png) / 1024:.0f} KB)")
 
-    cairosvg.svg2png(bytestring=svg.encode('utf-8'), write_to=png_path,
-                     output_width=800, output_height=600)
-    size_kb = os.path.getsize(png_path) / 1024
-    print(f"  {slug}.png ({size_kb:.0f} KB)")
+    print(f"\nDone! {len(pending)} rendered, {len(games) - len(pending)} cached, PNGs in {out_dir}")
 
-# Clean up SVGs (keep PNGs only)
-for game in GAMES:
-    svg_path = os.path.join(OUT_DIR, f"{game['slug']}.svg")
-    if os.path.exists(svg_path):
-        os.remove(svg_path)
 
-print(f"\nDone! {len(GAMES)} PNGs in {OUT_DIR}")
+if __name__ == "__main__":
+    main()
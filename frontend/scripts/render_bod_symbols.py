@@ -3,16 +3,37 @@ Blender CLI script to render Book of Dead slot symbols as gold metallic icons.
 Run: blender --background --python render_bod_symbols.py
 
 Renders 10 symbols at 512x512 transparent PNG with gold embossed style on dark stone bases.
+
+By default one Blender session builds the shared stage (camera, lights, base,
+materials) once, builds every symbol into its own collection and renders them
+by toggling collection visibility. Each symbol's scene is hashed and the render
+is skipped when the PNG exists and the hash matches the last render.
+
+Run with plain Python to shard the symbols across headless Blender processes:
+  python3 render_bod_symbols.py --jobs 4 [--only Horus --only A] [--force]
+
+Arguments after `--` are passed through when running inside Blender:
+  blender -b --python render_bod_symbols.py -- --shard 1/4 --mode isolated
 """
 
-import bpy
-import bmesh
+import argparse
+import hashlib
 import math
 import os
+import shutil
+import subprocess
 import sys
 
+try:
+    import bpy
+    import bmesh
+except ImportError:  # plain Python: launcher only
+    bpy = None
+
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
                           '..', 'public', 'symbols', 'book-of-dead')
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         '.cache', 'bod-symbols')
 RESOLUTION = 512
 
 # ──────────────────────────────────────────────────────────────────────
@@ -46,6 +67,12 @@ def clear_scene():
 # Materials
 # ──────────────────────────────────────────────────────────────────────
 
+def shared_material(name, factory, *args):
+    """Reuse a material datablock by name so its shader compiles once per session."""
+    mat = bpy.data.materials.get(name)
+    return mat if mat is not None else factory(name, *args)
+
+
 def create_gold_material(name="Gold"):
     mat = bpy.data.materials.new(name)
     mat.use_nodes = True
@@ -215,7 +242,7 @@ def create_base():
     bevel.width = 0.08
     bevel.segments = 4
 
-    stone_mat = create_dark_stone_material()
+    stone_mat = shared_material("DarkStone", create_dark_stone_material)
     base.data.materials.append(stone_mat)
     return base
 
@@ -243,7 +270,7 @@ def create_text_symbol(text, name, scale=0.9, extrude=0.12, material=None):
     obj.rotation_euler = (math.radians(90), 0, 0)
 
     if material is None:
-        material = create_gold_material(f"Gold_{name}")
+        material = shared_material("Gold", create_gold_material)
     obj.data.materials.append(material)
     return obj
 
@@ -273,7 +300,7 @@ def create_book_symbol():
     spine.location = (0, 0.02, 0)
     spine.rotation_euler = (math.radians(90), 0, 0)
 
-    gold = create_gold_material("Gold_Book")
+    gold = shared_material("Gold", create_gold_material)
     for obj in [left, right, spine]:
         obj.data.materials.append(gold)
         bev = obj.modifiers.new('Bevel', 'BEVEL')
@@ -303,7 +330,7 @@ def create_eye_of_horus():
     pupil = bpy.context.active_object
     pupil.name = 'HorusPupil'
     pupil.location = (0, -0.05, 0)
-    accent = create_accent_material("HorusAccent", (0.15, 0.35, 0.85, 1.0))
+    accent = shared_material("HorusAccent", create_accent_material, (0.15, 0.35, 0.85, 1.0))
     pupil.data.materials.append(accent)
     parts.append(pupil)
 
@@ -327,7 +354,7 @@ def create_eye_of_horus():
     spiral.rotation_euler = (math.radians(90), 0, 0)
     parts.append(spiral)
 
-    gold = create_gold_material("Gold_Horus")
+    gold = shared_material("Gold", create_gold_material)
     for p in parts:
         if not p.data.materials:
             p.data.materials.append(gold)
@@ -368,7 +395,7 @@ def create_ankh_symbol():
     hbar.rotation_euler = (0, 0, math.radians(90))
     parts.append(hbar)
 
-    gold = create_gold_material("Gold_Ankh")
+    gold = shared_material("Gold", create_gold_material)
     for p in parts:
         p.data.materials.append(gold)
         bev = p.modifiers.new('Bevel', 'BEVEL')
@@ -420,11 +447,11 @@ def create_scarab_symbol():
     sun.name = 'ScarabSun'
     sun.location = (0, 0, 0.85)
     sun.scale = (1.0, 0.5, 1.0)
-    accent = create_accent_material("OsirisAccent", (0.1, 0.55, 0.3, 1.0))
+    accent = shared_material("OsirisAccent", create_accent_material, (0.1, 0.55, 0.3, 1.0))
     sun.data.materials.append(accent)
     parts.append(sun)
 
-    gold = create_gold_material("Gold_Scarab")
+    gold = shared_material("Gold", create_gold_material)
     for p in parts:
         if not p.data.materials:
             p.data.materials.append(gold)
@@ -469,11 +496,11 @@ def create_hat_fedora():
     band = bpy.context.active_object
     band.name = 'FedoraBand'
     band.location = (0, 0, 0.08)
-    accent = create_accent_material("WildeAccent", (0.65, 0.45, 0.1, 1.0))
+    accent = shared_material("WildeAccent", create_accent_material, (0.65, 0.45, 0.1, 1.0))
     band.data.materials.append(accent)
     parts.append(band)
 
-    gold = create_gold_material("Gold_Fedora")
+    gold = shared_material("Gold", create_gold_material)
     for p in parts:
         if not p.data.materials:
             p.data.materials.append(gold)
@@ -506,6 +533,132 @@ def render_symbol(symbol_name, create_fn, filename):
     print(f"  -> Saved {outpath}")
 
 
+# ──────────────────────────────────────────────────────────────────────
+# Single-session rendering
+# ──────────────────────────────────────────────────────────────────────
+
+def build_stage():
+    """Camera, lights, base and render settings shared by every symbol."""
+    clear_scene()
+    setup_scene()
+    setup_camera()
+    setup_lighting()
+    create_base()
+
+
+def build_symbol_collection(symbol_name, create_fn):
+    """Build a symbol into its own collection, hidden from render."""
+    view_layer = bpy.context.view_layer
+    collection = bpy.data.collections.new(f"Symbol_{symbol_name}")
+    bpy.context.scene.collection.children.link(collection)
+    view_layer.active_layer_collection = view_layer.layer_collection.children[collection.name]
+    try:
+        create_fn()
+    finally:
+        view_layer.active_layer_collection = view_layer.layer_collection
+    collection.hide_render = True
+    return collection
+
+
+def _hash_values(h, *values):
+    h.update(repr(values).encode('utf-8'))
+
+
+def _socket_value(socket):
+    value = getattr(socket, 'default_value', None)
+    try:
+        return tuple(round(v, 6) for v in value)
+    except TypeError:
+        return round(value, 6) if isinstance(value, float) else value
+
+
+def _hash_node_tree(h, tree):
+    for node in sorted(tree.nodes, key=lambda n: n.name):
+        _hash_values(h, node.name, node.bl_idname,
+                     [(i.identifier, _socket_value(i)) for i in node.inputs])
+    _hash_values(h, sorted((l.from_node.name, l.from_socket.identifier,
+                            l.to_node.name, l.to_socket.identifier) for l in tree.links))
+
+
+def _hash_object(h, obj):
+    _hash_values(h, obj.name, obj.type,
+                 [round(v, 6) for row in obj.matrix_world for v in row],
+                 [(m.type, getattr(m, 'width', None), getattr(m, 'segments', None))
+                  for m in obj.modifiers])
+    data = obj.data
+    if obj.type == 'MESH':
+        coords = [0.0] * (len(data.vertices) * 3)
+        data.vertices.foreach_get('co', coords)
+        _hash_values(h, len(data.polygons), [round(c, 6) for c in coords])
+    elif obj.type == 'FONT':
+        _hash_values(h, data.body, data.extrude, data.bevel_depth,
+                     data.bevel_resolution, data.align_x, data.align_y)
+    elif obj.type == 'LIGHT':
+        _hash_values(h, data.type, data.energy, tuple(data.color), data.size)
+    elif obj.type == 'CAMERA':
+        _hash_values(h, data.type, data.ortho_scale)
+    for slot in obj.material_slots:
+        if slot.material is not None:
+            _hash_values(h, slot.material.name)
+            _hash_node_tree(h, slot.material.node_tree)
+
+
+def scene_hash(collection):
+    """Hash everything that ends up in this symbol's render."""
+    scene = bpy.context.scene
+    h = hashlib.sha256()
+    _hash_values(h, bpy.app.version_string, scene.render.engine, scene.cycles.samples,
+                 scene.render.resolution_x, scene.render.resolution_y,
+                 scene.render.film_transparent)
+    if scene.world is not None:
+        _hash_node_tree(h, scene.world.node_tree)
+    stage = [o for o in scene.collection.objects]
+    for obj in sorted(stage + list(collection.all_objects), key=lambda o: o.name):
+        _hash_object(h, obj)
+    return h.hexdigest()
+
+
+def _hash_path(filename):
+    return os.path.join(CACHE_DIR, f"{filename}.sha256")
+
+
+def is_current(filename, digest):
+    if not os.path.exists(os.path.join(OUTPUT_DIR, filename)):
+        return False
+    try:
+        with open(_hash_path(filename)) as f:
+            return f.read().strip() == digest
+    except FileNotFoundError:
+        return False
+
+
+def render_session(symbols, force=False):
+    """Build the stage once and render each symbol by toggling its collection."""
+    build_stage()
+    built = [(name, build_symbol_collection(name, create_fn), filename)
+             for name, create_fn, filename in symbols]
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    rendered = 0
+    for name, collection, filename in built:
+        for _other, other, _f in built:
+            other.hide_render = other is not collection
+        digest = scene_hash(collection)
+        if not force and is_current(filename, digest):
+            print(f"Skipping {name} (unchanged)")
+            continue
+
+        print(f"Rendering {name}...")
+        outpath = os.path.join(OUTPUT_DIR, filename)
+        bpy.context.scene.render.filepath = outpath
+        bpy.ops.render.render(write_still=True)
+        with open(_hash_path(filename), 'w') as f:
+            f.write(digest + '\n')
+        rendered += 1
+        print(f"  -> Saved {outpath}")
+    return rendered
+
+
 # ──────────────────────────────────────────────────────────────────────
 # Symbol definitions
 # ──────────────────────────────────────────────────────────────────────
@@ -524,17 +677,95 @@ SYMBOLS = [
 ]
 
 
+# ──────────────────────────────────────────────────────────────────────
+# Sharded launcher
+# ──────────────────────────────────────────────────────────────────────
+
+def select_symbols(only=None, shard=None):
+    """Filter SYMBOLS by name, then take every N-th entry for shard i/N."""
+    symbols = [s for s in SYMBOLS if not only or s[0] in only]
+    if shard is not None:
+        index, count = shard
+        symbols = symbols[index::count]
+    return symbols
+
+
+def launch(args):
+    """Run `args.jobs` headless Blender processes, one shard each."""
+    blender = args.blender
+    if shutil.which(blender) is None and not os.path.isfile(blender):
+        sys.exit(f"Blender not found: {blender} (set --blender or $BLENDER)")
+
+    jobs = max(1, min(args.jobs, len(select_symbols(args.only))))
+    threads = max(1, (os.cpu_count() or 1) // jobs)
+    passthrough = ['--mode', args.mode]
+    for name in args.only or []:
+        passthrough += ['--only', name]
+    if args.force:
+        passthrough.append('--force')
+
+    print(f"Launching {jobs} Blender shard(s), {threads} render thread(s) each")
+    procs = [
+        subprocess.Popen([blender, '-b', '-t', str(threads), '--python-exit-code', '1',
+                          '--python', os.path.abspath(__file__), '--',
+                          '--shard', f"{i}/{jobs}", *passthrough])
+        for i in range(jobs)
+    ]
+    failed = [i for i, proc in enumerate(procs) if proc.wait() != 0]
+    if failed:
+        sys.exit(f"Shard(s) {', '.join(map(str, failed))} failed")
+    print("Done! All shards finished.")
+
+
+def parse_shard(value):
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected I/N, got {value!r}")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"shard index out of range: {value!r}")
+    return index, count
+
+
+def parse_args(argv):
+    names = [name for name, _fn, _file in SYMBOLS]
+    parser = argparse.ArgumentParser(description="Render Book of Dead symbols with Blender.")
+    parser.add_argument('--only', action='append', choices=names, metavar='NAME',
+                        help=f"render only this symbol (repeatable): {', '.join(names)}")
+    parser.add_argument('--force', action='store_true', help="ignore the scene-hash cache")
+    parser.add_argument('--mode', choices=('session', 'isolated'), default='session',
+                        help="session: build the stage once; isolated: rebuild per symbol")
+    parser.add_argument('--shard', type=parse_shard, default=None, metavar='I/N',
+                        help="render every N-th symbol starting at I (set by the launcher)")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="launcher: Blender processes to run (default: CPU count)")
+    parser.add_argument('--blender', default=os.environ.get('BLENDER', 'blender'),
+                        help="launcher: Blender executable")
+    return parser.parse_args(argv)
+
+
 # ──────────────────────────────────────────────────────────────────────
 # Main
 # ──────────────────────────────────────────────────────────────────────
 
 def main():
+    if bpy is None:
+        launch(parse_args(sys.argv[1:]))
+        return
+
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    args = parse_args(argv)
+    symbols = select_symbols(args.only, args.shard)
+
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     print(f"Output directory: {OUTPUT_DIR}")
-    print(f"Rendering {len(SYMBOLS)} symbols at {RESOLUTION}x{RESOLUTION}...")
+    print(f"Rendering {len(symbols)} symbols at {RESOLUTION}x{RESOLUTION}...")
 
-    for name, create_fn, filename in SYMBOLS:
-        render_symbol(name, create_fn, filename)
+    if args.mode == 'isolated':
+        for name, create_fn, filename in symbols:
+            render_symbol(name, create_fn, filename)
+    else:
+        render_session(symbols, force=args.force)
 
     print("Done! All symbols rendered.")
 
@@ -0,0 +1,577 @@
+#!/usr/bin/env python3
+"""Long-running thumbnail render worker for /api/v1/images/generate.
+
+Renders the `generate-thumbnails.py` look for ad-hoc (title, category,
+provider) requests and publishes `<cache_key>.png` into the backend's
+`public/generated/` directory, where both the backend's cache fast path and
+`GET /images/jobs/{jobId}` serve it. The backend hands jobs over when
+`THUMBNAIL_WORKER_URL` points at this service.
+
+Rendering goes through a bounded process pool. Finished PNGs are kept in an
+in-memory LRU and in the content-addressed disk cache shared with
+`generate-thumbnails.py` (keyed by the SHA-256 of the SVG text).
+
+HTTP API (JSON):
+  POST /jobs           {title, category, provider[, cache_key]}
+                       200 completed (cache hit) | 202 pending | 400 | 503 queue full
+  GET  /jobs/<jobId>   {jobId, status, imageUrl, error, tier, latency_ms}
+  GET  /generated/<cache_key>.png   the published PNG (for hosts without a shared volume)
+  GET  /metrics        per-tier counters and latency percentiles
+  GET  /health
+
+Usage:
+  python3 frontend/scripts/thumbnail_worker.py serve --port 8090 --workers 4
+  python3 frontend/scripts/thumbnail_worker.py loadtest --concurrency 32 --requests 500 --p99-budget-ms 2000
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import math
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PUBLISH_DIR = os.path.join(SCRIPTS_DIR, '..', '..', 'backend', 'public', 'generated')
+
+
+def _load_thumbnails():
+    spec = importlib.util.spec_from_file_location(
+        'generate_thumbnails', os.path.join(SCRIPTS_DIR, 'generate-thumbnails.py'))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+thumbs = _load_thumbnails()
+
+KEY_RE = re.compile(r'^[0-9a-f]{16}$')
+# Same limits as ImageGenerateRequestSchema in backend/src/contracts/imageContract.ts
+FIELD_LIMITS = {'title': 100, 'category': 50, 'provider': 100}
+CATEGORY_ELEMENTS = {'roulette': 'roulette', 'blackjack': 'cards', 'baccarat': 'baccarat'}
+
+
+class QueueFull(Exception):
+    pass
+
+
+# ── Theme mapping ───────────────────────────────────────────────────
+
+def cache_key(title, category, provider):
+    """Mirror of `cacheKey()` in backend/src/imageService.ts."""
+    return hashlib.sha256(f"{title}|{category}|{provider}".encode('utf-8')).hexdigest()[:16]
+
+
+def split_title(title):
+    """Upper-case and break into at most two balanced lines."""
+    words = title.upper().split()
+    if len(words) < 2:
+        return title.upper()
+    best = min(range(1, len(words)),
+               key=lambda i: abs(len(' '.join(words[:i])) - len(' '.join(words[i:]))))
+    return ' '.join(words[:best]) + '\n' + ' '.join(words[best:])
+
+
+def game_for(title, category, provider, key):
+    """Map a request onto a GAMES-style theme: the category picks the
+    decorations, the cache key picks a palette deterministically."""
+    elements = CATEGORY_ELEMENTS.get(category.lower())
+    candidates = [g for g in thumbs.GAMES if g['elements'] == elements] or thumbs.GAMES
+    base = candidates[int(key, 16) % len(candidates)]
+    return {
+        **base,
+        'slug': f"job-{key}",
+        'title': escape(split_title(title)),
+        'tagline': escape(provider.upper()),
+    }
+
+
+def render(svg):
+    """Pool entry point: (png bytes, render ms)."""
+    start = time.perf_counter()
+    png = thumbs.render_png(svg)
+    return png, (time.perf_counter() - start) * 1000.0
+
+
+# ── Caches and metrics ──────────────────────────────────────────────
+
+class LruCache:
+    """Byte-bounded LRU of PNG payloads keyed by SVG hash."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            data = self._items.get(key)
+            if data is not None:
+                self._items.move_to_end(key)
+            return data
+
+    def put(self, key, data):
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._items[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes and len(self._items) > 1:
+                _key, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+
+    def __len__(self):
+        return len(self._items)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(values):
+    ordered = sorted(values)
+    return {
+        'count': len(ordered),
+        'p50': percentile(ordered, 50),
+        'p95': percentile(ordered, 95),
+        'p99': percentile(ordered, 99),
+        'max': ordered[-1] if ordered else None,
+    }
+
+
+class Metrics:
+    """Per-job latency samples (bounded window) grouped by cache tier."""
+
+    def __init__(self, window=10_000):
+        self._lock = threading.Lock()
+        self.total = deque(maxlen=window)
+        self.render = deque(maxlen=window)
+        self.queue_wait = deque(maxlen=window)
+        self.tiers = {'memory': 0, 'disk': 0, 'render': 0, 'failed': 0}
+        self.rejected = 0
+
+    def record(self, job):
+        with self._lock:
+            self.tiers['failed' if job.status == 'failed' else job.tier] += 1
+            self.total.append(job.latency_ms)
+            if job.render_ms is not None:
+                self.render.append(job.render_ms)
+                self.queue_wait.append(max(0.0, job.latency_ms - job.render_ms))
+
+    def reject(self):
+        with self._lock:
+            self.rejected += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'jobs': dict(self.tiers),
+                'rejected': self.rejected,
+                'latency_ms': summarize(self.total),
+                'render_ms': summarize(self.render),
+                'queue_wait_ms': summarize(self.queue_wait),
+            }
+
+
+# ── Worker ──────────────────────────────────────────────────────────
+
+class Job:
+    __slots__ = ('id', 'key', 'status', 'image_url', 'error', 'tier',
+                 'created', 'finished', 'render_ms')
+
+    def __init__(self, key):
+        self.id = str(uuid.uuid4())
+        self.key = key
+        self.status = 'pending'
+        self.image_url = None
+        self.error = None
+        self.tier = None
+        self.created = time.perf_counter()
+        self.finished = None
+        self.render_ms = None
+
+    @property
+    def latency_ms(self):
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return (end - self.created) * 1000.0
+
+    def to_dict(self):
+        # Same field names as ImageJobResponse, plus worker diagnostics.
+        return {
+            'jobId': self.id,
+            'status': self.status,
+            'imageUrl': self.image_url,
+            'error': self.error,
+            'tier': self.tier,
+            'latency_ms': round(self.latency_ms, 3),
+        }
+
+
+class RenderWorker:
+    def __init__(self, publish_dir=PUBLISH_DIR, cache_dir=thumbs.CACHE_DIR, workers=None,
+                 max_pending=None, memory_bytes=64 * 1024 * 1024, history=10_000):
+        self.publish_dir = os.path.abspath(publish_dir)
+        self.cache_dir = os.path.abspath(cache_dir)
+        os.makedirs(self.publish_dir, exist_ok=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.slots = threading.BoundedSemaphore(max_pending or workers * 8)
+        self.memory = LruCache(memory_bytes)
+        self.metrics = Metrics()
+        self.history = history
+        self._jobs = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def close(self):
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def submit(self, title, category, provider, key=None):
+        key = key or cache_key(title, category, provider)
+        with self._lock:
+            running = self._inflight.get(key)
+            if running is not None:
+                return running
+
+        svg = thumbs.generate_svg(game_for(title, category, provider, key))
+        digest = thumbs.svg_hash(svg)
+        job = Job(key)
+
+        png, tier = self.memory.get(digest), 'memory'
+        if png is None:
+            png, tier = self._read_disk(digest), 'disk'
+        if png is not None:
+            self._remember(job)
+            self._complete(job, digest, png, tier)
+            return job
+
+        if not self.slots.acquire(blocking=False):
+            self.metrics.reject()
+            raise QueueFull(key)
+        with self._lock:
+            running = self._inflight.get(key)
+            if running is not None:
+                self.slots.release()
+                return running
+            self._inflight[key] = job
+        self._remember(job)
+        job.status = 'processing'
+        future = self.pool.submit(render, svg)
+        future.add_done_callback(partial(self._rendered, job, digest))
+        return job
+
+    def _remember(self, job):
+        with self._lock:
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.history:
+                oldest_id, oldest = next(iter(self._jobs.items()))
+                if oldest.status not in ('completed', 'failed'):
+                    break
+                del self._jobs[oldest_id]
+
+    def _read_disk(self, digest):
+        try:
+            with open(os.path.join(self.cache_dir, f"{digest}.png"), 'rb') as f:
+                png = f.read()
+        except FileNotFoundError:
+            return None
+        self.memory.put(digest, png)
+        return png
+
+    def _rendered(self, job, digest, future):
+        try:
+            png, job.render_ms = future.result()
+            thumbs.write_atomic(os.path.join(self.cache_dir, f"{digest}.png"), png)
+            self.memory.put(digest, png)
+            self._complete(job, digest, png, 'render')
+        except Exception as exc:  # surfaced through the job, like the backend's processJob
+            job.status = 'failed'
+            job.error = str(exc)[:500]
+            job.tier = 'render'
+            job.finished = time.perf_counter()
+            self.metrics.record(job)
+        finally:
+            with self._lock:
+                self._inflight.pop(job.key, None)
+            self.slots.release()
+
+    def _complete(self, job, digest, png, tier):
+        path = os.path.join(self.publish_dir, f"{job.key}.png")
+        if not os.path.exists(path):
+            thumbs.write_atomic(path, png)
+        job.image_url = f"/generated/{job.key}.png"
+        job.tier = tier
+        job.finished = time.perf_counter()
+        job.status = 'completed'
+        self.metrics.record(job)
+
+
+# ── HTTP ────────────────────────────────────────────────────────────
+
+def validate(body):
+    if not isinstance(body, dict):
+        return 'body must be a JSON object'
+    for field, limit in FIELD_LIMITS.items():
+        value = body.get(field)
+        if not isinstance(value, str) or not 1 <= len(value) <= limit:
+            return f"{field} must be a string of 1..{limit} characters"
+    key = body.get('cache_key')
+    if key is not None and (not isinstance(key, str) or not KEY_RE.match(key)):
+        return 'cache_key must be 16 lowercase hex characters'
+    return None
+
+
+class Handler(BaseHTTPRequestHandler):
+    worker = None  # set by make_server()
+    verbose = False
+
+    def log_message(self, fmt, *args):
+        if self.verbose:
+            super().log_message(fmt, *args)
+
+    def _send(self, status, payload, headers=None):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_png(self, filename):
+        key, ext = os.path.splitext(filename)
+        try:
+            if ext != '.png' or not KEY_RE.match(key):
+                raise FileNotFoundError(filename)
+            with open(os.path.join(self.worker.publish_dir, filename), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            self._send(404, {'error': 'Not found', 'code': 'not_found'})
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send(200, {'status': 'ok'})
+        elif self.path == '/metrics':
+            snapshot = self.worker.metrics.snapshot()
+            snapshot['memory_cache'] = {'entries': len(self.worker.memory), 'bytes': self.worker.memory.size}
+            self._send(200, snapshot)
+        elif self.path.startswith('/generated/'):
+            self._send_png(self.path[len('/generated/'):])
+        elif self.path.startswith('/jobs/'):
+            job = self.worker.get(self.path[len('/jobs/'):])
+            if job is None:
+                self._send(404, {'error': 'Job not found', 'code': 'not_found'})
+            else:
+                self._send(200, job.to_dict())
+        else:
+            self._send(404, {'error': 'Not found', 'code': 'not_found'})
+
+    def do_POST(self):
+        if self.path != '/jobs':
+            self._send(404, {'error': 'Not found', 'code': 'not_found'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            body = json.loads(self.rfile.read(length) or b'null')
+        except ValueError:
+            body = None
+        problem = validate(body)
+        if problem:
+            self._send(400, {'error': problem, 'code': 'invalid_body'})
+            return
+        try:
+            job = self.worker.submit(body['title'], body['category'], body['provider'],
+                                     body.get('cache_key'))
+        except QueueFull:
+            self._send(503, {'error': 'Render queue full', 'code': 'queue_full'},
+                       {'Retry-After': '1'})
+            return
+        self._send(200 if job.status == 'completed' else 202, job.to_dict())
+
+
+class WorkerServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The stdlib backlog of 5 drops SYNs under concurrent clients, which
+    # shows up as 1 s retransmit spikes in p99.
+    request_queue_size = 128
+
+
+def make_server(worker, host='127.0.0.1', port=8090, verbose=False):
+    handler = type('WorkerHandler', (Handler,), {'worker': worker, 'verbose': verbose})
+    return WorkerServer((host, port), handler)
+
+
+# ── Load test ───────────────────────────────────────────────────────
+
+def _call(method, url, payload=None):
+    data = json.dumps(payload).encode('utf-8') if payload is not None else None
+    req = urllib.request.Request(url, data=data, method=method,
+                                 headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read() or b'null')
+
+
+def _one_request(base_url, distinct, poll_s, timeout_s, i):
+    """End-to-end latency of one thumbnail: submit, then poll until done.
+
+    A full queue (503) is resubmitted and an unfinished job polled until
+    `timeout_s` has passed; a request still unfinished then is a failure.
+    """
+    payload = {'title': f"Load Test {i % distinct}", 'category': 'slots', 'provider': 'SlotsOne'}
+    start = time.perf_counter()
+    deadline = start + timeout_s
+    status, body = _call('POST', f"{base_url}/jobs", payload)
+    while status == 503 and time.perf_counter() < deadline:
+        time.sleep(poll_s)
+        status, body = _call('POST', f"{base_url}/jobs", payload)
+    while (status in (200, 202) and body['status'] not in ('completed', 'failed')
+           and time.perf_counter() < deadline):
+        time.sleep(poll_s)
+        status, body = _call('GET', f"{base_url}/jobs/{body['jobId']}")
+    ok = status in (200, 202) and body['status'] == 'completed'
+    return (time.perf_counter() - start) * 1000.0, ok
+
+
+def loadtest(args):
+    server = worker = None
+    base_url = args.url
+    if base_url is None:
+        # Self-hosted run against throwaway caches, so renders are cold.
+        tmp = tempfile.mkdtemp(prefix='thumbnail-worker-')
+        worker = RenderWorker(os.path.join(tmp, 'generated'), os.path.join(tmp, 'cache'),
+                              workers=args.workers, max_pending=args.max_pending)
+        server = make_server(worker, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as ex:
+            results = list(ex.map(partial(_one_request, base_url.rstrip('/'), args.distinct,
+                                          args.poll_ms / 1000.0, args.timeout_s),
+                                  range(args.requests)))
+        wall_s = time.perf_counter() - start
+        _status, server_metrics = _call('GET', f"{base_url.rstrip('/')}/metrics")
+    finally:
+        if server is not None:
+            server.shutdown()
+            worker.close()
+
+    latencies = [ms for ms, _ok in results]
+    failures = sum(1 for _ms, ok in results if not ok)
+    report = {
+        'requests': args.requests,
+        'concurrency': args.concurrency,
+        'distinct': args.distinct,
+        'failures': failures,
+        'throughput_rps': round(args.requests / wall_s, 2),
+        'client_latency_ms': summarize(latencies),
+        'p99_budget_ms': args.p99_budget_ms,
+        'worker': server_metrics,
+    }
+    print(json.dumps(report, indent=2))
+    p99 = report['client_latency_ms']['p99']
+    if failures or (p99 is not None and p99 > args.p99_budget_ms):
+        print(f"FAIL: p99 {p99:.1f} ms (budget {args.p99_budget_ms} ms), {failures} failures",
+              file=sys.stderr)
+        return 1
+    print(f"OK: p99 {p99:.1f} ms within {args.p99_budget_ms} ms budget")
+    return 0
+
+
+# ── CLI ─────────────────────────────────────────────────────────────
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Thumbnail render worker.")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    serve = sub.add_parser('serve', help="run the HTTP worker")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8090)
+    serve.add_argument('--publish-dir', default=PUBLISH_DIR,
+                       help="where <cache_key>.png is published (default: backend/public/generated)")
+    serve.add_argument('--cache-dir', default=thumbs.CACHE_DIR)
+    serve.add_argument('--verbose', action='store_true')
+
+    load = sub.add_parser('loadtest', help="measure end-to-end latency under concurrency")
+    load.add_argument('--url', default=None, help="target worker (default: start one in-process)")
+    load.add_argument('--concurrency', type=int, default=16)
+    load.add_argument('--requests', type=int, default=200)
+    load.add_argument('--distinct', type=int, default=50,
+                      help="distinct titles; the rest exercise the caches")
+    load.add_argument('--poll-ms', type=float, default=10.0)
+    load.add_argument('--timeout-s', type=float, default=60.0,
+                      help="give up on a thumbnail (queue full or unfinished) after this; "
+                           "counts as a failure (default: 60)")
+    load.add_argument('--p99-budget-ms', type=float, default=2000.0)
+
+    for p in (serve, load):
+        p.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                       help="render processes (default: CPU count)")
+        p.add_argument('--max-pending', type=int, default=None,
+                       help="renders queued before POST returns 503 (default: 8 per worker)")
+    args = parser.parse_args(argv)
+    if args.command == 'loadtest' and args.requests < 1:
+        parser.error("--requests must be at least 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if thumbs.cairosvg is None:
+        sys.exit("cairosvg is required to render thumbnails: pip install cairosvg")
+    if args.command == 'loadtest':
+        sys.exit(loadtest(args))
+
+    worker = RenderWorker(args.publish_dir, args.cache_dir, workers=args.workers,
+                          max_pending=args.max_pending)
+    server = make_server(worker, args.host, args.port, args.verbose)
+    print(f"Thumbnail worker on http://{args.host}:{server.server_address[1]} "
+          f"({args.workers} render processes, publishing to {worker.publish_dir})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        worker.close()
+
+
+if __name__ == "__main__":
+    main()
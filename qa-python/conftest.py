@@ -9,6 +9,8 @@ ROOT = Path(__file__).resolve().parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+pytest_plugins = ("framework.profiling_plugin", "framework.traffic_plugin")
+
 from framework.api_client import ApiClient
 from framework.config import SETTINGS
 from framework.data_factory import Credentials, new_credentials
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import json
+import re
 import time
 import uuid
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
+from urllib.parse import urlencode
 
 import requests
 
+from framework import http_timing, profiling, traffic
 from framework.config import SETTINGS
+from framework.http_timing import PhaseTiming
 
 
 @dataclass
@@ -16,6 +22,7 @@ class ApiResponse:
     body: Any
     headers: requests.structures.CaseInsensitiveDict
     elapsed_ms: float
+    phases: PhaseTiming | None = None
 
     def json(self) -> Any:
         return self.body
@@ -28,13 +35,161 @@ class ApiResponse:
         return self
 
 
+_UNSET: Any = object()
+_SCALAR = re.compile(rb'\s*(-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|"[^"\\]*"|true|false|null)\s*[,}\]]')
+_OBJECT_START = re.compile(rb"\s*\{")
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"')
+_BRACKET = re.compile(rb"[{}\[\]]")
+
+
+@lru_cache(maxsize=64)
+def _key_pattern(key: str) -> re.Pattern[bytes]:
+    return re.compile(b'"' + re.escape(key.encode()) + rb'"\s*:')
+
+
+class RawApiResponse:
+    """High-volume response record: raw bytes, JSON decoded on first `.body`.
+
+    Returned by `ApiClient(high_volume=True)`. Only the status, content type,
+    timings and body bytes are kept (no header dict, no object tree until
+    asked for), so a load loop holding millions of these stays small.
+    """
+
+    __slots__ = ("status", "content", "content_type", "elapsed_ms", "phases", "_body")
+
+    def __init__(
+        self,
+        status: int,
+        content: bytes,
+        content_type: str,
+        elapsed_ms: float,
+        phases: PhaseTiming | None = None,
+    ) -> None:
+        self.status = status
+        self.content = content
+        self.content_type = content_type
+        self.elapsed_ms = elapsed_ms
+        self.phases = phases
+        self._body = _UNSET
+
+    @property
+    def body(self) -> Any:
+        if self._body is _UNSET:
+            if self.content_type.startswith("application/json"):
+                self._body = json.loads(self.content) if self.content else None
+            else:
+                self._body = self.content.decode("utf-8", "replace")
+        return self._body
+
+    def json(self) -> Any:
+        return self.body
+
+    def field(self, path: str) -> Any:
+        """Scalar at dotted `path` (`"balance.amount"`, `"win.amount"`) without
+        decoding the whole body.
+
+        The first segment matches the first key of that name in document order,
+        at any depth (`win` finds `outcome.win` if it comes first); each later
+        segment must be a key of the object the previous one matched. Non-scalar
+        leaves, escaped strings and misses fall back to a full decode, which
+        resolves the path the same way and raises KeyError as usual.
+        """
+        segments = path.split(".")
+        if self._body is _UNSET:
+            pos = _scan_path(self.content, segments)
+            if pos is not None:
+                leaf = _SCALAR.match(self.content, pos)
+                if leaf is not None:
+                    return json.loads(leaf.group(1))
+        value = _find_key(self.body, segments[0])
+        for segment in segments[1:]:
+            value = value[segment]
+        return value
+
+    def expect_ok(self, *, allowed: tuple[int, ...] = (200, 201)) -> "RawApiResponse":
+        if self.status not in allowed:
+            raise AssertionError(
+                f"Unexpected status {self.status} (allowed={allowed}); body={self.body!r}"
+            )
+        return self
+
+
+def _scan_path(raw: bytes, segments: list[str]) -> int | None:
+    """Offset just past the last key of `segments` in `raw`, or None if not found."""
+    match = _key_pattern(segments[0]).search(raw)
+    if match is None:
+        return None
+    for segment in segments[1:]:
+        opened = _OBJECT_START.match(raw, match.end())
+        if opened is None:
+            return None
+        pattern, pos, depth = _key_pattern(segment), opened.end(), 0
+        while True:
+            match = pattern.search(raw, pos)
+            if match is None:
+                return None
+            depth = _nesting(raw[pos : match.start()], depth)
+            if depth is None:
+                return None  # the enclosing object ended first
+            if depth == 0:
+                break
+            pos = match.end()
+    return match.end()
+
+
+def _nesting(between: bytes, depth: int) -> int | None:
+    """`depth` after the brackets in `between`; None once it drops below zero."""
+    for bracket in _BRACKET.findall(_STRING.sub(b"", between)):
+        depth += 1 if bracket in b"{[" else -1
+        if depth < 0:
+            return None
+    return depth
+
+
+def _find_key(obj: Any, key: str) -> Any:
+    """First value under `key` in document order — the decoded twin of `_scan_path`."""
+    stack: list[tuple[Any, Any]] = [(None, obj)]
+    while stack:
+        name, node = stack.pop()
+        if name == key:
+            return node
+        if isinstance(node, dict):
+            stack.extend(reversed(node.items()))
+        elif isinstance(node, list):
+            stack.extend((None, item) for item in reversed(node))
+    raise KeyError(key)
+
+
 class ApiClient:
-    """Thin Requests wrapper that normalizes auth, JSON, timing, and errors."""
+    """Thin Requests wrapper that normalizes auth, JSON, timing, and errors.
+
+    `phase_timing` (default: `API_PHASE_TIMING=1` or `--api-profile`) fills
+    `ApiResponse.phases` with connect / TTFB / download times and wire bytes.
+    `high_volume=True` returns slotted `RawApiResponse` records instead, for
+    load loops that keep millions of responses around.
+    """
 
-    def __init__(self, base_url: str | None = None, token: str | None = None) -> None:
+    def __init__(
+        self,
+        base_url: str | None = None,
+        token: str | None = None,
+        *,
+        phase_timing: bool | None = None,
+        high_volume: bool = False,
+    ) -> None:
         self.base_url = (base_url or SETTINGS.api_base_url).rstrip("/")
         self._session = requests.Session()
         self._token = token
+        if phase_timing is None:
+            phase_timing = SETTINGS.phase_timing or profiling.active() is not None
+        self.phase_timing = phase_timing
+        self.high_volume = high_volume
+        if phase_timing:
+            http_timing.install(self._session)
+
+    @property
+    def token(self) -> str | None:
+        return self._token
 
     def with_token(self, token: str) -> "ApiClient":
         self._token = token
@@ -53,8 +208,7 @@ class ApiClient:
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         token: str | None = None,
-    ) -> ApiResponse:
-        url = f"{self.base_url}{path}"
+    ) -> ApiResponse | RawApiResponse:
         merged = {"Accept": "application/json"}
         if json_body is not None:
             merged["Content-Type"] = "application/json"
@@ -63,31 +217,84 @@ class ApiClient:
             merged["Authorization"] = f"Bearer {effective_token}"
         if headers:
             merged.update(headers)
+        return self.send(method, path, headers=merged, json_body=json_body, params=params)
 
+    def send(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: dict[str, str],
+        data: bytes | None = None,
+        json_body: Any | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> ApiResponse | RawApiResponse:
+        """Send with `headers` exactly as given — no Accept/auth merging.
+
+        The entry point for callers that pre-build their headers and bodies
+        (`framework.rgs_client`); `request()` is the convenient front end.
+        """
+        url = f"{self.base_url}{path}"
+        phases: PhaseTiming | None = None
         start = time.perf_counter()
-        resp = self._session.request(
-            method=method.upper(),
-            url=url,
-            json=json_body,
-            params=params,
-            headers=merged,
-            timeout=SETTINGS.request_timeout_s,
-        )
-        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        if self.phase_timing:
+            resp, phases = http_timing.timed_request(
+                self._session,
+                method.upper(),
+                url,
+                data=data,
+                json=json_body,
+                params=params,
+                headers=headers,
+                timeout=SETTINGS.request_timeout_s,
+            )
+        else:
+            resp = self._session.request(
+                method=method.upper(),
+                url=url,
+                data=data,
+                json=json_body,
+                params=params,
+                headers=headers,
+                timeout=SETTINGS.request_timeout_s,
+            )
+        received = time.perf_counter()
+        elapsed_ms = (received - start) * 1000.0
 
         ctype = resp.headers.get("content-type", "")
+        recorder = traffic.recorder()
+        if recorder is not None:
+            target = f"{path}?{urlencode(params, doseq=True)}" if params else path
+            recorder.record(
+                method,
+                target,
+                data if data is not None else json_body,
+                "Authorization" in headers,
+                resp.status_code,
+                ctype,
+                resp.content,
+            )
+        if self.high_volume:
+            if profiling.active() is not None:
+                profiling.record_call(method, path, resp.status_code, elapsed_ms, 0.0, phases)
+            return RawApiResponse(resp.status_code, resp.content, ctype, elapsed_ms, phases)
+
         body: Any = resp.json() if ctype.startswith("application/json") else resp.text
+        if profiling.active() is not None:
+            decode_ms = (time.perf_counter() - received) * 1000.0
+            profiling.record_call(method, path, resp.status_code, elapsed_ms, decode_ms, phases)
         return ApiResponse(
             status=resp.status_code,
             body=body,
             headers=resp.headers,
             elapsed_ms=elapsed_ms,
+            phases=phases,
         )
 
-    def get(self, path: str, **kw: Any) -> ApiResponse:
+    def get(self, path: str, **kw: Any) -> ApiResponse | RawApiResponse:
         return self.request("GET", path, **kw)
 
-    def post(self, path: str, **kw: Any) -> ApiResponse:
+    def post(self, path: str, **kw: Any) -> ApiResponse | RawApiResponse:
         return self.request("POST", path, **kw)
 
 
@@ -7,22 +7,41 @@ without a LocalStack/AWS environment can run the rest of the suite with
 `pytest -m "not aws"`.
 """
 
-from framework.aws.client_factory import aws_client, aws_resource
-from framework.aws.cloudwatch_assertions import assert_log_contains
+from framework.aws.client_factory import aws_client, aws_resource, client_stats, thread_session
+from framework.aws.cloudwatch_assertions import LogCursor, assert_log_contains, assert_logs_contain
 from framework.aws.s3_assertions import (
+    SyncResult,
     assert_object_exists,
     assert_object_metadata,
+    sync_directory,
     wait_for_object,
+    wait_for_objects,
 )
-from framework.aws.sqs_assertions import assert_message_in_queue, drain_queue
+from framework.aws.sqs_assertions import (
+    assert_message_in_queue,
+    assert_messages_in_queue,
+    drain_queue,
+)
+from framework.aws.sqs_consumer import SqsConsumer, consumer_for, stop_consumers
 
 __all__ = [
     "aws_client",
     "aws_resource",
+    "client_stats",
+    "thread_session",
+    "LogCursor",
     "assert_log_contains",
+    "assert_logs_contain",
     "assert_object_exists",
     "assert_object_metadata",
     "wait_for_object",
+    "wait_for_objects",
+    "sync_directory",
+    "SyncResult",
     "assert_message_in_queue",
+    "assert_messages_in_queue",
     "drain_queue",
+    "SqsConsumer",
+    "consumer_for",
+    "stop_consumers",
 ]
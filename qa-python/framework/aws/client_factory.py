@@ -4,6 +4,18 @@ Honors `AWS_ENDPOINT_URL` so the same client code drives LocalStack
 (`http://localhost:4566`) and real AWS (no override). Region defaults to
 `us-east-1` to match LocalStack's default.
 
+`AWS_ENDPOINT_URL_<SERVICE>` (boto3's per-service convention, e.g.
+`AWS_ENDPOINT_URL_LOGS`) overrides it for one service, so logs can go to
+the local sink in `framework.aws.log_sink` while S3/SQS stay on LocalStack.
+
+Clients are thread-safe and shared: one per (service, endpoint, region,
+pool size), created under a lock because boto3's default session is not.
+The urllib3 pool holds `QA_AWS_MAX_POOL_CONNECTIONS` connections (default
+50, botocore's own default is 10) with TCP keepalive, so assertions fanned
+out over threads reuse connections instead of queueing on a full pool.
+Resources are not thread-safe, so `aws_resource` hands out one per thread.
+`client_stats()` reports calls, retries and connection reuse per client.
+
 In CI we set fake credentials and `AWS_ENDPOINT_URL=http://localhost:4566`
 via the workflow's `env:` block. Locally, source `.env` or export those
 variables yourself.
@@ -12,51 +24,168 @@ variables yourself.
 from __future__ import annotations
 
 import os
-from functools import lru_cache
+import threading
+from dataclasses import dataclass
 from typing import Any
 
 import boto3
 from botocore.config import Config
 
 
-def _endpoint_url() -> str | None:
-    return os.getenv("AWS_ENDPOINT_URL") or None
+@dataclass(frozen=True)
+class ClientKey:
+    service: str
+    endpoint: str | None
+    region: str
+    max_pool_connections: int
+
+
+@dataclass
+class ClientStats:
+    calls: int = 0
+    retries: int = 0
+    connections_opened: int = 0
+    requests_sent: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        return max(0, self.requests_sent - self.connections_opened)
+
+
+def _endpoint_url(service: str) -> str | None:
+    specific = os.getenv(f"AWS_ENDPOINT_URL_{service.upper().replace('-', '_')}")
+    return specific or os.getenv("AWS_ENDPOINT_URL") or None
 
 
 def _region() -> str:
     return os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION") or "us-east-1"
 
 
-def _client_config() -> Config:
+def _max_pool_connections() -> int:
+    return int(os.getenv("QA_AWS_MAX_POOL_CONNECTIONS", "50"))
+
+
+def _tcp_keepalive() -> bool:
+    return os.getenv("QA_AWS_TCP_KEEPALIVE", "1") != "0"
+
+
+def _client_config(max_pool_connections: int | None = None) -> Config:
     return Config(
         region_name=_region(),
         retries={"max_attempts": 3, "mode": "standard"},
         connect_timeout=5,
         read_timeout=15,
+        max_pool_connections=max_pool_connections or _max_pool_connections(),
+        tcp_keepalive=_tcp_keepalive(),
     )
 
 
-@lru_cache(maxsize=16)
-def aws_client(service: str) -> Any:
-    """Return a boto3 low-level client (cached per-service)."""
-    return boto3.client(
-        service,
-        endpoint_url=_endpoint_url(),
-        config=_client_config(),
-    )
+def _key(service: str, max_pool_connections: int | None) -> ClientKey:
+    return ClientKey(service, _endpoint_url(service), _region(), max_pool_connections or _max_pool_connections())
+
+
+_lock = threading.Lock()
+_clients: dict[ClientKey, Any] = {}
+_stats: dict[ClientKey, ClientStats] = {}
+_local = threading.local()
+
+
+def _count_call(stats: ClientStats) -> Any:
+    lock = threading.Lock()
+
+    def after_call(parsed: dict[str, Any] | None = None, **_kwargs: Any) -> None:
+        retries = int(((parsed or {}).get("ResponseMetadata") or {}).get("RetryAttempts") or 0)
+        with lock:
+            stats.calls += 1
+            stats.retries += retries
+
+    return after_call
+
+
+def aws_client(service: str, *, max_pool_connections: int | None = None) -> Any:
+    """Return a shared, thread-safe boto3 low-level client.
+
+    One client per (service, endpoint, region, pool size); the endpoint is
+    read from the environment on every call, so re-pointing it picks up a
+    fresh client.
+    """
+    key = _key(service, max_pool_connections)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = boto3.client(
+                service,
+                endpoint_url=key.endpoint,
+                config=_client_config(key.max_pool_connections),
+            )
+            stats = _stats.setdefault(key, ClientStats())
+            client.meta.events.register("after-call.*", _count_call(stats))
+            _clients[key] = client
+    return client
 
 
-@lru_cache(maxsize=16)
 def aws_resource(service: str) -> Any:
-    """Return a boto3 resource handle (cached per-service)."""
-    return boto3.resource(
-        service,
-        endpoint_url=_endpoint_url(),
-        config=_client_config(),
-    )
+    """Return a boto3 resource handle for the calling thread.
+
+    Resources (and the sessions behind them) are not thread-safe, so each
+    thread gets its own, built from a per-thread session.
+    """
+    key = _key(service, None)
+    cache: dict[ClientKey, Any] | None = getattr(_local, "resources", None)
+    if cache is None:
+        cache = _local.resources = {}
+    resource = cache.get(key)
+    if resource is None:
+        resource = thread_session().resource(
+            service,
+            endpoint_url=key.endpoint,
+            config=_client_config(key.max_pool_connections),
+        )
+        cache[key] = resource
+    return resource
+
+
+def thread_session() -> boto3.session.Session:
+    """A boto3 Session private to the calling thread."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = boto3.session.Session()
+    return session
+
+
+def _pool_counters(client: Any) -> tuple[int, int]:
+    """(connections opened, requests sent) across the client's urllib3 pools."""
+    try:
+        manager = client._endpoint.http_session._manager
+        pools = list(manager.pools._container.values())
+    except AttributeError:
+        return 0, 0
+    return sum(p.num_connections for p in pools), sum(p.num_requests for p in pools)
+
+
+def client_stats() -> dict[str, ClientStats]:
+    """Per-client counters keyed by `service@endpoint` (pool size appended
+    when it differs from the default)."""
+    out: dict[str, ClientStats] = {}
+    with _lock:
+        items = [(key, _clients[key], _stats[key]) for key in _clients]
+    for key, client, stats in items:
+        opened, sent = _pool_counters(client)
+        label = f"{key.service}@{key.endpoint or 'aws'}"
+        if key.max_pool_connections != _max_pool_connections():
+            label += f"#{key.max_pool_connections}"
+        out[label] = ClientStats(stats.calls, stats.retries, opened, sent)
+    return out
 
 
 def reset_clients() -> None:
     """Drop cached clients — used by integration test setup that re-points the endpoint."""
-    aws_client.cache_clear()
-    aws_resource.cache_clear()
+    with _lock:
+        _clients.clear()
+        _stats.clear()
+    # Other threads' resources are keyed by endpoint, so stale ones are never
+    # handed out again; only the caller's cache can be dropped from here.
+    _local.__dict__.clear()
@@ -3,24 +3,138 @@
 Tests that exercise an API can verify the system emitted the expected log
 line — useful for catching silent regressions in observability that pure
 HTTP-status checks miss.
+
+Searches go through a `LogCursor`: each poll follows `nextToken` to the end
+of the result set, then moves `startTime` forward so the next poll only asks
+for new events. An overlap window (deduplicated by `eventId`) covers events
+that arrive after later ones: CloudWatch can make an event searchable well
+after newer events from another stream, or one batched by a slow shipper.
+`overlap_ms` widens or narrows it (default 30s).
 """
 
 from __future__ import annotations
 
 import time
-from typing import Any
+from typing import Any, Iterable
 
 from botocore.exceptions import ClientError
 
 from framework.aws.client_factory import aws_client
 
+# filterPattern is limited to 1024 characters; longer OR-patterns fall back
+# to an unfiltered scan matched locally.
+_MAX_FILTER_PATTERN = 1024
+DEFAULT_OVERLAP_MS = 30_000
+
+
+def _quote(term: str) -> str:
+    return '"' + term.replace('"', '\\"') + '"'
+
+
+def _filter_pattern(patterns: list[str]) -> str | None:
+    if len(patterns) == 1:
+        return _quote(patterns[0])
+    combined = " ".join(f"?{_quote(p)}" for p in patterns)
+    return combined if len(combined) <= _MAX_FILTER_PATTERN else None
 
-def _log_group_exists(log_group: str) -> bool:
-    try:
-        resp = aws_client("logs").describe_log_groups(logGroupNamePrefix=log_group)
-    except ClientError:
-        return False
-    return any(g.get("logGroupName") == log_group for g in resp.get("logGroups", []))
+
+class LogCursor:
+    """Incremental reader over `filter_log_events` for one log group."""
+
+    def __init__(
+        self,
+        log_group: str,
+        *,
+        since_ms: int,
+        filter_pattern: str | None = None,
+        overlap_ms: int = DEFAULT_OVERLAP_MS,
+        page_limit: int = 10_000,
+    ) -> None:
+        self.log_group = log_group
+        self.start_ms = since_ms
+        self.filter_pattern = filter_pattern
+        self.overlap_ms = overlap_ms
+        self.page_limit = page_limit
+        self.scanned = 0
+        self.requests = 0
+        self._seen: dict[str, int] = {}  # eventId -> timestamp, within the overlap window
+        self._max_ts = since_ms
+
+    def poll(self) -> list[dict[str, Any]]:
+        """Every event not returned by an earlier poll, across all pages."""
+        logs = aws_client("logs")
+        kwargs: dict[str, Any] = {
+            "logGroupName": self.log_group,
+            "startTime": self.start_ms,
+            "limit": self.page_limit,
+        }
+        if self.filter_pattern:
+            kwargs["filterPattern"] = self.filter_pattern
+
+        fresh: list[dict[str, Any]] = []
+        while True:
+            try:
+                resp = logs.filter_log_events(**kwargs)
+            except ClientError as exc:
+                if exc.response.get("Error", {}).get("Code") == "ResourceNotFoundException":
+                    raise AssertionError(f"CloudWatch log group does not exist: {self.log_group}") from exc
+                raise
+            self.requests += 1
+            for evt in resp.get("events") or []:
+                event_id = evt.get("eventId") or f"{evt.get('logStreamName')}:{evt.get('timestamp')}:{evt.get('message')}"
+                if event_id in self._seen:
+                    continue
+                ts = int(evt.get("timestamp") or 0)
+                self._seen[event_id] = ts
+                self._max_ts = max(self._max_ts, ts)
+                fresh.append(evt)
+            token = resp.get("nextToken")
+            if not token or token == kwargs.get("nextToken"):
+                break
+            kwargs["nextToken"] = token
+
+        self.scanned += len(fresh)
+        # Only re-read the overlap window next time, and forget ids behind it.
+        self.start_ms = max(self.start_ms, self._max_ts - self.overlap_ms)
+        self._seen = {k: ts for k, ts in self._seen.items() if ts >= self.start_ms}
+        return fresh
+
+
+def _wait_for_patterns(
+    log_group: str,
+    patterns: list[str],
+    *,
+    since_ms: int | None,
+    timeout_s: float,
+    poll_interval_s: float,
+    overlap_ms: int,
+) -> tuple[dict[str, dict[str, Any]], LogCursor]:
+    if since_ms is None:
+        since_ms = int((time.time() - 60) * 1000)
+
+    cursor = LogCursor(log_group, since_ms=since_ms, filter_pattern=_filter_pattern(patterns), overlap_ms=overlap_ms)
+    pending = list(dict.fromkeys(patterns))
+    found: dict[str, dict[str, Any]] = {}
+    deadline = time.monotonic() + timeout_s
+    # Adaptive backoff: poll quickly while events are arriving, slow down to
+    # `poll_interval_s` while the group is quiet.
+    interval = min(0.1, poll_interval_s)
+
+    while True:
+        events = cursor.poll()
+        for evt in events:
+            message = evt.get("message") or ""
+            for pattern in [p for p in pending if p in message]:
+                found[pattern] = evt
+                pending.remove(pattern)
+        if not pending:
+            break
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        interval = min(0.1, poll_interval_s) if events else min(interval * 2, poll_interval_s)
+        time.sleep(min(interval, remaining))
+    return found, cursor
 
 
 def assert_log_contains(
@@ -30,41 +144,57 @@ def assert_log_contains(
     since_ms: int | None = None,
     timeout_s: float = 10.0,
     poll_interval_s: float = 1.0,
+    overlap_ms: int = DEFAULT_OVERLAP_MS,
 ) -> dict[str, Any]:
     """Poll `log_group` until a log event whose message contains `pattern`
     appears. `since_ms` filters to events with `timestamp >= since_ms`
-    (epoch milliseconds); defaults to "now minus 60s".
+    (epoch milliseconds); defaults to "now minus 60s". Each poll re-reads
+    events up to `overlap_ms` older than the newest one seen, for late arrivals.
 
     Returns the matching log event dict.
     """
-    if not _log_group_exists(log_group):
-        raise AssertionError(f"CloudWatch log group does not exist: {log_group}")
-
-    if since_ms is None:
-        since_ms = int((time.time() - 60) * 1000)
-
-    logs = aws_client("logs")
-    deadline = time.monotonic() + timeout_s
-    seen = 0
+    found, cursor = _wait_for_patterns(
+        log_group,
+        [pattern],
+        since_ms=since_ms,
+        timeout_s=timeout_s,
+        poll_interval_s=poll_interval_s,
+        overlap_ms=overlap_ms,
+    )
+    if pattern not in found:
+        raise AssertionError(
+            f"No CloudWatch log event in {log_group!r} matched {pattern!r} "
+            f"within {timeout_s}s (scanned {cursor.scanned} events)"
+        )
+    return found[pattern]
 
-    while time.monotonic() < deadline:
-        # filter_log_events scans across all streams in a group — exactly what
-        # the AWS console "Search log group" feature does.
-        kwargs: dict[str, Any] = {
-            "logGroupName": log_group,
-            "startTime": since_ms,
-            "filterPattern": f'"{pattern}"',
-            "limit": 50,
-        }
-        resp = logs.filter_log_events(**kwargs)
-        events = resp.get("events") or []
-        seen += len(events)
-        for evt in events:
-            if pattern in (evt.get("message") or ""):
-                return evt
-        time.sleep(poll_interval_s)
 
-    raise AssertionError(
-        f"No CloudWatch log event in {log_group!r} matched {pattern!r} "
-        f"within {timeout_s}s (scanned {seen} events)"
+def assert_logs_contain(
+    log_group: str,
+    patterns: Iterable[str],
+    *,
+    since_ms: int | None = None,
+    timeout_s: float = 10.0,
+    poll_interval_s: float = 1.0,
+    overlap_ms: int = DEFAULT_OVERLAP_MS,
+) -> dict[str, dict[str, Any]]:
+    """Wait in one polling loop until every pattern has appeared in `log_group`
+    (e.g. one request id per spin in a batch). Returns `{pattern: event}`.
+    """
+    patterns = list(patterns)
+    found, cursor = _wait_for_patterns(
+        log_group,
+        patterns,
+        since_ms=since_ms,
+        timeout_s=timeout_s,
+        poll_interval_s=poll_interval_s,
+        overlap_ms=overlap_ms,
     )
+    missing = [p for p in dict.fromkeys(patterns) if p not in found]
+    if missing:
+        shown = ", ".join(repr(p) for p in missing[:10]) + (" ..." if len(missing) > 10 else "")
+        raise AssertionError(
+            f"{len(missing)} of {len(set(patterns))} patterns never appeared in CloudWatch log "
+            f"group {log_group!r} within {timeout_s}s (scanned {cursor.scanned} events): {shown}"
+        )
+    return found
@@ -0,0 +1,439 @@
+"""Local, indexed stand-in for CloudWatch Logs.
+
+Implements the subset of the CloudWatch Logs JSON API that `framework.aws`
+uses (Create/Delete/DescribeLogGroups, CreateLogStream, DescribeLogStreams,
+PutLogEvents, FilterLogEvents) on a stdlib HTTP server. Point
+`AWS_ENDPOINT_URL` at it (or `AWS_ENDPOINT_URL_LOGS`, to keep S3/SQS on
+LocalStack or moto) and the assertions run unchanged.
+
+Unlike moto's linear scan, events live in per-group, time-ordered segments
+of up to `SEGMENT_SIZE` events, each with an inverted token index, so a
+quoted-term search only verifies the handful of events whose tokens match:
+pattern searches over millions of events return in milliseconds.
+
+Filter patterns: space-separated terms, each bare or "quoted", prefixed with
+`?` (any of) or `-` (none of); other terms must all match. A term matches
+when the message contains it as a substring, which is what the assertions
+check locally. JSON/space-delimited patterns are rejected.
+
+Usage:
+  python -m framework.aws.log_sink --port 4599
+  AWS_ENDPOINT_URL_LOGS=http://127.0.0.1:4599 pytest -m aws
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import json
+import re
+import shlex
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+SEGMENT_SIZE = 4096
+MAX_LIMIT = 10_000
+_TOKEN = re.compile(r"[A-Za-z0-9_]+")
+
+
+class LogsError(Exception):
+    """Maps to a CloudWatch Logs error response (`__type` + message)."""
+
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+# ── Filter patterns ─────────────────────────────────────────────────
+
+@dataclass
+class Term:
+    text: str
+    op: str  # "all" | "any" | "none"
+    exact: list[str] = field(default_factory=list)  # whole tokens every match must contain
+    edges: list[tuple[str, str]] = field(default_factory=list)  # (kind, token) partial tokens
+
+
+def _analyse(text: str, op: str) -> Term:
+    """Split a term into whole tokens (exact index hits) and partial edge tokens.
+
+    With substring semantics the first token of "abc-def" may be the tail of
+    a longer message token and the last one its head; tokens in between are
+    bounded by separators on both sides and must appear whole.
+    """
+    term = Term(text, op)
+    spans = [(m.start(), m.end(), m.group()) for m in _TOKEN.finditer(text)]
+    for start, end, tok in spans:
+        open_left = start == 0
+        open_right = end == len(text)
+        if open_left and open_right:
+            term.edges.append(("infix", tok))
+        elif open_left:
+            term.edges.append(("suffix", tok))
+        elif open_right:
+            term.edges.append(("prefix", tok))
+        else:
+            term.exact.append(tok)
+    return term
+
+
+def parse_filter_pattern(pattern: str | None) -> list[Term]:
+    if not pattern or not pattern.strip():
+        return []
+    if pattern.lstrip().startswith(("{", "[")):
+        raise LogsError("InvalidParameterException", "JSON and space-delimited filter patterns are not supported")
+    try:
+        words = shlex.split(pattern)
+    except ValueError as exc:
+        raise LogsError("InvalidParameterException", f"invalid filter pattern: {exc}") from exc
+    terms = []
+    for word in words:
+        op = "all"
+        if word.startswith("?"):
+            op, word = "any", word[1:]
+        elif word.startswith("-"):
+            op, word = "none", word[1:]
+        if word:
+            terms.append(_analyse(word, op))
+    return terms
+
+
+def message_matches(terms: list[Term], message: str) -> bool:
+    any_terms = [t for t in terms if t.op == "any"]
+    if any_terms and not any(t.text in message for t in any_terms):
+        return False
+    return all(
+        (t.text in message) if t.op == "all" else (t.text not in message)
+        for t in terms
+        if t.op != "any"
+    )
+
+
+# ── Storage ─────────────────────────────────────────────────────────
+
+class Segment:
+    """Events sorted by timestamp plus token -> positions postings."""
+
+    def __init__(self, events: list[tuple[int, int, str, str, str]]) -> None:
+        events.sort(key=lambda e: (e[0], e[4]))
+        self.timestamps = [e[0] for e in events]
+        self.events = events  # (timestamp, ingestionTime, stream, message, eventId)
+        self.postings: dict[str, list[int]] = {}
+        for pos, evt in enumerate(events):
+            for tok in set(_TOKEN.findall(evt[3])):
+                self.postings.setdefault(tok, []).append(pos)
+        self.min_ts = self.timestamps[0]
+        self.max_ts = self.timestamps[-1]
+
+    def _edge_positions(self, kind: str, tok: str) -> set[int]:
+        test: Callable[[str], bool] = {
+            "prefix": lambda key: key.startswith(tok),
+            "suffix": lambda key: key.endswith(tok),
+            "infix": lambda key: tok in key,
+        }[kind]
+        hit = self.postings.get(tok, [])
+        out = set(hit)
+        for key, positions in self.postings.items():
+            if key != tok and test(key):
+                out.update(positions)
+        return out
+
+    def _term_positions(self, term: Term) -> set[int] | None:
+        """Positions that may contain `term`; None when the index cannot narrow."""
+        if term.exact:
+            lists = sorted((self.postings.get(tok, []) for tok in term.exact), key=len)
+            out = set(lists[0])
+            for other in lists[1:]:
+                out.intersection_update(other)
+            return out
+        narrowed: set[int] | None = None
+        for kind, tok in term.edges:
+            found = self._edge_positions(kind, tok)
+            narrowed = found if narrowed is None else narrowed & found
+        return narrowed
+
+    def candidates(self, terms: list[Term], start_ms: int, end_ms: int) -> list[int]:
+        lo = bisect.bisect_left(self.timestamps, start_ms)
+        hi = bisect.bisect_right(self.timestamps, end_ms)
+        if lo >= hi:
+            return []
+        narrowed: set[int] | None = None
+        for term in (t for t in terms if t.op == "all"):
+            positions = self._term_positions(term)
+            if positions is not None:
+                narrowed = positions if narrowed is None else narrowed & positions
+        any_terms = [t for t in terms if t.op == "any"]
+        if any_terms:
+            union: set[int] | None = set()
+            for term in any_terms:
+                positions = self._term_positions(term)
+                if positions is None:
+                    union = None
+                    break
+                union |= positions
+            if union is not None:
+                narrowed = union if narrowed is None else narrowed & union
+        if narrowed is None:
+            return list(range(lo, hi))
+        return sorted(p for p in narrowed if lo <= p < hi)
+
+
+@dataclass
+class LogGroup:
+    name: str
+    created_ms: int
+    streams: dict[str, int] = field(default_factory=dict)  # name -> creationTime
+    segments: list[Segment] = field(default_factory=list)
+    open: list[tuple[int, int, str, str, str]] = field(default_factory=list)
+    stored_bytes: int = 0
+
+    def add(self, events: list[tuple[int, int, str, str, str]]) -> None:
+        self.open.extend(events)
+        while len(self.open) >= SEGMENT_SIZE:
+            bisect.insort(self.segments, Segment(self.open[:SEGMENT_SIZE]), key=lambda seg: seg.min_ts)
+            self.open = self.open[SEGMENT_SIZE:]
+
+    def search(
+        self,
+        terms: list[Term],
+        start_ms: int,
+        end_ms: int,
+        streams: set[str] | None,
+        *,
+        after: tuple[int, str] | None = None,
+        limit: int = MAX_LIMIT,
+    ) -> list[tuple[int, int, str, str, str]]:
+        """Up to `limit + 1` matching events ordered by (timestamp, eventId),
+        starting after the `after` key.
+
+        Segments are visited by their earliest timestamp, so once a full page
+        is collected every later segment starting beyond it is skipped.
+        """
+        if after is not None:
+            start_ms = max(start_ms, after[0])
+
+        def wanted(evt: tuple[int, int, str, str, str]) -> bool:
+            return ((after is None or (evt[0], evt[4]) > after)
+                    and (streams is None or evt[2] in streams)
+                    and message_matches(terms, evt[3]))
+
+        out = [evt for evt in self.open if start_ms <= evt[0] <= end_ms and wanted(evt)]
+        out.sort(key=lambda e: (e[0], e[4]))
+        del out[limit + 1:]
+        for seg in self.segments:
+            if seg.min_ts > end_ms or (len(out) > limit and seg.min_ts > out[limit][0]):
+                break
+            if seg.max_ts < start_ms:
+                continue
+            found = []
+            for pos in seg.candidates(terms, start_ms, end_ms):
+                evt = seg.events[pos]
+                if wanted(evt):
+                    found.append(evt)
+                    if len(found) > limit:
+                        break
+            if found:
+                out.extend(found)
+                out.sort(key=lambda e: (e[0], e[4]))
+                del out[limit + 1:]
+        return out
+
+
+class LogStore:
+    """Thread-safe in-memory log groups; the HTTP server is a thin wrapper."""
+
+    def __init__(self) -> None:
+        self.groups: dict[str, LogGroup] = {}
+        self._lock = threading.RLock()
+        self._seq = 0
+
+    def _group(self, name: str) -> LogGroup:
+        group = self.groups.get(name)
+        if group is None:
+            raise LogsError("ResourceNotFoundException", "The specified log group does not exist.")
+        return group
+
+    def create_log_group(self, logGroupName: str, **_: Any) -> dict[str, Any]:
+        with self._lock:
+            if logGroupName in self.groups:
+                raise LogsError("ResourceAlreadyExistsException", "The specified log group already exists")
+            self.groups[logGroupName] = LogGroup(logGroupName, int(time.time() * 1000))
+        return {}
+
+    def delete_log_group(self, logGroupName: str, **_: Any) -> dict[str, Any]:
+        with self._lock:
+            self._group(logGroupName)
+            del self.groups[logGroupName]
+        return {}
+
+    def describe_log_groups(self, logGroupNamePrefix: str = "", **_: Any) -> dict[str, Any]:
+        with self._lock:
+            groups = sorted(g for g in self.groups if g.startswith(logGroupNamePrefix))
+            return {"logGroups": [
+                {
+                    "logGroupName": name,
+                    "creationTime": self.groups[name].created_ms,
+                    "storedBytes": self.groups[name].stored_bytes,
+                    "arn": f"arn:aws:logs:us-east-1:000000000000:log-group:{name}:*",
+                }
+                for name in groups
+            ]}
+
+    def create_log_stream(self, logGroupName: str, logStreamName: str, **_: Any) -> dict[str, Any]:
+        with self._lock:
+            group = self._group(logGroupName)
+            if logStreamName in group.streams:
+                raise LogsError("ResourceAlreadyExistsException", "The specified log stream already exists")
+            group.streams[logStreamName] = int(time.time() * 1000)
+        return {}
+
+    def describe_log_streams(self, logGroupName: str, logStreamNamePrefix: str = "", **_: Any) -> dict[str, Any]:
+        with self._lock:
+            group = self._group(logGroupName)
+            return {"logStreams": [
+                {"logStreamName": name, "creationTime": created}
+                for name, created in sorted(group.streams.items())
+                if name.startswith(logStreamNamePrefix)
+            ]}
+
+    def put_log_events(self, logGroupName: str, logStreamName: str, logEvents: list[dict[str, Any]],
+                       **_: Any) -> dict[str, Any]:
+        now = int(time.time() * 1000)
+        with self._lock:
+            group = self._group(logGroupName)
+            if logStreamName not in group.streams:
+                raise LogsError("ResourceNotFoundException", "The specified log stream does not exist.")
+            batch = []
+            for evt in logEvents:
+                self._seq += 1
+                message = str(evt["message"])
+                batch.append((int(evt["timestamp"]), now, logStreamName, message, f"{self._seq:020d}"))
+                group.stored_bytes += len(message)
+            group.add(batch)
+        return {"nextSequenceToken": f"{self._seq:020d}"}
+
+    def filter_log_events(
+        self,
+        logGroupName: str,
+        startTime: int = 0,
+        endTime: int | None = None,
+        filterPattern: str | None = None,
+        logStreamNames: list[str] | None = None,
+        limit: int = MAX_LIMIT,
+        nextToken: str | None = None,
+        **_: Any,
+    ) -> dict[str, Any]:
+        terms = parse_filter_pattern(filterPattern)
+        end = endTime if endTime is not None else 2 ** 62
+        limit = max(1, min(int(limit), MAX_LIMIT))
+        # The token is the key of the last event returned; events sort by
+        # (timestamp, eventId), so the next page resumes right after it.
+        after = None
+        if nextToken:
+            ts, _, event_id = nextToken.partition(":")
+            after = (int(ts), event_id)
+        with self._lock:
+            matches = self._group(logGroupName).search(
+                terms, startTime, end, set(logStreamNames) if logStreamNames else None,
+                after=after, limit=limit)
+        page = matches[:limit]
+        resp: dict[str, Any] = {
+            "events": [
+                {"logStreamName": e[2], "timestamp": e[0], "message": e[3],
+                 "ingestionTime": e[1], "eventId": e[4]}
+                for e in page
+            ],
+            "searchedLogStreams": [],
+        }
+        if len(matches) > limit:
+            resp["nextToken"] = f"{page[-1][0]}:{page[-1][4]}"
+        return resp
+
+
+# ── HTTP front end ──────────────────────────────────────────────────
+
+_OPERATIONS = {
+    "CreateLogGroup": "create_log_group",
+    "DeleteLogGroup": "delete_log_group",
+    "DescribeLogGroups": "describe_log_groups",
+    "CreateLogStream": "create_log_stream",
+    "DescribeLogStreams": "describe_log_streams",
+    "PutLogEvents": "put_log_events",
+    "FilterLogEvents": "filter_log_events",
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "LogSinkServer"
+
+    def do_POST(self) -> None:  # noqa: N802 — http.server naming
+        target = self.headers.get("X-Amz-Target", "")
+        operation = target.rpartition(".")[2]
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            method = _OPERATIONS.get(operation)
+            if method is None:
+                raise LogsError("UnknownOperationException", f"unsupported operation: {target or self.path}")
+            params = json.loads(self.rfile.read(length) or b"{}")
+            self._send(200, getattr(self.server.store, method)(**params))
+        except LogsError as exc:
+            self._send(400, {"__type": exc.code, "message": str(exc)})
+        except (TypeError, KeyError, ValueError) as exc:
+            self._send(400, {"__type": "InvalidParameterException", "message": str(exc)})
+
+    def _send(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/x-amz-json-1.1")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: Any) -> None:
+        pass
+
+
+class LogSinkServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, store: LogStore | None = None) -> None:
+        super().__init__((host, port), _Handler)
+        self.store = store or LogStore()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def endpoint_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LogSinkServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="log-sink", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local indexed CloudWatch Logs stand-in.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4599)
+    args = parser.parse_args()
+    server = LogSinkServer(args.host, args.port)
+    print(f"log sink listening on {server.endpoint_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
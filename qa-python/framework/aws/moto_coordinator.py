@@ -0,0 +1,187 @@
+"""Share in-process-style moto servers between pytest-xdist workers.
+
+Without coordination every xdist worker boots its own `ThreadedMotoServer`,
+so `-n auto` on a 32-core runner means 32 servers and 32 cold boto3 endpoint
+resolutions. Here the first worker to arrive starts a small pool of moto
+servers (one by default) as a detached helper process, records them in a
+JSON state file guarded by an `fcntl` lock, and every worker picks its
+server by worker number. Each worker registers its pid; the last one to
+release the pool stops the servers. If every registered worker dies without
+releasing, the helper notices and exits on its own.
+
+    servers = SharedMotoServers(state_dir, pool_size=2)
+    os.environ["AWS_ENDPOINT_URL"] = servers.acquire()
+    ...
+    servers.release()
+
+POSIX only (`fcntl`), like the CI runners.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fcntl
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager, redirect_stdout
+from typing import Any, Iterator
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _worker_index(worker_id: str) -> int:
+    digits = "".join(ch for ch in worker_id if ch.isdigit())
+    return int(digits) if digits else 0
+
+
+def _wait_until_listening(endpoint: str, timeout_s: float = 15.0) -> None:
+    host, port = endpoint.rsplit("//", 1)[1].rsplit(":", 1)
+    deadline = time.monotonic() + timeout_s
+    while True:
+        try:
+            with socket.create_connection((host, int(port)), timeout=0.5):
+                return
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"moto server at {endpoint} did not start listening")
+            time.sleep(0.05)
+
+
+class SharedMotoServers:
+    """Reference-counted pool of moto servers shared through `state_dir`."""
+
+    def __init__(self, state_dir: str, *, pool_size: int = 1, worker_id: str = "master") -> None:
+        os.makedirs(state_dir, exist_ok=True)
+        self.state_path = os.path.join(state_dir, "moto-servers.json")
+        self.lock_path = os.path.join(state_dir, "moto-servers.lock")
+        self.pool_size = max(1, pool_size)
+        self.worker_id = worker_id
+        self.endpoint: str | None = None
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with open(self.lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            with open(self.state_path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {"servers": [], "workers": []}
+
+    def _write(self, state: dict[str, Any]) -> None:
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_path)
+
+    def _spawn(self) -> dict[str, Any]:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(p for p in (_ROOT, env.get("PYTHONPATH")) if p)
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "framework.aws.moto_coordinator", "--state", self.state_path],
+            stdout=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+            env=env,
+            start_new_session=True,
+            text=True,
+        )
+        line = proc.stdout.readline().strip() if proc.stdout else ""
+        if proc.stdout:
+            proc.stdout.close()
+        if not line.startswith("http"):
+            proc.kill()
+            raise RuntimeError(f"moto helper failed to start (got {line!r})")
+        _wait_until_listening(line)
+        return {"pid": proc.pid, "endpoint": line}
+
+    def acquire(self) -> str:
+        """Register this worker and return the endpoint it should use."""
+        with self._locked():
+            state = self._read()
+            state["workers"] = [pid for pid in state["workers"] if _pid_alive(pid)]
+            servers = [s for s in state["servers"] if _pid_alive(s["pid"])]
+            while len(servers) < self.pool_size:
+                servers.append(self._spawn())
+            state["servers"] = servers
+            if os.getpid() not in state["workers"]:
+                state["workers"].append(os.getpid())
+            self._write(state)
+        self.endpoint = servers[_worker_index(self.worker_id) % len(servers)]["endpoint"]
+        return self.endpoint
+
+    def release(self) -> None:
+        """Unregister this worker; the last one out stops the servers."""
+        with self._locked():
+            state = self._read()
+            state["workers"] = [pid for pid in state["workers"] if pid != os.getpid() and _pid_alive(pid)]
+            if state["workers"]:
+                self._write(state)
+                return
+            for server in state["servers"]:
+                try:
+                    os.kill(server["pid"], signal.SIGTERM)
+                except ProcessLookupError:
+                    continue
+                try:
+                    os.waitpid(server["pid"], 0)  # reap it if we spawned it
+                except ChildProcessError:
+                    pass
+            try:
+                os.remove(self.state_path)
+            except FileNotFoundError:
+                pass
+
+
+def _serve(state_path: str, grace_s: float = 30.0) -> None:
+    """Helper process: run one ThreadedMotoServer until no worker is left."""
+    from moto.server import ThreadedMotoServer
+
+    # stdout carries only the endpoint line; moto's banner goes to stderr.
+    with redirect_stdout(sys.stderr):
+        server = ThreadedMotoServer(ip_address="127.0.0.1", port=0)
+        server.start()
+        host, port = server.get_host_and_port()
+    print(f"http://{host}:{port}", flush=True)
+
+    started = time.monotonic()
+    try:
+        while True:
+            time.sleep(2.0)
+            try:
+                with open(state_path) as f:
+                    workers = json.load(f).get("workers", [])
+            except FileNotFoundError:
+                workers = []  # not written yet, or removed by the last release
+            except ValueError:
+                continue  # mid-write; try again next tick
+            if time.monotonic() - started > grace_s and not any(_pid_alive(pid) for pid in workers):
+                break
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run one shared moto server (internal helper).")
+    parser.add_argument("--state", required=True)
+    _serve(parser.parse_args().state)
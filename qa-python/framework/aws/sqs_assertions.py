@@ -1,22 +1,43 @@
-"""SQS message assertions for event-driven flow tests."""
+"""SQS message assertions for event-driven flow tests.
+
+Waiters long-poll (up to 20s per receive, capped by the remaining timeout)
+and check every received message against all outstanding predicates in one
+loop. Matches are deleted with `DeleteMessageBatch`; non-matching messages
+are handed straight back with `ChangeMessageVisibilityBatch`, so tests that
+share a queue don't hide each other's events for a visibility timeout.
+"""
 
 from __future__ import annotations
 
 import json
 import time
-from typing import Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Mapping
 
 from framework.aws.client_factory import aws_client
 
+# SQS limits: 10 messages per receive / batch call, 20s maximum long poll.
+_BATCH_SIZE = 10
+_MAX_WAIT_S = 20
 
-def _receive_batch(queue_url: str, *, max_messages: int = 10, wait_s: int = 1) -> list[dict[str, Any]]:
-    resp = aws_client("sqs").receive_message(
-        QueueUrl=queue_url,
-        MaxNumberOfMessages=max_messages,
-        WaitTimeSeconds=wait_s,
-        MessageAttributeNames=["All"],
-        AttributeNames=["All"],
-    )
+
+def _receive_batch(
+    queue_url: str,
+    *,
+    max_messages: int = _BATCH_SIZE,
+    wait_s: int = 1,
+    visibility_s: int | None = None,
+) -> list[dict[str, Any]]:
+    kwargs: dict[str, Any] = {
+        "QueueUrl": queue_url,
+        "MaxNumberOfMessages": max_messages,
+        "WaitTimeSeconds": wait_s,
+        "MessageAttributeNames": ["All"],
+        "AttributeNames": ["All"],
+    }
+    if visibility_s is not None:
+        kwargs["VisibilityTimeout"] = visibility_s
+    resp = aws_client("sqs").receive_message(**kwargs)
     return resp.get("Messages") or []
 
 
@@ -27,6 +48,136 @@ def _try_parse_body(body: str) -> Any:
         return body
 
 
+def _chunks(items: list[Any], size: int = _BATCH_SIZE) -> list[list[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _delete_batch(queue_url: str, messages: list[dict[str, Any]]) -> list[str]:
+    """Delete `messages` with DeleteMessageBatch. Returns the deleted MessageIds."""
+    sqs = aws_client("sqs")
+    deleted: list[str] = []
+    for chunk in _chunks(messages):
+        resp = sqs.delete_message_batch(
+            QueueUrl=queue_url,
+            Entries=[{"Id": str(i), "ReceiptHandle": m["ReceiptHandle"]} for i, m in enumerate(chunk)],
+        )
+        deleted += [chunk[int(ok["Id"])].get("MessageId", "") for ok in resp.get("Successful") or []]
+    return deleted
+
+
+def _release_batch(queue_url: str, messages: list[dict[str, Any]]) -> None:
+    """Make `messages` visible again right away for other consumers.
+
+    Failures are ignored: a message we could not release simply reappears
+    when its visibility timeout runs out.
+    """
+    sqs = aws_client("sqs")
+    for chunk in _chunks(messages):
+        sqs.change_message_visibility_batch(
+            QueueUrl=queue_url,
+            Entries=[
+                {"Id": str(i), "ReceiptHandle": m["ReceiptHandle"], "VisibilityTimeout": 0}
+                for i, m in enumerate(chunk)
+            ],
+        )
+
+
+def _await_matches(
+    queue_url: str,
+    predicates: Mapping[str, Callable[[Any], bool]],
+    *,
+    timeout_s: float,
+    delete_on_match: bool,
+    max_wait_s: int,
+    visibility_s: int,
+) -> tuple[dict[str, dict[str, Any]], set[str]]:
+    """Receive until every predicate matched a distinct message or time runs out.
+
+    Returns the matches so far and the ids of non-matching messages seen.
+    Predicates are pure functions of the body, so a message already judged
+    non-matching is released again without being re-evaluated.
+    """
+    deadline = time.monotonic() + timeout_s
+    pending = dict(predicates)
+    matched: dict[str, dict[str, Any]] = {}
+    seen_ids: set[str] = set()
+    idle_s = 0.05
+
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        wait_s = int(min(max_wait_s, remaining))
+        batch = _receive_batch(queue_url, wait_s=wait_s, visibility_s=visibility_s)
+
+        hits: list[dict[str, Any]] = []
+        misses: list[dict[str, Any]] = []
+        fresh = False
+        for msg in batch:
+            msg_id = msg.get("MessageId", "")
+            if msg_id in seen_ids:
+                misses.append(msg)
+                continue
+            fresh = True
+            body = _try_parse_body(msg.get("Body", ""))
+            name = next((n for n, pred in pending.items() if pred(body)), None)
+            if name is None:
+                seen_ids.add(msg_id)
+                misses.append(msg)
+            else:
+                matched[name] = msg
+                del pending[name]
+                hits.append(msg)
+
+        if misses:
+            _release_batch(queue_url, misses)
+        if hits and delete_on_match:
+            _delete_batch(queue_url, hits)
+
+        # Released messages come straight back on the next receive; when a
+        # round brought nothing new, back off instead of spinning on them.
+        if fresh:
+            idle_s = 0.05
+        elif batch or wait_s == 0:
+            time.sleep(min(idle_s, max(0.0, deadline - time.monotonic())))
+            idle_s = min(idle_s * 2, 1.0)
+
+    return matched, seen_ids
+
+
+def assert_messages_in_queue(
+    queue_url: str,
+    predicates: Mapping[str, Callable[[Any], bool]],
+    *,
+    timeout_s: float = 10.0,
+    delete_on_match: bool = True,
+    max_wait_s: int = _MAX_WAIT_S,
+    visibility_s: int = 30,
+) -> dict[str, dict[str, Any]]:
+    """Wait until each named predicate matched its own message on `queue_url`.
+
+    Predicates are called with the parsed body (JSON if parseable, else the
+    raw string); a message is claimed by the first outstanding predicate it
+    satisfies. Returns `{name: sqs_message}` for every predicate. Raises
+    AssertionError naming the predicates still unmatched at the timeout.
+    """
+    matched, seen_ids = _await_matches(
+        queue_url,
+        predicates,
+        timeout_s=timeout_s,
+        delete_on_match=delete_on_match,
+        max_wait_s=max_wait_s,
+        visibility_s=visibility_s,
+    )
+    missing = [name for name in predicates if name not in matched]
+    if missing:
+        raise AssertionError(
+            f"{len(missing)} of {len(predicates)} SQS predicates unmatched within {timeout_s}s "
+            f"on {queue_url}: {', '.join(missing)} (saw {len(seen_ids)} non-matching messages)"
+        )
+    return matched
+
+
 def assert_message_in_queue(
     queue_url: str,
     *,
@@ -37,40 +188,51 @@ def assert_message_in_queue(
     """Poll `queue_url` until a message satisfying `predicate` arrives.
 
     `predicate` is called with the parsed body (JSON if parseable, else the raw
-    string). Returns the matching SQS message dict. Drains and re-queues
-    non-matching messages by changing visibility, but leaves them in the queue.
+    string). Returns the matching SQS message dict. Non-matching messages are
+    made visible again immediately and stay in the queue.
     """
-    sqs = aws_client("sqs")
-    deadline = time.monotonic() + timeout_s
-    seen_ids: set[str] = set()
-
-    while time.monotonic() < deadline:
-        for msg in _receive_batch(queue_url):
-            msg_id = msg.get("MessageId", "")
-            body = _try_parse_body(msg.get("Body", ""))
-            if predicate(body):
-                if delete_on_match:
-                    sqs.delete_message(QueueUrl=queue_url, ReceiptHandle=msg["ReceiptHandle"])
-                return msg
-            seen_ids.add(msg_id)
-        time.sleep(0.2)
-
-    raise AssertionError(
-        f"No SQS message matched predicate within {timeout_s}s on {queue_url} "
-        f"(saw {len(seen_ids)} non-matching messages)"
+    matched, seen_ids = _await_matches(
+        queue_url,
+        {"predicate": predicate},
+        timeout_s=timeout_s,
+        delete_on_match=delete_on_match,
+        max_wait_s=_MAX_WAIT_S,
+        visibility_s=30,
     )
+    if not matched:
+        raise AssertionError(
+            f"No SQS message matched predicate within {timeout_s}s on {queue_url} "
+            f"(saw {len(seen_ids)} non-matching messages)"
+        )
+    return matched["predicate"]
 
 
-def drain_queue(queue_url: str, *, max_iterations: int = 20) -> int:
+def drain_queue(
+    queue_url: str, *, max_iterations: int = 20, workers: int = 4, timeout_s: float = 30.0
+) -> int:
     """Receive-and-delete all messages currently visible. Used in test setup
-    to ensure a clean queue between scenarios. Returns the count drained."""
-    sqs = aws_client("sqs")
-    drained = 0
-    for _ in range(max_iterations):
-        batch = _receive_batch(queue_url, wait_s=0)
-        if not batch:
-            break
-        for msg in batch:
-            sqs.delete_message(QueueUrl=queue_url, ReceiptHandle=msg["ReceiptHandle"])
-            drained += 1
-    return drained
+    to ensure a clean queue between scenarios. Returns the count drained.
+
+    `workers` threads each receive and batch-delete until the queue looks
+    empty. Each worker stops after `max_iterations` receive calls (with the
+    defaults, up to 800 messages in all), or after `timeout_s`, whichever
+    comes first. This way, a producer that keeps publishing cannot hang
+    setup. SQS may hand the same message to two concurrent receivers, so
+    the count is of distinct MessageIds.
+    """
+    deadline = time.monotonic() + timeout_s
+
+    def worker() -> list[str]:
+        drained: list[str] = []
+        for _ in range(max_iterations):
+            if time.monotonic() >= deadline:
+                break
+            batch = _receive_batch(queue_url, wait_s=0)
+            if not batch:
+                break
+            drained += _delete_batch(queue_url, batch)
+        return drained
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(lambda _i: worker(), range(max(1, workers))))
+    return len({msg_id for ids in results for msg_id in ids})
@@ -0,0 +1,243 @@
+"""Background SQS consumer with an in-memory event index.
+
+One daemon thread per queue long-polls continuously, parses each body with
+the same rules as the assertions (`_try_parse_body`), deletes it from the
+queue and indexes it by message attributes and selected JSON fields. Tests
+then wait on the index instead of polling SQS themselves, so N assertions
+against one queue cost zero extra AWS calls and never race each other for
+messages.
+
+    index = consumer_for(queue_url)
+    msg = index.wait_for(round_id=round_id, event="spin_settled", timeout_s=5)
+
+Memory is bounded: past `max_messages` the oldest indexed messages are
+evicted (claimed or not).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from botocore.exceptions import ClientError
+
+from framework.aws.sqs_assertions import _delete_batch, _receive_batch, _try_parse_body
+
+DEFAULT_INDEX_FIELDS = ("event", "event_type", "event_id", "round_id", "user_id")
+_MISSING_QUEUE_CODES = ("AWS.SimpleQueueService.NonExistentQueue", "QueueDoesNotExist")
+
+
+@dataclass
+class IndexedMessage:
+    message: dict[str, Any]
+    body: Any
+    keys: list[tuple[str, str]]
+    received_at: float = field(default_factory=time.monotonic)
+    claimed: bool = False
+
+
+def _index_keys(message: dict[str, Any], body: Any, fields: Iterable[str]) -> list[tuple[str, str]]:
+    keys: list[tuple[str, str]] = []
+    for name, attr in (message.get("MessageAttributes") or {}).items():
+        if "StringValue" in attr:
+            keys.append((name, attr["StringValue"]))
+    if isinstance(body, dict):
+        for name in fields:
+            value = body.get(name)
+            if value is not None and not isinstance(value, (dict, list)):
+                keys.append((name, str(value)))
+    return keys
+
+
+class SqsConsumer:
+    """Consumes `queue_url` on a background thread into a bounded index."""
+
+    def __init__(
+        self,
+        queue_url: str,
+        *,
+        index_fields: Iterable[str] = DEFAULT_INDEX_FIELDS,
+        max_messages: int = 10_000,
+        wait_s: int = 1,
+    ) -> None:
+        self.queue_url = queue_url
+        self.index_fields = tuple(index_fields)
+        self.max_messages = max_messages
+        self.wait_s = wait_s
+        self.received = 0
+        self.evicted = 0
+        self.last_error: str | None = None
+
+        self._messages: OrderedDict[str, IndexedMessage] = OrderedDict()
+        self._index: dict[tuple[str, str], dict[str, None]] = {}
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"sqs-consumer:{queue_url}", daemon=True)
+
+    # ── Lifecycle ───────────────────────────────────────────────────
+
+    def start(self) -> "SqsConsumer":
+        self._thread.start()
+        return self
+
+    def stop(self, timeout_s: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout_s)
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive() and not self._stop.is_set()
+
+    def _run(self) -> None:
+        backoff_s = 0.1
+        while not self._stop.is_set():
+            try:
+                batch = _receive_batch(self.queue_url, wait_s=self.wait_s)
+                if batch:
+                    _delete_batch(self.queue_url, batch)
+                    self._add(batch)
+                backoff_s = 0.1
+            except ClientError as exc:
+                code = exc.response.get("Error", {}).get("Code", "")
+                self.last_error = f"{code}: {exc}"
+                if code in _MISSING_QUEUE_CODES:
+                    break
+                self._stop.wait(backoff_s)
+                backoff_s = min(backoff_s * 2, 5.0)
+            except Exception as exc:  # noqa: BLE001 — keep consuming; surfaced via last_error
+                self.last_error = repr(exc)
+                self._stop.wait(backoff_s)
+                backoff_s = min(backoff_s * 2, 5.0)
+        with self._cond:
+            self._cond.notify_all()
+
+    # ── Index ───────────────────────────────────────────────────────
+
+    def _add(self, batch: list[dict[str, Any]]) -> None:
+        with self._cond:
+            for msg in batch:
+                msg_id = msg.get("MessageId", "")
+                if msg_id in self._messages:
+                    continue
+                body = _try_parse_body(msg.get("Body", ""))
+                entry = IndexedMessage(msg, body, _index_keys(msg, body, self.index_fields))
+                self._messages[msg_id] = entry
+                for key in entry.keys:
+                    self._index.setdefault(key, {})[msg_id] = None
+                self.received += 1
+            while len(self._messages) > self.max_messages:
+                self._evict_oldest()
+            self._cond.notify_all()
+
+    def _evict_oldest(self) -> None:
+        msg_id, entry = self._messages.popitem(last=False)
+        for key in entry.keys:
+            ids = self._index.get(key)
+            if ids is not None:
+                ids.pop(msg_id, None)
+                if not ids:
+                    del self._index[key]
+        self.evicted += 1
+
+    def _candidates(self, fields: dict[str, Any]) -> Iterable[str]:
+        if not fields:
+            return list(self._messages)
+        sets = [self._index.get((name, str(value)), {}) for name, value in fields.items()]
+        smallest = min(sets, key=len)
+        return [msg_id for msg_id in smallest if all(msg_id in s for s in sets)]
+
+    def find(
+        self,
+        predicate: Callable[[Any], bool] | None = None,
+        *,
+        include_claimed: bool = False,
+        **fields: Any,
+    ) -> list[dict[str, Any]]:
+        """Indexed messages matching `fields` (and `predicate` on the parsed
+        body), oldest first. Never touches SQS."""
+        with self._cond:
+            return [e.message for e in self._matches(predicate, fields, include_claimed)]
+
+    def _matches(
+        self, predicate: Callable[[Any], bool] | None, fields: dict[str, Any], include_claimed: bool
+    ) -> list[IndexedMessage]:
+        out = []
+        for msg_id in self._candidates(fields):
+            entry = self._messages[msg_id]
+            if entry.claimed and not include_claimed:
+                continue
+            if predicate is None or predicate(entry.body):
+                out.append(entry)
+        return out
+
+    def wait_for(
+        self,
+        predicate: Callable[[Any], bool] | None = None,
+        *,
+        timeout_s: float = 10.0,
+        claim: bool = True,
+        **fields: Any,
+    ) -> dict[str, Any]:
+        """Block until an unclaimed indexed message matches, then return it.
+
+        `fields` are equality filters on indexed keys (message attributes and
+        `index_fields` of the JSON body); `predicate` further filters the
+        parsed body. With `claim` the message is not handed to later waits.
+        """
+        deadline = time.monotonic() + timeout_s
+        with self._cond:
+            while True:
+                found = self._matches(predicate, fields, include_claimed=False)
+                if found:
+                    entry = found[0]
+                    entry.claimed = entry.claimed or claim
+                    return entry.message
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._thread.is_alive():
+                    break
+                self._cond.wait(remaining)
+
+        detail = f"; consumer error: {self.last_error}" if self.last_error else ""
+        raise AssertionError(
+            f"No indexed SQS message matched {fields or 'predicate'} within {timeout_s}s "
+            f"on {self.queue_url} (indexed {len(self._messages)} of {self.received} received{detail})"
+        )
+
+
+# ── Session registry ────────────────────────────────────────────────
+
+_consumers: dict[str, SqsConsumer] = {}
+_registry_lock = threading.Lock()
+
+
+def consumer_for(queue_url: str, **kwargs: Any) -> SqsConsumer:
+    """The running consumer for `queue_url`, started on first use.
+
+    Options only apply when the consumer is created.
+    """
+    with _registry_lock:
+        consumer = _consumers.get(queue_url)
+        if consumer is None or not consumer.running:
+            consumer = SqsConsumer(queue_url, **kwargs).start()
+            _consumers[queue_url] = consumer
+        return consumer
+
+
+def stop_consumer(queue_url: str) -> None:
+    with _registry_lock:
+        consumer = _consumers.pop(queue_url, None)
+    if consumer is not None:
+        consumer.stop()
+
+
+def stop_consumers() -> None:
+    """Stop every registered consumer — called at session teardown."""
+    with _registry_lock:
+        consumers = list(_consumers.values())
+        _consumers.clear()
+    for consumer in consumers:
+        consumer.stop()
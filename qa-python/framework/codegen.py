@@ -0,0 +1,381 @@
+"""Generate `framework/rgs_client.py` — a typed client — from backend/openapi.json.
+
+Usage:
+    python -m framework.codegen            # (re)write framework/rgs_client.py
+    python -m framework.codegen --check    # exit 1 if it is stale
+
+One method per operation, named `<verb>_<path>` (`post_spin`,
+`get_history_by_round_id`), with keyword arguments typed from the request
+schema, query and header parameters. Headers are pre-built per auth mode and
+path templates are f-strings, so a call goes straight to `ApiClient.send`
+without merging anything. Every operation with a body also gets
+`prepare_<name>(**fixed)`, returning a `PreparedCall` whose body template
+pre-encodes the fixed fields and patches only the volatile ones
+(`VOLATILE_FIELDS`) per call.
+
+Contract drift fails here rather than at request time: undeclared path
+parameters, non-object bodies, unknown schema types, name collisions and
+operations without a 2xx response all raise `CodegenError`. The generated
+file records the spec's sha256, and `tests/framework/test_codegen.py`
+fails when the committed client no longer matches the spec.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import keyword
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from framework.schemas import OPENAPI_PATH
+
+OUTPUT_PATH = Path(__file__).resolve().parent / "rgs_client.py"
+
+# Body fields that change on every call: patched into pre-encoded templates,
+# defaulted when omitted.
+VOLATILE_FIELDS = {"client_timestamp": "now_ms"}
+
+_METHODS = ("get", "post", "put", "patch", "delete")
+_SKIPPED_HEADERS = {"cookie"}  # the session's cookie jar owns these
+
+
+class CodegenError(Exception):
+    pass
+
+
+def _snake(name: str) -> str:
+    name = re.sub(r"[^0-9A-Za-z]+", "_", name)
+    name = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).lower().strip("_")
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+@dataclass
+class Arg:
+    name: str  # Python name
+    wire: str  # JSON field / query key / header name
+    annotation: str
+    required: bool
+    volatile: str | None = None  # default factory name for volatile body fields
+
+
+@dataclass
+class Operation:
+    name: str
+    method: str
+    path: str
+    summary: str
+    authed: bool
+    success: tuple[int, ...]
+    schema: str | None
+    path_args: list[Arg] = field(default_factory=list)
+    query_args: list[Arg] = field(default_factory=list)
+    header_args: list[Arg] = field(default_factory=list)
+    body_args: list[Arg] | None = None
+
+
+class _Spec:
+    def __init__(self, spec: dict[str, Any]) -> None:
+        self.spec = spec
+        self.components = spec.get("components", {}).get("schemas", {})
+
+    def resolve(self, schema: dict[str, Any], where: str) -> tuple[dict[str, Any], str | None]:
+        ref = schema.get("$ref")
+        if ref is None:
+            return schema, None
+        name = ref.rsplit("/", 1)[-1]
+        if not ref.startswith("#/components/schemas/") or name not in self.components:
+            raise CodegenError(f"{where}: unresolvable $ref {ref!r}")
+        return self.components[name], name
+
+    def annotation(self, schema: dict[str, Any], where: str) -> str:
+        schema, _name = self.resolve(schema, where)
+        if "enum" in schema:
+            out = f"Literal[{', '.join(json.dumps(v) for v in schema['enum'])}]"
+        else:
+            kind = schema.get("type")
+            if kind == "string":
+                out = "str"
+            elif kind == "integer":
+                out = "int"
+            elif kind == "number":
+                out = "float"
+            elif kind == "boolean":
+                out = "bool"
+            elif kind == "array":
+                out = f"list[{self.annotation(schema.get('items', {}), where + '[]')}]"
+            elif kind == "object" or "properties" in schema:
+                out = "dict[str, Any]"
+            else:
+                raise CodegenError(f"{where}: unsupported schema type {kind!r}")
+        return f"{out} | None" if schema.get("nullable") else out
+
+
+def _operation_name(method: str, path: str) -> str:
+    parts = []
+    for segment in path.removeprefix("/api/v1").strip("/").split("/"):
+        if segment.startswith("{") and segment.endswith("}"):
+            parts.append(f"by_{_snake(segment[1:-1])}")
+        elif segment:
+            parts.append(_snake(segment))
+    return "_".join([method, *parts])
+
+
+def parse(spec: dict[str, Any]) -> list[Operation]:
+    s = _Spec(spec)
+    ops: list[Operation] = []
+    seen: set[str] = set()
+    for path, item in spec.get("paths", {}).items():
+        for method in _METHODS:
+            raw = item.get(method)
+            if raw is None:
+                continue
+            where = f"{method.upper()} {path}"
+            name = _operation_name(method, path)
+            if name in seen:
+                raise CodegenError(f"{where}: method name {name!r} collides with another operation")
+            seen.add(name)
+
+            success = tuple(sorted(int(code) for code in raw.get("responses", {}) if code.startswith("2")))
+            if not success:
+                raise CodegenError(f"{where}: no 2xx response declared")
+            schema_name = None
+            content = raw["responses"][str(success[0])].get("content", {}).get("application/json")
+            if content is not None:
+                _schema, schema_name = s.resolve(content.get("schema", {}), where)
+
+            op = Operation(
+                name=name,
+                method=method.upper(),
+                path=path,
+                summary=" ".join((raw.get("summary") or "").split()),
+                authed=bool(raw.get("security", spec.get("security"))),
+                success=success,
+                schema=schema_name,
+            )
+            for param in raw.get("parameters", []):
+                param, _ = s.resolve(param, where)
+                loc, wire = param.get("in"), param["name"]
+                if loc == "header" and wire.lower() in _SKIPPED_HEADERS:
+                    continue
+                arg = Arg(
+                    name=_snake(wire),
+                    wire=wire,
+                    annotation=s.annotation(param.get("schema", {}), f"{where} {wire}"),
+                    required=bool(param.get("required")) or loc == "path",
+                )
+                {"path": op.path_args, "query": op.query_args, "header": op.header_args}.get(loc, []).append(arg)
+
+            declared = {a.wire for a in op.path_args}
+            templated = set(re.findall(r"{([^}]+)}", path))
+            if declared != templated:
+                raise CodegenError(f"{where}: path parameters {sorted(templated)} declared as {sorted(declared)}")
+
+            body = raw.get("requestBody", {}).get("content", {}).get("application/json")
+            if body is not None:
+                schema, _ = s.resolve(body.get("schema", {}), where)
+                if schema.get("type") != "object" or "properties" not in schema:
+                    raise CodegenError(f"{where}: request body is not a JSON object schema")
+                required = set(schema.get("required", []))
+                op.body_args = []
+                for wire, prop in schema["properties"].items():
+                    annotation = s.annotation(prop, f"{where} body.{wire}")
+                    volatile = VOLATILE_FIELDS.get(wire)
+                    if volatile is not None and annotation not in ("int", "float"):
+                        raise CodegenError(f"{where}: volatile field {wire!r} is {annotation}, expected a number")
+                    op.body_args.append(Arg(_snake(wire), wire, annotation, wire in required and not volatile, volatile))
+
+            names = [a.name for a in op.path_args + op.query_args + op.header_args + (op.body_args or [])]
+            dupes = sorted({n for n in names if names.count(n) > 1})
+            if dupes:
+                raise CodegenError(f"{where}: argument names collide: {dupes}")
+            ops.append(op)
+    return ops
+
+
+# ── Rendering ───────────────────────────────────────────────────────
+
+def _signature(args: list[Arg]) -> list[str]:
+    ordered = [a for a in args if a.required] + [a for a in args if not a.required]
+    return [
+        f"{a.name}: {a.annotation}," if a.required else f"{a.name}: {_optional(a.annotation)} = None,"
+        for a in ordered
+    ]
+
+
+def _optional(annotation: str) -> str:
+    return annotation if annotation.endswith("| None") else f"{annotation} | None"
+
+
+def _path_expr(op: Operation) -> str:
+    if not op.path_args:
+        return json.dumps(op.path)
+    by_wire = {a.wire: a.name for a in op.path_args}
+    return 'f"' + re.sub(r"{([^}]+)}", lambda m: f"{{quote(str({by_wire[m.group(1)]}), safe='')}}", op.path) + '"'
+
+
+def _headers_expr(op: Operation) -> str:
+    json_body = "True" if op.body_args is not None else "False"
+    return f"self._auth({json_body})" if op.authed else ("_ACCEPT_JSON" if op.body_args is not None else "_ACCEPT")
+
+
+def _body_dict(args: list[Arg]) -> str:
+    return "{" + ", ".join(f"{json.dumps(a.wire)}: {a.name}" for a in args) + "}"
+
+
+def _render_operation(op: Operation) -> list[str]:
+    path_part = op.path_args
+    kwargs = op.query_args + op.header_args + (op.body_args or [])
+    ok = ", ".join(str(c) for c in op.success)
+    doc = f"{op.method} {op.path}" + (f" — {op.summary}" if op.summary else "")
+    doc += f" ({ok}: {op.schema})" if op.schema else f" ({ok})"
+
+    lines = [f"    def {op.name}("]
+    lines.append("        self,")
+    lines += [f"        {a.name}: {a.annotation}," for a in path_part]
+    if kwargs:
+        lines.append("        *,")
+        lines += [f"        {line}" for line in _signature(kwargs)]
+    lines.append("    ) -> Response:")
+    lines.append(f'        """{doc}"""')
+    lines.append(f"        headers = {_headers_expr(op)}")
+    for a in op.header_args:
+        lines.append(f"        if {a.name} is not None:")
+        lines.append(f"            headers = {{**headers, {json.dumps(a.wire)}: {a.name}}}")
+    call = [f'"{op.method}"', _path_expr(op), "headers=headers"]
+    if op.query_args:
+        pairs = ", ".join(f"({json.dumps(a.wire)}, {a.name})" for a in op.query_args)
+        lines.append(f"        params = {{k: v for k, v in ({pairs},) if v is not None}}")
+        call.append("params=params")
+    if op.body_args is not None:
+        fields = ", ".join(
+            f"{json.dumps(a.wire)}: {a.volatile}() if {a.name} is None else {a.name}" if a.volatile else f"{json.dumps(a.wire)}: {a.name}"
+            for a in op.body_args
+        )
+        lines.append(f"        body = encode_body({{{fields}}})")
+        call.append("data=body")
+    lines.append(f"        return self.api.send({', '.join(call)})")
+
+    if op.body_args is not None:
+        fixed = [a for a in op.body_args if not a.volatile]
+        volatile = [a for a in op.body_args if a.volatile]
+        call_kwargs = [f"`{a.name}`" for a in volatile + op.header_args]
+        lines.append("")
+        lines.append(f"    def prepare_{op.name}(")
+        lines.append("        self,")
+        lines += [f"        {a.name}: {a.annotation}," for a in path_part]
+        if fixed:
+            lines.append("        *,")
+            lines += [f"        {line}" for line in _signature(fixed)]
+        lines.append("    ) -> PreparedCall:")
+        pdoc = f"`{op.name}` with the body pre-encoded"
+        pdoc += f"; call with {', '.join(call_kwargs)}." if call_kwargs else "."
+        lines.append(f'        """{pdoc}"""')
+        volatile_map = "{" + ", ".join(f"{json.dumps(a.wire)}: {a.volatile}" for a in volatile) + "}"
+        fixed_dict = "{" + ", ".join(f"{json.dumps(a.wire)}: {a.name}" for a in fixed) + "}"
+        if any(not a.required for a in fixed):
+            fixed_dict = f"{{k: v for k, v in {fixed_dict}.items() if v is not None}}"
+        lines.append(f"        template = BodyTemplate({fixed_dict}, {volatile_map})")
+        header_map = "{" + ", ".join(f"{json.dumps(a.name)}: {json.dumps(a.wire)}" for a in op.header_args) + "}"
+        lines.append(
+            f'        return PreparedCall(self.api, "{op.method}", {_path_expr(op)}, {_headers_expr(op)}, template, {header_map})'
+        )
+    return lines
+
+
+def render(spec_bytes: bytes) -> str:
+    ops = parse(json.loads(spec_bytes))
+    digest = hashlib.sha256(spec_bytes).hexdigest()
+    out = [
+        '"""Typed client for the SlotsOne RGS API.',
+        "",
+        "Generated by `python -m framework.codegen` from backend/openapi.json — do",
+        "not edit; regenerate after changing the contract.",
+        '"""',
+        "",
+        "from __future__ import annotations",
+        "",
+        "from typing import Any, Literal, NamedTuple",
+        "from urllib.parse import quote",
+        "",
+        "from framework.api_client import ApiClient, ApiResponse, RawApiResponse",
+        "from framework.request_templates import BodyTemplate, PreparedCall, encode_body, now_ms",
+        "",
+        f'SPEC_SHA256 = "{digest}"',
+        "",
+        "Response = ApiResponse | RawApiResponse",
+        "",
+        '_ACCEPT = {"Accept": "application/json"}',
+        '_ACCEPT_JSON = {"Accept": "application/json", "Content-Type": "application/json"}',
+        "",
+        "",
+        "class Operation(NamedTuple):",
+        "    method: str",
+        "    path: str",
+        "    success: tuple[int, ...]",
+        "    schema: str | None",
+        "",
+        "",
+        "OPERATIONS: dict[str, Operation] = {",
+    ]
+    for op in ops:
+        out.append(
+            f'    "{op.name}": Operation("{op.method}", {json.dumps(op.path)}, {op.success!r}, '
+            f"{json.dumps(op.schema) if op.schema else 'None'}),"
+        )
+    out += [
+        "}",
+        "",
+        "",
+        "class RgsClient:",
+        '    """One method per OpenAPI operation, sending through `ApiClient.send`."""',
+        "",
+        "    def __init__(self, api: ApiClient) -> None:",
+        "        self.api = api",
+        "        self._token: str | None = None",
+        "        self._headers = (_ACCEPT, _ACCEPT_JSON)",
+        "",
+        "    def _auth(self, json_body: bool) -> dict[str, str]:",
+        "        token = self.api.token",
+        "        if token != self._token:",
+        "            self._token = token",
+        '            bearer = {"Authorization": f"Bearer {token}"} if token else {}',
+        "            self._headers = ({**_ACCEPT, **bearer}, {**_ACCEPT_JSON, **bearer})",
+        "        return self._headers[json_body]",
+    ]
+    for op in ops:
+        out.append("")
+        out += _render_operation(op)
+    return "\n".join(out) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spec", type=Path, default=OPENAPI_PATH)
+    parser.add_argument("--out", type=Path, default=OUTPUT_PATH)
+    parser.add_argument("--check", action="store_true", help="fail if --out differs from what the spec generates")
+    args = parser.parse_args(argv)
+
+    try:
+        source = render(args.spec.read_bytes())
+    except CodegenError as exc:
+        print(f"codegen: {exc}", file=sys.stderr)
+        return 2
+    current = args.out.read_text() if args.out.exists() else ""
+    if args.check:
+        if current != source:
+            print(f"codegen: {args.out} is stale — run `python -m framework.codegen`", file=sys.stderr)
+            return 1
+        return 0
+    if current != source:
+        args.out.write_text(source)
+        print(f"wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
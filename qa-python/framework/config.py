@@ -17,6 +17,7 @@ class Settings:
     default_game_id: str
     request_timeout_s: float
     smoke_response_budget_ms: int
+    phase_timing: bool
 
     @classmethod
     def from_env(cls) -> "Settings":
@@ -28,6 +29,7 @@ class Settings:
             default_game_id=os.getenv("DEFAULT_GAME_ID", "slot_mega_fortune_001"),
             request_timeout_s=float(os.getenv("REQUEST_TIMEOUT_S", "10")),
             smoke_response_budget_ms=int(os.getenv("SMOKE_RESPONSE_BUDGET_MS", "1500")),
+            phase_timing=os.getenv("API_PHASE_TIMING", "0") == "1",
         )
 
 
@@ -0,0 +1,23 @@
+"""An in-process stand-in for the backend, for running the suite offline.
+
+`FakeRgs` implements the routes in the OpenAPI contract — auth with refresh
+cookies, slot init/spin, history and summary, provably-fair seed rotation,
+wallet top-up, and European and American roulette — over in-memory stores,
+using Python ports of the backend's engines (`framework.fake_rgs.engines`)
+so outcomes for a given seed pair and nonce match the real service.
+
+    server = FakeRgsServer().start()      # or: python -m framework.fake_rgs --port 3001
+    # API_BASE_URL=server.base_url; tests/api runs unchanged
+    server.stop()
+
+`FakeRgs.handle` can also be called directly, without a socket.
+"""
+
+from framework.fake_rgs.app import FakeRgs, HttpError
+from framework.fake_rgs.server import FakeRgsServer
+
+__all__ = [
+    "FakeRgs",
+    "FakeRgsServer",
+    "HttpError",
+]
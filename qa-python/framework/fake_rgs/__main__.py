@@ -0,0 +1,24 @@
+import argparse
+
+from framework.fake_rgs import FakeRgs, FakeRgsServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the in-memory fake backend.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument(
+        "--spin-rate-limit", type=int, default=0, help="spins per second per user (0 = unlimited, the default)"
+    )
+    args = parser.parse_args()
+
+    server = FakeRgsServer(FakeRgs(spin_rate_limit=args.spin_rate_limit), args.host, args.port)
+    print(f"fake RGS listening on {server.base_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
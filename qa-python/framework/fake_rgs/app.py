@@ -0,0 +1,958 @@
+"""The fake backend's state and route handlers, independent of any socket.
+
+`FakeRgs.handle(method, target, headers, body)` takes one parsed HTTP
+request (header names lower-cased) and returns `(status, body, headers)`.
+Handlers follow `backend/src/routes/*.ts` and `store.ts` step for step —
+same validation order, status codes, error codes and response shapes — over
+plain in-memory stores instead of Postgres:
+
+  users         email -> user, refresh tokens rotated on use
+  players       per user: wallet, active seed pair, round index, recent numbers
+  sessions      session_id -> owner, game, expiry (1h)
+  idempotency   "<user>:<key>" -> fingerprint + stored response (24h)
+
+Each player's rounds are kept in creation order with prefix sums (and a
+running maximum) of bet and win cents, plus a separate list of winning
+rounds, so `/history` and `/history/summary` bisect the date range and
+answer the result filter without scanning. The bet-size filters, and the
+biggest win after a `date_from`, fall back to a scan of the range.
+
+Deviations, all invisible to a client: tokens are HS256-signed with a
+per-instance secret instead of RS256, passwords are salted SHA-256 instead
+of scrypt, and the spin rate limit (5/s per user on the backend) is off
+unless `spin_rate_limit` is given.
+"""
+
+from __future__ import annotations
+
+import base64
+import bisect
+import hashlib
+import hmac
+import json
+import re
+import secrets
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Mapping
+from urllib.parse import parse_qsl
+
+from framework.fake_rgs import engines
+from framework.fake_rgs.engines import RouletteTable, from_cents, js_number, to_cents
+
+ACCESS_TOKEN_TTL = 900
+REFRESH_TOKEN_TTL = 7 * 24 * 60 * 60
+SESSION_TTL_MS = 60 * 60 * 1000
+IDEMPOTENCY_TTL_MS = 24 * 60 * 60 * 1000
+DEFAULT_BALANCE_CENTS = 100_000
+HISTORY_MAX_LIMIT = 100
+JSON_HEADERS: list[tuple[str, str]] = []
+
+Reply = tuple[int, bytes | None, list[tuple[str, str]]]
+
+_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+_UUID = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.I)
+# zod's `.email()` pattern
+_EMAIL = re.compile(
+    r"^(?!\.)(?!.*\.\.)([A-Za-z0-9_'+\-.]*)[A-Za-z0-9_+-]@([A-Za-z0-9][A-Za-z0-9\-]*\.)+[A-Za-z]{2,}$"
+)
+_COOKIE_PATH = "/api/v1/auth"
+
+
+class HttpError(Exception):
+    """Maps to the backend's `{error, code}` body with `status`."""
+
+    def __init__(self, status: int, error: str, code: str) -> None:
+        super().__init__(error)
+        self.status = status
+        self.error = error
+        self.code = code
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _iso(ms: int) -> str:
+    return datetime.fromtimestamp(ms / 1000, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.") + f"{ms % 1000:03d}Z"
+
+
+def _b64url(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _b64url_json(segment: str) -> Any:
+    try:
+        return json.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    except ValueError:
+        return None
+
+
+# ── zod-equivalent checks ───────────────────────────────────────────
+
+
+def _is_num(value: Any) -> bool:
+    return type(value) is float or type(value) is int
+
+
+def _is_int(value: Any) -> bool:
+    return type(value) is int or (type(value) is float and value.is_integer())
+
+
+def _is_str(value: Any, min_len: int = 0) -> bool:
+    return type(value) is str and len(value) >= min_len
+
+
+def _strict(body: Any, allowed: frozenset[str]) -> bool:
+    return type(body) is dict and body.keys() <= allowed
+
+
+# ── Stores ──────────────────────────────────────────────────────────
+
+
+class SeedPair:
+    __slots__ = ("id", "server_seed", "server_seed_hash", "client_seed", "nonce", "active")
+
+    def __init__(self) -> None:
+        self.id = str(uuid.uuid4())
+        self.server_seed = engines.generate_server_seed()
+        self.server_seed_hash = engines.hash_server_seed(self.server_seed)
+        self.client_seed = "default"
+        self.nonce = 0
+        self.active = True
+
+    def public(self) -> dict[str, Any]:
+        return {
+            "seed_pair_id": self.id,
+            "server_seed_hash": self.server_seed_hash,
+            "client_seed": self.client_seed,
+            "nonce": self.nonce,
+        }
+
+
+class Round:
+    __slots__ = (
+        "id", "session_id", "game_id", "seed_pair", "nonce", "bet_cents", "win_cents", "currency",
+        "lines", "balance_before", "balance_after", "balance_after_bet", "reel_matrix", "breakdown",
+        "bonus", "outcome_hash", "created_ms", "roulette_bets", "_tx_ids", "_item",
+    )  # fmt: skip
+
+    @property
+    def created_at(self) -> str:
+        return _iso(self.created_ms)
+
+    def transaction_ids(self) -> tuple[str, str]:
+        """Ids of the bet and win ledger rows, minted when first shown."""
+        if self._tx_ids is None:
+            self._tx_ids = (str(uuid.uuid4()), str(uuid.uuid4()))
+        return self._tx_ids
+
+    def history_item(self) -> bytes:
+        """The round as a `SpinResponse`, as `getHistory` maps it; encoded once."""
+        if self._item is None:
+            self._item = _encode(
+                {
+                    "spin_id": self.id,
+                    "session_id": self.session_id,
+                    "game_id": self.game_id,
+                    "balance": {"amount": from_cents(self.balance_after), "currency": self.currency},
+                    "bet": {"amount": from_cents(self.bet_cents), "currency": self.currency, "lines": self.lines},
+                    "outcome": {
+                        "reel_matrix": self.reel_matrix,
+                        "win": {
+                            "amount": from_cents(self.win_cents),
+                            "currency": self.currency,
+                            "breakdown": self.breakdown,
+                        },
+                        "bonus_triggered": self.bonus,
+                    },
+                    "next_state": "free_spins" if self.bonus else "base_game",
+                    "timestamp": self.created_ms,
+                }
+            ).encode()
+        return self._item
+
+
+class RoundIndex:
+    """One player's rounds, oldest first, with the aggregates history needs."""
+
+    def __init__(self) -> None:
+        self.rounds: list[Round] = []
+        self.created: list[int] = []
+        self.bets: list[int] = []
+        self.wins: list[int] = []
+        self.cum_bet = [0]
+        self.cum_win = [0]
+        self.max_win = [0]  # max_win[i] == max(wins[:i])
+        self.winners: list[int] = []  # positions with win > bet
+        self.winners_cum_bet = [0]
+        self.winners_cum_win = [0]
+        self.winners_max_win = [0]
+        self.by_id: dict[str, Round] = {}
+
+    def add(self, rnd: Round) -> None:
+        pos = len(self.rounds)
+        self.rounds.append(rnd)
+        self.created.append(rnd.created_ms)
+        self.bets.append(rnd.bet_cents)
+        self.wins.append(rnd.win_cents)
+        self.cum_bet.append(self.cum_bet[-1] + rnd.bet_cents)
+        self.cum_win.append(self.cum_win[-1] + rnd.win_cents)
+        self.max_win.append(max(self.max_win[-1], rnd.win_cents))
+        if rnd.win_cents > rnd.bet_cents:
+            self.winners.append(pos)
+            self.winners_cum_bet.append(self.winners_cum_bet[-1] + rnd.bet_cents)
+            self.winners_cum_win.append(self.winners_cum_win[-1] + rnd.win_cents)
+            self.winners_max_win.append(max(self.winners_max_win[-1], rnd.win_cents))
+        self.by_id[rnd.id] = rnd
+
+    def query(
+        self,
+        date_from: int | None,
+        date_to: int | None,
+        result: str | None,
+        min_bet: int | None,
+        max_bet: int | None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> tuple[list[Round], dict[str, Any]]:
+        """Newest-first page (when `limit` is given) and the summary."""
+        lo = 0 if date_from is None else bisect.bisect_left(self.created, date_from)
+        hi = len(self.rounds) if date_to is None else bisect.bisect_right(self.created, date_to)
+        hi = max(lo, hi)
+        w_lo = bisect.bisect_left(self.winners, lo)
+        w_hi = bisect.bisect_left(self.winners, hi)
+
+        if min_bet is None and max_bet is None and result != "loss":
+            if result == "win":
+                positions: Any = self.winners[w_lo:w_hi]
+                count = w_hi - w_lo
+                wagered = self.winners_cum_bet[w_hi] - self.winners_cum_bet[w_lo]
+                won = self.winners_cum_win[w_hi] - self.winners_cum_win[w_lo]
+                if w_lo == 0:
+                    biggest = self.winners_max_win[w_hi]
+                else:
+                    biggest = max((self.wins[i] for i in positions), default=0)
+            else:
+                positions = range(lo, hi)
+                count = hi - lo
+                wagered = self.cum_bet[hi] - self.cum_bet[lo]
+                won = self.cum_win[hi] - self.cum_win[lo]
+                biggest = self.max_win[hi] if lo == 0 else max(self.wins[lo:hi], default=0)
+        else:
+            winners = set(self.winners[w_lo:w_hi]) if result else ()
+            positions = [
+                i
+                for i in range(lo, hi)
+                if (result is None or (i in winners) == (result == "win"))
+                and (min_bet is None or self.bets[i] >= min_bet)
+                and (max_bet is None or self.bets[i] <= max_bet)
+            ]
+            count = len(positions)
+            wagered = sum(self.bets[i] for i in positions)
+            won = sum(self.wins[i] for i in positions)
+            biggest = max((self.wins[i] for i in positions), default=0)
+
+        page = []
+        if limit is not None and offset < count:
+            page = [self.rounds[i] for i in positions[max(0, count - offset - limit) : count - offset][::-1]]
+        summary = {
+            "total_rounds": count,
+            "total_wagered": from_cents(wagered),
+            "total_won": from_cents(won),
+            "net_result": from_cents(won - wagered),
+            "biggest_win": from_cents(biggest),
+        }
+        return page, summary
+
+
+class Player:
+    __slots__ = ("id", "balance_cents", "seed_pair", "rounds", "recent_numbers", "rate_reset_ms", "rate_count")
+
+    def __init__(self, user_id: str) -> None:
+        self.id = user_id
+        self.balance_cents = DEFAULT_BALANCE_CENTS
+        self.seed_pair: SeedPair | None = None
+        self.rounds = RoundIndex()
+        self.recent_numbers: deque[int] = deque(maxlen=20)
+        self.rate_reset_ms = 0
+        self.rate_count = 0
+
+    def active_seed_pair(self) -> SeedPair:
+        if self.seed_pair is None:
+            self.seed_pair = SeedPair()
+        return self.seed_pair
+
+
+class Session:
+    __slots__ = ("user_id", "game_id", "expires_ms")
+
+    def __init__(self, user_id: str, game_id: str, expires_ms: int) -> None:
+        self.user_id = user_id
+        self.game_id = game_id
+        self.expires_ms = expires_ms
+
+
+# ── App ─────────────────────────────────────────────────────────────
+
+Handler = Callable[["FakeRgs", str, Mapping[str, str], str, bytes], Reply]
+
+
+class FakeRgs:
+    def __init__(self, *, spin_rate_limit: int = 0, secret: bytes | None = None) -> None:
+        self.spin_rate_limit = spin_rate_limit
+        self._secret = secret or secrets.token_bytes(32)
+        self.users: dict[str, tuple[str, str, str]] = {}  # email -> (user_id, salt, password hash)
+        self.players: dict[str, Player] = {}
+        self.sessions: dict[str, Session] = {}
+        self.refresh_tokens: dict[str, tuple[str, float]] = {}
+        self.idempotency: dict[str, tuple[str, bytes, int]] = {}
+        self._verified: dict[str, tuple[str, int]] = {}  # token -> (user_id, exp)
+        self.requests = 0
+
+    # ── plumbing ──
+
+    def handle(self, method: str, target: str, headers: Mapping[str, str], body: bytes) -> Reply:
+        self.requests += 1
+        path, _, query = target.partition("?")
+        route = _ROUTES.get((method, path))
+        if route is None and method == "GET" and path.startswith("/api/v1/history/"):
+            route = FakeRgs._round_detail
+        if route is None:
+            return _error(404, "Not found", "not_found")
+        try:
+            return route(self, path, headers, query, body)
+        except _RateLimited as exc:
+            status, payload, _headers = _error(exc.status, exc.error, exc.code)
+            return status, payload, [("Retry-After", str(exc.retry_after))]
+        except HttpError as exc:
+            return _error(exc.status, exc.error, exc.code)
+
+    def _body(self, body: bytes) -> Any:
+        # express.json() parse failures reach the app's catch-all handler as 500s
+        if not body:
+            return {}
+        try:
+            return json.loads(body)
+        except ValueError:
+            raise HttpError(500, "Internal server error", "internal_error") from None
+
+    def _player(self, user_id: str) -> Player:
+        player = self.players.get(user_id)
+        if player is None:
+            player = self.players[user_id] = Player(user_id)
+        return player
+
+    def _authenticate(self, headers: Mapping[str, str]) -> Player:
+        """`middleware/auth.ts`, with verified tokens cached until they expire."""
+        auth = headers.get("authorization")
+        if not auth or not auth.startswith("Bearer "):
+            raise HttpError(401, "Unauthorized", "missing_token")
+        token = auth[7:].strip()
+        cached = self._verified.get(token)
+        now = int(time.time())
+        if cached is None:
+            parts = token.split(".")
+            if len(parts) != 3:
+                raise HttpError(401, "Unauthorized", "invalid_token")
+            header, payload = _b64url_json(parts[0]), _b64url_json(parts[1])
+            if type(header) is not dict or type(payload) is not dict or not _is_str(payload.get("sub"), 1):
+                raise HttpError(401, "Unauthorized", "invalid_token")
+            if header.get("alg") != "HS256":
+                raise HttpError(401, "Unauthorized", "invalid_token_alg")
+            if not hmac.compare_digest(parts[2], self._sign(f"{parts[0]}.{parts[1]}")):
+                raise HttpError(401, "Unauthorized", "invalid_token_signature")
+            exp = payload.get("exp")
+            cached = (payload["sub"], exp if type(exp) is int else 2**62)
+            if len(self._verified) > 100_000:
+                self._verified.clear()
+            self._verified[token] = cached
+        if now >= cached[1]:
+            raise HttpError(401, "Unauthorized", "token_expired")
+        return self._player(cached[0])
+
+    def _sign(self, signing_input: str) -> str:
+        return _b64url(hmac.new(self._secret, signing_input.encode(), hashlib.sha256).digest())
+
+    def issue_token(self, user_id: str, ttl: int = ACCESS_TOKEN_TTL) -> str:
+        now = int(time.time())
+        header = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+        payload = _b64url(
+            _encode(
+                {"sub": user_id, "iss": "slotsone-dev", "aud": "slotsone-client", "iat": now, "exp": now + ttl}
+            ).encode()
+        )
+        return f"{header}.{payload}.{self._sign(f'{header}.{payload}')}"
+
+    def _auth_reply(self, user_id: str, status: int = 200) -> Reply:
+        refresh = secrets.token_hex(32)
+        self.refresh_tokens[refresh] = (user_id, time.time() + REFRESH_TOKEN_TTL)
+        body = {"access_token": self.issue_token(user_id), "token_type": "Bearer", "expires_in": ACCESS_TOKEN_TTL}
+        cookie = f"refresh_token={refresh}; Max-Age={REFRESH_TOKEN_TTL}; Path={_COOKIE_PATH}; HttpOnly; SameSite=Lax"
+        return status, _encode(body).encode(), [("Set-Cookie", cookie)]
+
+    def _session(self, player: Player, session_id: str, game_id: str) -> Session:
+        session = self.sessions.get(session_id)
+        if session is None or session.expires_ms <= _now_ms():
+            raise HttpError(403, "Session not found or expired", "session_expired")
+        if session.user_id != player.id:
+            raise HttpError(403, "Forbidden", "forbidden")
+        if session.game_id != game_id:
+            raise HttpError(400, "Invalid game for session", "invalid_game_id")
+        return session
+
+    def _new_session(self, player: Player, game_id: str) -> tuple[str, int]:
+        session_id = f"sess_{str(uuid.uuid4())[:12]}"
+        expires = _now_ms() + SESSION_TTL_MS
+        self.sessions[session_id] = Session(player.id, game_id, expires)
+        return session_id, expires
+
+    def _replayed(self, player: Player, key: str | None, fingerprint: str) -> bytes | None:
+        if not key:
+            return None
+        entry = self.idempotency.get(f"{player.id}:{key}")
+        if entry is None:
+            return None
+        if entry[2] <= _now_ms() - IDEMPOTENCY_TTL_MS:
+            del self.idempotency[f"{player.id}:{key}"]
+            return None
+        if entry[0] != fingerprint:
+            raise HttpError(409, "Idempotency key reused with different request payload", "idempotency_key_reused")
+        return entry[1]
+
+    def _charge(self, player: Player, bet_cents: int) -> None:
+        if player.balance_cents < bet_cents:
+            raise HttpError(422, "insufficient_balance", "insufficient_balance")
+        if self.spin_rate_limit:
+            now = _now_ms()
+            if player.rate_reset_ms <= now:
+                player.rate_reset_ms, player.rate_count = now + 1000, 0
+            player.rate_count += 1
+            if player.rate_count > self.spin_rate_limit:
+                retry = max(1, -(-(player.rate_reset_ms - now) // 1000))
+                raise _RateLimited(retry)
+
+    def _settle(
+        self,
+        player: Player,
+        session_id: str,
+        game_id: str,
+        bet_cents: int,
+        play: Callable[[int], dict[str, Any]],
+    ) -> tuple[Round, dict[str, Any]]:
+        """Seed, debit, play, credit and record, in `executeSpin`'s order."""
+        pair = player.active_seed_pair()
+        pair.nonce += 1
+        nonce = pair.nonce
+        outcome = play(engines.derive_spin_seed(pair.server_seed, pair.client_seed, nonce))
+        win_cents = to_cents(outcome["win"]["amount"])
+        before = player.balance_cents
+        player.balance_cents -= bet_cents
+        after_bet = player.balance_cents
+        player.balance_cents += win_cents
+
+        now = _now_ms()
+        rnd = Round()
+        rnd.id = str(uuid.uuid4())
+        rnd.session_id = session_id
+        rnd.game_id = game_id
+        rnd.seed_pair = pair
+        rnd.nonce = nonce
+        rnd.bet_cents = bet_cents
+        rnd.win_cents = win_cents
+        rnd.currency = engines.CURRENCY
+        rnd.balance_before = before
+        rnd.balance_after = player.balance_cents
+        rnd.balance_after_bet = after_bet
+        rnd.breakdown = outcome["win"]["breakdown"]
+        rnd.created_ms = now
+        rnd._tx_ids = None
+        rnd.roulette_bets = None
+        rnd._item = None
+        return rnd, outcome
+
+    # ── /health, /ready ──
+
+    def _health(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        return 200, b'{"status":"ok"}', JSON_HEADERS
+
+    def _ready(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        return 200, b'{"status":"ready","checks":{"database":{"status":"ok","latency_ms":0}}}', JSON_HEADERS
+
+    # ── /api/v1/auth ──
+
+    def _credentials(self, body: bytes) -> tuple[str, str]:
+        data = self._body(body)
+        if (
+            not _strict(data, frozenset(("email", "password")))
+            or not _is_str(data.get("email"))
+            or not _EMAIL.match(data["email"])
+            or not _is_str(data.get("password"), 8)
+        ):
+            raise HttpError(400, "Invalid request", "invalid_body")
+        return data["email"].lower(), data["password"]
+
+    @staticmethod
+    def _hash_password(salt: str, password: str) -> str:
+        return hashlib.sha256(f"{salt}:{password}".encode()).hexdigest()
+
+    def _register(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        email, password = self._credentials(body)
+        if email in self.users:
+            raise HttpError(409, "Email already registered", "email_taken")
+        user_id, salt = str(uuid.uuid4()), secrets.token_hex(8)
+        self.users[email] = (user_id, salt, self._hash_password(salt, password))
+        return self._auth_reply(user_id, 201)
+
+    def _login(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        email, password = self._credentials(body)
+        user = self.users.get(email)
+        if user is None or not hmac.compare_digest(user[2], self._hash_password(user[1], password)):
+            raise HttpError(401, "Invalid credentials", "invalid_credentials")
+        return self._auth_reply(user[0])
+
+    def _consume_refresh(self, headers: Mapping[str, str]) -> tuple[str | None, str | None]:
+        token = None
+        for part in headers.get("cookie", "").split(";"):
+            name, eq, value = part.partition("=")
+            if eq and name.strip() == "refresh_token":
+                token = value.strip()
+                break
+        if token is None:
+            return None, None
+        entry = self.refresh_tokens.pop(token, None)
+        if entry is None or entry[1] <= time.time():
+            return token, None
+        return token, entry[0]
+
+    def _refresh(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        token, user_id = self._consume_refresh(headers)
+        if token is None:
+            raise HttpError(401, "No refresh token", "missing_refresh_token")
+        if user_id is None:
+            status, payload, extra = _error(401, "Invalid or expired refresh token", "invalid_refresh_token")
+            return status, payload, [("Set-Cookie", _CLEAR_COOKIE)]
+        return self._auth_reply(user_id)
+
+    def _logout(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        _token, user_id = self._consume_refresh(headers)
+        if user_id is not None:
+            for token in [t for t, (owner, _exp) in self.refresh_tokens.items() if owner == user_id]:
+                del self.refresh_tokens[token]
+        return 204, None, [("Set-Cookie", _CLEAR_COOKIE)]
+
+    # ── /api/v1/game, /spin ──
+
+    def _game_init(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        player = self._authenticate(headers)
+        data = self._body(body)
+        if not _strict(data, _INIT_FIELDS) or not all(_is_str(v, 1) for v in data.values()):
+            raise HttpError(400, "Invalid request", "invalid_body")
+        game_id = data.get("game_id", engines.GAME_ID)
+        session_id, expires = self._new_session(player, game_id)
+        reply = {
+            "session_id": session_id,
+            "game_id": game_id,
+            # like `getConfig`, games without an engine here get Mega Fortune's config
+            "config": engines.SLOT_CONFIG,
+            "balance": {"amount": from_cents(player.balance_cents), "currency": engines.CURRENCY},
+            "idle_matrix": engines.idle_matrix(),
+            "expires_at": _iso(expires),
+        }
+        return 200, _encode(reply).encode(), JSON_HEADERS
+
+    def _spin(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        player = self._authenticate(headers)
+        data = self._body(body)
+        bet = data.get("bet") if type(data) is dict else None
+        if (
+            not _strict(data, _SPIN_FIELDS)
+            or not _is_str(data.get("session_id"), 1)
+            or not _is_str(data.get("game_id"), 1)
+            or not _is_int(data.get("client_timestamp"))
+            or not _strict(bet, _BET_FIELDS)
+            or not _is_num(bet.get("amount"))
+            or not _is_str(bet.get("currency"), 1)
+            or not _is_int(bet.get("lines"))
+        ):
+            raise HttpError(400, "Invalid request", "invalid_body")
+        session_id, game_id = data["session_id"], data["game_id"]
+        amount, currency, lines = bet["amount"], bet["currency"], int(bet["lines"])
+        if amount < 0:
+            raise HttpError(400, "Invalid bet amount", "invalid_bet")
+
+        self._session(player, session_id, game_id)
+        if game_id != engines.GAME_ID:
+            raise HttpError(400, "Unknown slot game", "invalid_request")
+        if amount < engines.MIN_BET or amount > engines.MAX_BET:
+            raise HttpError(422, "Bet amount out of range", "invalid_bet")
+        if currency != engines.CURRENCY:
+            raise HttpError(422, "Invalid currency", "invalid_currency")
+        if not 1 <= lines <= engines.PAYLINES:
+            raise HttpError(422, "Invalid lines count", "invalid_lines")
+
+        key = headers.get("idempotency-key")
+        fingerprint = f"{session_id}|{game_id}|{amount:.2f}|{currency}|{lines}"
+        stored = self._replayed(player, key, fingerprint)
+        if stored is not None:
+            return 200, stored, JSON_HEADERS
+        bet_cents = to_cents(amount)
+        self._charge(player, bet_cents)
+
+        rnd, outcome = self._settle(
+            player, session_id, game_id, bet_cents, lambda seed: engines.run_spin(amount, currency, lines, seed)
+        )
+        rnd.lines = lines
+        rnd.reel_matrix = outcome["reel_matrix"]
+        rnd.bonus = outcome["bonus_triggered"]
+        # the outcome's JSON is both hashed and sent, so encode it once
+        outcome_json = _encode(outcome).encode()
+        rnd.outcome_hash = hashlib.sha256(outcome_json).hexdigest()
+        player.rounds.add(rnd)
+
+        head = _encode(
+            {
+                "spin_id": rnd.id,
+                "session_id": session_id,
+                "game_id": game_id,
+                "balance": {"amount": from_cents(rnd.balance_after), "currency": currency},
+                "bet": {"amount": amount, "currency": currency, "lines": lines},
+            }
+        ).encode()
+        next_state = b"free_spins" if outcome["bonus_triggered"] else b"base_game"
+        reply = b'%s,"outcome":%s,"next_state":"%s","timestamp":%d}' % (
+            head[:-1],
+            outcome_json,
+            next_state,
+            rnd.created_ms,
+        )
+        if key:
+            self.idempotency[f"{player.id}:{key}"] = (fingerprint, reply, rnd.created_ms)
+        return 200, reply, JSON_HEADERS
+
+    # ── /api/v1/roulette, /api/v1/american-roulette ──
+
+    def _roulette_init(self, table: RouletteTable, headers: Mapping[str, str]) -> Reply:
+        player = self._authenticate(headers)
+        session_id, expires = self._new_session(player, table.game_id)
+        reply = {
+            "session_id": session_id,
+            "game_id": table.game_id,
+            "config": table.config,
+            "balance": {"amount": from_cents(player.balance_cents), "currency": engines.CURRENCY},
+            "recent_numbers": list(reversed(player.recent_numbers)),
+            "expires_at": _iso(expires),
+        }
+        return 200, _encode(reply).encode(), JSON_HEADERS
+
+    def _roulette_spin(self, table: RouletteTable, headers: Mapping[str, str], body: bytes) -> Reply:
+        player = self._authenticate(headers)
+        data = self._body(body)
+        bets = data.get("bets") if type(data) is dict else None
+        if (
+            not _strict(data, _ROULETTE_FIELDS)
+            or not _is_str(data.get("session_id"))
+            or not _is_str(data.get("game_id", ""))
+            or not _is_num(data.get("client_timestamp", 0))
+            or type(bets) is not list
+            or not 1 <= len(bets) <= 200
+            or not all(self._bet_ok(table, b) for b in bets)
+        ):
+            raise HttpError(400, "Invalid request", "invalid_body")
+        session_id = data["session_id"]
+        game_id = data.get("game_id", table.game_id)
+        bets = [{"type": b["type"], "numbers": [int(n) for n in b["numbers"]], "amount": b["amount"]} for b in bets]
+        total_bet = sum(b["amount"] for b in bets)
+
+        self._session(player, session_id, game_id)
+        error = table.validate(bets)
+        if error:
+            raise HttpError(400, error, "invalid_bet" if error == "Total bet exceeds limit" else "invalid_request")
+        if total_bet <= 0:
+            raise HttpError(422, "Total bet must be positive", "invalid_request")
+
+        key = headers.get("idempotency-key")
+        normalized = sorted(
+            ({**b, "numbers": sorted(b["numbers"])} for b in bets), key=lambda b: b["type"].lower()
+        )
+        fingerprint = f"{session_id}|{game_id}|{engines.CURRENCY}|{_encode(normalized)}"
+        stored = self._replayed(player, key, fingerprint)
+        if stored is not None:
+            return 200, stored, JSON_HEADERS
+        bet_cents = to_cents(total_bet)
+        self._charge(player, bet_cents)
+
+        rnd, outcome = self._settle(
+            player, session_id, game_id, bet_cents, lambda seed: table.spin(bets, engines.CURRENCY, seed)
+        )
+        rnd.lines = len(bets)
+        rnd.reel_matrix = {
+            "winning_number": outcome["winning_number"],
+            "winning_color": outcome["winning_color"],
+            "wheel_position": outcome["wheel_position"],
+        }
+        rnd.bonus = None
+        rnd.outcome_hash = None
+        rnd.roulette_bets = [
+            {
+                "id": str(uuid.uuid4()),
+                "bet_type": row["bet_type"],
+                "numbers": row["numbers"],
+                "amount": from_cents(to_cents(row["bet_amount"])),
+                "payout": from_cents(to_cents(row["payout"])),
+                "la_partage": row.get("la_partage", False),
+                "created_at": rnd.created_at,
+            }
+            for row in outcome["win"]["breakdown"]
+        ]
+        player.rounds.add(rnd)
+        player.recent_numbers.append(outcome["winning_number"])
+
+        # Both variants answer with `total_bet` at the top level, as the backend
+        # does (the European response schema doesn't list it).
+        reply = _encode(
+            {
+                "spin_id": rnd.id,
+                "session_id": session_id,
+                "game_id": game_id,
+                "balance": {"amount": from_cents(rnd.balance_after), "currency": engines.CURRENCY},
+                "total_bet": js_number(total_bet),
+                "outcome": outcome,
+                "timestamp": rnd.created_ms,
+            }
+        ).encode()
+        if key:
+            self.idempotency[f"{player.id}:{key}"] = (fingerprint, reply, rnd.created_ms)
+        return 200, reply, JSON_HEADERS
+
+    @staticmethod
+    def _bet_ok(table: RouletteTable, bet: Any) -> bool:
+        return (
+            _strict(bet, _ROULETTE_BET_FIELDS)
+            and bet.get("type") in table.bet_types
+            and type(bet.get("numbers")) is list
+            and all(_is_int(n) and table.min_number <= n <= 36 for n in bet["numbers"])
+            and _is_num(bet.get("amount"))
+            and bet["amount"] > 0
+        )
+
+    def _eu_init(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        return self._roulette_init(engines.EUROPEAN, headers)
+
+    def _eu_spin(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        return self._roulette_spin(engines.EUROPEAN, headers, body)
+
+    def _us_init(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        return self._roulette_init(engines.AMERICAN, headers)
+
+    def _us_spin(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        return self._roulette_spin(engines.AMERICAN, headers, body)
+
+    # ── /api/v1/history ──
+
+    @staticmethod
+    def _history_filters(query: str) -> tuple[dict[str, Any], int | None, int | None]:
+        params = dict(parse_qsl(query))
+        try:
+            limit = int(params["limit"]) if "limit" in params else None
+            offset = int(params["offset"]) if "offset" in params else None
+            min_bet = to_cents(float(params["min_bet"])) if "min_bet" in params else None
+            max_bet = to_cents(float(params["max_bet"])) if "max_bet" in params else None
+        except ValueError:
+            raise HttpError(400, "Invalid request", "invalid_query") from None
+        result = params.get("result")
+        if result not in (None, "win", "loss", "all"):
+            raise HttpError(400, "Invalid request", "invalid_query")
+        bounds = []
+        for name in ("date_from", "date_to"):
+            value = params.get(name)
+            if value is None:
+                bounds.append(None)
+                continue
+            try:
+                parsed = datetime.fromisoformat(value)
+            except ValueError:
+                # Postgres rejecting the timestamp surfaces as a 500 on the backend
+                raise HttpError(500, "Internal server error", "internal_error") from None
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            bounds.append(int(parsed.timestamp() * 1000))
+        filters = {
+            "date_from": bounds[0],
+            "date_to": bounds[1],
+            "result": None if result == "all" else result,
+            "min_bet": min_bet,
+            "max_bet": max_bet,
+        }
+        return filters, limit, offset
+
+    def _history(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        player = self._authenticate(headers)
+        filters, limit, offset = self._history_filters(query)
+        limit = max(1, min(HISTORY_MAX_LIMIT, 50 if limit is None else limit))
+        offset = max(0, offset or 0)
+        page, summary = player.rounds.query(**filters, limit=limit, offset=offset)
+        reply = b"".join(
+            (
+                b'{"items":[',
+                b",".join(rnd.history_item() for rnd in page),
+                b'],"total":%d,"limit":%d,"offset":%d,"summary":' % (summary["total_rounds"], limit, offset),
+                _encode(summary).encode(),
+                b"}",
+            )
+        )
+        return 200, reply, JSON_HEADERS
+
+    def _history_summary(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        player = self._authenticate(headers)
+        filters, _limit, _offset = self._history_filters(query)
+        _page, summary = player.rounds.query(**filters)
+        return 200, _encode(summary).encode(), JSON_HEADERS
+
+    def _round_detail(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        player = self._authenticate(headers)
+        round_id = path[len("/api/v1/history/") :]
+        rnd = player.rounds.by_id.get(round_id) if _UUID.match(round_id) else None
+        if rnd is None:
+            raise HttpError(404, "Round not found", "not_found")
+        pair = rnd.seed_pair
+        bet_tx, win_tx = rnd.transaction_ids()
+        created_at = rnd.created_at
+        transactions = [
+            {
+                "id": bet_tx,
+                "type": "bet",
+                "amount": from_cents(rnd.bet_cents),
+                "balance_after": from_cents(rnd.balance_after_bet),
+                "created_at": created_at,
+            }
+        ]
+        if rnd.win_cents > 0:
+            transactions.append(
+                {
+                    "id": win_tx,
+                    "type": "win",
+                    "amount": from_cents(rnd.win_cents),
+                    "balance_after": from_cents(rnd.balance_after),
+                    "created_at": created_at,
+                }
+            )
+        reply = {
+            "round": {
+                "id": rnd.id,
+                "session_id": rnd.session_id,
+                "game_id": rnd.game_id,
+                "bet": from_cents(rnd.bet_cents),
+                "win": from_cents(rnd.win_cents),
+                "currency": rnd.currency,
+                "lines": rnd.lines,
+                "balance_before": from_cents(rnd.balance_before),
+                "balance_after": from_cents(rnd.balance_after),
+                "reel_matrix": rnd.reel_matrix,
+                "win_breakdown": rnd.breakdown,
+                "bonus_triggered": rnd.bonus,
+                "outcome_hash": rnd.outcome_hash,
+                "created_at": created_at,
+            },
+            "provably_fair": {
+                "seed_pair_id": pair.id,
+                "server_seed_hash": pair.server_seed_hash,
+                "server_seed": None if pair.active else pair.server_seed,
+                "client_seed": pair.client_seed,
+                "nonce": rnd.nonce,
+                "revealed": not pair.active,
+            },
+            "transactions": transactions,
+            "roulette_bets": rnd.roulette_bets or [],
+        }
+        return 200, _encode(reply).encode(), JSON_HEADERS
+
+    # ── /api/v1/provably-fair, /api/v1/wallet ──
+
+    def _pf_rotate(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        player = self._authenticate(headers)
+        previous = player.seed_pair
+        if previous is not None:
+            previous.active = False
+        player.seed_pair = None
+        current = player.active_seed_pair()
+        reply = {
+            "previous": None
+            if previous is None
+            else {
+                "seed_pair_id": previous.id,
+                "server_seed": previous.server_seed,
+                "server_seed_hash": previous.server_seed_hash,
+                "client_seed": previous.client_seed,
+                "nonce": previous.nonce,
+            },
+            "current": current.public(),
+        }
+        return 200, _encode(reply).encode(), JSON_HEADERS
+
+    def _pf_client_seed(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        player = self._authenticate(headers)
+        data = self._body(body)
+        seed = data.get("client_seed") if type(data) is dict else None
+        if not seed or type(seed) is not str or len(seed) > 64:
+            raise HttpError(400, "Invalid client seed", "invalid_body")
+        if player.seed_pair is None:
+            raise HttpError(404, "No active seed pair", "not_found")
+        player.seed_pair.client_seed = seed
+        return 200, _encode(player.seed_pair.public()).encode(), JSON_HEADERS
+
+    def _pf_current(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        player = self._authenticate(headers)
+        pair = player.active_seed_pair()
+        return 200, _encode({**pair.public(), "active": pair.active}).encode(), JSON_HEADERS
+
+    def _topup(self, path: str, headers: Mapping[str, str], query: str, body: bytes) -> Reply:
+        player = self._authenticate(headers)
+        data = self._body(body)
+        amount = data.get("amount") if type(data) is dict else None
+        if not _strict(data, frozenset(("amount",))) or not _is_num(amount) or not 0 < amount <= 100_000:
+            raise HttpError(400, "Invalid request", "invalid_body")
+        player.balance_cents += to_cents(amount)
+        reply = {"balance": {"amount": from_cents(player.balance_cents), "currency": "USD"}, "credited": amount}
+        return 200, _encode(reply).encode(), JSON_HEADERS
+
+
+class _RateLimited(HttpError):
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(429, "Too many requests", "rate_limited")
+        self.retry_after = retry_after
+
+
+def _error(status: int, error: str, code: str) -> Reply:
+    return status, _encode({"error": error, "code": code}).encode(), JSON_HEADERS
+
+
+_CLEAR_COOKIE = f"refresh_token=; Path={_COOKIE_PATH}; Expires=Thu, 01 Jan 1970 00:00:00 GMT; HttpOnly; SameSite=Lax"
+_INIT_FIELDS = frozenset(("game_id", "platform", "locale", "client_version"))
+_SPIN_FIELDS = frozenset(("session_id", "game_id", "bet", "client_timestamp"))
+_BET_FIELDS = frozenset(("amount", "currency", "lines"))
+_ROULETTE_FIELDS = frozenset(("session_id", "game_id", "bets", "client_timestamp"))
+_ROULETTE_BET_FIELDS = frozenset(("type", "numbers", "amount"))
+
+_ROUTES: dict[tuple[str, str], Handler] = {
+    ("GET", "/health"): FakeRgs._health,
+    ("GET", "/ready"): FakeRgs._ready,
+    ("POST", "/api/v1/auth/register"): FakeRgs._register,
+    ("POST", "/api/v1/auth/login"): FakeRgs._login,
+    ("POST", "/api/v1/auth/refresh"): FakeRgs._refresh,
+    ("POST", "/api/v1/auth/logout"): FakeRgs._logout,
+    ("POST", "/api/v1/game/init"): FakeRgs._game_init,
+    ("POST", "/api/v1/spin"): FakeRgs._spin,
+    ("GET", "/api/v1/history"): FakeRgs._history,
+    ("GET", "/api/v1/history/summary"): FakeRgs._history_summary,
+    ("POST", "/api/v1/provably-fair/rotate"): FakeRgs._pf_rotate,
+    ("PUT", "/api/v1/provably-fair/client-seed"): FakeRgs._pf_client_seed,
+    ("GET", "/api/v1/provably-fair/current"): FakeRgs._pf_current,
+    ("POST", "/api/v1/wallet/topup"): FakeRgs._topup,
+    ("POST", "/api/v1/roulette/init"): FakeRgs._eu_init,
+    ("POST", "/api/v1/roulette/spin"): FakeRgs._eu_spin,
+    ("POST", "/api/v1/american-roulette/init"): FakeRgs._us_init,
+    ("POST", "/api/v1/american-roulette/spin"): FakeRgs._us_spin,
+}
@@ -0,0 +1,468 @@
+"""Python reference engines: ports of `backend/src/engine/*` and `provablyFair.ts`.
+
+Given the same seed they produce the same outcome as the backend, bit for
+bit: Mulberry32 is reproduced in 32-bit unsigned arithmetic, money rounds
+half-up like `Math.round`, and whole-number floats are emitted as ints so
+`hash_outcome` hashes the same JSON text `JSON.stringify` would.
+
+Only Mega Fortune (`slot_mega_fortune_001`) of the slot games is ported.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import math
+import secrets
+from typing import Any, Callable
+
+# ── provablyFair.ts ─────────────────────────────────────────────────
+
+
+def generate_server_seed() -> str:
+    return secrets.token_hex(32)
+
+
+def hash_server_seed(seed: str) -> str:
+    return hashlib.sha256(seed.encode()).hexdigest()
+
+
+def derive_spin_seed(server_seed: str, client_seed: str, nonce: int) -> int:
+    digest = hmac.new(server_seed.encode(), f"{client_seed}:{nonce}".encode(), hashlib.sha256).digest()
+    return int.from_bytes(digest[:4], "big")
+
+
+_js_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def hash_outcome(outcome: Any) -> str:
+    return hashlib.sha256(_js_encode(outcome).encode()).hexdigest()
+
+
+# ── JS number semantics ─────────────────────────────────────────────
+
+
+def js_number(value: float) -> float | int:
+    """`2.0` -> `2`, so JSON text matches `JSON.stringify`."""
+    return int(value) if type(value) is float and value.is_integer() else value
+
+
+def js_round(value: float) -> int:
+    """`Math.round`: halves round towards +infinity."""
+    return math.floor(value + 0.5)
+
+
+def round2(value: float) -> float | int:
+    """`Math.round(value * 100) / 100`."""
+    return js_number(js_round(value * 100) / 100)
+
+
+def to_cents(amount: float) -> int:
+    return js_round(amount * 100)
+
+
+def from_cents(cents: int) -> float | int:
+    return cents // 100 if cents % 100 == 0 else cents / 100
+
+
+# ── rng.ts ──────────────────────────────────────────────────────────
+
+_M32 = 0xFFFFFFFF
+
+
+def mulberry32(seed: int) -> Callable[[], float]:
+    state = seed & _M32
+
+    def next_float() -> float:
+        nonlocal state
+        state = (state + 0x6D2B79F5) & _M32
+        t = ((state ^ (state >> 15)) * (1 | state)) & _M32
+        t = ((t + (((t ^ (t >> 7)) * (61 | t)) & _M32)) & _M32) ^ t
+        return (t ^ (t >> 14)) / 4294967296
+
+    return next_float
+
+
+# ── gameConfig.ts / spinEngine.ts (Mega Fortune) ────────────────────
+
+GAME_ID = "slot_mega_fortune_001"
+REELS = 5
+ROWS = 3
+PAYLINES = 20
+SYMBOLS = ("10", "J", "Q", "K", "A", "Star", "Scatter", "Wild")
+MIN_BET = 0.1
+MAX_BET = 100
+BET_LEVELS = [0.1, 0.2, 0.5, 1, 2, 5, 10, 25, 50, 100]
+CURRENCY = "USD"
+
+REEL_STRIPS = [
+    "10 J Q K A 10 J Star Q K A 10 J Q K Scatter A 10 J Q Wild K A".split(),
+    "J Q K A 10 J Q K Star A 10 J Q K A 10 J Scatter Q K A 10 J".split(),
+    "Q K A 10 J Q K A 10 J Star Q K A 10 J Q K Scatter A 10 J Q".split(),
+    "K A 10 J Q K A 10 J Q K Star A 10 J Q K A 10 Scatter J Q K".split(),
+    "A 10 J Q K A 10 J Q K A 10 J Star Q K A 10 J Q Scatter K A".split(),
+]
+PAYTABLE = {
+    "10": (0.2, 0.5, 2),
+    "J": (0.2, 0.5, 2.5),
+    "Q": (0.3, 0.8, 3),
+    "K": (0.3, 1, 4),
+    "A": (0.5, 1.5, 5),
+    "Star": (0.5, 2, 10),
+}
+SCATTER_FREE_SPINS = ((3, 5), (4, 10), (5, 20))
+LINE_DEFS = [
+    [1, 1, 1, 1, 1], [0, 0, 0, 0, 0], [2, 2, 2, 2, 2], [1, 0, 0, 0, 1], [1, 2, 2, 2, 1],
+    [0, 1, 0, 1, 0], [2, 1, 2, 1, 2], [0, 0, 1, 0, 0], [2, 2, 1, 2, 2], [1, 1, 0, 1, 1],
+    [1, 1, 2, 1, 1], [0, 1, 1, 1, 0], [2, 1, 1, 1, 2], [0, 2, 0, 2, 0], [2, 0, 2, 0, 2],
+    [1, 0, 1, 0, 1], [1, 2, 1, 2, 1], [0, 1, 2, 1, 0], [2, 1, 0, 1, 2], [0, 2, 1, 2, 0],
+]
+
+# Every stop position's visible column, built once.
+_COLUMNS = [
+    [[strip[(pos + row) % len(strip)] for row in range(ROWS)] for pos in range(len(strip))]
+    for strip in REEL_STRIPS
+]
+
+_LINE_WINS = sorted(
+    ({"symbol": s, "x3": x3, "x4": x4, "x5": x5} for s, (x3, x4, x5) in PAYTABLE.items()),
+    key=lambda item: -item["x5"],
+)
+SLOT_CONFIG: dict[str, Any] = {
+    "reels": REELS,
+    "rows": ROWS,
+    "paylines": PAYLINES,
+    "currencies": [CURRENCY],
+    "min_bet": MIN_BET,
+    "max_bet": MAX_BET,
+    "min_lines": 1,
+    "max_lines": PAYLINES,
+    "default_lines": PAYLINES,
+    "line_defs": LINE_DEFS,
+    "bet_levels": BET_LEVELS,
+    "paytable_url": "",
+    "paytable": {
+        "line_wins": _LINE_WINS,
+        "scatter": {
+            "symbol": "Scatter",
+            "awards": [{"count": c, "free_spins": n} for c, n in SCATTER_FREE_SPINS],
+        },
+        "wild": {"symbol": "Wild", "substitutes_for": [item["symbol"] for item in _LINE_WINS]},
+    },
+    "rules_url": "",
+    "rtp": 96.5,
+    "volatility": "high",
+    "features": ["free_spins", "multipliers", "scatter"],
+}
+
+
+def idle_matrix() -> list[list[str]]:
+    return [list(cols[secrets.randbelow(len(cols))]) for cols in _COLUMNS]
+
+
+def run_spin(bet_amount: float, currency: str, lines: int, seed: int) -> dict[str, Any]:
+    rng = mulberry32(seed)
+    matrix = [list(cols[math.floor(rng() * len(cols))]) for cols in _COLUMNS]
+    lines = max(1, min(PAYLINES, math.floor(lines)))
+    bet_per_line = bet_amount / lines
+
+    breakdown = []
+    total = 0.0
+    for line_index in range(lines):
+        line = LINE_DEFS[line_index]
+        symbol = None
+        count = 0
+        for reel in range(REELS):
+            sym = matrix[reel][line[reel]]
+            if sym == "Wild":
+                count += 1
+                continue
+            if symbol is None:
+                symbol = sym
+            if sym != symbol:
+                break
+            count += 1
+        if count < 3 or symbol is None:
+            continue
+        pay = PAYTABLE.get(symbol)
+        if pay is None or pay[count - 3] <= 0:
+            continue
+        payout = bet_per_line * pay[count - 3]
+        total += payout
+        breakdown.append(
+            {"type": "line", "line_index": line_index, "symbol": symbol, "count": count, "payout": js_number(payout)}
+        )
+
+    scatters = sum(col.count("Scatter") for col in matrix)
+    free_spins = 0
+    for needed, awarded in reversed(SCATTER_FREE_SPINS):
+        if scatters >= needed:
+            free_spins = awarded
+            break
+    bonus = (
+        {"type": "free_spins", "free_spins_count": free_spins, "bonus_round_id": f"br_{seed}", "multiplier": 1}
+        if free_spins
+        else None
+    )
+    return {
+        "reel_matrix": matrix,
+        "win": {"amount": round2(total), "currency": currency, "breakdown": breakdown},
+        "bonus_triggered": bonus,
+    }
+
+
+# ── Roulette (rouletteConfig.ts / americanRouletteConfig.ts) ────────
+
+DOUBLE_ZERO = -1
+RED = frozenset((1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36))
+BLACK = frozenset((2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35))
+TABLE_ROWS = [
+    [3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 36],
+    [2, 5, 8, 11, 14, 17, 20, 23, 26, 29, 32, 35],
+    [1, 4, 7, 10, 13, 16, 19, 22, 25, 28, 31, 34],
+]
+_TABLE_POS = {n: (r, c) for r, row in enumerate(TABLE_ROWS) for c, n in enumerate(row)}
+_COLUMN_SETS = [frozenset(range(start, 37, 3)) for start in (1, 2, 3)]
+_DOZENS = [frozenset(range(start, start + 12)) for start in (1, 13, 25)]
+_EVEN_MONEY = {
+    "red": RED,
+    "black": BLACK,
+    "even": frozenset(range(2, 37, 2)),
+    "odd": frozenset(range(1, 37, 2)),
+    "high": frozenset(range(19, 37)),
+    "low": frozenset(range(1, 19)),
+}
+
+
+def _color(n: int) -> str:
+    return "red" if n in RED else "black" if n in BLACK else "green"
+
+
+def _adjacent(a: int, b: int) -> bool:
+    pa, pb = _TABLE_POS.get(a), _TABLE_POS.get(b)
+    return pa is not None and pb is not None and abs(pa[0] - pb[0]) + abs(pa[1] - pb[1]) == 1
+
+
+def _positions(numbers: list[int]) -> list[tuple[int, int]] | None:
+    pos = [_TABLE_POS.get(n) for n in numbers]
+    return None if None in pos else pos  # type: ignore[return-value]
+
+
+def _is_street(numbers: list[int]) -> bool:
+    pos = _positions(numbers)
+    return pos is not None and len({c for _r, c in pos}) == 1
+
+
+def _is_corner(numbers: list[int]) -> bool:
+    pos = _positions(numbers)
+    if pos is None:
+        return False
+    rows, cols = {r for r, _c in pos}, {c for _r, c in pos}
+    return len(rows) == 2 and len(cols) == 2 and max(rows) - min(rows) == 1 and max(cols) - min(cols) == 1
+
+
+def _is_six_line(numbers: list[int]) -> bool:
+    pos = _positions(numbers)
+    if pos is None:
+        return False
+    rows, cols = {r for r, _c in pos}, {c for _r, c in pos}
+    return len(rows) == 3 and len(cols) == 2 and max(cols) - min(cols) == 1
+
+
+class RouletteTable:
+    """One wheel variant: bet types, validation (`*Validation.ts`) and the spin."""
+
+    def __init__(
+        self,
+        game_id: str,
+        variant: str,
+        wheel_order: list[int],
+        bet_types: dict[str, tuple[int, int, int]],
+        *,
+        la_partage: bool,
+        rtp: float,
+        features: list[str],
+    ) -> None:
+        self.game_id = game_id
+        self.wheel_order = wheel_order
+        self.bet_types = bet_types  # type -> (payout, size, max bet)
+        self.la_partage = la_partage
+        self.min_number = min(wheel_order)
+        self.min_bet = 0.1
+        self.max_total_bet = 2000
+        # JS key order: integer keys ascending, then "-1" (00)
+        colors = {n: _color(n) for n in sorted(wheel_order, key=lambda n: (n < 0, n))}
+        self.config: dict[str, Any] = {
+            "game_id": game_id,
+            "type": "roulette",
+            "variant": variant,
+            "numbers": len(wheel_order),
+            **({"double_zero": DOUBLE_ZERO} if DOUBLE_ZERO in colors else {}),
+            "min_bet": self.min_bet,
+            "max_total_bet": self.max_total_bet,
+            "bet_levels": [0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100],
+            "bet_types": {name: {"payout": p, "size": s, "maxBet": m} for name, (p, s, m) in bet_types.items()},
+            "currencies": [CURRENCY],
+            "rtp": rtp,
+            "features": features,
+            "wheel_order": wheel_order,
+            "number_colors": {str(n): c for n, c in colors.items()},
+        }
+
+    def _adjacent(self, a: int, b: int) -> bool:
+        greens = (0, DOUBLE_ZERO) if self.min_number < 0 else (0,)
+        if a in greens or b in greens:
+            zero_adj = {*greens, 1, 2, 3}
+            return (a in greens and b in zero_adj) or (b in greens and a in zero_adj)
+        return _adjacent(a, b)
+
+    def _shape_error(self, kind: str, numbers: list[int]) -> str | None:
+        ordered = sorted(numbers)
+        if kind == "split":
+            return None if self._adjacent(numbers[0], numbers[1]) else "Split numbers must be adjacent on the table"
+        if kind == "street":
+            if _is_street(numbers):
+                return None
+            return "Street must be a 3-number column group" + ("" if self.min_number < 0 else " (e.g. 1,2,3)")
+        if kind == "trio":
+            return None if ordered in ([0, 1, 2], [0, 2, 3]) else "Trio must be [0,1,2] or [0,2,3]"
+        if kind == "corner":
+            return None if _is_corner(numbers) else "Corner must form a 2x2 block on the table"
+        if kind == "basket":
+            return None if ordered == [0, 1, 2, 3] else "Basket must be [0,1,2,3]"
+        if kind == "topLine":
+            return None if ordered == [-1, 0, 1, 2, 3] else "Top line must be [0, -1, 1, 2, 3] (0, 00, 1, 2, 3)"
+        if kind == "sixLine":
+            return None if _is_six_line(numbers) else "Six line must be two adjacent column groups (6 numbers)"
+        if kind == "column":
+            return None if set(numbers) in _COLUMN_SETS else "Column bet must match a full column"
+        if kind == "dozen":
+            return None if set(numbers) in _DOZENS else "Dozen bet must match a dozen range"
+        if kind in _EVEN_MONEY and not set(numbers) <= _EVEN_MONEY[kind]:
+            return f"{kind} bet numbers invalid"
+        return None
+
+    def validate(self, bets: list[dict[str, Any]]) -> str | None:
+        """The backend's error message for the first invalid bet, or None."""
+        if not bets:
+            return "At least one bet required"
+        seen = set()
+        total = 0.0
+        for bet in bets:
+            kind, numbers, amount = bet["type"], bet["numbers"], bet["amount"]
+            payout_size_max = self.bet_types.get(kind)
+            if payout_size_max is None:
+                return f"Invalid bet type: {kind}"
+            _payout, size, max_bet = payout_size_max
+            if len(numbers) != size:
+                return f"Invalid numbers count for {kind}: expected {size}, got {len(numbers)}"
+            if not all(self.min_number <= n <= 36 for n in numbers):
+                return (
+                    "Numbers must be integers between -1 (00) and 36"
+                    if self.min_number < 0
+                    else "Numbers must be integers between 0 and 36"
+                )
+            if len(set(numbers)) != len(numbers):
+                return "Duplicate numbers in bet"
+            if amount < self.min_bet:
+                return f"Bet amount {js_number(amount)} below minimum {self.min_bet}"
+            if amount > max_bet:
+                return f"{kind} bet amount {js_number(amount)} exceeds max {max_bet}"
+            key = (kind, tuple(sorted(numbers)))
+            if key in seen:
+                return f"Duplicate bet: {kind} on [{','.join(map(str, numbers))}]"
+            seen.add(key)
+            error = self._shape_error(kind, numbers)
+            if error:
+                return error
+            total += amount
+        if total > self.max_total_bet:
+            return f"Total bet {js_number(total)} exceeds table limit {self.max_total_bet}"
+        return None
+
+    def spin(self, bets: list[dict[str, Any]], currency: str, seed: int) -> dict[str, Any]:
+        position = math.floor(mulberry32(seed)() * len(self.wheel_order))
+        number = self.wheel_order[position]
+        breakdown = []
+        total_win = 0.0
+        total_bet = 0.0
+        for bet in bets:
+            kind, numbers, amount = bet["type"], bet["numbers"], bet["amount"]
+            won = number in numbers
+            shared = False
+            payout = 0.0
+            if won:
+                payout = amount * (self.bet_types[kind][0] + 1)
+            elif self.la_partage and number == 0 and kind in _EVEN_MONEY:
+                shared = True
+                payout = amount / 2
+            total_win += payout
+            total_bet += amount
+            row: dict[str, Any] = {
+                "bet_type": kind,
+                "numbers": numbers,
+                "bet_amount": amount,
+                "payout": round2(payout),
+                "profit": round2(payout - amount),
+            }
+            if self.la_partage:
+                row["la_partage"] = shared
+            row["won"] = won
+            breakdown.append(row)
+
+        outcome: dict[str, Any] = {"winning_number": number}
+        if self.min_number < 0:
+            outcome["winning_number_display"] = "00" if number == DOUBLE_ZERO else str(number)
+        outcome.update(
+            winning_color=_color(number),
+            wheel_position=position,
+            win={"amount": round2(total_win), "currency": currency, "breakdown": breakdown},
+            total_bet=round2(total_bet),
+            total_return=round2(total_win),
+        )
+        return outcome
+
+
+EUROPEAN = RouletteTable(
+    "roulette_european_001",
+    "european",
+    [0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23, 10, 5, 24, 16, 33, 1, 20, 14,
+     31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26],
+    {
+        "straight": (35, 1, 100),
+        "split": (17, 2, 200),
+        "street": (11, 3, 300),
+        "trio": (11, 3, 300),
+        "corner": (8, 4, 400),
+        "basket": (8, 4, 400),
+        "sixLine": (5, 6, 500),
+        "column": (2, 12, 1000),
+        "dozen": (2, 12, 1000),
+        **{kind: (1, 18, 1000) for kind in ("red", "black", "even", "odd", "high", "low")},
+    },
+    la_partage=True,
+    rtp=97.3,
+    features=["la_partage", "announced_bets", "neighbor_bets"],
+)
+
+AMERICAN = RouletteTable(
+    "roulette_american_001",
+    "american",
+    [0, 28, 9, 26, 30, 11, 7, 20, 32, 17, 5, 22, 34, 15, 3, 24, 36, 13, 1, DOUBLE_ZERO, 27, 10, 25,
+     29, 12, 8, 19, 31, 18, 6, 21, 33, 16, 4, 23, 35, 14, 2],
+    {
+        "straight": (35, 1, 100),
+        "split": (17, 2, 200),
+        "street": (11, 3, 300),
+        "corner": (8, 4, 400),
+        "topLine": (6, 5, 500),
+        "sixLine": (5, 6, 500),
+        "column": (2, 12, 1000),
+        "dozen": (2, 12, 1000),
+        **{kind: (1, 18, 1000) for kind in ("red", "black", "even", "odd", "high", "low")},
+    },
+    la_partage=False,
+    rtp=94.74,
+    features=["top_line"],
+)
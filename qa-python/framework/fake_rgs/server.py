@@ -0,0 +1,148 @@
+"""A small HTTP/1.1 front end for `FakeRgs` on an asyncio event loop.
+
+One protocol instance per connection parses requests straight off the
+receive buffer (keep-alive and pipelining supported, bodies by
+Content-Length only) and writes each response with a single `write`.
+`http.server` costs several syscalls and a thread per connection; this
+keeps one core well above 10k requests/sec for the spin and history calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from http import HTTPStatus
+
+from framework.fake_rgs.app import FakeRgs
+
+_STATUS_LINES = {s.value: f"HTTP/1.1 {s.value} {s.phrase}\r\n".encode() for s in HTTPStatus}
+_JSON = b"Content-Type: application/json; charset=utf-8\r\n"
+_MAX_HEAD = 64 * 1024
+_INTERNAL_ERROR = b'{"error":"Internal server error","code":"internal_error"}'
+
+log = logging.getLogger(__name__)
+
+
+class _HttpProtocol(asyncio.Protocol):
+    __slots__ = ("app", "transport", "buffer")
+
+    def __init__(self, app: FakeRgs) -> None:
+        self.app = app
+        self.transport: asyncio.Transport | None = None
+        self.buffer = b""
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def data_received(self, data: bytes) -> None:
+        buffer = self.buffer + data if self.buffer else data
+        out = []
+        close = False
+        while True:
+            head_end = buffer.find(b"\r\n\r\n")
+            if head_end < 0:
+                if len(buffer) > _MAX_HEAD:
+                    out.append(self._raw(431, b""))
+                    close = True
+                    buffer = b""
+                break
+            lines = buffer[:head_end].decode("latin-1").split("\r\n")
+            try:
+                method, target, version = lines[0].split(" ")
+            except ValueError:
+                out.append(self._raw(400, b""))
+                close = True
+                buffer = b""
+                break
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            length = int(headers.get("content-length") or 0)
+            body_end = head_end + 4 + length
+            if len(buffer) < body_end:
+                break
+            body = buffer[head_end + 4 : body_end]
+            buffer = buffer[body_end:]
+
+            try:
+                status, payload, extra = self.app.handle(method, target, headers, body)
+            except Exception:
+                log.exception("fake RGS failed on %s %s", method, target)
+                status, payload, extra = 500, _INTERNAL_ERROR, []
+            parts = [_STATUS_LINES[status]]
+            for name, value in extra:
+                parts.append(f"{name}: {value}\r\n".encode())
+            if payload is not None:
+                parts.append(_JSON)
+                parts.append(b"Content-Length: %d\r\n\r\n" % len(payload))
+                parts.append(payload)
+            else:
+                parts.append(b"\r\n")
+            out.append(b"".join(parts))
+            if headers.get("connection", "").lower() == "close" or version == "HTTP/1.0":
+                close = True
+                buffer = b""
+                break
+        self.buffer = buffer
+        if out:
+            self.transport.write(b"".join(out))
+        if close:
+            self.transport.close()
+
+    @staticmethod
+    def _raw(status: int, payload: bytes) -> bytes:
+        return _STATUS_LINES[status] + b"Content-Length: %d\r\nConnection: close\r\n\r\n" % len(payload) + payload
+
+
+class FakeRgsServer:
+    """Serves a `FakeRgs` on a background thread; `base_url` is API_BASE_URL."""
+
+    def __init__(self, app: FakeRgs | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.app = app or FakeRgs()
+        self.host = host
+        self.port = port
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def _listen(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(lambda: _HttpProtocol(self.app), self.host, self.port, backlog=512)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def start(self) -> "FakeRgsServer":
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._listen())
+        self._thread = threading.Thread(target=self._loop.run_forever, name="fake-rgs", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._listen())
+        try:
+            self._loop.run_forever()
+        finally:
+            self._close()
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._close()
+
+    def _close(self) -> None:
+        loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        if self._server is not None:
+            self._server.close()
+        loop.close()
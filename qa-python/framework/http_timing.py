@@ -0,0 +1,116 @@
+"""Phase-level timing for `ApiClient` requests.
+
+`ApiResponse.elapsed_ms` is one number around `Session.request`. With phase
+timing on, the client streams the response and splits that into:
+
+  connect     TCP (+TLS) setup, 0.0 when a pooled connection was reused
+  ttfb        request sent -> status line and headers received
+  download    reading (and decompressing) the body
+
+plus wire bytes (as received, possibly gzip'd) vs decoded body bytes.
+
+Connection setup is timed by swapping urllib3's connection classes on the
+session's adapters for subclasses whose `connect()` records its duration;
+requests and urllib3 stay otherwise untouched. Off (the default), the
+client takes its original non-streaming path and none of this runs.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+@dataclass(frozen=True)
+class PhaseTiming:
+    connect_ms: float
+    reused: bool
+    ttfb_ms: float
+    download_ms: float
+    wire_bytes: int
+    body_bytes: int
+    content_encoding: str | None = None
+
+    @property
+    def total_ms(self) -> float:
+        return self.connect_ms + self.ttfb_ms + self.download_ms
+
+
+class _TimedConnectMixin:
+    qa_connect_ms: float = 0.0
+    qa_fresh: bool = False
+
+    def connect(self) -> None:
+        start = time.perf_counter()
+        super().connect()  # type: ignore[misc]
+        self.qa_connect_ms = (time.perf_counter() - start) * 1000.0
+        self.qa_fresh = True
+
+
+class TimedHTTPConnection(_TimedConnectMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools hand out connection-timing connections."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+def install(session: requests.Session) -> None:
+    """Mount timing adapters on `session` (idempotent)."""
+    if isinstance(session.get_adapter("http://"), TimedAdapter):
+        return
+    session.mount("https://", TimedAdapter())
+    session.mount("http://", TimedAdapter())
+
+
+def timed_request(session: requests.Session, method: str, url: str, **kwargs: Any) -> tuple[requests.Response, PhaseTiming]:
+    """`session.request` with the body read eagerly and every phase timed.
+
+    The session must have had `install()` called on it.
+    """
+    start = time.perf_counter()
+    resp = session.request(method, url, stream=True, **kwargs)
+    headers_at = time.perf_counter()
+    conn = resp.raw.connection
+    body = resp.content  # reads, decompresses and releases the connection
+    done = time.perf_counter()
+
+    fresh = bool(getattr(conn, "qa_fresh", False))
+    connect_ms = getattr(conn, "qa_connect_ms", 0.0) if fresh else 0.0
+    if conn is not None:
+        conn.qa_fresh = False
+    phases = PhaseTiming(
+        connect_ms=connect_ms,
+        reused=not fresh,
+        ttfb_ms=max(0.0, (headers_at - start) * 1000.0 - connect_ms),
+        download_ms=(done - headers_at) * 1000.0,
+        wire_bytes=resp.raw.tell(),
+        body_bytes=len(body),
+        content_encoding=resp.headers.get("content-encoding"),
+    )
+    return resp, phases
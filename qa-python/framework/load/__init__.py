@@ -0,0 +1,28 @@
+"""Load generation against the RGS API.
+
+`OpenModelRunner` sends requests on a precomputed `ArrivalSchedule`
+(constant, Poisson, step or ramp) and measures latency from each request's
+intended send time, so a stalling server shows up in the tail instead of
+silently slowing the load down. `LatencyHistogram` is the fixed-size
+histogram both latencies are recorded into. `LoadDriver` runs the same
+model across forked worker processes of async players, with their metrics
+in shared memory.
+
+    python -m framework.load --schedule poisson:200:60 --workers 64
+    python -m framework.load --schedule constant:2000:60 --processes 4 --workers 64
+"""
+
+from framework.load.driver import LoadDriver, LoadReport
+from framework.load.histogram import LatencyHistogram
+from framework.load.open_model import LoadResult, OpenModelRunner
+from framework.load.schedule import ArrivalSchedule, parse_schedule
+
+__all__ = [
+    "ArrivalSchedule",
+    "LatencyHistogram",
+    "LoadDriver",
+    "LoadReport",
+    "LoadResult",
+    "OpenModelRunner",
+    "parse_schedule",
+]
@@ -0,0 +1,78 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from framework.api_client import ApiClient
+from framework.config import SETTINGS
+from framework.data_factory import new_credentials
+from framework.load import LoadDriver, OpenModelRunner, parse_schedule
+from framework.request_templates import PreparedCall
+from framework.rgs_client import RgsClient
+
+GAME_ID = "slot_mega_fortune_001"
+
+
+def spin_player(base_url: str | None, bet: float) -> PreparedCall:
+    """Register a fresh player, open a session and return its spin call."""
+    api = ApiClient(base_url=base_url, high_volume=True)
+    rgs = RgsClient(api)
+    creds = new_credentials()
+    token = rgs.post_auth_register(email=creds.email, password=creds.password).expect_ok().field("access_token")
+    api.with_token(token)
+    rgs.post_wallet_topup(amount=100_000).expect_ok()
+    session_id = rgs.post_game_init(game_id=GAME_ID).expect_ok().field("session_id")
+    return rgs.prepare_post_spin(
+        session_id=session_id, game_id=GAME_ID, bet={"amount": bet, "currency": "USD", "lines": 20}
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Open-model spin load against API_BASE_URL.")
+    parser.add_argument(
+        "--schedule",
+        default="constant:20:30",
+        help="constant:RATE:SECS | poisson:RATE:SECS | ramp:FROM:TO:SECS | step:RATE:SECS,RATE:SECS,...",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="seed for the poisson schedule")
+    parser.add_argument("--workers", type=int, default=32, help="concurrent requests (one player each)")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=0,
+        help="fork this many worker processes of --workers async players each (0: threads in this process)",
+    )
+    parser.add_argument("--max-lag", type=float, default=5.0, help="drop arrivals queued longer than this (s)")
+    parser.add_argument("--bet", type=float, default=0.1)
+    parser.add_argument("--base-url", default=None, help="defaults to API_BASE_URL")
+    parser.add_argument("--json", type=Path, default=None, help="also write the summary here")
+    args = parser.parse_args()
+
+    try:
+        schedule = parse_schedule(args.schedule, args.seed)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.processes:
+        print(f"{schedule!r}, {args.processes} x {args.workers} players", file=sys.stderr, flush=True)
+        driver = LoadDriver(
+            schedule,
+            args.base_url or SETTINGS.api_base_url,
+            processes=args.processes,
+            players=args.workers,
+            bet=args.bet,
+            max_lag=args.max_lag,
+        )
+        result = driver.run(on_report=lambda report: print(report, file=sys.stderr, flush=True))
+    else:
+        print(f"{schedule!r}, {args.workers} workers", file=sys.stderr, flush=True)
+        runner = OpenModelRunner(
+            schedule, lambda: spin_player(args.base_url, args.bet), workers=args.workers, max_lag=args.max_lag
+        )
+        result = runner.run()
+    print(result.format())
+    if args.json:
+        args.json.write_text(json.dumps(result.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Minimal keep-alive HTTP/1.1 client on asyncio streams, for load workers.
+
+One `AioConnection` per virtual player: requests go out one at a time on a
+persistent connection, reconnecting after the server closes it. Headers are
+passed pre-encoded, so the request for a prepared call is a bytes join.
+Response bodies are read by Content-Length or chunked encoding and returned
+undecoded:
+
+    conn = AioConnection("http://127.0.0.1:3001")
+    status, body = await conn.request("POST", "/api/v1/spin", headers, payload)
+
+Each request, reconnects included, is bounded by `timeout` (default
+`REQUEST_TIMEOUT_S`, as for `ApiClient`). When it expires, the connection
+is closed and `asyncio.TimeoutError` is raised.
+
+Deliberately small — no redirects, proxies, TLS options or compression.
+The `ApiClient` remains the client for tests; this only exists because a
+worker process drives hundreds of players from one event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import ssl
+from typing import Any, Mapping
+from urllib.parse import urlsplit
+
+from framework.config import SETTINGS
+
+
+def encode_headers(headers: Mapping[str, str]) -> bytes:
+    return "".join(f"{name}: {value}\r\n" for name, value in headers.items()).encode("latin-1")
+
+
+class AioConnection:
+    __slots__ = ("host", "port", "tls", "timeout", "_host_header", "_reader", "_writer")
+
+    def __init__(self, base_url: str, *, timeout: float | None = None) -> None:
+        parts = urlsplit(base_url)
+        self.tls = parts.scheme == "https"
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or (443 if self.tls else 80)
+        self.timeout = SETTINGS.request_timeout_s if timeout is None else timeout
+        self._host_header = f"Host: {parts.netloc}\r\n".encode()
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def _connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port, ssl=ssl.create_default_context() if self.tls else None
+        )
+
+    async def request(self, method: str, path: str, headers: bytes = b"", body: bytes | None = None) -> tuple[int, bytes]:
+        head = b"%s %s HTTP/1.1\r\n%s%s" % (method.encode(), path.encode(), self._host_header, headers)
+        if body is not None:
+            head += b"Content-Length: %d\r\n" % len(body)
+        payload = head + b"\r\n" + (body or b"")
+        try:
+            return await asyncio.wait_for(self._send(payload), self.timeout)
+        except asyncio.TimeoutError:
+            # a response may still be on its way; the connection cannot be reused
+            self.close()
+            raise
+
+    async def _send(self, payload: bytes) -> tuple[int, bytes]:
+        while True:
+            # a kept-alive connection the server has since closed fails before
+            # any response byte; only then is it safe to send again
+            reused = self._writer is not None
+            if not reused:
+                await self._connect()
+            try:
+                self._writer.write(payload)
+                return await self._read_response()
+            except (ConnectionError, asyncio.IncompleteReadError) as exc:
+                self.close()
+                if not reused or (isinstance(exc, asyncio.IncompleteReadError) and exc.partial):
+                    raise
+
+    async def _read_response(self) -> tuple[int, bytes]:
+        reader = self._reader
+        head = await reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        status = int(lines[0].split(" ", 2)[1])
+        length = None
+        chunked = close = False
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            name = name.strip().lower()
+            if name == "content-length":
+                length = int(value)
+            elif name == "transfer-encoding" and "chunked" in value.lower():
+                chunked = True
+            elif name == "connection" and value.strip().lower() == "close":
+                close = True
+        if chunked:
+            parts = []
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";", 1)[0], 16)
+                if size == 0:
+                    await reader.readuntil(b"\r\n")
+                    break
+                parts.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(parts)
+        elif length is not None:
+            body = await reader.readexactly(length)
+        else:
+            body = await reader.read()
+            close = True
+        if close:
+            self.close()
+        return status, body
+
+    async def json(self, method: str, path: str, headers: bytes = b"", payload: Any = None) -> tuple[int, Any]:
+        body = None
+        if payload is not None:
+            body = json.dumps(payload, separators=(",", ":")).encode()
+            headers += b"Content-Type: application/json\r\n"
+        status, raw = await self.request(method, path, headers, body)
+        return status, json.loads(raw) if raw else None
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
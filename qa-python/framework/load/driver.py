@@ -0,0 +1,337 @@
+"""Multi-process open-model load driver with metrics in shared memory.
+
+One Python process is GIL-bound well before the target is, once every
+response is JSON-decoded. `LoadDriver` forks `processes` workers. Each
+worker runs an asyncio event loop of `players` virtual players, each with
+its own account, game session and keep-alive connection
+(`framework.load.aio_client`). The run is open-model, as in
+`OpenModelRunner`. Worker *w* takes every `processes`-th arrival of the
+schedule, starting at *w*. Players take the worker's next due arrival,
+and latency is measured from its intended send time.
+
+Workers report through one `multiprocessing.shared_memory` block, not files
+or pipes. Each worker owns a fixed-size slot and is its only writer:
+
+    header   start time (CLOCK_MONOTONIC, shared by all processes), stop flag
+    slot w   COUNTERS int64s, then two `LatencyHistogram`s (latency, service)
+
+The coordinator reads the slots while the run is in progress for the
+per-interval report (`on_report`), and merges them into a `LoadResult`
+at the end. Nothing is locked. Counters are aligned int64s written by
+a single process, so a live read is at worst one update behind.
+
+    driver = LoadDriver(ArrivalSchedule.constant(2000, 60), base_url, processes=4, players=64)
+    result = driver.run(on_report=print)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+import multiprocessing
+import os
+import time
+from array import array
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Callable
+
+from framework.data_factory import new_credentials
+from framework.load.aio_client import AioConnection, encode_headers
+from framework.load.histogram import BUCKET_BYTES, BUCKETS, LatencyHistogram
+from framework.load.open_model import LoadResult
+from framework.load.schedule import ArrivalSchedule
+from framework.request_templates import BodyTemplate, now_ms
+
+GAME_ID = "slot_mega_fortune_001"
+COUNTERS = (
+    "sent", "dropped", "late", "max_backlog", "errors",
+    "2xx", "3xx", "4xx", "429", "5xx",
+    "players_ready", "done",
+)  # fmt: skip
+_C = {name: i for i, name in enumerate(COUNTERS)}
+_OUTCOME_COUNTERS = ("2xx", "3xx", "4xx", "429", "5xx", "errors")
+HEADER_BYTES = 64
+SLOT_BYTES = len(COUNTERS) * 8 + 2 * BUCKETS * BUCKET_BYTES
+
+
+@dataclass
+class LoadReport:
+    """One interval of a running load, from the shared counters."""
+
+    elapsed_s: float
+    sent: int
+    dropped: int
+    rate: float  # sent per second over the interval
+    p50_ms: float  # latency from intended send, over the interval
+    p99_ms: float
+    backlog_peak: int  # max over the run so far
+
+    def __str__(self) -> str:
+        return (
+            f"[{self.elapsed_s:6.1f}s] sent {self.sent:8d}  {self.rate:8.1f}/s  "
+            f"p50 {self.p50_ms:8.2f}ms  p99 {self.p99_ms:8.2f}ms  dropped {self.dropped}  "
+            f"backlog peak {self.backlog_peak}"
+        )
+
+
+class _Slot:
+    """A worker's view of its region of the shared block."""
+
+    __slots__ = ("counters", "latency", "service")
+
+    def __init__(self, buf: memoryview, index: int) -> None:
+        base = HEADER_BYTES + index * SLOT_BYTES
+        hist_base = base + len(COUNTERS) * 8
+        self.counters = buf[base:hist_base].cast("q")
+        self.latency = LatencyHistogram(buf[hist_base : hist_base + BUCKETS * BUCKET_BYTES])
+        self.service = LatencyHistogram(buf[hist_base + BUCKETS * BUCKET_BYTES : base + SLOT_BYTES])
+
+    def release(self) -> None:
+        self.counters.release()
+        self.latency.counts.release()
+        self.service.counts.release()
+
+
+class LoadDriver:
+    def __init__(
+        self,
+        schedule: ArrivalSchedule,
+        base_url: str,
+        *,
+        processes: int | None = None,
+        players: int = 32,
+        bet: float = 0.1,
+        max_lag: float | None = 5.0,
+        late_after: float = 0.001,
+        setup_timeout: float = 120.0,
+        request_timeout: float | None = None,
+    ) -> None:
+        self.schedule = schedule
+        self.base_url = base_url.rstrip("/")
+        self.processes = processes or os.cpu_count() or 1
+        self.players = players
+        self.bet = bet
+        self.max_lag = max_lag
+        self.late_after = late_after
+        self.setup_timeout = setup_timeout
+        self.request_timeout = request_timeout  # None: REQUEST_TIMEOUT_S
+
+    # ── coordinator ──
+
+    def run(self, *, report_every: float = 1.0, on_report: Callable[[LoadReport], None] | None = None) -> LoadResult:
+        shm = shared_memory.SharedMemory(create=True, size=HEADER_BYTES + self.processes * SLOT_BYTES)
+        buf = shm.buf
+        buf[:] = bytes(len(buf))
+        header = buf[:16].cast("d")
+        slots = [_Slot(buf, w) for w in range(self.processes)]
+        ctx = multiprocessing.get_context("fork")
+        procs = [
+            ctx.Process(target=self._worker_main, args=(shm, w), name=f"load-worker-{w}", daemon=True)
+            for w in range(self.processes)
+        ]
+        try:
+            for p in procs:
+                p.start()
+            self._await_players(slots, procs)
+            # a little lead time so every worker is waiting when arrival 0 is due
+            start = time.monotonic() + 0.05
+            header[0] = start
+            elapsed = self._monitor(slots, procs, start, report_every, on_report)
+            self._check_exits(slots, procs)
+            return self._merge(slots, elapsed)
+        except BaseException:
+            header[1] = 1.0  # stop flag
+            raise
+        finally:
+            for p in procs:
+                p.join(timeout=10)
+                if p.is_alive():
+                    p.terminate()
+            for slot in slots:
+                slot.release()
+            header.release()
+            del buf
+            shm.close()
+            shm.unlink()
+
+    def _await_players(self, slots: list[_Slot], procs: list) -> None:
+        deadline = time.monotonic() + self.setup_timeout
+        ready = _C["players_ready"]
+        while sum(s.counters[ready] for s in slots) < self.processes * self.players:
+            dead = [p.name for p in procs if p.exitcode not in (None, 0)]
+            if dead:
+                raise RuntimeError(f"load workers failed during player setup: {', '.join(dead)}")
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"players not ready after {self.setup_timeout}s")
+            time.sleep(0.02)
+
+    def _monitor(
+        self,
+        slots: list[_Slot],
+        procs: list,
+        start: float,
+        report_every: float,
+        on_report: Callable[[LoadReport], None] | None,
+    ) -> float:
+        done, sent_i, dropped_i, backlog_i = _C["done"], _C["sent"], _C["dropped"], _C["max_backlog"]
+        last_sent, last_at = 0, start
+        last_hist = LatencyHistogram()
+        while True:
+            time.sleep(0.02)
+            now = time.monotonic()
+            finished = all(s.counters[done] for s in slots) or not any(p.is_alive() for p in procs)
+            if on_report is not None and (finished or now - last_at >= report_every):
+                merged = LatencyHistogram()
+                for s in slots:
+                    merged.merge(s.latency)
+                interval = LatencyHistogram(array("q", (a - b for a, b in zip(merged.counts, last_hist.counts))))
+                sent = sum(s.counters[sent_i] for s in slots)
+                on_report(
+                    LoadReport(
+                        elapsed_s=now - start,
+                        sent=sent,
+                        dropped=sum(s.counters[dropped_i] for s in slots),
+                        rate=(sent - last_sent) / max(now - last_at, 1e-9),
+                        p50_ms=interval.percentile(50),
+                        p99_ms=interval.percentile(99),
+                        backlog_peak=max(s.counters[backlog_i] for s in slots),
+                    )
+                )
+                last_sent, last_at, last_hist = sent, now, merged
+            if finished:
+                return now - start
+
+    def _check_exits(self, slots: list[_Slot], procs: list) -> None:
+        """Raise if a worker died: its remaining arrivals were neither sent nor dropped."""
+        for p in procs:
+            p.join(timeout=10)
+        dead = [f"{p.name} (exit {p.exitcode})" for p in procs if p.exitcode != 0]
+        if dead:
+            accounted = sum(s.counters[_C["sent"]] + s.counters[_C["dropped"]] for s in slots)
+            raise RuntimeError(
+                f"load workers failed during the run: {', '.join(dead)}; "
+                f"{len(self.schedule) - accounted} of {len(self.schedule)} arrivals unaccounted for"
+            )
+
+    def _merge(self, slots: list[_Slot], elapsed: float) -> LoadResult:
+        result = LoadResult(self.schedule.name, len(self.schedule), elapsed_s=elapsed)
+        for s in slots:
+            c = s.counters
+            result.sent += c[_C["sent"]]
+            result.dropped += c[_C["dropped"]]
+            result.late += c[_C["late"]]
+            result.max_backlog = max(result.max_backlog, c[_C["max_backlog"]])
+            for name in _OUTCOME_COUNTERS:
+                if c[_C[name]]:
+                    result.outcomes[name] += c[_C[name]]
+            result.latency.merge(s.latency)
+            result.service.merge(s.service)
+        return result
+
+    # ── worker process ──
+
+    def _worker_main(self, shm: shared_memory.SharedMemory, index: int) -> None:
+        slot = _Slot(shm.buf, index)
+        header = shm.buf[:16].cast("d")
+        try:
+            asyncio.run(self._worker(slot, header, index))
+        finally:
+            slot.counters[_C["done"]] = 1
+            slot.release()
+            header.release()
+
+    async def _worker(self, slot: _Slot, header: memoryview, index: int) -> None:
+        players = await asyncio.gather(*(self._new_player() for _ in range(self.players)))
+        for _ in players:
+            slot.counters[_C["players_ready"]] += 1
+        while header[0] == 0.0:
+            if header[1]:
+                return
+            await asyncio.sleep(0.005)
+        start = header[0]
+        offsets = self.schedule.offsets[index :: self.processes]
+        state = {"next": 0}
+        await asyncio.gather(*(self._play(conn, spin, slot, header, start, offsets, state) for conn, spin in players))
+
+    async def _new_player(self) -> tuple[AioConnection, Callable[[], tuple[bytes, bytes]]]:
+        """Register, top up and open a session; return the connection and spin request builder."""
+        conn = AioConnection(self.base_url, timeout=self.request_timeout)
+        creds = new_credentials()
+        status, body = await conn.json(
+            "POST", "/api/v1/auth/register", payload={"email": creds.email, "password": creds.password}
+        )
+        if status != 201:
+            raise RuntimeError(f"register failed: {status} {body}")
+        auth = encode_headers({"Authorization": f"Bearer {body['access_token']}", "Accept": "application/json"})
+        await conn.json("POST", "/api/v1/wallet/topup", auth, {"amount": 100_000})
+        status, body = await conn.json("POST", "/api/v1/game/init", auth, {"game_id": GAME_ID})
+        if status != 200:
+            raise RuntimeError(f"game init failed: {status} {body}")
+        template = BodyTemplate(
+            {"session_id": body["session_id"], "game_id": GAME_ID, "bet": {"amount": self.bet, "currency": "USD", "lines": 20}},
+            {"client_timestamp": now_ms},
+        )
+        headers = auth + b"Content-Type: application/json\r\n"
+        return conn, lambda: (headers, template.render())
+
+    async def _play(
+        self,
+        conn: AioConnection,
+        spin: Callable[[], tuple[bytes, bytes]],
+        slot: _Slot,
+        header: memoryview,
+        start: float,
+        offsets: array,
+        state: dict[str, int],
+    ) -> None:
+        counters = slot.counters
+        record_latency = slot.latency.record_seconds
+        record_service = slot.service.record_seconds
+        clock = time.monotonic
+        total = len(offsets)
+        max_lag, late_after = self.max_lag, self.late_after
+        sent_i, dropped_i, late_i, backlog_i, errors_i = (
+            _C["sent"], _C["dropped"], _C["late"], _C["max_backlog"], _C["errors"],
+        )  # fmt: skip
+        while True:
+            i = state["next"]
+            if i >= total or header[1]:
+                return
+            state["next"] = i + 1
+            intended = start + offsets[i]
+            now = clock()
+            if now < intended:
+                await asyncio.sleep(intended - now)
+            else:
+                # this worker's arrivals due by now that no player has taken, this one included
+                backlog = bisect.bisect_right(offsets, now - start) - i
+                if backlog > counters[backlog_i]:
+                    counters[backlog_i] = backlog
+                lag = now - intended
+                if max_lag is not None and lag > max_lag:
+                    counters[dropped_i] += 1
+                    continue
+                if lag > late_after:
+                    counters[late_i] += 1
+            headers, body = spin()
+            sent_at = clock()
+            try:
+                status, raw = await conn.request("POST", "/api/v1/spin", headers, body)
+                # decode like a real client would; this is the per-response CPU the fan-out spreads
+                if raw:
+                    json.loads(raw)
+                counters[_C[_status_counter(status)]] += 1
+            except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError):
+                counters[errors_i] += 1
+            done = clock()
+            counters[sent_i] += 1
+            record_latency(done - intended)
+            record_service(done - sent_at)
+
+
+def _status_counter(status: int) -> str:
+    if status == 429:
+        return "429"
+    return f"{min(max(status // 100, 2), 5)}xx"
@@ -0,0 +1,119 @@
+"""Fixed-size log-linear latency histogram (HdrHistogram's bucket layout).
+
+Values are recorded in microseconds. Below 128 µs every value has its own
+bucket. Above that, each power of two is split into 64 sub-buckets, so a
+reported percentile is within 1/64 (~1.6%) of the true value, from 1 µs up
+to about two hours. The counts are a flat array of `BUCKETS` signed 64-bit
+integers and nothing else. That means a histogram can live in any
+writable buffer, e.g. one shared between processes:
+
+    hist = LatencyHistogram()                  # private array
+    hist = LatencyHistogram(memoryview(buf))   # over an existing buffer
+    hist.record_seconds(t1 - t0)
+    hist.percentile(99)                        # ms
+
+A histogram is not thread-safe; give each thread its own and `merge`.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Any
+
+SUB_BUCKET_BITS = 7
+_SUB = 1 << SUB_BUCKET_BITS  # 128
+_HALF = _SUB >> 1  # 64
+MAX_SHIFT = 26  # values up to 2**33 µs (~2.4 hours)
+BUCKETS = _SUB + MAX_SHIFT * _HALF
+BUCKET_BYTES = 8
+MAX_VALUE_US = (1 << (SUB_BUCKET_BITS + MAX_SHIFT)) - 1
+
+
+def bucket_index(value_us: int) -> int:
+    if value_us < _SUB:
+        return value_us if value_us > 0 else 0
+    shift = value_us.bit_length() - SUB_BUCKET_BITS
+    if shift > MAX_SHIFT:
+        return BUCKETS - 1
+    return _SUB + (shift - 1) * _HALF + (value_us >> shift) - _HALF
+
+
+def bucket_upper_us(index: int) -> int:
+    """Largest value that lands in bucket `index`."""
+    if index < _SUB:
+        return index
+    shift = (index - _SUB) // _HALF + 1
+    sub = (index - _SUB) % _HALF + _HALF
+    return ((sub + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    __slots__ = ("counts",)
+
+    def __init__(self, counts: Any = None) -> None:
+        if counts is None:
+            counts = array("q", bytes(BUCKETS * BUCKET_BYTES))
+        elif isinstance(counts, memoryview) and counts.format != "q":
+            counts = counts.cast("q")
+        if len(counts) != BUCKETS:
+            raise ValueError(f"histogram needs {BUCKETS} buckets, got {len(counts)}")
+        self.counts = counts
+
+    def record_us(self, value_us: int) -> None:
+        self.counts[bucket_index(value_us)] += 1
+
+    def record_seconds(self, seconds: float) -> None:
+        self.counts[bucket_index(int(seconds * 1_000_000))] += 1
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        counts = self.counts
+        for i, n in enumerate(other.counts):
+            if n:
+                counts[i] += n
+        return self
+
+    def reset(self) -> None:
+        counts = self.counts
+        for i in range(BUCKETS):
+            counts[i] = 0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def percentile(self, q: float) -> float:
+        """The `q`-th percentile (0-100) in milliseconds; 0.0 when empty."""
+        total = self.count
+        if not total:
+            return 0.0
+        rank = max(1, math.ceil(total * q / 100))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return bucket_upper_us(i) / 1000
+        return bucket_upper_us(BUCKETS - 1) / 1000
+
+    def max_ms(self) -> float:
+        for i in range(BUCKETS - 1, -1, -1):
+            if self.counts[i]:
+                return bucket_upper_us(i) / 1000
+        return 0.0
+
+    def mean_ms(self) -> float:
+        total = self.count
+        if not total:
+            return 0.0
+        return sum(bucket_upper_us(i) * n for i, n in enumerate(self.counts) if n) / total / 1000
+
+    def summary(self) -> dict[str, float | int]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean_ms(), 3),
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "p99_9_ms": self.percentile(99.9),
+            "max_ms": self.max_ms(),
+        }
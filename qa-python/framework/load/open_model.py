@@ -0,0 +1,207 @@
+"""Open-model load runner: requests go out on an arrival schedule, not in a loop.
+
+A closed loop ("N threads spinning as fast as they can", like the JMeter
+plan) sends the next request only after the previous response. When the
+server stalls, the clients stall with it. Fewer requests are sent, and
+the ones that would have waited never get measured, so p99 looks fine
+during an incident. This is coordinated omission.
+
+`OpenModelRunner` instead issues request *i* at `schedule.offsets[i]`,
+however the earlier ones are doing. It measures every request's latency from
+that intended send time:
+
+    runner = OpenModelRunner(ArrivalSchedule.poisson(200, 60), make_call, workers=64)
+    result = runner.run()
+    result.latency.percentile(99)   # ms, from intended send (what a player sees)
+    result.service.percentile(99)   # ms, from actual send (what the server did)
+
+`make_call()` is invoked once per worker thread and returns that worker's
+zero-argument request function, so each worker can own its `ApiClient` and
+player. A worker takes the next arrival, sleeps until it is due and sends
+it. When all workers are busy, due arrivals queue up: that is the backlog,
+and the wait counts towards `latency`. An arrival still queued `max_lag`
+seconds after it was due is dropped. Drops are counted, never silently
+skipped, so a run that drops is visibly not keeping up.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from framework.load.histogram import LatencyHistogram
+from framework.load.schedule import ArrivalSchedule
+
+Call = Callable[[], Any]
+
+
+def outcome_of(result: Any) -> str:
+    """Status label for a call's return value: its `.status` if it has one."""
+    status = getattr(result, "status", None)
+    return "ok" if status is None else str(status)
+
+
+@dataclass
+class LoadResult:
+    schedule: str
+    planned: int
+    sent: int = 0
+    dropped: int = 0
+    late: int = 0  # sent after their intended time (by more than `late_after`)
+    max_backlog: int = 0
+    elapsed_s: float = 0.0
+    outcomes: Counter = field(default_factory=Counter)  # "200", "429", "ConnectionError", ...
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    service: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def achieved_rate(self) -> float:
+        return self.sent / self.elapsed_s if self.elapsed_s else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "schedule": self.schedule,
+            "planned": self.planned,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "late": self.late,
+            "max_backlog": self.max_backlog,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "achieved_rate": round(self.achieved_rate, 1),
+            "outcomes": dict(self.outcomes),
+            "latency": self.latency.summary(),
+            "service": self.service.summary(),
+        }
+
+    def format(self) -> str:
+        lat, svc = self.latency.summary(), self.service.summary()
+        lines = [
+            f"{self.schedule}: {self.sent}/{self.planned} sent in {self.elapsed_s:.1f}s "
+            f"({self.achieved_rate:.1f}/s), {self.dropped} dropped, {self.late} late, "
+            f"max backlog {self.max_backlog}",
+            "  outcomes  " + ", ".join(f"{k}={v}" for k, v in sorted(self.outcomes.items())),
+            f"  {'':9} {'p50':>9} {'p90':>9} {'p99':>9} {'p99.9':>9} {'max':>9}  (ms)",
+        ]
+        for label, s in (("latency", lat), ("service", svc)):
+            lines.append(
+                f"  {label:9} {s['p50_ms']:9.2f} {s['p90_ms']:9.2f} {s['p99_ms']:9.2f} "
+                f"{s['p99_9_ms']:9.2f} {s['max_ms']:9.2f}"
+            )
+        return "\n".join(lines)
+
+
+class _WorkerStats:
+    __slots__ = ("sent", "dropped", "late", "max_backlog", "outcomes", "latency", "service")
+
+    def __init__(self) -> None:
+        self.sent = 0
+        self.dropped = 0
+        self.late = 0
+        self.max_backlog = 0
+        self.outcomes: Counter = Counter()
+        self.latency = LatencyHistogram()
+        self.service = LatencyHistogram()
+
+
+class OpenModelRunner:
+    def __init__(
+        self,
+        schedule: ArrivalSchedule,
+        make_call: Callable[[], Call],
+        *,
+        workers: int = 32,
+        max_lag: float | None = 5.0,
+        late_after: float = 0.001,
+        classify: Callable[[Any], str] = outcome_of,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.schedule = schedule
+        self.make_call = make_call
+        self.workers = workers
+        self.max_lag = max_lag
+        self.late_after = late_after
+        self.classify = classify
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """Stop taking new arrivals; in-flight requests finish."""
+        self._stop.set()
+
+    def run(self) -> LoadResult:
+        self._stop.clear()
+        self._next = itertools.count()
+        stats = [_WorkerStats() for _ in range(self.workers)]
+        calls = [self.make_call() for _ in range(self.workers)]
+        self._start = time.perf_counter()
+        threads = [
+            threading.Thread(target=self._work, args=(call, s), name=f"load-{i}", daemon=True)
+            for i, (call, s) in enumerate(zip(calls, stats))
+        ]
+        for t in threads:
+            t.start()
+        try:
+            for t in threads:
+                while t.is_alive():
+                    t.join(0.2)
+        except KeyboardInterrupt:
+            self.stop()
+            for t in threads:
+                t.join()
+        elapsed = time.perf_counter() - self._start
+
+        result = LoadResult(self.schedule.name, len(self.schedule), elapsed_s=elapsed)
+        for s in stats:
+            result.sent += s.sent
+            result.dropped += s.dropped
+            result.late += s.late
+            result.max_backlog = max(result.max_backlog, s.max_backlog)
+            result.outcomes.update(s.outcomes)
+            result.latency.merge(s.latency)
+            result.service.merge(s.service)
+        return result
+
+    def _work(self, call: Call, stats: _WorkerStats) -> None:
+        offsets = self.schedule.offsets
+        total = len(offsets)
+        start = self._start
+        clock = time.perf_counter
+        stop = self._stop
+        max_lag = self.max_lag
+        late_after = self.late_after
+        classify = self.classify
+        record_latency = stats.latency.record_seconds
+        record_service = stats.service.record_seconds
+        for i in self._next:
+            if i >= total or stop.is_set():
+                return
+            intended = start + offsets[i]
+            now = clock()
+            if now < intended:
+                if stop.wait(intended - now):
+                    return
+            else:
+                # arrivals due by now that no worker has picked up yet, this one included
+                backlog = self.schedule.due(now - start) - i
+                if backlog > stats.max_backlog:
+                    stats.max_backlog = backlog
+                lag = now - intended
+                if max_lag is not None and lag > max_lag:
+                    stats.dropped += 1
+                    continue
+                if lag > late_after:
+                    stats.late += 1
+            sent_at = clock()
+            try:
+                outcome = classify(call())
+            except Exception as exc:  # noqa: BLE001 — a failed request is a result, not a crash
+                outcome = type(exc).__name__
+            done = clock()
+            stats.sent += 1
+            stats.outcomes[outcome] += 1
+            record_latency(done - intended)
+            record_service(done - sent_at)
@@ -0,0 +1,127 @@
+"""Precomputed arrival schedules for open-model load.
+
+An `ArrivalSchedule` is the sorted list of intended send times (seconds from
+the start of the run) for every request in the run. It is fixed before the
+first request goes out, so a slow server can't change when requests are
+*supposed* to arrive. That is what separates an open model from a closed
+loop, where each client waits for its previous response.
+
+    ArrivalSchedule.constant(rate=200, duration=60)
+    ArrivalSchedule.poisson(rate=200, duration=60, seed=7)
+    ArrivalSchedule.step([(50, 30), (200, 30), (50, 30)])   # (rate, seconds) stages
+    ArrivalSchedule.ramp(start_rate=10, end_rate=300, duration=120)
+
+`parse_schedule("poisson:200:60")` builds one from a CLI string.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import random
+from array import array
+from typing import Iterable, Sequence
+
+
+class ArrivalSchedule:
+    __slots__ = ("name", "offsets", "duration")
+
+    def __init__(self, name: str, offsets: Iterable[float], duration: float) -> None:
+        self.name = name
+        self.offsets = array("d", offsets)
+        self.duration = duration
+        if any(b < a for a, b in zip(self.offsets, self.offsets[1:])):
+            raise ValueError("arrival offsets must be sorted")
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __repr__(self) -> str:
+        return f"ArrivalSchedule({self.name!r}, {len(self)} arrivals over {self.duration:g}s)"
+
+    @property
+    def mean_rate(self) -> float:
+        return len(self) / self.duration if self.duration else 0.0
+
+    def due(self, elapsed: float) -> int:
+        """How many arrivals are due by `elapsed` seconds into the run."""
+        return bisect.bisect_right(self.offsets, elapsed)
+
+    @classmethod
+    def constant(cls, rate: float, duration: float) -> "ArrivalSchedule":
+        _check_rate(rate, duration)
+        count = int(rate * duration)
+        return cls(f"constant {rate:g}/s", (i / rate for i in range(count)), duration)
+
+    @classmethod
+    def poisson(cls, rate: float, duration: float, seed: int | None = None) -> "ArrivalSchedule":
+        """Exponential inter-arrival gaps: independent players at `rate` on average."""
+        _check_rate(rate, duration)
+        rng = random.Random(seed)
+        offsets = []
+        t = rng.expovariate(rate)
+        while t < duration:
+            offsets.append(t)
+            t += rng.expovariate(rate)
+        return cls(f"poisson {rate:g}/s", offsets, duration)
+
+    @classmethod
+    def step(cls, stages: Sequence[tuple[float, float]]) -> "ArrivalSchedule":
+        """Constant rate within each `(rate, duration)` stage, stages back to back."""
+        if not stages:
+            raise ValueError("step schedule needs at least one (rate, duration) stage")
+        offsets: list[float] = []
+        start = 0.0
+        for rate, duration in stages:
+            if duration <= 0 or rate < 0:
+                raise ValueError(f"bad stage ({rate}, {duration})")
+            offsets.extend(start + i / rate for i in range(int(rate * duration)))
+            start += duration
+        label = " -> ".join(f"{rate:g}/s x {duration:g}s" for rate, duration in stages)
+        return cls(f"step {label}", offsets, start)
+
+    @classmethod
+    def ramp(cls, start_rate: float, end_rate: float, duration: float) -> "ArrivalSchedule":
+        """Rate changes linearly from `start_rate` to `end_rate` over `duration`.
+
+        The k-th arrival is where the expected count, the integral of the
+        rate, reaches k: r0*t + (r1 - r0)*t^2 / (2*duration) = k.
+        """
+        if duration <= 0 or start_rate < 0 or end_rate < 0 or start_rate == end_rate == 0:
+            raise ValueError(f"bad ramp {start_rate} -> {end_rate} over {duration}")
+        slope = (end_rate - start_rate) / duration
+        total = int((start_rate + end_rate) * duration / 2)
+        if slope == 0:
+            offsets = (k / start_rate for k in range(total))
+        else:
+            offsets = (
+                (-start_rate + math.sqrt(start_rate * start_rate + 2 * slope * k)) / slope for k in range(total)
+            )
+        return cls(f"ramp {start_rate:g}->{end_rate:g}/s", offsets, duration)
+
+
+def _check_rate(rate: float, duration: float) -> None:
+    if rate <= 0 or duration <= 0:
+        raise ValueError(f"rate and duration must be positive (got {rate}, {duration})")
+
+
+def parse_schedule(spec: str, seed: int | None = None) -> ArrivalSchedule:
+    """`constant:RATE:SECS`, `poisson:RATE:SECS`, `ramp:FROM:TO:SECS`,
+    or `step:RATE:SECS,RATE:SECS,...`."""
+    kind, _, rest = spec.partition(":")
+    try:
+        if kind == "constant":
+            rate, duration = map(float, rest.split(":"))
+            return ArrivalSchedule.constant(rate, duration)
+        if kind == "poisson":
+            rate, duration = map(float, rest.split(":"))
+            return ArrivalSchedule.poisson(rate, duration, seed)
+        if kind == "ramp":
+            start, end, duration = map(float, rest.split(":"))
+            return ArrivalSchedule.ramp(start, end, duration)
+        if kind == "step":
+            stages = [tuple(map(float, stage.split(":"))) for stage in rest.split(",")]
+            return ArrivalSchedule.step([(rate, duration) for rate, duration in stages])
+    except ValueError as exc:
+        raise ValueError(f"bad schedule {spec!r}: {exc}") from None
+    raise ValueError(f"unknown schedule kind {kind!r} (constant, poisson, step, ramp)")
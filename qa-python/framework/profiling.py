@@ -0,0 +1,215 @@
+"""Per-test API call profiler: the recorder `ApiClient` and `assert_matches` feed.
+
+Answers "is this test slow because of the backend or because of us?". With
+`--api-profile[=PATH]` every `ApiClient` call is tagged with the running
+test's node id and its wall time split into:
+
+  network     `Session.request` — connect, server time and body download
+  decode      JSON decoding of the body
+  validation  `schemas.assert_matches` (attributed to the test, per schema)
+
+Network time is further split per endpoint into connect / TTFB / download,
+with new-connection counts and wire vs body bytes, from the client's
+`PhaseTiming` (`framework.http_timing`), which profiling switches on.
+
+The pytest side (option, attribution, reports) lives in
+`framework.profiling_plugin`.
+
+Disabled (the default), the hooks in `ApiClient` and `assert_matches` cost
+one global lookup per call.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from framework.http_timing import PhaseTiming
+
+_ID_SEGMENT = re.compile(
+    r"^(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|[0-9a-fA-F]{16,}|[A-Za-z]+[-_][0-9A-Za-z_-]{8,})$"
+)
+
+
+def endpoint_template(path: str) -> str:
+    """`/api/v1/history/3f2c…` -> `/api/v1/history/{id}` so calls aggregate per route."""
+    path = path.split("?", 1)[0]
+    return "/".join("{id}" if _ID_SEGMENT.match(seg) else seg for seg in path.split("/"))
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+@dataclass
+class TestProfile:
+    calls: int = 0
+    network_ms: float = 0.0
+    decode_ms: float = 0.0
+    validation_ms: float = 0.0
+    validations: dict[str, float] = field(default_factory=dict)
+    endpoints: dict[str, float] = field(default_factory=dict)
+    new_connections: int = 0
+
+    @property
+    def api_ms(self) -> float:
+        return self.network_ms + self.decode_ms + self.validation_ms
+
+
+@dataclass
+class EndpointProfile:
+    calls: int = 0
+    network_ms: list[float] = field(default_factory=list)
+    decode_ms: float = 0.0
+    statuses: dict[str, int] = field(default_factory=dict)
+    ttfb_ms: list[float] = field(default_factory=list)
+    connect_ms: float = 0.0
+    download_ms: float = 0.0
+    new_connections: int = 0
+    wire_bytes: int = 0
+    body_bytes: int = 0
+
+
+class ApiProfiler:
+    def __init__(self) -> None:
+        self.current: str = "<no test>"
+        self.tests: dict[str, TestProfile] = {}
+        self.endpoints: dict[str, EndpointProfile] = {}
+
+    def _test(self) -> TestProfile:
+        profile = self.tests.get(self.current)
+        if profile is None:
+            profile = self.tests[self.current] = TestProfile()
+        return profile
+
+    def record_call(
+        self,
+        method: str,
+        path: str,
+        status: int,
+        network_ms: float,
+        decode_ms: float,
+        phases: PhaseTiming | None = None,
+    ) -> None:
+        name = f"{method.upper()} {endpoint_template(path)}"
+        test = self._test()
+        test.calls += 1
+        test.network_ms += network_ms
+        test.decode_ms += decode_ms
+        test.endpoints[name] = test.endpoints.get(name, 0.0) + network_ms + decode_ms
+
+        ep = self.endpoints.get(name)
+        if ep is None:
+            ep = self.endpoints[name] = EndpointProfile()
+        ep.calls += 1
+        ep.network_ms.append(network_ms)
+        ep.decode_ms += decode_ms
+        ep.statuses[str(status)] = ep.statuses.get(str(status), 0) + 1
+        if phases is not None:
+            new = 0 if phases.reused else 1
+            test.new_connections += new
+            ep.new_connections += new
+            ep.ttfb_ms.append(phases.ttfb_ms)
+            ep.connect_ms += phases.connect_ms
+            ep.download_ms += phases.download_ms
+            ep.wire_bytes += phases.wire_bytes
+            ep.body_bytes += phases.body_bytes
+
+    def record_validation(self, component: str, elapsed_ms: float) -> None:
+        test = self._test()
+        test.validation_ms += elapsed_ms
+        test.validations[component] = test.validations.get(component, 0.0) + elapsed_ms
+
+    # ── Reporting ───────────────────────────────────────────────────
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "tests": {nodeid: asdict(p) for nodeid, p in self.tests.items()},
+            "endpoints": {name: asdict(ep) for name, ep in self.endpoints.items()},
+        }
+
+    def merge_json(self, data: dict[str, Any]) -> None:
+        for nodeid, raw in data.get("tests", {}).items():
+            self.tests[nodeid] = TestProfile(**raw)
+        for name, raw in data.get("endpoints", {}).items():
+            ep = self.endpoints.setdefault(name, EndpointProfile())
+            for key, value in raw.items():
+                current = getattr(ep, key)
+                if isinstance(current, dict):
+                    for k, count in value.items():
+                        current[k] = current.get(k, 0) + count
+                else:
+                    setattr(ep, key, current + value)  # lists concatenate, numbers add
+
+    def report(self, top: int = 10) -> dict[str, Any]:
+        tests = sorted(self.tests.items(), key=lambda kv: kv[1].api_ms, reverse=True)[:top]
+        endpoints = sorted(self.endpoints.items(), key=lambda kv: sum(kv[1].network_ms), reverse=True)[:top]
+        return {
+            "slowest_tests": [
+                {
+                    "nodeid": nodeid,
+                    "calls": p.calls,
+                    "api_ms": round(p.api_ms, 2),
+                    "network_ms": round(p.network_ms, 2),
+                    "decode_ms": round(p.decode_ms, 2),
+                    "validation_ms": round(p.validation_ms, 2),
+                    "new_connections": p.new_connections,
+                }
+                for nodeid, p in tests
+            ],
+            "hot_endpoints": [
+                {
+                    "endpoint": name,
+                    "calls": ep.calls,
+                    "total_ms": round(sum(ep.network_ms), 2),
+                    "p50_ms": round(_percentile(ep.network_ms, 0.50), 2),
+                    "p95_ms": round(_percentile(ep.network_ms, 0.95), 2),
+                    "max_ms": round(max(ep.network_ms, default=0.0), 2),
+                    "decode_ms": round(ep.decode_ms, 2),
+                    "connect_ms": round(ep.connect_ms, 2),
+                    "ttfb_p50_ms": round(_percentile(ep.ttfb_ms, 0.50), 2),
+                    "ttfb_p95_ms": round(_percentile(ep.ttfb_ms, 0.95), 2),
+                    "download_ms": round(ep.download_ms, 2),
+                    "new_connections": ep.new_connections,
+                    "wire_bytes": ep.wire_bytes,
+                    "body_bytes": ep.body_bytes,
+                    "statuses": ep.statuses,
+                }
+                for name, ep in endpoints
+            ],
+        }
+
+
+_active: ApiProfiler | None = None
+
+
+def activate(profiler: ApiProfiler | None) -> None:
+    global _active
+    _active = profiler
+
+
+def active() -> ApiProfiler | None:
+    return _active
+
+
+def record_call(
+    method: str,
+    path: str,
+    status: int,
+    network_ms: float,
+    decode_ms: float,
+    phases: PhaseTiming | None = None,
+) -> None:
+    if _active is not None:
+        _active.record_call(method, path, status, network_ms, decode_ms, phases)
+
+
+def record_validation(component: str, elapsed_ms: float) -> None:
+    if _active is not None:
+        _active.record_validation(component, elapsed_ms)
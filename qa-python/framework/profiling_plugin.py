@@ -0,0 +1,125 @@
+"""pytest plugin for the API call profiler in `framework.profiling`.
+
+`--api-profile[=PATH]` tags every `ApiClient` call with the running test's
+node id. At session end the slowest tests and the hottest endpoints are
+ranked in the terminal summary and written to PATH (default
+`api-profile.json`). Each test also gets its breakdown as an Allure JSON
+attachment when allure-pytest is active. Under xdist every worker writes
+its own part and the controller merges them into PATH.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from framework import profiling
+from framework.profiling import ApiProfiler
+
+try:
+    import allure
+except ImportError:  # allure-pytest is optional for the profiler
+    allure = None
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--api-profile",
+        nargs="?",
+        const="api-profile.json",
+        default=None,
+        metavar="PATH",
+        help="profile ApiClient calls per test; write the JSON report to PATH (default: api-profile.json)",
+    )
+
+
+def _worker_id(config: pytest.Config) -> str | None:
+    # not PYTEST_XDIST_WORKER: a pytest run started from inside a worker inherits it
+    workerinput = getattr(config, "workerinput", None)
+    return None if workerinput is None else workerinput["workerid"]
+
+
+def _part_path(path: Path, worker: str) -> Path:
+    return path.with_name(f"{path.stem}.{worker}{path.suffix}")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("--api-profile", default=None):
+        profiling.activate(ApiProfiler())
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    profiling.activate(None)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: pytest.Item | None):
+    profiler = profiling.active()
+    if profiler is None:
+        yield
+        return
+    profiler.current = item.nodeid
+    try:
+        yield
+    finally:
+        profiler.current = "<no test>"
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item: pytest.Item, nextitem: pytest.Item | None):
+    yield
+    profiler = profiling.active()
+    if profiler is None or allure is None:
+        return
+    profile = profiler.tests.get(item.nodeid)
+    if profile is not None:
+        allure.attach(
+            json.dumps(asdict(profile) | {"api_ms": round(profile.api_ms, 2)}, indent=2),
+            name="api-profile",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    profiler = profiling.active()
+    if profiler is None:
+        return
+    path = Path(session.config.getoption("--api-profile"))
+    worker = _worker_id(session.config)
+    if worker is not None:
+        _part_path(path, worker).write_text(json.dumps(profiler.to_json()))
+        return
+    for part in sorted(path.parent.glob(f"{path.stem}.gw*{path.suffix}")):
+        profiler.merge_json(json.loads(part.read_text()))
+        part.unlink()
+    path.write_text(json.dumps(profiler.report(top=50) | profiler.to_json(), indent=2))
+
+
+def pytest_terminal_summary(terminalreporter: Any, exitstatus: int, config: pytest.Config) -> None:
+    profiler = profiling.active()
+    if profiler is None or _worker_id(config) is not None or not profiler.tests:
+        return
+    report = profiler.report()
+    tr = terminalreporter
+    tr.section("API profile")
+    tr.write_line(f"{'api ms':>9} {'network':>9} {'decode':>8} {'schema':>8} {'calls':>5}  test")
+    for row in report["slowest_tests"]:
+        tr.write_line(
+            f"{row['api_ms']:9.1f} {row['network_ms']:9.1f} {row['decode_ms']:8.1f} "
+            f"{row['validation_ms']:8.1f} {row['calls']:5d}  {row['nodeid']}"
+        )
+    tr.write_line("")
+    tr.write_line(
+        f"{'total ms':>9} {'p50':>7} {'p95':>7} {'connect':>8} {'ttfb95':>7} {'download':>8} {'new':>4} {'calls':>5}  endpoint"
+    )
+    for row in report["hot_endpoints"]:
+        tr.write_line(
+            f"{row['total_ms']:9.1f} {row['p50_ms']:7.1f} {row['p95_ms']:7.1f} {row['connect_ms']:8.1f} "
+            f"{row['ttfb_p95_ms']:7.1f} {row['download_ms']:8.1f} {row['new_connections']:4d} {row['calls']:5d}  "
+            f"{row['endpoint']}"
+        )
+    tr.write_line(f"full report: {config.getoption('--api-profile')}")
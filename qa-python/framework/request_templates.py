@@ -0,0 +1,122 @@
+"""Pre-encoded request bodies for the generated client (`framework.rgs_client`).
+
+A load loop spinning one session sends the same `session_id`, `game_id` and
+`bet` thousands of times; only `client_timestamp` (and the Idempotency-Key
+header) changes. `BodyTemplate` JSON-encodes the fixed fields once and, per
+call, encodes just the volatile ones and splices them on:
+
+    tpl = BodyTemplate({"session_id": sid, "game_id": gid, "bet": bet},
+                       volatile={"client_timestamp": now_ms})
+    tpl.render()                      # b'{"session_id":...,"client_timestamp":1718...}'
+    tpl.render(client_timestamp=42)
+
+`PreparedCall` binds a template to a method, path and pre-built headers, so
+a call is one small bytes join plus `ApiClient.send`.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+
+if TYPE_CHECKING:
+    from framework.api_client import ApiClient, ApiResponse, RawApiResponse
+
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def encode_body(fields: Mapping[str, Any]) -> bytes:
+    """Compact JSON, `None` fields dropped (they are optional in the contract)."""
+    return _encode({k: v for k, v in fields.items() if v is not None}).encode()
+
+
+def _encode_value(value: Any) -> bytes:
+    if type(value) is int:
+        return str(value).encode()
+    return _encode(value).encode()
+
+
+class BodyTemplate:
+    """A JSON object body with its fixed fields encoded once."""
+
+    __slots__ = ("_head", "_slots", "_names")
+
+    def __init__(
+        self,
+        fixed: Mapping[str, Any],
+        volatile: Mapping[str, Callable[[], Any] | None],
+    ) -> None:
+        overlap = set(fixed) & set(volatile)
+        if overlap:
+            raise ValueError(f"fields both fixed and volatile: {sorted(overlap)}")
+        head = encode_body(fixed)[:-1]  # b'{"a":1' or b'{'
+        sep = b"," if len(head) > 1 else b""
+        slots = []
+        for name, default in volatile.items():
+            slots.append((name, sep + _encode(name).encode() + b":", default))
+            sep = b","
+        self._head = head
+        self._slots = tuple(slots)
+        self._names = frozenset(volatile)
+
+    @property
+    def volatile(self) -> tuple[str, ...]:
+        return tuple(name for name, _prefix, _default in self._slots)
+
+    def render(self, **values: Any) -> bytes:
+        unknown = values.keys() - self._names
+        if unknown:
+            raise TypeError(f"not volatile fields of this template: {sorted(unknown)}")
+        parts = [self._head]
+        for name, prefix, default in self._slots:
+            value = values.get(name)
+            if value is None:
+                if default is None:
+                    raise TypeError(f"volatile field {name!r} has no default and was not given")
+                value = default()
+            parts.append(prefix)
+            parts.append(_encode_value(value))
+        parts.append(b"}")
+        return b"".join(parts)
+
+
+class PreparedCall:
+    """One operation with its path, headers and body template bound.
+
+    Keyword arguments at call time are either volatile body fields or the
+    operation's header parameters (by Python name, e.g. `idempotency_key`).
+    Headers are captured when prepared, so re-prepare after a token change.
+    """
+
+    __slots__ = ("api", "method", "path", "headers", "template", "header_params")
+
+    def __init__(
+        self,
+        api: ApiClient,
+        method: str,
+        path: str,
+        headers: dict[str, str],
+        template: BodyTemplate,
+        header_params: Mapping[str, str] | None = None,
+    ) -> None:
+        self.api = api
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.template = template
+        self.header_params = dict(header_params or {})
+
+    def __call__(self, **values: Any) -> ApiResponse | RawApiResponse:
+        headers = self.headers
+        for py_name, header in self.header_params.items():
+            value = values.pop(py_name, None)
+            if value is not None:
+                if headers is self.headers:
+                    headers = dict(headers)
+                headers[header] = value
+        return self.api.send(self.method, self.path, headers=headers, data=self.template.render(**values))
@@ -0,0 +1,404 @@
+"""Typed client for the SlotsOne RGS API.
+
+Generated by `python -m framework.codegen` from backend/openapi.json — do
+not edit; regenerate after changing the contract.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Literal, NamedTuple
+from urllib.parse import quote
+
+from framework.api_client import ApiClient, ApiResponse, RawApiResponse
+from framework.request_templates import BodyTemplate, PreparedCall, encode_body, now_ms
+
+SPEC_SHA256 = "946710f488b59502cabc81e6a34322dc3a7d02bad3fd2b030c306d19bdb3747e"
+
+Response = ApiResponse | RawApiResponse
+
+_ACCEPT = {"Accept": "application/json"}
+_ACCEPT_JSON = {"Accept": "application/json", "Content-Type": "application/json"}
+
+
+class Operation(NamedTuple):
+    method: str
+    path: str
+    success: tuple[int, ...]
+    schema: str | None
+
+
+OPERATIONS: dict[str, Operation] = {
+    "post_auth_register": Operation("POST", "/api/v1/auth/register", (201,), "AuthResponse"),
+    "post_auth_login": Operation("POST", "/api/v1/auth/login", (200,), "AuthResponse"),
+    "post_auth_refresh": Operation("POST", "/api/v1/auth/refresh", (200,), "AuthResponse"),
+    "post_auth_logout": Operation("POST", "/api/v1/auth/logout", (204,), None),
+    "get_health": Operation("GET", "/health", (200,), None),
+    "get_ready": Operation("GET", "/ready", (200,), None),
+    "post_game_init": Operation("POST", "/api/v1/game/init", (200,), "InitResponse"),
+    "post_spin": Operation("POST", "/api/v1/spin", (200,), "SpinResponse"),
+    "get_history": Operation("GET", "/api/v1/history", (200,), "EnhancedHistoryResponse"),
+    "get_history_summary": Operation("GET", "/api/v1/history/summary", (200,), "HistorySummaryResponse"),
+    "get_history_by_round_id": Operation("GET", "/api/v1/history/{roundId}", (200,), "RoundDetailResponse"),
+    "post_provably_fair_rotate": Operation("POST", "/api/v1/provably-fair/rotate", (200,), "SeedRotationResponse"),
+    "put_provably_fair_client_seed": Operation("PUT", "/api/v1/provably-fair/client-seed", (200,), "SeedPairResponse"),
+    "get_provably_fair_current": Operation("GET", "/api/v1/provably-fair/current", (200,), "SeedPairResponse"),
+    "post_wallet_topup": Operation("POST", "/api/v1/wallet/topup", (200,), "TopUpResponse"),
+    "post_images_generate": Operation("POST", "/api/v1/images/generate", (200, 202), "ImageJobResponse"),
+    "post_roulette_init": Operation("POST", "/api/v1/roulette/init", (200,), "RouletteInitResponse"),
+    "post_roulette_spin": Operation("POST", "/api/v1/roulette/spin", (200,), "RouletteSpinResponse"),
+    "post_american_roulette_init": Operation("POST", "/api/v1/american-roulette/init", (200,), "AmericanRouletteInitResponse"),
+    "post_american_roulette_spin": Operation("POST", "/api/v1/american-roulette/spin", (200,), "AmericanRouletteSpinResponse"),
+    "post_game_rewind": Operation("POST", "/api/v1/game/rewind", (200,), "RewindResponse"),
+    "get_images_jobs_by_job_id": Operation("GET", "/api/v1/images/jobs/{jobId}", (200,), "ImageJobResponse"),
+}
+
+
+class RgsClient:
+    """One method per OpenAPI operation, sending through `ApiClient.send`."""
+
+    def __init__(self, api: ApiClient) -> None:
+        self.api = api
+        self._token: str | None = None
+        self._headers = (_ACCEPT, _ACCEPT_JSON)
+
+    def _auth(self, json_body: bool) -> dict[str, str]:
+        token = self.api.token
+        if token != self._token:
+            self._token = token
+            bearer = {"Authorization": f"Bearer {token}"} if token else {}
+            self._headers = ({**_ACCEPT, **bearer}, {**_ACCEPT_JSON, **bearer})
+        return self._headers[json_body]
+
+    def post_auth_register(
+        self,
+        *,
+        email: str,
+        password: str,
+    ) -> Response:
+        """POST /api/v1/auth/register — Register a new player account (201: AuthResponse)"""
+        headers = _ACCEPT_JSON
+        body = encode_body({"email": email, "password": password})
+        return self.api.send("POST", "/api/v1/auth/register", headers=headers, data=body)
+
+    def prepare_post_auth_register(
+        self,
+        *,
+        email: str,
+        password: str,
+    ) -> PreparedCall:
+        """`post_auth_register` with the body pre-encoded."""
+        template = BodyTemplate({"email": email, "password": password}, {})
+        return PreparedCall(self.api, "POST", "/api/v1/auth/register", _ACCEPT_JSON, template, {})
+
+    def post_auth_login(
+        self,
+        *,
+        email: str,
+        password: str,
+    ) -> Response:
+        """POST /api/v1/auth/login — Login and receive a JWT (200: AuthResponse)"""
+        headers = _ACCEPT_JSON
+        body = encode_body({"email": email, "password": password})
+        return self.api.send("POST", "/api/v1/auth/login", headers=headers, data=body)
+
+    def prepare_post_auth_login(
+        self,
+        *,
+        email: str,
+        password: str,
+    ) -> PreparedCall:
+        """`post_auth_login` with the body pre-encoded."""
+        template = BodyTemplate({"email": email, "password": password}, {})
+        return PreparedCall(self.api, "POST", "/api/v1/auth/login", _ACCEPT_JSON, template, {})
+
+    def post_auth_refresh(
+        self,
+    ) -> Response:
+        """POST /api/v1/auth/refresh — Silently refresh the access token (200: AuthResponse)"""
+        headers = _ACCEPT
+        return self.api.send("POST", "/api/v1/auth/refresh", headers=headers)
+
+    def post_auth_logout(
+        self,
+    ) -> Response:
+        """POST /api/v1/auth/logout — Logout and revoke all refresh tokens (204)"""
+        headers = _ACCEPT
+        return self.api.send("POST", "/api/v1/auth/logout", headers=headers)
+
+    def get_health(
+        self,
+    ) -> Response:
+        """GET /health — Liveness probe (200)"""
+        headers = _ACCEPT
+        return self.api.send("GET", "/health", headers=headers)
+
+    def get_ready(
+        self,
+    ) -> Response:
+        """GET /ready — Readiness probe (200)"""
+        headers = _ACCEPT
+        return self.api.send("GET", "/ready", headers=headers)
+
+    def post_game_init(
+        self,
+        *,
+        game_id: str | None = None,
+        platform: str | None = None,
+        locale: str | None = None,
+        client_version: str | None = None,
+    ) -> Response:
+        """POST /api/v1/game/init — Initialize game session (200: InitResponse)"""
+        headers = self._auth(True)
+        body = encode_body({"game_id": game_id, "platform": platform, "locale": locale, "client_version": client_version})
+        return self.api.send("POST", "/api/v1/game/init", headers=headers, data=body)
+
+    def prepare_post_game_init(
+        self,
+        *,
+        game_id: str | None = None,
+        platform: str | None = None,
+        locale: str | None = None,
+        client_version: str | None = None,
+    ) -> PreparedCall:
+        """`post_game_init` with the body pre-encoded."""
+        template = BodyTemplate({k: v for k, v in {"game_id": game_id, "platform": platform, "locale": locale, "client_version": client_version}.items() if v is not None}, {})
+        return PreparedCall(self.api, "POST", "/api/v1/game/init", self._auth(True), template, {})
+
+    def post_spin(
+        self,
+        *,
+        session_id: str,
+        game_id: str,
+        bet: dict[str, Any],
+        idempotency_key: str | None = None,
+        client_timestamp: int | None = None,
+    ) -> Response:
+        """POST /api/v1/spin — Execute one spin (200: SpinResponse)"""
+        headers = self._auth(True)
+        if idempotency_key is not None:
+            headers = {**headers, "Idempotency-Key": idempotency_key}
+        body = encode_body({"session_id": session_id, "game_id": game_id, "bet": bet, "client_timestamp": now_ms() if client_timestamp is None else client_timestamp})
+        return self.api.send("POST", "/api/v1/spin", headers=headers, data=body)
+
+    def prepare_post_spin(
+        self,
+        *,
+        session_id: str,
+        game_id: str,
+        bet: dict[str, Any],
+    ) -> PreparedCall:
+        """`post_spin` with the body pre-encoded; call with `client_timestamp`, `idempotency_key`."""
+        template = BodyTemplate({"session_id": session_id, "game_id": game_id, "bet": bet}, {"client_timestamp": now_ms})
+        return PreparedCall(self.api, "POST", "/api/v1/spin", self._auth(True), template, {"idempotency_key": "Idempotency-Key"})
+
+    def get_history(
+        self,
+        *,
+        limit: int | None = None,
+        offset: int | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        result: Literal["win", "loss", "all"] | None = None,
+        min_bet: float | None = None,
+        max_bet: float | None = None,
+    ) -> Response:
+        """GET /api/v1/history — Get spin history with filters and summary (200: EnhancedHistoryResponse)"""
+        headers = self._auth(False)
+        params = {k: v for k, v in (("limit", limit), ("offset", offset), ("date_from", date_from), ("date_to", date_to), ("result", result), ("min_bet", min_bet), ("max_bet", max_bet),) if v is not None}
+        return self.api.send("GET", "/api/v1/history", headers=headers, params=params)
+
+    def get_history_summary(
+        self,
+        *,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        result: Literal["win", "loss", "all"] | None = None,
+        min_bet: float | None = None,
+        max_bet: float | None = None,
+    ) -> Response:
+        """GET /api/v1/history/summary — Get aggregated stats for the current user (200: HistorySummaryResponse)"""
+        headers = self._auth(False)
+        params = {k: v for k, v in (("date_from", date_from), ("date_to", date_to), ("result", result), ("min_bet", min_bet), ("max_bet", max_bet),) if v is not None}
+        return self.api.send("GET", "/api/v1/history/summary", headers=headers, params=params)
+
+    def get_history_by_round_id(
+        self,
+        round_id: str,
+    ) -> Response:
+        """GET /api/v1/history/{roundId} — Get round detail with provably fair data and transactions (200: RoundDetailResponse)"""
+        headers = self._auth(False)
+        return self.api.send("GET", f"/api/v1/history/{quote(str(round_id), safe='')}", headers=headers)
+
+    def post_provably_fair_rotate(
+        self,
+    ) -> Response:
+        """POST /api/v1/provably-fair/rotate — Rotate seed pair — reveals old server seed, creates new pair (200: SeedRotationResponse)"""
+        headers = self._auth(False)
+        return self.api.send("POST", "/api/v1/provably-fair/rotate", headers=headers)
+
+    def put_provably_fair_client_seed(
+        self,
+        *,
+        client_seed: str,
+    ) -> Response:
+        """PUT /api/v1/provably-fair/client-seed — Set the client seed for the active seed pair (200: SeedPairResponse)"""
+        headers = self._auth(True)
+        body = encode_body({"client_seed": client_seed})
+        return self.api.send("PUT", "/api/v1/provably-fair/client-seed", headers=headers, data=body)
+
+    def prepare_put_provably_fair_client_seed(
+        self,
+        *,
+        client_seed: str,
+    ) -> PreparedCall:
+        """`put_provably_fair_client_seed` with the body pre-encoded."""
+        template = BodyTemplate({"client_seed": client_seed}, {})
+        return PreparedCall(self.api, "PUT", "/api/v1/provably-fair/client-seed", self._auth(True), template, {})
+
+    def get_provably_fair_current(
+        self,
+    ) -> Response:
+        """GET /api/v1/provably-fair/current — Get the current active seed pair info (200: SeedPairResponse)"""
+        headers = self._auth(False)
+        return self.api.send("GET", "/api/v1/provably-fair/current", headers=headers)
+
+    def post_wallet_topup(
+        self,
+        *,
+        amount: float,
+    ) -> Response:
+        """POST /api/v1/wallet/topup — Top up wallet balance (demo) (200: TopUpResponse)"""
+        headers = self._auth(True)
+        body = encode_body({"amount": amount})
+        return self.api.send("POST", "/api/v1/wallet/topup", headers=headers, data=body)
+
+    def prepare_post_wallet_topup(
+        self,
+        *,
+        amount: float,
+    ) -> PreparedCall:
+        """`post_wallet_topup` with the body pre-encoded."""
+        template = BodyTemplate({"amount": amount}, {})
+        return PreparedCall(self.api, "POST", "/api/v1/wallet/topup", self._auth(True), template, {})
+
+    def post_images_generate(
+        self,
+        *,
+        title: str,
+        category: str,
+        provider: str,
+    ) -> Response:
+        """POST /api/v1/images/generate — Request game thumbnail generation (200, 202: ImageJobResponse)"""
+        headers = self._auth(True)
+        body = encode_body({"title": title, "category": category, "provider": provider})
+        return self.api.send("POST", "/api/v1/images/generate", headers=headers, data=body)
+
+    def prepare_post_images_generate(
+        self,
+        *,
+        title: str,
+        category: str,
+        provider: str,
+    ) -> PreparedCall:
+        """`post_images_generate` with the body pre-encoded."""
+        template = BodyTemplate({"title": title, "category": category, "provider": provider}, {})
+        return PreparedCall(self.api, "POST", "/api/v1/images/generate", self._auth(True), template, {})
+
+    def post_roulette_init(
+        self,
+    ) -> Response:
+        """POST /api/v1/roulette/init — Initialize a roulette session (200: RouletteInitResponse)"""
+        headers = self._auth(False)
+        return self.api.send("POST", "/api/v1/roulette/init", headers=headers)
+
+    def post_roulette_spin(
+        self,
+        *,
+        session_id: str,
+        bets: list[dict[str, Any]],
+        idempotency_key: str | None = None,
+        game_id: str | None = None,
+        client_timestamp: float | None = None,
+    ) -> Response:
+        """POST /api/v1/roulette/spin — Place roulette bets and spin the wheel (200: RouletteSpinResponse)"""
+        headers = self._auth(True)
+        if idempotency_key is not None:
+            headers = {**headers, "Idempotency-Key": idempotency_key}
+        body = encode_body({"session_id": session_id, "game_id": game_id, "bets": bets, "client_timestamp": now_ms() if client_timestamp is None else client_timestamp})
+        return self.api.send("POST", "/api/v1/roulette/spin", headers=headers, data=body)
+
+    def prepare_post_roulette_spin(
+        self,
+        *,
+        session_id: str,
+        bets: list[dict[str, Any]],
+        game_id: str | None = None,
+    ) -> PreparedCall:
+        """`post_roulette_spin` with the body pre-encoded; call with `client_timestamp`, `idempotency_key`."""
+        template = BodyTemplate({k: v for k, v in {"session_id": session_id, "game_id": game_id, "bets": bets}.items() if v is not None}, {"client_timestamp": now_ms})
+        return PreparedCall(self.api, "POST", "/api/v1/roulette/spin", self._auth(True), template, {"idempotency_key": "Idempotency-Key"})
+
+    def post_american_roulette_init(
+        self,
+    ) -> Response:
+        """POST /api/v1/american-roulette/init — Initialize an American roulette session (200: AmericanRouletteInitResponse)"""
+        headers = self._auth(False)
+        return self.api.send("POST", "/api/v1/american-roulette/init", headers=headers)
+
+    def post_american_roulette_spin(
+        self,
+        *,
+        session_id: str,
+        bets: list[dict[str, Any]],
+        idempotency_key: str | None = None,
+        game_id: str | None = None,
+        client_timestamp: float | None = None,
+    ) -> Response:
+        """POST /api/v1/american-roulette/spin — Place American roulette bets and spin the wheel (200: AmericanRouletteSpinResponse)"""
+        headers = self._auth(True)
+        if idempotency_key is not None:
+            headers = {**headers, "Idempotency-Key": idempotency_key}
+        body = encode_body({"session_id": session_id, "game_id": game_id, "bets": bets, "client_timestamp": now_ms() if client_timestamp is None else client_timestamp})
+        return self.api.send("POST", "/api/v1/american-roulette/spin", headers=headers, data=body)
+
+    def prepare_post_american_roulette_spin(
+        self,
+        *,
+        session_id: str,
+        bets: list[dict[str, Any]],
+        game_id: str | None = None,
+    ) -> PreparedCall:
+        """`post_american_roulette_spin` with the body pre-encoded; call with `client_timestamp`, `idempotency_key`."""
+        template = BodyTemplate({k: v for k, v in {"session_id": session_id, "game_id": game_id, "bets": bets}.items() if v is not None}, {"client_timestamp": now_ms})
+        return PreparedCall(self.api, "POST", "/api/v1/american-roulette/spin", self._auth(True), template, {"idempotency_key": "Idempotency-Key"})
+
+    def post_game_rewind(
+        self,
+        *,
+        session_id: str,
+        offer_id: str,
+        tier: Literal["safe", "standard", "super"],
+    ) -> Response:
+        """POST /api/v1/game/rewind — Accept Time Rewind offer (200: RewindResponse)"""
+        headers = self._auth(True)
+        body = encode_body({"session_id": session_id, "offer_id": offer_id, "tier": tier})
+        return self.api.send("POST", "/api/v1/game/rewind", headers=headers, data=body)
+
+    def prepare_post_game_rewind(
+        self,
+        *,
+        session_id: str,
+        offer_id: str,
+        tier: Literal["safe", "standard", "super"],
+    ) -> PreparedCall:
+        """`post_game_rewind` with the body pre-encoded."""
+        template = BodyTemplate({"session_id": session_id, "offer_id": offer_id, "tier": tier}, {})
+        return PreparedCall(self.api, "POST", "/api/v1/game/rewind", self._auth(True), template, {})
+
+    def get_images_jobs_by_job_id(
+        self,
+        job_id: str,
+    ) -> Response:
+        """GET /api/v1/images/jobs/{jobId} — Poll image generation job status (200: ImageJobResponse)"""
+        headers = self._auth(False)
+        return self.api.send("GET", f"/api/v1/images/jobs/{quote(str(job_id), safe='')}", headers=headers)
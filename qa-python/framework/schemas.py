@@ -9,12 +9,15 @@ from __future__ import annotations
 
 import copy
 import json
+import time
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from jsonschema import Draft202012Validator, RefResolver
 
+from framework import profiling
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 OPENAPI_PATH = REPO_ROOT / "backend" / "openapi.json"
 
@@ -69,7 +72,9 @@ def assert_matches(component_name: str, payload: Any) -> None:
 
     Raises AssertionError with a flat list of violations on mismatch.
     """
+    start = time.perf_counter()
     errors = sorted(validator_for(component_name).iter_errors(payload), key=lambda e: list(e.path))
+    profiling.record_validation(component_name, (time.perf_counter() - start) * 1000.0)
     if not errors:
         return
     formatted = "\n".join(f"  - {'/'.join(map(str, e.path)) or '<root>'}: {e.message}" for e in errors)
@@ -0,0 +1,439 @@
+"""Record/replay of `ApiClient` traffic, for running the framework offline.
+
+Capture (`pytest --api-capture[=PATH]`, or `start_capture()`) records every
+request/response pair `ApiClient.send` sees into a gzip'd JSONL store:
+
+    {"format": "slotsone-traffic", "version": 1, "records": N, "index": {key: [line, n]}}
+    {"key": "...", "method": "POST", "path": "/api/v1/spin", "status": 200, "ctype": "...", "body": "...", "count": 3}
+    ...
+
+Records are grouped by match key (the header's index points at each group)
+and identical responses are stored once with a count.
+
+The match key is method + templated path (`/api/v1/history/{id}`) + the
+normalized query and body + whether a bearer token was sent. Normalizing
+drops volatile fields (`client_timestamp`) and replaces strings that vary
+per run with `{s}`: always for credential fields (`email`, `password`) and
+every string in an `/auth/` body, otherwise anything id-shaped, with a
+digit or `@`, or over 32 chars. A replayed run with fresh credentials and
+sessions still matches.
+
+Responses are stored with tokens replaced by `{{token}}` and values echoed
+from the request (the spin's `session_id`, the round id in the path)
+replaced by `{{req:<where>}}`. `ReplayServer` fills those from the live
+request, mints fresh JWT-shaped tokens, and maps server-minted ids (uuids,
+`sess_…`) to fresh ones consistently for its lifetime. Several recordings
+under one key are served round-robin. A miss is a 501 `ErrorResponse` with
+code `REPLAY_MISS`.
+
+    python -m framework.traffic replay api-traffic.jsonl.gz --port 3001
+    API_BASE_URL=http://127.0.0.1:3001 pytest tests/api
+
+Replay is for exercising and benchmarking the Python side; it has no state,
+so flows that depend on it (a duplicate registration's 409, a spin showing
+up in history) only replay as they were recorded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import gzip
+import hashlib
+import itertools
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterable
+from urllib.parse import parse_qsl, urlsplit
+
+from framework.profiling import endpoint_template
+
+FORMAT = "slotsone-traffic"
+VERSION = 1
+
+VOLATILE_FIELDS = frozenset({"client_timestamp"})
+TOKEN_FIELDS = frozenset({"access_token", "refresh_token"})
+CREDENTIAL_FIELDS = frozenset({"email", "password"})
+
+_SERVER_ID = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[a-z]+_[0-9a-f]{8}-[0-9a-f]{1,4}",
+    re.IGNORECASE,
+)
+# A JSON string literal that is a placeholder or a server-minted id.
+_DYNAMIC = re.compile(r'"(\{\{token\}\}|\{\{req:[^"}]+\}\}|' + _SERVER_ID.pattern + r')"', re.IGNORECASE)
+_DIGIT = re.compile(r"\d")
+
+
+def _varies(value: str, key: str | None = None) -> bool:
+    # credentials are random per run whatever their shape (a generated
+    # password need not contain a digit)
+    return (
+        key in CREDENTIAL_FIELDS
+        or len(value) > 32
+        or "@" in value
+        or _DIGIT.search(value) is not None
+        or _SERVER_ID.fullmatch(value) is not None
+    )
+
+
+def normalize(value: Any, key: str | None = None, *, all_strings: bool = False) -> Any:
+    """The parts of a request body that identify *which* response it wants.
+
+    `all_strings` replaces every string, for bodies that are all per-run
+    values (auth requests).
+    """
+    if isinstance(value, dict):
+        return {
+            k: normalize(v, k, all_strings=all_strings) for k, v in sorted(value.items()) if k not in VOLATILE_FIELDS
+        }
+    if isinstance(value, list):
+        return [normalize(v, key, all_strings=all_strings) for v in value]
+    if isinstance(value, str) and (all_strings or _varies(value, key)):
+        return "{s}"
+    return value
+
+
+def _is_auth(path: str) -> bool:
+    return "/auth/" in path
+
+
+def _decode_body(body: Any) -> Any:
+    if body is None or body == b"":
+        return None
+    if isinstance(body, (bytes, bytearray)):
+        try:
+            return json.loads(body)
+        except ValueError:
+            return {"{raw}": hashlib.sha1(body).hexdigest()}
+    return body
+
+
+def match_key(method: str, target: str, body: Any, authed: bool) -> str:
+    """`target` is the path with its query string, as sent on the wire."""
+    split = urlsplit(target)
+    query = normalize(dict(sorted(parse_qsl(split.query))))
+    body_shape = normalize(_decode_body(body), all_strings=_is_auth(split.path))
+    shape = json.dumps([query, body_shape], sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha1(shape.encode()).hexdigest()[:16]
+    return f"{method.upper()} {endpoint_template(split.path)} {digest} {'auth' if authed else 'anon'}"
+
+
+def bindings(target: str, body: Any) -> dict[str, str]:
+    """Per-run values in a request that responses may echo back."""
+    out: dict[str, str] = {}
+    path = urlsplit(target).path
+    auth = _is_auth(path)
+    for i, (seg, tmpl) in enumerate(zip(path.split("/"), endpoint_template(path).split("/"))):
+        if tmpl == "{id}":
+            out[f"path.{i}"] = seg
+
+    def walk(node: Any, where: str) -> None:
+        if isinstance(node, dict):
+            for k, v in node.items():
+                walk(v, f"{where}.{k}" if where else k)
+        elif isinstance(node, list):
+            for i, v in enumerate(node):
+                walk(v, f"{where}.{i}")
+        elif isinstance(node, str) and (auth or _varies(node, where.rsplit(".", 1)[-1])):
+            out[f"body.{where}"] = node
+
+    walk(_decode_body(body), "")
+    return out
+
+
+def _template_response(text: str, request_bindings: dict[str, str]) -> str:
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return text
+    by_value = {v: k for k, v in request_bindings.items()}
+
+    def walk(node: Any, key: str | None = None) -> Any:
+        if isinstance(node, dict):
+            return {k: walk(v, k) for k, v in node.items()}
+        if isinstance(node, list):
+            return [walk(v) for v in node]
+        if isinstance(node, str):
+            if key in TOKEN_FIELDS:
+                return "{{token}}"
+            if node in by_value:
+                return f"{{{{req:{by_value[node]}}}}}"
+        return node
+
+    return json.dumps(walk(payload), separators=(",", ":"))
+
+
+# ── Capture ─────────────────────────────────────────────────────────
+
+class TrafficRecorder:
+    """Collects request/response pairs in memory; `save()` writes the store."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._records: dict[tuple[str, int, str], dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def record(
+        self,
+        method: str,
+        target: str,
+        body: Any,
+        authed: bool,
+        status: int,
+        content_type: str,
+        content: bytes,
+    ) -> None:
+        key = match_key(method, target, body, authed)
+        text = content.decode("utf-8", "replace")
+        if content_type.startswith("application/json"):
+            text = _template_response(text, bindings(target, body))
+        self._add(
+            {
+                "key": key,
+                "method": method.upper(),
+                "path": endpoint_template(urlsplit(target).path),
+                "status": status,
+                "ctype": content_type,
+                "body": text,
+                "count": 1,
+            }
+        )
+
+    def _add(self, rec: dict[str, Any]) -> None:
+        ident = (rec["key"], rec["status"], rec["body"])
+        with self._lock:
+            existing = self._records.get(ident)
+            if existing is None:
+                self._records[ident] = dict(rec)
+            else:
+                existing["count"] += rec["count"]
+
+    def merge_file(self, path: str | Path) -> None:
+        for rec in read_store(path):
+            self._add(rec)
+
+    def save(self, path: str | Path) -> None:
+        with self._lock:
+            records = sorted(self._records.values(), key=lambda r: (r["key"], -r["count"]))
+        index: dict[str, list[int]] = {}
+        for line, rec in enumerate(records, start=1):
+            index.setdefault(rec["key"], [line, 0])[1] += 1
+        header = {"format": FORMAT, "version": VERSION, "records": len(records), "index": index}
+        tmp = Path(f"{path}.tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            f.write(json.dumps(header, separators=(",", ":")) + "\n")
+            for rec in records:
+                f.write(json.dumps(rec, separators=(",", ":")) + "\n")
+        tmp.replace(path)
+
+
+def read_store(path: str | Path) -> Iterable[dict[str, Any]]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("format") != FORMAT or header.get("version") != VERSION:
+            raise ValueError(f"{path}: not a {FORMAT} v{VERSION} store")
+        for line in f:
+            yield json.loads(line)
+
+
+_active: TrafficRecorder | None = None
+
+
+def start_capture() -> TrafficRecorder:
+    global _active
+    _active = TrafficRecorder()
+    return _active
+
+
+def stop_capture() -> TrafficRecorder | None:
+    global _active
+    recorder, _active = _active, None
+    return recorder
+
+
+def recorder() -> TrafficRecorder | None:
+    return _active
+
+
+# ── Replay ──────────────────────────────────────────────────────────
+
+def fake_jwt() -> str:
+    def part(obj: dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(obj, separators=(",", ":")).encode()).rstrip(b"=").decode()
+
+    now = int(time.time())
+    return ".".join(
+        [part({"alg": "HS256", "typ": "JWT"}), part({"sub": str(uuid.uuid4()), "iat": now, "exp": now + 900}), uuid.uuid4().hex]
+    )
+
+
+class IdRewriter:
+    """Maps recorded server-minted ids to fresh ones of the same shape."""
+
+    def __init__(self) -> None:
+        self._map: dict[str, str] = {}
+
+    def __call__(self, recorded: str) -> str:
+        fresh = self._map.get(recorded)
+        if fresh is None:
+            new = str(uuid.uuid4())
+            prefix, sep, tail = recorded.partition("_")
+            fresh = f"{prefix}_{new[: len(tail)]}" if sep else new
+            fresh = self._map.setdefault(recorded, fresh)
+        return fresh
+
+
+class CompiledResponse:
+    """A recorded body split into literal text and dynamic string slots."""
+
+    __slots__ = ("status", "ctype", "parts")
+
+    def __init__(self, status: int, ctype: str, body: str) -> None:
+        self.status = status
+        self.ctype = ctype
+        parts: list[str | tuple[str, str]] = []
+        pos = 0
+        if ctype.startswith("application/json"):
+            for m in _DYNAMIC.finditer(body):
+                parts.append(body[pos : m.start()])
+                value = m.group(1)
+                if value == "{{token}}":
+                    parts.append(("token", ""))
+                elif value.startswith("{{req:"):
+                    parts.append(("req", value[6:-2]))
+                else:
+                    parts.append(("id", value))
+                pos = m.end()
+        parts.append(body[pos:])
+        self.parts = [p for p in parts if p != ""]
+
+    def render(self, request_bindings: dict[str, str], ids: IdRewriter) -> bytes:
+        out: list[str] = []
+        for part in self.parts:
+            if isinstance(part, str):
+                out.append(part)
+                continue
+            kind, arg = part
+            if kind == "token":
+                value = fake_jwt()
+            elif kind == "req":
+                value = request_bindings.get(arg) or str(uuid.uuid4())
+            else:
+                value = ids(arg)
+            out.append(json.dumps(value))
+        return "".join(out).encode()
+
+
+class ReplayStore:
+    def __init__(self, paths: Iterable[str | Path] = ()) -> None:
+        self.responses: dict[str, list[CompiledResponse]] = {}
+        self._cursors: dict[str, Any] = {}
+        self.ids = IdRewriter()
+        for path in paths:
+            self.load(path)
+
+    def load(self, path: str | Path) -> None:
+        for rec in read_store(path):
+            self.responses.setdefault(rec["key"], []).append(
+                CompiledResponse(rec["status"], rec["ctype"], rec["body"])
+            )
+        self._cursors = {key: itertools.cycle(range(len(v))) for key, v in self.responses.items()}
+
+    def lookup(self, method: str, target: str, body: bytes, authed: bool) -> tuple[int, str, bytes]:
+        key = match_key(method, target, body, authed)
+        cursor = self._cursors.get(key)
+        if cursor is None:
+            miss = {"error": f"no recorded response for {method} {endpoint_template(urlsplit(target).path)}", "code": "REPLAY_MISS"}
+            return 501, "application/json", json.dumps(miss).encode()
+        compiled = self.responses[key][next(cursor)]
+        return compiled.status, compiled.ctype, compiled.render(bindings(target, body), self.ids)
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    server: "ReplayServer"
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        authed = self.headers.get("Authorization", "").startswith("Bearer ")
+        status, ctype, payload = self.server.store.lookup(self.command, self.path, body, authed)
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle  # noqa: N815 — http.server naming
+
+    def log_message(self, *_args: Any) -> None:
+        pass
+
+
+class ReplayServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, store: ReplayStore, host: str = "127.0.0.1", port: int = 0) -> None:
+        super().__init__((host, port), _ReplayHandler)
+        self.store = store
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="api-replay", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay or inspect captured ApiClient traffic.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    replay = sub.add_parser("replay", help="serve recorded responses")
+    replay.add_argument("stores", nargs="+")
+    replay.add_argument("--host", default="127.0.0.1")
+    replay.add_argument("--port", type=int, default=3001)
+    stats = sub.add_parser("stats", help="summarize a store")
+    stats.add_argument("stores", nargs="+")
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        for path in args.stores:
+            per_route: dict[str, list[int]] = {}
+            for rec in read_store(path):
+                row = per_route.setdefault(f"{rec['method']} {rec['path']}", [0, 0])
+                row[0] += 1
+                row[1] += rec["count"]
+            print(path)
+            for route, (records, calls) in sorted(per_route.items()):
+                print(f"  {calls:7d} calls {records:5d} responses  {route}")
+        return
+
+    server = ReplayServer(ReplayStore(args.stores), args.host, args.port)
+    print(f"replaying {sum(map(len, server.store.responses.values()))} responses on {server.base_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""pytest plugin for traffic capture in `framework.traffic`.
+
+`--api-capture[=PATH]` records every `ApiClient` request/response pair of
+the session into PATH (default `api-traffic.jsonl.gz`). Under xdist every
+worker writes its own part and the controller merges them into PATH.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from framework import traffic
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--api-capture",
+        nargs="?",
+        const="api-traffic.jsonl.gz",
+        default=None,
+        metavar="PATH",
+        help="record ApiClient traffic for offline replay into PATH (default: api-traffic.jsonl.gz)",
+    )
+
+
+def _part_path(path: Path, worker: str) -> Path:
+    return path.with_name(f"{path.name.split('.', 1)[0]}.{worker}.jsonl.gz")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("--api-capture", default=None):
+        traffic.start_capture()
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    recorder = traffic.stop_capture()
+    if recorder is None:
+        return
+    path = Path(session.config.getoption("--api-capture"))
+    workerinput = getattr(session.config, "workerinput", None)  # set by xdist on workers only
+    if workerinput is not None:
+        recorder.save(_part_path(path, workerinput["workerid"]))
+        return
+    for part in sorted(path.parent.glob(_part_path(path, "gw*").name)):
+        recorder.merge_file(part)
+        part.unlink()
+    recorder.save(path)
@@ -12,18 +12,16 @@ import pytest
 
 from framework.api_client import ApiClient
 from framework.config import SETTINGS
+from framework.rgs_client import RgsClient
 from framework.schemas import assert_matches
 
 
 def _init_session(api: ApiClient) -> dict:
-    resp = api.post(
-        "/api/v1/game/init",
-        json_body={
-            "game_id": SETTINGS.default_game_id,
-            "platform": "web",
-            "locale": "en",
-            "client_version": "qa-python/0.1",
-        },
+    resp = RgsClient(api).post_game_init(
+        game_id=SETTINGS.default_game_id,
+        platform="web",
+        locale="en",
+        client_version="qa-python/0.1",
     ).expect_ok()
     assert_matches("InitResponse", resp.body)
     return resp.body
@@ -38,14 +36,10 @@ def _spin_once(
 ) -> dict:
     cfg = session["config"]
     effective_lines = lines if lines is not None else cfg.get("default_lines", cfg["max_lines"])
-    resp = api.post(
-        "/api/v1/spin",
-        json_body={
-            "session_id": session["session_id"],
-            "game_id": SETTINGS.default_game_id,
-            "bet": {"amount": amount, "currency": "USD", "lines": effective_lines},
-            "client_timestamp": int(time.time() * 1000),
-        },
+    resp = RgsClient(api).post_spin(
+        session_id=session["session_id"],
+        game_id=SETTINGS.default_game_id,
+        bet={"amount": amount, "currency": "USD", "lines": effective_lines},
     ).expect_ok()
     assert_matches("SpinResponse", resp.body)
     return resp.body
@@ -13,6 +13,8 @@ import secrets
 import pytest
 
 from framework.aws.client_factory import aws_client, reset_clients
+from framework.aws.moto_coordinator import SharedMotoServers
+from framework.aws.sqs_consumer import SqsConsumer, consumer_for, stop_consumer, stop_consumers
 
 
 def _ensure_credentials() -> None:
@@ -22,39 +24,52 @@ def _ensure_credentials() -> None:
     os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
 
 
+def _worker_tag() -> str:
+    """xdist worker id (`gw3`), or `main` without xdist — prefixes resource
+    names so workers sharing one moto server never collide."""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
 @pytest.fixture(scope="session", autouse=True)
-def _aws_session_setup():
+def _aws_session_setup(tmp_path_factory: pytest.TempPathFactory):
     """Three modes, decided in priority order:
 
     1. `CI_AWS_REAL=1` → run against real AWS using ambient credentials.
     2. `AWS_ENDPOINT_URL` set → run against LocalStack (or any boto3 endpoint).
-    3. Neither → spin up an in-process `moto` ThreadedMotoServer on a free
-       port and point boto3 at it. Zero infra requirement.
+    3. Neither → share `moto` ThreadedMotoServers across the session's xdist
+       workers (`QA_MOTO_SERVERS`, default 1) and point boto3 at one. Zero
+       infra requirement.
     """
     _ensure_credentials()
 
     if os.getenv("CI_AWS_REAL") == "1":
         reset_clients()
         yield
+        stop_consumers()
         return
 
     if os.getenv("AWS_ENDPOINT_URL"):
         reset_clients()
         yield
+        stop_consumers()
         return
 
-    # In-process moto fallback.
-    from moto.server import ThreadedMotoServer
-
-    server = ThreadedMotoServer(ip_address="127.0.0.1", port=0)
-    server.start()
-    host, port = server.get_host_and_port()
-    os.environ["AWS_ENDPOINT_URL"] = f"http://{host}:{port}"
+    # Shared moto fallback. xdist workers' base temp dirs share a parent that
+    # is unique to the session, which is where the pool's state lives.
+    base = tmp_path_factory.getbasetemp()
+    state_dir = base.parent if os.getenv("PYTEST_XDIST_WORKER") else base
+    servers = SharedMotoServers(
+        str(state_dir),
+        pool_size=int(os.getenv("QA_MOTO_SERVERS", "1")),
+        worker_id=_worker_tag(),
+    )
+    os.environ["AWS_ENDPOINT_URL"] = servers.acquire()
     reset_clients()
     try:
         yield
     finally:
-        server.stop()
+        stop_consumers()
+        servers.release()
         os.environ.pop("AWS_ENDPOINT_URL", None)
         reset_clients()
 
@@ -62,7 +77,7 @@ def _aws_session_setup():
 @pytest.fixture
 def s3_bucket() -> str:
     """Create an ephemeral S3 bucket and delete it after the test."""
-    name = f"qa-py-{secrets.token_hex(6)}"
+    name = f"qa-py-{_worker_tag()}-{secrets.token_hex(6)}"
     s3 = aws_client("s3")
     s3.create_bucket(Bucket=name)
     yield name
@@ -77,18 +92,25 @@ def s3_bucket() -> str:
 @pytest.fixture
 def sqs_queue() -> str:
     """Create an ephemeral SQS queue and delete it after the test."""
-    name = f"qa-py-{secrets.token_hex(6)}"
+    name = f"qa-py-{_worker_tag()}-{secrets.token_hex(6)}"
     sqs = aws_client("sqs")
     resp = sqs.create_queue(QueueName=name)
     url = resp["QueueUrl"]
     yield url
+    stop_consumer(url)
     sqs.delete_queue(QueueUrl=url)
 
 
+@pytest.fixture
+def sqs_events(sqs_queue: str) -> SqsConsumer:
+    """Background consumer + event index for `sqs_queue`."""
+    return consumer_for(sqs_queue)
+
+
 @pytest.fixture
 def cloudwatch_log_group() -> str:
     """Create an ephemeral CloudWatch log group and delete it after the test."""
-    name = f"/qa-py/{secrets.token_hex(6)}"
+    name = f"/qa-py/{_worker_tag()}/{secrets.token_hex(6)}"
     logs = aws_client("logs")
     logs.create_log_group(logGroupName=name)
     yield name
@@ -0,0 +1,46 @@
+"""Client pool — S3/SQS assertions fanned out over threads share one client
+per service and reuse its connections instead of queueing on a full pool.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from framework.aws.client_factory import aws_client, aws_resource, client_stats
+
+
+@pytest.mark.aws
+def test_threaded_fan_out_reuses_pooled_connections(s3_bucket: str, caplog: pytest.LogCaptureFixture) -> None:
+    s3 = aws_client("s3")
+    assert aws_client("s3") is s3
+    assert aws_client("s3", max_pool_connections=5) is not s3
+
+    def put(i: int) -> None:
+        aws_client("s3").put_object(Bucket=s3_bucket, Key=f"fan-out/{i:03d}.json", Body=b"{}")
+
+    with caplog.at_level(logging.WARNING, logger="urllib3.connectionpool"):
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            list(pool.map(put, range(200)))
+    assert "Connection pool is full" not in caplog.text
+
+    stats = next(v for k, v in client_stats().items() if k.startswith("s3@") and "#" not in k)
+    assert stats.calls >= 200
+    assert stats.connections_opened <= 50
+    assert stats.connections_reused >= 150
+
+
+@pytest.mark.aws
+def test_resources_are_per_thread(s3_bucket: str) -> None:
+    mine = aws_resource("s3")
+    assert aws_resource("s3") is mine
+
+    theirs: list[object] = []
+    thread = threading.Thread(target=lambda: theirs.append(aws_resource("s3")))
+    thread.start()
+    thread.join()
+    assert theirs[0] is not mine
+    assert mine.Bucket(s3_bucket).name == s3_bucket
@@ -15,7 +15,7 @@ import uuid
 import pytest
 
 from framework.aws.client_factory import aws_client
-from framework.aws.cloudwatch_assertions import assert_log_contains
+from framework.aws.cloudwatch_assertions import LogCursor, assert_log_contains, assert_logs_contain
 
 
 @pytest.mark.aws
@@ -60,3 +60,83 @@ def test_missing_log_event_raises_with_context(cloudwatch_log_group: str) -> Non
             timeout_s=2,
             poll_interval_s=0.5,
         )
+
+
+@pytest.mark.aws
+def test_batch_of_request_ids_found_in_one_loop(cloudwatch_log_group: str) -> None:
+    logs = aws_client("logs")
+    stream = "qa-py-batch"
+    logs.create_log_stream(logGroupName=cloudwatch_log_group, logStreamName=stream)
+    now_ms = int(time.time() * 1000)
+    request_ids = [f"req-{uuid.uuid4()}" for _ in range(40)]
+    logs.put_log_events(
+        logGroupName=cloudwatch_log_group,
+        logStreamName=stream,
+        logEvents=[
+            {"timestamp": now_ms + i, "message": f'{{"request_id":"{rid}","msg":"spin_executed"}}'}
+            for i, rid in enumerate(request_ids)
+        ],
+    )
+
+    found = assert_logs_contain(cloudwatch_log_group, request_ids, since_ms=now_ms - 1000, timeout_s=10)
+    assert set(found) == set(request_ids)
+    assert request_ids[17] in found[request_ids[17]]["message"]
+
+    with pytest.raises(AssertionError, match=r"1 of 41 patterns never appeared"):
+        assert_logs_contain(
+            cloudwatch_log_group, [*request_ids, "req-missing"], since_ms=now_ms - 1000, timeout_s=1
+        )
+
+
+@pytest.mark.aws
+def test_cursor_follows_pages_and_only_returns_new_events(cloudwatch_log_group: str) -> None:
+    logs = aws_client("logs")
+    stream = "qa-py-cursor"
+    logs.create_log_stream(logGroupName=cloudwatch_log_group, logStreamName=stream)
+    now_ms = int(time.time() * 1000)
+    logs.put_log_events(
+        logGroupName=cloudwatch_log_group,
+        logStreamName=stream,
+        logEvents=[{"timestamp": now_ms + i, "message": f"line {i}"} for i in range(35)],
+    )
+
+    cursor = LogCursor(cloudwatch_log_group, since_ms=now_ms - 1000, page_limit=10)
+    assert [e["message"] for e in cursor.poll()] == [f"line {i}" for i in range(35)]
+    assert cursor.requests >= 4
+    assert cursor.poll() == []
+
+    logs.put_log_events(
+        logGroupName=cloudwatch_log_group,
+        logStreamName=stream,
+        logEvents=[{"timestamp": now_ms + 100, "message": "late line"}],
+    )
+    assert [e["message"] for e in cursor.poll()] == ["late line"]
+    assert cursor.scanned == 36
+
+
+@pytest.mark.aws
+def test_cursor_overlap_catches_events_arriving_out_of_order(cloudwatch_log_group: str) -> None:
+    logs = aws_client("logs")
+    logs.create_log_stream(logGroupName=cloudwatch_log_group, logStreamName="qa-py-fast")
+    logs.create_log_stream(logGroupName=cloudwatch_log_group, logStreamName="qa-py-slow")
+    now_ms = int(time.time() * 1000)
+    logs.put_log_events(
+        logGroupName=cloudwatch_log_group,
+        logStreamName="qa-py-fast",
+        logEvents=[{"timestamp": now_ms, "message": "newest"}],
+    )
+    cursor = LogCursor(cloudwatch_log_group, since_ms=now_ms - 20_000)
+    narrow = LogCursor(cloudwatch_log_group, since_ms=now_ms - 20_000, overlap_ms=2000)
+    assert len(cursor.poll()) == len(narrow.poll()) == 1
+
+    # a slow shipper delivers an event stamped 10s before the one already seen
+    logs.put_log_events(
+        logGroupName=cloudwatch_log_group,
+        logStreamName="qa-py-slow",
+        logEvents=[{"timestamp": now_ms - 10_000, "message": "shipped late"}],
+    )
+    assert [e["message"] for e in cursor.poll()] == ["shipped late"]
+    assert narrow.poll() == []
+
+    found = assert_log_contains(cloudwatch_log_group, "shipped late", since_ms=now_ms - 20_000, overlap_ms=15_000)
+    assert found["logStreamName"] == "qa-py-slow"
@@ -0,0 +1,100 @@
+"""Local log sink — the CloudWatch assertions run unchanged against the
+indexed stand-in once `AWS_ENDPOINT_URL_LOGS` points at it.
+
+Pattern modelled here: pump a large batch of structured backend log lines
+into the sink and search for individual request ids, which moto would
+answer with a linear scan per poll.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+
+import pytest
+
+from framework.aws.client_factory import aws_client, reset_clients
+from framework.aws.cloudwatch_assertions import LogCursor, assert_log_contains, assert_logs_contain
+from framework.aws.log_sink import SEGMENT_SIZE, LogSinkServer, LogStore
+
+
+@pytest.fixture
+def log_sink(monkeypatch: pytest.MonkeyPatch) -> LogSinkServer:
+    server = LogSinkServer().start()
+    monkeypatch.setenv("AWS_ENDPOINT_URL_LOGS", server.endpoint_url)
+    reset_clients()
+    yield server
+    server.stop()
+    monkeypatch.delenv("AWS_ENDPOINT_URL_LOGS")
+    reset_clients()
+
+
+def _spin_lines(request_ids: list[str], start_ms: int) -> list[dict]:
+    return [
+        {"timestamp": start_ms + i, "message": f'{{"level":"info","request_id":"{rid}","msg":"spin_executed"}}'}
+        for i, rid in enumerate(request_ids)
+    ]
+
+
+@pytest.mark.aws
+@pytest.mark.smoke
+def test_assertions_run_against_the_sink(log_sink: LogSinkServer) -> None:
+    logs = aws_client("logs")
+    logs.create_log_group(logGroupName="/qa-py/sink")
+    logs.create_log_stream(logGroupName="/qa-py/sink", logStreamName="backend")
+
+    now_ms = int(time.time() * 1000)
+    request_ids = [f"req-{uuid.uuid4()}" for _ in range(3 * SEGMENT_SIZE)]
+    for start in range(0, len(request_ids), 5000):
+        logs.put_log_events(
+            logGroupName="/qa-py/sink",
+            logStreamName="backend",
+            logEvents=_spin_lines(request_ids[start : start + 5000], now_ms + start),
+        )
+
+    evt = assert_log_contains("/qa-py/sink", request_ids[9000], since_ms=now_ms, timeout_s=5)
+    assert request_ids[9000] in evt["message"]
+
+    sample = request_ids[::1000]
+    assert set(assert_logs_contain("/qa-py/sink", sample, since_ms=now_ms, timeout_s=5)) == set(sample)
+
+    cursor = LogCursor("/qa-py/sink", since_ms=now_ms, filter_pattern='"spin_executed"', page_limit=5000)
+    assert len(cursor.poll()) == len(request_ids)
+    assert cursor.requests == 3
+
+
+@pytest.mark.aws
+@pytest.mark.negative
+def test_missing_group_and_unsupported_pattern(log_sink: LogSinkServer) -> None:
+    with pytest.raises(AssertionError, match="log group does not exist"):
+        assert_log_contains("/qa-py/nope", "anything", timeout_s=1)
+
+    logs = aws_client("logs")
+    logs.create_log_group(logGroupName="/qa-py/json")
+    with pytest.raises(logs.exceptions.InvalidParameterException):
+        logs.filter_log_events(logGroupName="/qa-py/json", filterPattern="{ $.level = \"error\" }")
+
+
+def test_term_search_has_substring_semantics() -> None:
+    store = LogStore()
+    store.create_log_group(logGroupName="g")
+    store.create_log_stream(logGroupName="g", logStreamName="s")
+    messages = [f"user=u{i} round=r-{i:05d} status={'error' if i % 7 == 0 else 'ok'}" for i in range(SEGMENT_SIZE + 50)]
+    store.put_log_events(
+        logGroupName="g",
+        logStreamName="s",
+        logEvents=[{"timestamp": 1000 + i, "message": m} for i, m in enumerate(messages)],
+    )
+
+    def search(pattern: str) -> list[str]:
+        return [e["message"] for e in store.filter_log_events(logGroupName="g", filterPattern=pattern)["events"]]
+
+    cases = {
+        '"r-00042 status"': lambda m: "r-00042 status" in m,
+        '"00042"': lambda m: "00042" in m,  # partial token
+        "status=err": lambda m: "status=err" in m,
+        '?"u3 " ?"u4 "': lambda m: "u3 " in m or "u4 " in m,
+        'status=ok -"round=r-0000"': lambda m: "status=ok" in m and "round=r-0000" not in m,
+    }
+    for pattern, expected in cases.items():
+        assert search(pattern) == [m for m in messages if expected(m)], pattern
@@ -0,0 +1,33 @@
+"""Shared moto pool — xdist workers share a small pool of moto servers that
+lives exactly as long as the workers that registered with it.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from framework.aws.moto_coordinator import SharedMotoServers, _pid_alive
+
+
+def test_pool_is_shared_by_worker_number_and_stopped_by_last_release(tmp_path: Path) -> None:
+    gw0 = SharedMotoServers(str(tmp_path), pool_size=2, worker_id="gw0")
+    gw1 = SharedMotoServers(str(tmp_path), pool_size=2, worker_id="gw1")
+    gw2 = SharedMotoServers(str(tmp_path), pool_size=2, worker_id="gw2")
+
+    endpoints = {gw0.acquire(), gw1.acquire(), gw2.acquire()}
+    assert len(endpoints) == 2  # gw2 wraps around onto gw0's server
+    assert gw0.endpoint == gw2.endpoint
+
+    state = gw0._read()
+    assert len(state["servers"]) == 2
+    assert state["workers"] == [os.getpid()]  # one process here, registered once
+    pids = [s["pid"] for s in state["servers"]]
+
+    gw0.release()
+    deadline = time.monotonic() + 5
+    while any(_pid_alive(pid) for pid in pids) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not any(_pid_alive(pid) for pid in pids)
+    assert not (tmp_path / "moto-servers.json").exists()
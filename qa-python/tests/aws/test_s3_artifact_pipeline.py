@@ -10,14 +10,18 @@ headers before downstream cache invalidation runs.
 from __future__ import annotations
 
 import io
+from pathlib import Path
 
 import pytest
 
 from framework.aws.client_factory import aws_client
 from framework.aws.s3_assertions import (
+    MB,
     assert_object_exists,
     assert_object_metadata,
+    sync_directory,
     wait_for_object,
+    wait_for_objects,
 )
 
 
@@ -75,3 +79,52 @@ def test_wait_for_object_polls_until_async_upload_completes(s3_bucket: str) -> N
 def test_missing_object_raises_assertion(s3_bucket: str) -> None:
     with pytest.raises(AssertionError, match="S3 object missing"):
         assert_object_exists(s3_bucket, "does/not/exist.txt")
+
+
+def _fake_report(root: Path, files: int) -> None:
+    (root / "data").mkdir(parents=True)
+    (root / "index.html").write_text("<!doctype html><title>Allure</title>")
+    for i in range(files):
+        (root / "data" / f"test-case-{i:04d}.json").write_text(f'{{"uid":"{i}","status":"passed"}}')
+    # Large enough to go multipart with a 5 MB threshold (S3's minimum part size).
+    (root / "data" / "attachments.bin").write_bytes(bytes(range(256)) * (6 * MB // 256))
+
+
+@pytest.mark.aws
+@pytest.mark.regression
+def test_report_sync_uploads_only_changed_files(s3_bucket: str, tmp_path: Path) -> None:
+    _fake_report(tmp_path, files=150)
+    opts = {"multipart_threshold": 5 * MB, "multipart_chunksize": 5 * MB}
+
+    first = sync_directory(str(tmp_path), s3_bucket, "reports/run-1", cache_control="no-cache", **opts)
+    assert len(first.uploaded) == 152 and first.skipped == []
+    assert_object_metadata(s3_bucket, "reports/run-1/index.html", content_type="text/html", cache_control="no-cache")
+
+    again = sync_directory(str(tmp_path), s3_bucket, "reports/run-1", **opts)
+    assert again.uploaded == [] and len(again.skipped) == 152
+
+    (tmp_path / "data" / "test-case-0007.json").write_text('{"uid":"7","status":"failed"}')
+    changed = sync_directory(str(tmp_path), s3_bucket, "reports/run-1", **opts)
+    assert changed.uploaded == ["reports/run-1/data/test-case-0007.json"]
+
+
+@pytest.mark.aws
+@pytest.mark.regression
+def test_wait_for_objects_resolves_many_keys_per_listing(s3_bucket: str) -> None:
+    import threading
+    import time
+
+    s3 = aws_client("s3")
+    keys = [f"reports/run-2/data/test-case-{i:04d}.json" for i in range(250)]
+
+    def delayed_upload() -> None:
+        time.sleep(0.3)
+        for key in keys:
+            s3.put_object(Bucket=s3_bucket, Key=key, Body=b"{}")
+
+    threading.Thread(target=delayed_upload, daemon=True).start()
+    found = wait_for_objects(s3_bucket, keys, timeout_s=60, poll_interval_s=0.2)
+    assert set(found) == set(keys)
+
+    with pytest.raises(AssertionError, match=r"1 of 2 S3 objects did not appear"):
+        wait_for_objects(s3_bucket, [keys[0], "reports/run-2/missing.json"], timeout_s=0.5)
@@ -0,0 +1,79 @@
+"""SQS consumer index — many assertions against one queue share a single
+background consumer instead of each running its own polling loop.
+
+Pattern modelled here: a batch of spins publishes one `spin_settled` event
+per round; each round's assertion awaits its event from the index by
+`round_id`, with no SQS calls of its own.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from framework.aws.client_factory import aws_client
+from framework.aws.sqs_consumer import SqsConsumer
+
+
+def _publish(queue_url: str, events: list[dict]) -> None:
+    sqs = aws_client("sqs")
+    for start in range(0, len(events), 10):
+        sqs.send_message_batch(
+            QueueUrl=queue_url,
+            Entries=[
+                {
+                    "Id": str(i),
+                    "MessageBody": json.dumps(evt),
+                    "MessageAttributes": {"source": {"DataType": "String", "StringValue": "rgs"}},
+                }
+                for i, evt in enumerate(events[start : start + 10])
+            ],
+        )
+
+
+@pytest.mark.aws
+@pytest.mark.smoke
+def test_events_are_awaited_from_the_index(sqs_queue: str, sqs_events: SqsConsumer) -> None:
+    rounds = [f"round-{i}" for i in range(30)]
+    _publish(sqs_queue, [{"event": "spin_settled", "round_id": rid, "win": i} for i, rid in enumerate(rounds)])
+
+    for i, rid in enumerate(reversed(rounds)):
+        msg = sqs_events.wait_for(round_id=rid, event="spin_settled", timeout_s=5)
+        assert json.loads(msg["Body"])["win"] == len(rounds) - 1 - i
+
+    # Message attributes are indexed too; claimed messages are not handed out twice.
+    assert len(sqs_events.find(source="rgs", include_claimed=True)) == len(rounds)
+    assert sqs_events.find(source="rgs") == []
+
+
+@pytest.mark.aws
+def test_predicate_filters_within_indexed_candidates(sqs_queue: str, sqs_events: SqsConsumer) -> None:
+    _publish(sqs_queue, [{"event": "wallet_credited", "user_id": "u1", "amount_cents": c} for c in (100, 500)])
+    msg = sqs_events.wait_for(
+        lambda body: body["amount_cents"] > 200, event="wallet_credited", user_id="u1", timeout_s=5
+    )
+    assert json.loads(msg["Body"])["amount_cents"] == 500
+
+
+@pytest.mark.aws
+@pytest.mark.negative
+def test_missing_indexed_event_times_out(sqs_queue: str, sqs_events: SqsConsumer) -> None:
+    with pytest.raises(AssertionError, match="No indexed SQS message matched"):
+        sqs_events.wait_for(round_id="never", timeout_s=1)
+
+
+@pytest.mark.aws
+def test_index_evicts_oldest_past_bound(sqs_queue: str) -> None:
+    consumer = SqsConsumer(sqs_queue, max_messages=5).start()
+    try:
+        _publish(sqs_queue, [{"round_id": f"r{i}"} for i in range(12)])
+        deadline = time.monotonic() + 5
+        while consumer.received < 12 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert consumer.received == 12
+        assert len(consumer.find(include_claimed=True)) == 5
+        assert consumer.evicted == 7
+    finally:
+        consumer.stop()
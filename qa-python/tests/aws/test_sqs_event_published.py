@@ -14,7 +14,11 @@ import uuid
 import pytest
 
 from framework.aws.client_factory import aws_client
-from framework.aws.sqs_assertions import assert_message_in_queue, drain_queue
+from framework.aws.sqs_assertions import (
+    assert_message_in_queue,
+    assert_messages_in_queue,
+    drain_queue,
+)
 
 
 @pytest.mark.aws
@@ -54,3 +58,73 @@ def test_missing_event_times_out_with_clear_error(sqs_queue: str) -> None:
             predicate=lambda body: isinstance(body, dict) and body.get("never") == True,
             timeout_s=2,
         )
+
+
+@pytest.mark.aws
+def test_many_events_are_matched_in_one_wait(sqs_queue: str) -> None:
+    drain_queue(sqs_queue)
+    sqs = aws_client("sqs")
+    round_ids = [f"round-{i}" for i in range(25)]
+    for start in range(0, len(round_ids), 10):
+        sqs.send_message_batch(
+            QueueUrl=sqs_queue,
+            Entries=[
+                {"Id": str(i), "MessageBody": json.dumps({"event": "spin_settled", "round_id": rid})}
+                for i, rid in enumerate(round_ids[start : start + 10])
+            ],
+        )
+    sqs.send_message(QueueUrl=sqs_queue, MessageBody=json.dumps({"event": "unrelated"}))
+
+    matched = assert_messages_in_queue(
+        sqs_queue,
+        {rid: (lambda body, rid=rid: isinstance(body, dict) and body.get("round_id") == rid) for rid in round_ids},
+        timeout_s=10,
+    )
+    assert set(matched) == set(round_ids)
+    assert json.loads(matched["round-7"]["Body"])["round_id"] == "round-7"
+
+    # Matches were deleted; the unrelated event was handed back, not hidden.
+    remaining = sqs.receive_message(QueueUrl=sqs_queue, MaxNumberOfMessages=10, WaitTimeSeconds=0)
+    bodies = [json.loads(m["Body"]) for m in remaining.get("Messages") or []]
+    assert bodies == [{"event": "unrelated"}]
+
+
+@pytest.mark.aws
+@pytest.mark.negative
+def test_unmatched_predicates_are_named_in_the_error(sqs_queue: str) -> None:
+    drain_queue(sqs_queue)
+    aws_client("sqs").send_message(QueueUrl=sqs_queue, MessageBody=json.dumps({"round_id": "a"}))
+    with pytest.raises(AssertionError, match=r"1 of 2 SQS predicates unmatched .*: b"):
+        assert_messages_in_queue(
+            sqs_queue,
+            {
+                "a": lambda body: body.get("round_id") == "a",
+                "b": lambda body: body.get("round_id") == "b",
+            },
+            timeout_s=2,
+        )
+
+
+@pytest.mark.aws
+def test_drain_queue_empties_large_backlog(sqs_queue: str) -> None:
+    sqs = aws_client("sqs")
+    for start in range(0, 120, 10):
+        sqs.send_message_batch(
+            QueueUrl=sqs_queue,
+            Entries=[{"Id": str(i), "MessageBody": f"msg-{start + i}"} for i in range(10)],
+        )
+    assert drain_queue(sqs_queue) == 120
+    assert drain_queue(sqs_queue) == 0
+
+
+@pytest.mark.aws
+def test_drain_queue_is_bounded(sqs_queue: str) -> None:
+    sqs = aws_client("sqs")
+    for start in range(0, 50, 10):
+        sqs.send_message_batch(
+            QueueUrl=sqs_queue,
+            Entries=[{"Id": str(i), "MessageBody": f"msg-{start + i}"} for i in range(10)],
+        )
+    assert drain_queue(sqs_queue, timeout_s=0) == 0
+    assert drain_queue(sqs_queue, workers=1, max_iterations=2) == 20
+    assert drain_queue(sqs_queue) == 30
@@ -0,0 +1,107 @@
+"""Fixtures for framework self-tests.
+
+These exercise `framework/` itself against a tiny in-process HTTP stub, so
+they run without the backend: `pytest tests/framework`.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator
+
+import pytest
+
+from framework import profiling
+from framework.fake_rgs import FakeRgsServer
+
+Route = Callable[[str, dict[str, Any] | None], tuple[int, Any]]
+
+
+class StubServer:
+    """Serves canned JSON per `METHOD /path` and records every request."""
+
+    def __init__(self) -> None:
+        self.routes: dict[str, Route] = {}
+        self.gzipped: set[str] = set()
+        self.requests: list[tuple[str, str]] = []
+        self.request_headers: list[dict[str, str]] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                path = self.path.split("?", 1)[0]
+                stub.requests.append((self.command, path))
+                stub.request_headers.append(dict(self.headers.items()))
+                route = stub.routes.get(f"{self.command} {path}")
+                if route is None:
+                    status, body = 404, {"error": "not_found"}
+                else:
+                    status, body = route(path, json.loads(raw) if raw else None)
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                if f"{self.command} {path}" in stub.gzipped and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    payload = gzip.compress(payload)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = _handle
+
+            def log_message(self, *_args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def route(self, method: str, path: str, body: Any, status: int = 200, *, gzip: bool = False) -> None:
+        self.routes[f"{method} {path}"] = lambda _path, _req: (status, body)
+        if gzip:
+            self.gzipped.add(f"{method} {path}")
+
+    def start(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stub_server() -> StubServer:
+    server = StubServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="module")
+def fake_rgs() -> Iterator[FakeRgsServer]:
+    """The in-memory fake backend, one per test module."""
+    server = FakeRgsServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def no_profiler() -> None:
+    """Run the test with no active API profiler, even under `--api-profile`."""
+    previous = profiling.active()
+    profiling.activate(None)
+    yield
+    profiling.activate(previous)
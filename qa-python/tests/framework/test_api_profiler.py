@@ -0,0 +1,100 @@
+"""API profiler — per-test attribution of network, decode and schema time,
+plus the `--api-profile` report end to end."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from framework import profiling
+from framework.api_client import ApiClient
+from framework.profiling import ApiProfiler, endpoint_template
+from framework.schemas import assert_matches
+
+pytest_plugins = ("pytester",)
+
+
+@pytest.fixture
+def profiler() -> ApiProfiler:
+    previous = profiling.active()
+    profiler = ApiProfiler()
+    profiling.activate(profiler)
+    yield profiler
+    profiling.activate(previous)
+
+
+def test_endpoint_template_collapses_ids() -> None:
+    assert endpoint_template("/api/v1/history/42") == "/api/v1/history/{id}"
+    assert endpoint_template("/api/v1/history/3f2c9a1e-0b7d-4c1e-9f00-1234567890ab?x=1") == "/api/v1/history/{id}"
+    assert endpoint_template("/api/v1/spin/spin_01HZX3K9QW") == "/api/v1/spin/{id}"
+    assert endpoint_template("/api/v1/game/init") == "/api/v1/game/init"
+
+
+def test_calls_and_validation_are_attributed_to_the_running_test(stub_server, profiler: ApiProfiler) -> None:
+    stub_server.route("GET", "/health", {"status": "ok"})
+    stub_server.route("GET", "/api/v1/history/17", {"error": "nope", "code": "not_found"}, status=404)
+    stub_server.route("GET", "/api/v1/history/18", {"error": "nope", "code": "not_found"}, status=404)
+    api = ApiClient(base_url=stub_server.base_url)
+
+    profiler.current = "tests/x.py::test_a"
+    api.get("/health")
+    api.get("/health")
+    profiler.current = "tests/x.py::test_b"
+    api.get("/api/v1/history/17")
+    api.get("/api/v1/history/18")
+    assert_matches("ErrorResponse", {"error": "nope", "code": "not_found"})
+
+    a, b = profiler.tests["tests/x.py::test_a"], profiler.tests["tests/x.py::test_b"]
+    assert (a.calls, b.calls) == (2, 2)
+    assert a.network_ms > 0 and a.validation_ms == 0
+    assert set(b.validations) == {"ErrorResponse"} and b.validation_ms > 0
+    assert b.api_ms == pytest.approx(b.network_ms + b.decode_ms + b.validation_ms)
+
+    history = profiler.endpoints["GET /api/v1/history/{id}"]
+    assert history.calls == 2 and history.statuses == {"404": 2}
+
+    report = profiler.report(top=1)
+    assert len(report["slowest_tests"]) == 1 and len(report["hot_endpoints"]) == 1
+
+
+def test_disabled_profiler_records_nothing(stub_server, no_profiler) -> None:
+    stub_server.route("GET", "/health", {"status": "ok"})
+    assert ApiClient(base_url=stub_server.base_url).get("/health").status == 200
+    assert profiling.active() is None
+
+
+def test_merge_json_combines_worker_parts() -> None:
+    gw0, gw1 = ApiProfiler(), ApiProfiler()
+    gw0.current, gw1.current = "t::a", "t::b"
+    gw0.record_call("get", "/health", 200, 5.0, 0.1)
+    gw1.record_call("GET", "/health", 503, 7.0, 0.2)
+
+    merged = ApiProfiler()
+    merged.merge_json(json.loads(json.dumps(gw0.to_json())))
+    merged.merge_json(json.loads(json.dumps(gw1.to_json())))
+
+    assert set(merged.tests) == {"t::a", "t::b"}
+    ep = merged.endpoints["GET /health"]
+    assert ep.calls == 2 and sorted(ep.network_ms) == [5.0, 7.0]
+    assert ep.statuses == {"200": 1, "503": 1}
+
+
+def test_api_profile_option_writes_report(pytester: pytest.Pytester, stub_server) -> None:
+    stub_server.route("GET", "/health", {"status": "ok"})
+    pytester.makeconftest('pytest_plugins = ("framework.profiling_plugin",)')
+    pytester.makepyfile(
+        test_sample=f"""
+        from framework.api_client import ApiClient
+
+        def test_health():
+            assert ApiClient(base_url="{stub_server.base_url}").get("/health").status == 200
+        """
+    )
+    result = pytester.runpytest_subprocess("-p", "no:cacheprovider", "--api-profile=profile.json")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*API profile*", "*GET /health*"])
+
+    report = json.loads((pytester.path / "profile.json").read_text())
+    assert [row["nodeid"] for row in report["slowest_tests"]] == ["test_sample.py::test_health"]
+    assert report["hot_endpoints"][0]["endpoint"] == "GET /health"
@@ -0,0 +1,73 @@
+"""Generated RGS client — stays in sync with backend/openapi.json, sends
+pre-built headers and pre-encoded bodies."""
+
+from __future__ import annotations
+
+import copy
+import json
+
+import pytest
+
+from framework import codegen
+from framework.api_client import ApiClient
+from framework.request_templates import BodyTemplate
+from framework.rgs_client import OPERATIONS, RgsClient
+from framework.schemas import OPENAPI_PATH
+
+
+def test_committed_client_matches_the_spec() -> None:
+    generated = codegen.render(OPENAPI_PATH.read_bytes())
+    assert generated == codegen.OUTPUT_PATH.read_text(), "stale client — run `python -m framework.codegen`"
+    assert codegen.main(["--check"]) == 0
+
+
+@pytest.mark.negative
+@pytest.mark.parametrize(
+    "mutate, message",
+    [
+        (lambda s: s["paths"]["/api/v1/history/{roundId}"]["get"].update(parameters=[]), "path parameters"),
+        (lambda s: s["components"]["schemas"]["SpinRequest"]["properties"].update(client_timestamp={"type": "string"}), "volatile"),
+        (lambda s: s["paths"]["/api/v1/spin"]["post"]["responses"].pop("200"), "no 2xx"),
+        (lambda s: s["paths"]["/api/v1/spin"]["post"]["requestBody"]["content"]["application/json"].update(schema={"$ref": "#/components/schemas/Nope"}), "unresolvable"),
+    ],
+)
+def test_contract_drift_fails_generation(mutate, message: str) -> None:
+    spec = copy.deepcopy(json.loads(OPENAPI_PATH.read_bytes()))
+    mutate(spec)
+    with pytest.raises(codegen.CodegenError, match=message):
+        codegen.render(json.dumps(spec).encode())
+
+
+def test_body_template_patches_only_volatile_fields() -> None:
+    tpl = BodyTemplate({"session_id": "s-1", "bet": {"amount": 1.5, "lines": 20}}, {"client_timestamp": lambda: 7})
+    assert json.loads(tpl.render()) == {"session_id": "s-1", "bet": {"amount": 1.5, "lines": 20}, "client_timestamp": 7}
+    assert json.loads(tpl.render(client_timestamp=9))["client_timestamp"] == 9
+    assert BodyTemplate({}, {"n": None}).render(n=1) == b'{"n":1}'
+    with pytest.raises(TypeError):
+        tpl.render(session_id="other")
+
+
+def test_generated_calls_send_prebuilt_requests(stub_server) -> None:
+    seen: list[dict] = []
+
+    def spin_route(_path: str, body: dict) -> tuple[int, dict]:
+        seen.append(body)
+        return 200, {"spin_id": "x"}
+
+    stub_server.routes["POST /api/v1/spin"] = spin_route
+    stub_server.route("GET", "/api/v1/history/round%2F1", {"round": {}})
+    rgs = RgsClient(ApiClient(base_url=stub_server.base_url, token="t0k"))
+    bet = {"amount": 1.0, "currency": "USD", "lines": 20}
+
+    assert rgs.post_spin(session_id="s-1", game_id="g", bet=bet, idempotency_key="k-1").status == 200
+    spin = rgs.prepare_post_spin(session_id="s-1", game_id="g", bet=bet)
+    spin(client_timestamp=123)
+    spin(idempotency_key="k-2")
+    assert rgs.get_history_by_round_id("round/1").status == 200
+
+    assert [b["client_timestamp"] for b in seen][1] == 123
+    assert all(b["session_id"] == "s-1" and b["bet"] == bet for b in seen)
+    spin_headers = stub_server.request_headers[:3]
+    assert all(h["Authorization"] == "Bearer t0k" and h["Content-Type"] == "application/json" for h in spin_headers)
+    assert [h.get("Idempotency-Key") for h in spin_headers] == ["k-1", None, "k-2"]
+    assert OPERATIONS["post_spin"].schema == "SpinResponse"
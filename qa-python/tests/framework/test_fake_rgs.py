@@ -0,0 +1,191 @@
+"""Fake backend — contract shapes, history index, provably-fair replay."""
+
+from __future__ import annotations
+
+import json
+import uuid
+
+import pytest
+
+from framework.api_client import ApiClient
+from framework.data_factory import new_credentials
+from framework.fake_rgs import FakeRgs, engines
+from framework.provably_fair import server_seed_matches_hash, sha256_hex
+from framework.rgs_client import RgsClient
+from framework.schemas import assert_matches
+
+GAME_ID = "slot_mega_fortune_001"
+
+
+@pytest.fixture
+def rgs(fake_rgs) -> RgsClient:
+    api = ApiClient(base_url=fake_rgs.base_url)
+    creds = new_credentials()
+    resp = RgsClient(api).post_auth_register(email=creds.email, password=creds.password)
+    assert resp.status == 201
+    api.with_token(resp.body["access_token"])
+    return RgsClient(api)
+
+
+def _spins(rgs: RgsClient, bets: list[float]) -> tuple[str, list[dict]]:
+    session = rgs.post_game_init(game_id=GAME_ID).body
+    out = []
+    for amount in bets:
+        resp = rgs.post_spin(
+            session_id=session["session_id"], game_id=GAME_ID, bet={"amount": amount, "currency": "USD", "lines": 20}
+        )
+        assert resp.status == 200, resp.body
+        out.append(resp.body)
+    return session["session_id"], out
+
+
+def test_slot_flow_matches_contract(rgs) -> None:
+    init = rgs.post_game_init(game_id=GAME_ID)
+    assert_matches("InitResponse", init.body)
+    assert init.body["balance"] == {"amount": 1000, "currency": "USD"}
+
+    _sid, spins = _spins(rgs, [1.0, 2.5])
+    for spin in spins:
+        assert_matches("SpinResponse", spin)
+    win = sum(s["outcome"]["win"]["amount"] for s in spins)
+    assert spins[-1]["balance"]["amount"] == pytest.approx(1000 - 3.5 + win)
+
+    history = rgs.get_history(limit=10).body
+    assert_matches("EnhancedHistoryResponse", history)
+    assert [i["spin_id"] for i in history["items"]] == [s["spin_id"] for s in reversed(spins)]
+    assert history["items"][0]["outcome"] == spins[-1]["outcome"]
+
+    detail = rgs.get_history_by_round_id(spins[0]["spin_id"]).body
+    assert_matches("RoundDetailResponse", detail)
+    assert [t["type"] for t in detail["transactions"]][0] == "bet"
+
+
+def test_revealed_seed_reproduces_outcome(rgs) -> None:
+    _sid, spins = _spins(rgs, [1.0, 1.0, 1.0])
+    before = rgs.get_history_by_round_id(spins[1]["spin_id"]).body["provably_fair"]
+    assert before["server_seed"] is None and before["revealed"] is False
+
+    rotation = rgs.post_provably_fair_rotate().body
+    assert_matches("SeedRotationResponse", rotation)
+    assert rotation["previous"]["nonce"] == 3
+
+    detail = rgs.get_history_by_round_id(spins[1]["spin_id"]).body
+    pf = detail["provably_fair"]
+    assert pf["revealed"] is True and pf["nonce"] == 2
+    assert server_seed_matches_hash(pf["server_seed"], pf["server_seed_hash"])
+    seed = engines.derive_spin_seed(pf["server_seed"], pf["client_seed"], pf["nonce"])
+    outcome = engines.run_spin(1.0, "USD", 20, seed)
+    assert outcome == spins[1]["outcome"]
+    assert detail["round"]["outcome_hash"] == sha256_hex(json.dumps(outcome, separators=(",", ":")))
+
+
+def test_client_seed_requires_active_pair(rgs) -> None:
+    resp = rgs.put_provably_fair_client_seed(client_seed="mine")
+    assert (resp.status, resp.body["code"]) == (404, "not_found")
+    rgs.get_provably_fair_current()
+    resp = rgs.put_provably_fair_client_seed(client_seed="mine")
+    assert resp.status == 200 and resp.body["client_seed"] == "mine"
+
+
+def test_history_filters_and_summary(rgs) -> None:
+    _sid, spins = _spins(rgs, [0.5, 1.0, 2.0, 5.0, 10.0] * 4)
+    wins = [s for s in spins if s["outcome"]["win"]["amount"] > s["bet"]["amount"]]
+
+    summary = rgs.get_history_summary().body
+    assert summary["total_rounds"] == 20
+    assert summary["total_wagered"] == pytest.approx(74)
+    assert summary["net_result"] == pytest.approx(sum(s["outcome"]["win"]["amount"] for s in spins) - 74)
+
+    won = rgs.get_history(result="win", limit=100).body
+    assert won["total"] == len(wins)
+    assert {i["spin_id"] for i in won["items"]} == {s["spin_id"] for s in wins}
+    lost = rgs.get_history_summary(result="loss").body
+    assert lost["total_rounds"] == 20 - len(wins)
+
+    page = rgs.get_history(min_bet=1, max_bet=5, limit=3, offset=2).body
+    assert page["total"] == 12 and len(page["items"]) == 3
+    expected = [s["spin_id"] for s in reversed(spins) if 1 <= s["bet"]["amount"] <= 5][2:5]
+    assert [i["spin_id"] for i in page["items"]] == expected
+
+    future = rgs.get_history(date_from="2999-01-01T00:00:00Z").body
+    assert future["total"] == 0 and future["summary"]["biggest_win"] == 0
+    assert rgs.get_history(result="maybe").status == 400
+
+
+def test_spin_errors_follow_backend_order(rgs) -> None:
+    sid, _ = _spins(rgs, [])
+    bet = {"amount": 1.0, "currency": "USD", "lines": 20}
+    cases = [
+        (dict(session_id="sess_missing", game_id=GAME_ID, bet=bet), 403, "session_expired"),
+        (dict(session_id=sid, game_id="other_game", bet=bet), 400, "invalid_game_id"),
+        (dict(session_id=sid, game_id=GAME_ID, bet={**bet, "amount": 500}), 422, "invalid_bet"),
+        (dict(session_id=sid, game_id=GAME_ID, bet={**bet, "currency": "EUR"}), 422, "invalid_currency"),
+        (dict(session_id=sid, game_id=GAME_ID, bet={**bet, "lines": 21}), 422, "invalid_lines"),
+        (dict(session_id=sid, game_id=GAME_ID, bet={"amount": 1.0}), 400, "invalid_body"),
+    ]
+    for kwargs, status, code in cases:
+        resp = rgs.post_spin(**kwargs)
+        assert (resp.status, resp.body["code"]) == (status, code), kwargs
+
+
+def test_idempotent_spin_replays_stored_response(rgs) -> None:
+    sid, _ = _spins(rgs, [])
+    key = str(uuid.uuid4())
+    bet = {"amount": 1.0, "currency": "USD", "lines": 20}
+    first = rgs.post_spin(session_id=sid, game_id=GAME_ID, bet=bet, idempotency_key=key).body
+    again = rgs.post_spin(session_id=sid, game_id=GAME_ID, bet=bet, idempotency_key=key).body
+    assert again == first
+    assert rgs.get_history_summary().body["total_rounds"] == 1
+    other = rgs.post_spin(session_id=sid, game_id=GAME_ID, bet={**bet, "amount": 2.0}, idempotency_key=key)
+    assert (other.status, other.body["code"]) == (409, "idempotency_key_reused")
+
+
+@pytest.mark.parametrize(
+    ("init", "spin", "table", "schema"),
+    [
+        ("post_roulette_init", "post_roulette_spin", engines.EUROPEAN, "Roulette"),
+        ("post_american_roulette_init", "post_american_roulette_spin", engines.AMERICAN, "AmericanRoulette"),
+    ],
+)
+def test_roulette_flow(rgs, init, spin, table, schema) -> None:
+    session = getattr(rgs, init)().body
+    assert_matches(f"{schema}InitResponse", session)
+    bets = [{"type": "red", "numbers": sorted(engines.RED), "amount": 5}, {"type": "straight", "numbers": [17], "amount": 1}]
+    resp = getattr(rgs, spin)(session_id=session["session_id"], game_id=table.game_id, bets=bets)
+    assert resp.status == 200, resp.body
+    outcome = resp.body["outcome"]
+    assert_matches(f"{schema}Outcome", outcome)
+    assert resp.body["total_bet"] == 6
+    assert resp.body["balance"]["amount"] == pytest.approx(1000 - 6 + outcome["win"]["amount"])
+
+    detail = rgs.get_history_by_round_id(resp.body["spin_id"]).body
+    assert detail["round"]["reel_matrix"]["winning_number"] == outcome["winning_number"]
+    assert [b["bet_type"] for b in detail["roulette_bets"]] == ["red", "straight"]
+    assert getattr(rgs, init)().body["recent_numbers"] == [outcome["winning_number"]]
+
+    bad = getattr(rgs, spin)(
+        session_id=session["session_id"], game_id=table.game_id, bets=[{"type": "split", "numbers": [1, 5], "amount": 1}]
+    )
+    assert (bad.status, bad.body["code"]) == (400, "invalid_request")
+
+
+def test_refresh_rotates_cookie_and_logout_revokes(fake_rgs) -> None:
+    api = ApiClient(base_url=fake_rgs.base_url)
+    rgs = RgsClient(api)
+    creds = new_credentials()
+    rgs.post_auth_register(email=creds.email, password=creds.password)
+    first = rgs.post_auth_refresh()
+    assert first.status == 200
+    assert rgs.post_auth_logout().status == 204
+    resp = rgs.post_auth_refresh()
+    assert (resp.status, resp.body["code"]) == (401, "missing_refresh_token")
+
+
+def test_handle_without_socket() -> None:
+    app = FakeRgs()
+    status, body, _headers = app.handle("GET", "/api/v1/history", {}, b"")
+    assert (status, json.loads(body)["code"]) == (401, "missing_token")
+    token = app.issue_token("user-1")
+    status, body, _headers = app.handle("GET", "/api/v1/history/summary", {"authorization": f"Bearer {token}"}, b"")
+    assert status == 200 and json.loads(body)["total_rounds"] == 0
+    assert app.handle("GET", "/api/v1/nope", {}, b"")[0] == 404
@@ -0,0 +1,99 @@
+"""High-volume responses — slotted records, lazy JSON and hot-field reads."""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+
+import pytest
+
+from framework.api_client import ApiClient, RawApiResponse
+
+SPIN = {
+    "spin_id": "spin_01HZX3K9QW",
+    "session_id": "sess-1",
+    "game_id": "slot_mega_fortune_001",
+    "balance": {"amount": 99950, "currency": "USD"},
+    "bet": {"amount": 50, "currency": "USD", "lines": 20},
+    "outcome": {
+        "reel_matrix": [[f"S{r}{c}" for c in range(3)] for r in range(5)],
+        "win": {
+            "amount": 12.5,
+            "currency": "USD",
+            "breakdown": [
+                {"type": "line", "line_index": i, "symbol": "A", "count": 3, "payout": 2.5} for i in range(5)
+            ],
+        },
+        "bonus_triggered": None,
+    },
+    "next_state": {"mode": "base", "free_spins_remaining": 0},
+}
+
+
+def _record(payload: object) -> RawApiResponse:
+    return RawApiResponse(200, json.dumps(payload).encode(), "application/json; charset=utf-8", 1.0)
+
+
+def test_hot_fields_are_read_without_decoding_the_body() -> None:
+    resp = _record(SPIN)
+    assert resp.field("balance.amount") == 99950
+    assert resp.field("win.amount") == 12.5
+    assert resp.field("outcome.win.currency") == "USD"
+    assert resp.field("next_state.mode") == "base"
+    assert resp.field("outcome.bonus_triggered") is None
+    assert not isinstance(resp._body, dict)  # still undecoded
+
+    assert resp.body == SPIN
+    assert resp.field("win.amount") == 12.5  # decoded path agrees
+
+
+@pytest.mark.negative
+def test_field_falls_back_to_full_decode() -> None:
+    resp = _record({"user": {"name": 'quote " inside'}, "win": {"breakdown": [1, 2]}})
+    assert resp.field("user.name") == 'quote " inside'  # escaped string
+    assert resp.field("win.breakdown") == [1, 2]  # non-scalar leaf
+    with pytest.raises(KeyError):
+        _record(SPIN).field("balance.nope")
+
+
+@pytest.mark.negative
+def test_later_segments_stay_inside_the_matched_object() -> None:
+    # `amount` exists, but under `bet`, not under `balance`
+    resp = _record({"balance": {"currency": "USD"}, "bet": {"amount": 50}})
+    with pytest.raises(KeyError):
+        resp.field("balance.amount")
+    resp.body
+    with pytest.raises(KeyError):
+        resp.field("balance.amount")
+
+
+def test_scan_and_decoded_paths_agree_on_document_order() -> None:
+    payload = {"outcome": {"win": 1, "nested": {"win": 3}}, "win": 2}
+    resp = _record(payload)
+    assert resp.field("win") == 1  # first in document order, before decoding
+    resp.body
+    assert resp.field("win") == 1  # ... and after
+    assert _record(payload).field("outcome.win") == 1
+    assert _record({"a": [{"b": {"c": 1}}], "b": {"c": 2}}).field("b.c") == 1
+
+
+def test_high_volume_client_keeps_at_most_half_the_memory(stub_server) -> None:
+    stub_server.route("POST", "/api/v1/spin", SPIN)
+
+    def retained_per_response(api: ApiClient, n: int = 200) -> float:
+        for _ in range(20):  # warm the pool and caches outside the trace
+            api.post("/api/v1/spin", json_body={})
+        kept = []
+        tracemalloc.start()
+        try:
+            for _ in range(n):
+                kept.append(api.post("/api/v1/spin", json_body={}))
+            current, _peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert kept[-1].body == SPIN
+        return current / n
+
+    full = retained_per_response(ApiClient(base_url=stub_server.base_url))
+    light = retained_per_response(ApiClient(base_url=stub_server.base_url, high_volume=True))
+    assert light <= full / 2, (light, full)
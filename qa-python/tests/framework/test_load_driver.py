@@ -0,0 +1,90 @@
+"""Multi-process load driver — shared-memory metrics against the fake backend."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import time
+
+import pytest
+
+from framework.load import ArrivalSchedule, LoadDriver
+from framework.load.aio_client import AioConnection
+
+
+def test_workers_report_through_shared_memory(fake_rgs) -> None:
+    reports = []
+    driver = LoadDriver(ArrivalSchedule.constant(rate=300, duration=1), fake_rgs.base_url, processes=2, players=4)
+    result = driver.run(report_every=0.25, on_report=reports.append)
+
+    assert result.sent == 300 and result.dropped == 0
+    assert result.outcomes == {"2xx": 300}
+    assert result.latency.count == result.service.count == 300
+    assert result.latency.percentile(50) >= result.service.percentile(50)
+    # every spin landed, spread over both workers' players
+    players = [p for p in fake_rgs.app.players.values() if p.rounds.rounds]
+    assert len(players) == 8
+    assert sum(len(p.rounds.rounds) for p in players) == 300
+
+    assert reports and reports[-1].sent == 300
+    sent = [r.sent for r in reports]
+    assert sent == sorted(sent) and max(r.rate for r in reports) > 0
+
+
+def test_worker_setup_failure_is_raised() -> None:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    driver = LoadDriver(
+        ArrivalSchedule.constant(rate=10, duration=1), f"http://127.0.0.1:{port}", processes=1, players=1
+    )
+    with pytest.raises(RuntimeError, match="player setup"):
+        driver.run()
+
+
+def test_stalled_spins_time_out_as_errors(stub_server) -> None:
+    stub_server.route("POST", "/api/v1/auth/register", {"access_token": "t"}, 201)
+    stub_server.route("POST", "/api/v1/wallet/topup", {})
+    stub_server.route("POST", "/api/v1/game/init", {"session_id": "s"})
+    stub_server.routes["POST /api/v1/spin"] = lambda _path, _req: (time.sleep(1.0), (200, {}))[1]
+
+    async def stalled() -> None:
+        conn = AioConnection(stub_server.base_url, timeout=0.1)
+        with pytest.raises(asyncio.TimeoutError):
+            await conn.request("POST", "/api/v1/spin", b"", b"{}")
+        assert conn._writer is None  # not reused after a timeout
+
+    asyncio.run(stalled())
+
+    driver = LoadDriver(
+        ArrivalSchedule.constant(rate=10, duration=0.3),
+        stub_server.base_url,
+        processes=1,
+        players=3,
+        max_lag=None,
+        request_timeout=0.2,
+    )
+    result = driver.run()
+    assert result.sent == 3 and result.outcomes == {"errors": 3}
+    assert result.service.max_ms() < 900
+
+
+class _CrashingDriver(LoadDriver):
+    async def _new_player(self):
+        conn, spin = await super()._new_player()
+        calls = [0]
+
+        def crash_after_five():
+            calls[0] += 1
+            if calls[0] > 5:
+                os._exit(3)  # a worker killed mid-run never sets its done flag
+            return spin()
+
+        return conn, crash_after_five
+
+
+def test_worker_dying_mid_run_is_raised(fake_rgs) -> None:
+    driver = _CrashingDriver(ArrivalSchedule.constant(rate=100, duration=0.5), fake_rgs.base_url, processes=1, players=1)
+    with pytest.raises(RuntimeError, match=r"during the run: load-worker-0 \(exit 3\).*unaccounted"):
+        driver.run()
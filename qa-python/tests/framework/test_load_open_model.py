@@ -0,0 +1,103 @@
+"""Open-model load — schedules, histogram, coordinated-omission correction."""
+
+from __future__ import annotations
+
+import threading
+import time
+from array import array
+
+import pytest
+
+from framework.load import ArrivalSchedule, LatencyHistogram, OpenModelRunner, parse_schedule
+from framework.load.histogram import BUCKET_BYTES, BUCKETS
+
+
+def test_schedules_hit_their_rates() -> None:
+    constant = ArrivalSchedule.constant(rate=100, duration=2)
+    assert len(constant) == 200 and constant.offsets[1] == pytest.approx(0.01)
+
+    poisson = ArrivalSchedule.poisson(rate=1000, duration=5, seed=3)
+    assert 4700 < len(poisson) < 5300
+    assert list(poisson.offsets) == list(ArrivalSchedule.poisson(rate=1000, duration=5, seed=3).offsets)
+
+    step = ArrivalSchedule.step([(10, 1), (100, 1)])
+    assert len(step) == 110 and step.due(0.999) == 10 and step.duration == 2
+
+    ramp = ArrivalSchedule.ramp(start_rate=0, end_rate=200, duration=10)
+    assert len(ramp) == 1000
+    # expected count by t is 10*t^2: a quarter of the arrivals in the first half
+    assert ramp.due(5.0) == pytest.approx(250, abs=1)
+
+    assert len(parse_schedule("step:10:1,20:1")) == 30
+    with pytest.raises(ValueError, match="unknown schedule"):
+        parse_schedule("burst:10:1")
+
+
+def test_histogram_percentiles_and_shared_buffer() -> None:
+    hist = LatencyHistogram()
+    for us in range(1, 100_001):
+        hist.record_us(us)
+    assert hist.count == 100_000
+    assert hist.percentile(50) == pytest.approx(50.0, rel=0.02)
+    assert hist.percentile(99) == pytest.approx(99.0, rel=0.02)
+    assert hist.max_ms() == pytest.approx(100.0, rel=0.02)
+
+    buf = bytearray(BUCKETS * BUCKET_BYTES)
+    shared = LatencyHistogram(memoryview(buf))
+    shared.merge(hist)
+    assert LatencyHistogram(array("q", bytes(buf))).percentile(99) == hist.percentile(99)
+    with pytest.raises(ValueError):
+        LatencyHistogram(array("q", [0] * 10))
+
+
+def _stalling_call(stall_at: int, stall_s: float):
+    lock = threading.Lock()
+    calls = [0]
+
+    def make_call():
+        def call() -> None:
+            with lock:
+                calls[0] += 1
+                n = calls[0]
+            time.sleep(stall_s if n == stall_at else 0.001)
+
+        return call
+
+    return make_call
+
+
+def test_stall_shows_in_latency_not_just_service_time() -> None:
+    # 200/s for 1s on one worker; request 20 stalls for 300ms. A closed loop
+    # would record one slow sample. Measured from intended send time, every
+    # arrival queued behind the stall is slow too.
+    schedule = ArrivalSchedule.constant(rate=200, duration=1)
+    result = OpenModelRunner(schedule, _stalling_call(20, 0.3), workers=1, max_lag=None).run()
+
+    assert result.sent == 200 and result.dropped == 0
+    assert result.max_backlog >= 50
+    assert result.late >= 50
+    assert result.service.percentile(90) < 20
+    assert result.latency.percentile(90) > 100
+    assert result.latency.max_ms() >= 300
+
+
+def test_arrivals_past_max_lag_are_dropped_and_counted() -> None:
+    schedule = ArrivalSchedule.constant(rate=200, duration=1)
+    result = OpenModelRunner(schedule, _stalling_call(1, 0.5), workers=1, max_lag=0.1).run()
+
+    assert result.dropped > 50
+    assert result.sent + result.dropped == result.planned
+    assert result.outcomes["ok"] == result.sent
+    assert result.summary()["dropped"] == result.dropped
+
+
+def test_failed_calls_are_outcomes() -> None:
+    def make_call():
+        def call() -> None:
+            raise ConnectionError("refused")
+
+        return call
+
+    result = OpenModelRunner(ArrivalSchedule.constant(rate=100, duration=0.2), make_call, workers=2).run()
+    assert result.outcomes == {"ConnectionError": 20}
+    assert "ConnectionError=20" in result.format()
@@ -0,0 +1,50 @@
+"""Phase timing — connect / TTFB / download and wire bytes on ApiResponse."""
+
+from __future__ import annotations
+
+from framework.api_client import ApiClient
+from framework.profiling import ApiProfiler
+
+
+def test_first_call_opens_a_connection_and_later_calls_reuse_it(stub_server) -> None:
+    stub_server.route("GET", "/health", {"status": "ok"})
+    api = ApiClient(base_url=stub_server.base_url, phase_timing=True)
+
+    first = api.get("/health").phases
+    second = api.get("/health").phases
+
+    assert first is not None and second is not None
+    assert not first.reused and first.connect_ms > 0
+    assert second.reused and second.connect_ms == 0.0
+    assert second.ttfb_ms > 0 and second.download_ms >= 0
+    assert second.wire_bytes == second.body_bytes == len(b'{"status": "ok"}')
+
+
+def test_wire_bytes_are_the_compressed_size(stub_server) -> None:
+    history = {"items": [{"spin_id": f"spin-{i}", "bet": 100, "win": 0} for i in range(200)]}
+    stub_server.route("GET", "/api/v1/history", history, gzip=True)
+
+    resp = ApiClient(base_url=stub_server.base_url, phase_timing=True).get("/api/v1/history")
+
+    assert resp.body == history
+    assert resp.phases.content_encoding == "gzip"
+    assert resp.phases.wire_bytes < resp.phases.body_bytes / 5
+
+
+def test_disabled_by_default(stub_server, no_profiler) -> None:
+    stub_server.route("GET", "/health", {"status": "ok"})
+    resp = ApiClient(base_url=stub_server.base_url).get("/health")
+    assert resp.status == 200 and resp.phases is None
+
+
+def test_phases_flow_into_the_profiler(stub_server) -> None:
+    stub_server.route("GET", "/health", {"status": "ok"})
+    api = ApiClient(base_url=stub_server.base_url, phase_timing=True)
+    profiler = ApiProfiler()
+    for _ in range(3):
+        resp = api.get("/health")
+        profiler.record_call("GET", "/health", resp.status, resp.elapsed_ms, 0.0, resp.phases)
+
+    row = profiler.report()["hot_endpoints"][0]
+    assert row["new_connections"] == 1 and row["calls"] == 3
+    assert row["connect_ms"] > 0 and row["ttfb_p95_ms"] > 0
@@ -0,0 +1,128 @@
+"""Record/replay — a captured flow replays offline with fresh tokens and ids."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import uuid
+from pathlib import Path
+
+import pytest
+
+from framework import traffic
+from framework.api_client import ApiClient
+from framework.data_factory import new_credentials
+from framework.rgs_client import RgsClient
+from framework.traffic import ReplayServer, ReplayStore, TrafficRecorder
+
+BET = {"amount": 1.0, "currency": "USD", "lines": 20}
+
+
+def _backend(stub) -> None:
+    """Just enough of the RGS on the stub to mint tokens and ids."""
+    spins: list[str] = []
+
+    def spin(_path: str, body: dict) -> tuple[int, dict]:
+        spins.append(str(uuid.uuid4()))
+        return 200, {"spin_id": spins[-1], "session_id": body["session_id"], "balance": {"amount": 999.0 - len(spins)}}
+
+    stub.routes["POST /api/v1/auth/register"] = lambda _p, _b: (201, {"access_token": f"h.{uuid.uuid4().hex}.s", "token_type": "Bearer"})
+    stub.routes["POST /api/v1/game/init"] = lambda _p, _b: (200, {"session_id": f"sess_{str(uuid.uuid4())[:12]}", "game_id": "slot_mega_fortune_001"})
+    stub.routes["POST /api/v1/spin"] = spin
+    stub.routes["GET /api/v1/history"] = lambda _p, _b: (200, {"items": [{"spin_id": s} for s in reversed(spins)]})
+    # round-detail routes are registered per id once the spins exist
+    stub.round_route = lambda spin_id: stub.route("GET", f"/api/v1/history/{spin_id}", {"round": {"id": spin_id}})
+
+
+def _flow(api: ApiClient) -> dict:
+    creds = new_credentials()
+    token = api.post("/api/v1/auth/register", json_body={"email": creds.email, "password": creds.password}).body["access_token"]
+    api.with_token(token)
+    rgs = RgsClient(api)
+    session = rgs.post_game_init(game_id="slot_mega_fortune_001", platform="web").body
+    spins = [rgs.post_spin(session_id=session["session_id"], game_id="slot_mega_fortune_001", bet=BET).body for _ in range(2)]
+    history = rgs.get_history(limit=10).body
+    return {"token": token, "session": session, "spins": spins, "history": history, "api": api}
+
+
+@pytest.fixture
+def recorded(stub_server, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, dict]:
+    _backend(stub_server)
+    # a private recorder: a session-wide --api-capture keeps its own
+    recorder = TrafficRecorder()
+    monkeypatch.setattr(traffic, "_active", recorder)
+    try:
+        flow = _flow(ApiClient(base_url=stub_server.base_url))
+        for s in flow["spins"]:
+            stub_server.round_route(s["spin_id"])
+        flow["round"] = flow["api"].get(f"/api/v1/history/{flow['spins'][0]['spin_id']}").body
+    finally:
+        monkeypatch.undo()
+    path = tmp_path / "traffic.jsonl.gz"
+    recorder.save(path)
+    return path, flow
+
+
+def test_store_is_indexed_and_deduplicated(recorded) -> None:
+    path, flow = recorded
+    with gzip.open(path, "rt") as f:
+        header = json.loads(f.readline())
+        records = [json.loads(line) for line in f]
+    assert header["format"] == "slotsone-traffic" and header["records"] == len(records)
+    spin_key = next(k for k in header["index"] if k.startswith("POST /api/v1/spin "))
+    line, n = header["index"][spin_key]
+    assert n == 2 and all(r["key"] == spin_key for r in records[line - 1 : line - 1 + n])
+    assert all("{{req:body.session_id}}" in r["body"] for r in records if r["key"] == spin_key)
+    assert not any(flow["token"] in r["body"] for r in records)  # tokens never hit the store
+
+
+def test_replay_serves_the_flow_with_fresh_tokens_and_ids(recorded) -> None:
+    path, original = recorded
+    server = ReplayServer(ReplayStore([path])).start()
+    try:
+        replayed = _flow(ApiClient(base_url=server.base_url))
+        round_id = replayed["spins"][1]["spin_id"]
+        detail = replayed["api"].get(f"/api/v1/history/{round_id}").body
+        miss = replayed["api"].get("/api/v1/provably-fair/current")
+    finally:
+        server.stop()
+
+    assert replayed["token"] != original["token"] and replayed["token"].count(".") == 2
+    session_id = replayed["session"]["session_id"]
+    assert session_id.startswith("sess_") and session_id != original["session"]["session_id"]
+    assert all(s["session_id"] == session_id for s in replayed["spins"])  # echoed from the live request
+    assert [s["balance"] for s in replayed["spins"]] == [s["balance"] for s in original["spins"]]
+    replayed_ids = [s["spin_id"] for s in replayed["spins"]]
+    assert not set(replayed_ids) & {s["spin_id"] for s in original["spins"]}
+    assert [i["spin_id"] for i in replayed["history"]["items"]] == replayed_ids[::-1]  # ids mapped consistently
+    assert detail == {"round": {"id": round_id}}
+    assert miss.status == 501 and miss.body["code"] == "REPLAY_MISS"
+
+
+def test_parts_merge_and_counts_add_up(tmp_path: Path) -> None:
+    parts = []
+    for i in range(2):
+        rec = TrafficRecorder()
+        for _ in range(3):
+            rec.record("GET", "/health", None, False, 200, "application/json", b'{"status":"ok"}')
+        rec.record("GET", f"/api/v1/history/{uuid.uuid4()}", None, True, 404, "application/json", b'{"error":"x","code":"NOT_FOUND"}')
+        parts.append(tmp_path / f"part{i}.jsonl.gz")
+        rec.save(parts[-1])
+
+    merged = TrafficRecorder()
+    for part in parts:
+        merged.merge_file(part)
+    merged.save(tmp_path / "all.jsonl.gz")
+    records = list(traffic.read_store(tmp_path / "all.jsonl.gz"))
+    assert sorted((r["path"], r["count"]) for r in records) == [("/api/v1/history/{id}", 2), ("/health", 6)]
+
+
+def test_credentials_without_digits_still_match() -> None:
+    # generated passwords need not contain a digit; they must not enter the key
+    recorded = json.dumps({"email": "qa_py_a1@test.slotsone.dev", "password": "Pass_abcdefghijklmnop"}).encode()
+    replayed = json.dumps({"email": "qa_py_b2@test.slotsone.dev", "password": "Pass_zyxwvutsrqponmlk"}).encode()
+    for path in ("/api/v1/auth/register", "/api/v1/auth/login"):
+        assert traffic.match_key("POST", path, recorded, False) == traffic.match_key("POST", path, replayed, False)
+    assert traffic.normalize({"password": "nodigits"}) == {"password": "{s}"}
+    # outside auth, ordinary enum-like strings still distinguish requests
+    assert traffic.normalize({"game_id": "slot_mega_fortune_001", "platform": "web"})["platform"] == "web"
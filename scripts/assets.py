@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""
+Build generated art assets as a dependency graph.
+
+Each node is a generator script or a post-processing step (resize, atlas
+packing, PNG compression). A node's key hashes its command, the contents of
+its source files, and the keys and output contents of the nodes it depends
+on, so a hand-edited or externally regenerated input also triggers a rebuild.
+A node only runs when its key differs from the last successful build or one
+of its outputs is missing. Independent nodes run concurrently within a CPU
+budget.
+
+A step that rewrites a dependency's outputs in place (compress) declares them
+as its own outputs. Keys are recorded after a node runs, so that rewrite does
+not count as an input change on the next build.
+
+Usage:
+  python3 scripts/assets.py list
+  python3 scripts/assets.py build [NODE ...] [--cpus N] [--force] [--dry-run]
+                                  [--report build-report.json]
+
+State is kept in scripts/.cache/assets.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+STATE_PATH = os.path.join(ROOT, "scripts", ".cache", "assets.json")
+BUILD_DIR = os.path.join(ROOT, "scripts", ".cache", "build")
+
+SYMBOLS_DIR = "frontend/public/symbols"
+THUMBNAILS_DIR = "frontend/public/games"
+ATLAS_CELL = 256
+
+
+@dataclass
+class Node:
+    """One step of the asset build.
+
+    `command` is an argv list (paths relative to the repo root, `{cpus}` is
+    replaced with the CPU share granted by the scheduler); `action` is an
+    in-process alternative that receives the granted CPU count.
+    """
+
+    name: str
+    sources: Sequence[str]
+    outputs: Sequence[str]
+    deps: Sequence[str] = ()
+    command: Optional[Sequence[str]] = None
+    action: Optional[Callable[[int], None]] = None
+    cpus: int = 1
+    requires: Sequence[str] = ()
+    description: str = ""
+
+    def argv(self, cpus: int) -> List[str]:
+        return [arg.replace("{cpus}", str(cpus)) for arg in self.command or ()]
+
+
+@dataclass
+class Result:
+    name: str
+    status: str  # built | cached | failed | skipped | unavailable
+    key: str = ""
+    seconds: float = 0.0
+    started: float = 0.0
+    cpus: int = 0
+    detail: str = ""
+
+
+# ── Post-processing steps ───────────────────────────────────────────
+
+def _require_pil():
+    try:
+        from PIL import Image
+    except ImportError:
+        raise RuntimeError("Pillow is required for this step: pip install pillow")
+    return Image
+
+
+def _symbol_files() -> List[str]:
+    return sorted(glob.glob(os.path.join(ROOT, SYMBOLS_DIR, "*.png")))
+
+
+def resize_symbols(cpus: int) -> None:
+    """Downscale the 512px slot symbols to atlas cells."""
+    Image = _require_pil()
+    out_dir = os.path.join(BUILD_DIR, f"symbols-{ATLAS_CELL}")
+    os.makedirs(out_dir, exist_ok=True)
+
+    def resize(path: str) -> None:
+        with Image.open(path) as im:
+            im.convert("RGBA").resize((ATLAS_CELL, ATLAS_CELL), Image.LANCZOS).save(
+                os.path.join(out_dir, os.path.basename(path)), "PNG")
+
+    with ThreadPoolExecutor(max_workers=cpus) as pool:
+        list(pool.map(resize, _symbol_files()))
+
+
+def pack_symbol_atlas(cpus: int) -> None:
+    """Pack the resized symbols into one sheet with a Pixi spritesheet JSON."""
+    Image = _require_pil()
+    cells = sorted(glob.glob(os.path.join(BUILD_DIR, f"symbols-{ATLAS_CELL}", "*.png")))
+    if not cells:
+        raise RuntimeError("no resized symbols to pack")
+    columns = 1
+    while columns * columns < len(cells):
+        columns += 1
+    rows = (len(cells) + columns - 1) // columns
+    padding = 2
+    step = ATLAS_CELL + padding * 2
+
+    sheet = Image.new("RGBA", (columns * step, rows * step), (0, 0, 0, 0))
+    frames = {}
+    for i, path in enumerate(cells):
+        x = (i % columns) * step + padding
+        y = (i // columns) * step + padding
+        with Image.open(path) as im:
+            sheet.paste(im, (x, y))
+        frames[os.path.basename(path)] = {
+            "frame": {"x": x, "y": y, "w": ATLAS_CELL, "h": ATLAS_CELL},
+            "rotated": False,
+            "trimmed": False,
+            "spriteSourceSize": {"x": 0, "y": 0, "w": ATLAS_CELL, "h": ATLAS_CELL},
+            "sourceSize": {"w": ATLAS_CELL, "h": ATLAS_CELL},
+        }
+
+    out_dir = os.path.join(ROOT, SYMBOLS_DIR, "atlas")
+    os.makedirs(out_dir, exist_ok=True)
+    sheet.save(os.path.join(out_dir, "symbols.png"), "PNG", optimize=True)
+    meta = {
+        "frames": frames,
+        "meta": {
+            "image": "symbols.png",
+            "format": "RGBA8888",
+            "size": {"w": sheet.width, "h": sheet.height},
+            "scale": ATLAS_CELL / 512,
+        },
+    }
+    with open(os.path.join(out_dir, "symbols.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+        f.write("\n")
+
+
+def compress_pngs(patterns: Sequence[str]) -> Callable[[int], None]:
+    """Losslessly recompress PNGs in place, keeping whichever file is smaller."""
+
+    def action(cpus: int) -> None:
+        Image = _require_pil()
+        paths = sorted({p for pattern in patterns for p in glob.glob(os.path.join(ROOT, pattern))})
+
+        def compress(path: str) -> int:
+            tmp = f"{path}.tmp"
+            with Image.open(path) as im:
+                im.save(tmp, "PNG", optimize=True)
+            saved = os.path.getsize(path) - os.path.getsize(tmp)
+            if saved > 0:
+                os.replace(tmp, path)
+                return saved
+            os.remove(tmp)
+            return 0
+
+        with ThreadPoolExecutor(max_workers=cpus) as pool:
+            saved = sum(pool.map(compress, paths))
+        print(f"compress: {len(paths)} PNGs, {saved / 1024:.1f} KiB saved")
+
+    return action
+
+
+# ── Graph ───────────────────────────────────────────────────────────
+
+NODES: List[Node] = [
+    Node(
+        name="slot-symbols",
+        description="Pure-Python slot symbols (10, J, Q, K, A, star, scatter, wild)",
+        sources=["scripts/generate_slot_symbols.py"],
+        outputs=[f"{SYMBOLS_DIR}/{name}.png"
+                 for name in ("10", "j", "q", "k", "a", "star", "scatter", "wild")],
+        command=[sys.executable, "scripts/generate_slot_symbols.py"],
+    ),
+    Node(
+        name="wheel",
+        description="Roulette wheel sprites and layer metadata (european + american)",
+        sources=["scripts/generate-wheel.py"],
+        outputs=[f"frontend/public/assets/roulette/pro/{prefix}-2048.{ext}"
+                 for prefix in ("wheel-topdown", "wheel-topdown-american")
+                 for ext in ("png", "json")],
+        command=[sys.executable, "scripts/generate-wheel.py", "--variant", "all", "--layers"],
+    ),
+    Node(
+        name="thumbnails",
+        description="Lobby game thumbnails (SVG -> PNG via cairosvg)",
+        sources=["frontend/scripts/generate-thumbnails.py"],
+        outputs=[THUMBNAILS_DIR],
+        command=[sys.executable, "frontend/scripts/generate-thumbnails.py", "--jobs", "{cpus}"],
+        cpus=4,
+    ),
+    Node(
+        name="bod-symbols",
+        description="Book of Dead symbols rendered with Blender",
+        sources=["frontend/scripts/render_bod_symbols.py"],
+        outputs=[f"{SYMBOLS_DIR}/book-of-dead"],
+        command=[sys.executable, "frontend/scripts/render_bod_symbols.py", "--jobs", "{cpus}"],
+        cpus=4,
+        requires=["blender"],
+    ),
+    Node(
+        name="symbols-msdf",
+        description="Resolution-independent MTSDF glyph atlas (numpy)",
+        sources=["scripts/generate_msdf_atlas.py", "scripts/generate_slot_symbols.py"],
+        outputs=[f"{SYMBOLS_DIR}/msdf/glyphs.png", f"{SYMBOLS_DIR}/msdf/glyphs.json"],
+        command=[sys.executable, "scripts/generate_msdf_atlas.py"],
+    ),
+    Node(
+        name="win-sprites",
+        description="Animated win-highlight sprite sheets (glow pulse over cached layers)",
+        sources=["scripts/generate_win_sprites.py", "scripts/generate_slot_symbols.py"],
+        outputs=[f"{SYMBOLS_DIR}/win"],
+        command=[sys.executable, "scripts/generate_win_sprites.py", "--jobs", "{cpus}"],
+        cpus=4,
+    ),
+    Node(
+        name="symbols-resize",
+        description=f"Slot symbols downscaled to {ATLAS_CELL}px atlas cells",
+        sources=["scripts/assets.py"],
+        outputs=[f"scripts/.cache/build/symbols-{ATLAS_CELL}"],
+        deps=["slot-symbols"],
+        action=resize_symbols,
+        cpus=2,
+    ),
+    Node(
+        name="symbols-atlas",
+        description="Slot symbol atlas + Pixi spritesheet JSON",
+        sources=["scripts/assets.py"],
+        outputs=[f"{SYMBOLS_DIR}/atlas/symbols.png", f"{SYMBOLS_DIR}/atlas/symbols.json"],
+        deps=["symbols-resize"],
+        action=pack_symbol_atlas,
+    ),
+    Node(
+        name="compress",
+        description="Lossless PNG recompression of thumbnails",
+        sources=["scripts/assets.py"],
+        outputs=[THUMBNAILS_DIR],  # rewritten in place
+        deps=["thumbnails"],
+        action=compress_pngs([f"{THUMBNAILS_DIR}/*.png"]),
+        cpus=2,
+    ),
+]
+
+
+def node_map(nodes: Sequence[Node]) -> Dict[str, Node]:
+    by_name = {node.name: node for node in nodes}
+    for node in nodes:
+        for dep in node.deps:
+            if dep not in by_name:
+                raise ValueError(f"{node.name}: unknown dependency {dep!r}")
+    return by_name
+
+
+def topo_order(nodes: Dict[str, Node], targets: Sequence[str]) -> List[str]:
+    """Targets plus their transitive dependencies, dependencies first."""
+    order: List[str] = []
+    state: Dict[str, str] = {}
+
+    def visit(name: str) -> None:
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"dependency cycle through {name!r}")
+        state[name] = "visiting"
+        for dep in nodes[name].deps:
+            visit(dep)
+        state[name] = "done"
+        order.append(name)
+
+    for target in targets:
+        visit(target)
+    return order
+
+
+# ── Hashing and state ───────────────────────────────────────────────
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def output_digest(node: Node) -> str:
+    """Hash of the current contents of a node's outputs (directories walked)."""
+    h = hashlib.sha256()
+    for out in sorted(node.outputs):
+        full = os.path.join(ROOT, out)
+        if os.path.isdir(full):
+            files = []
+            for dirpath, _dirnames, filenames in os.walk(full):
+                files += [os.path.join(dirpath, name) for name in filenames]
+            for path in sorted(files):
+                h.update(os.path.relpath(path, ROOT).encode())
+                h.update(file_digest(path).encode())
+        elif os.path.isfile(full):
+            h.update(out.encode())
+            h.update(file_digest(full).encode())
+        else:
+            h.update(f"{out} missing".encode())
+    return h.hexdigest()
+
+
+def node_key(node: Node, nodes: Dict[str, Node], keys: Dict[str, str]) -> str:
+    """Key over the node's own inputs plus each dependency's key and outputs."""
+    h = hashlib.sha256()
+    h.update(node.name.encode())
+    # `{cpus}` is left unexpanded so the key does not depend on the budget.
+    h.update(json.dumps(list(node.command or ())[1:]).encode())
+    for source in sorted(node.sources):
+        h.update(source.encode())
+        h.update(file_digest(os.path.join(ROOT, source)).encode())
+    for dep in node.deps:
+        h.update(keys[dep].encode())
+        h.update(output_digest(nodes[dep]).encode())
+    return h.hexdigest()
+
+
+def outputs_present(node: Node) -> bool:
+    return all(os.path.exists(os.path.join(ROOT, out)) for out in node.outputs)
+
+
+def load_state() -> Dict[str, str]:
+    try:
+        with open(STATE_PATH) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_state(state: Dict[str, str]) -> None:
+    os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
+    tmp = f"{STATE_PATH}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, STATE_PATH)
+
+
+# ── Scheduler ───────────────────────────────────────────────────────
+
+def run_node(node: Node, cpus: int) -> None:
+    if node.action is not None:
+        node.action(cpus)
+        return
+    proc = subprocess.run(node.argv(cpus), cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        tail = (proc.stderr or proc.stdout).strip().splitlines()[-5:]
+        raise RuntimeError(f"exit {proc.returncode}: " + " | ".join(tail))
+
+
+def build(nodes: Dict[str, Node], targets: Sequence[str], budget: int,
+          force: bool = False, dry_run: bool = False) -> List[Result]:
+    order = topo_order(nodes, targets)
+    state = load_state()
+    state_lock = threading.Lock()
+    results: Dict[str, Result] = {}
+    keys: Dict[str, str] = {}
+    pending = list(order)
+    running: Dict[Future, tuple] = {}
+    free = budget
+    t0 = time.perf_counter()
+
+    def finish(name: str, result: Result) -> None:
+        results[name] = result
+        if result.status in ("built", "cached"):
+            keys[name] = result.key
+
+    with ThreadPoolExecutor(max_workers=max(1, budget)) as pool:
+        while pending or running:
+            progressed = False
+            for name in list(pending):
+                node = nodes[name]
+                dep_results = [results.get(dep) for dep in node.deps]
+                if any(r is None for r in dep_results):
+                    continue
+                blocked = [r.name for r in dep_results if r.status not in ("built", "cached")]
+                if blocked:
+                    pending.remove(name)
+                    finish(name, Result(name, "skipped", detail=f"blocked by {', '.join(blocked)}"))
+                    progressed = True
+                    continue
+                missing = [tool for tool in node.requires if shutil.which(tool) is None]
+                if missing:
+                    pending.remove(name)
+                    finish(name, Result(name, "unavailable", detail=f"missing {', '.join(missing)}"))
+                    progressed = True
+                    continue
+
+                key = node_key(node, nodes, keys)
+                if not force and state.get(name) == key and outputs_present(node):
+                    pending.remove(name)
+                    finish(name, Result(name, "cached", key=key))
+                    progressed = True
+                    continue
+                if dry_run:
+                    pending.remove(name)
+                    finish(name, Result(name, "built", key=key, detail="would build"))
+                    progressed = True
+                    continue
+
+                grant = min(node.cpus, budget)
+                if grant > free:
+                    continue
+                free -= grant
+                pending.remove(name)
+                started = time.perf_counter()
+                print(f"[assets] start {name} ({grant} cpu)")
+                running[pool.submit(run_node, node, grant)] = (name, key, grant, started)
+                progressed = True
+
+            if progressed or not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, key, grant, started = running.pop(future)
+                free += grant
+                seconds = time.perf_counter() - started
+                error = future.exception()
+                if error is None:
+                    # Re-key: a step that rewrites its dependency's outputs in
+                    # place must record the outputs it left behind.
+                    key = node_key(nodes[name], nodes, keys)
+                    with state_lock:
+                        state[name] = key
+                        save_state(state)
+                    finish(name, Result(name, "built", key, seconds, started - t0, grant))
+                    print(f"[assets] done  {name} in {seconds:.2f}s")
+                else:
+                    finish(name, Result(name, "failed", key, seconds, started - t0, grant, str(error)))
+                    print(f"[assets] FAIL  {name}: {error}", file=sys.stderr)
+
+    return [results[name] for name in order]
+
+
+def print_report(results: Sequence[Result], wall: float) -> None:
+    busy = sum(r.seconds for r in results)
+    print()
+    print(f"{'node':<16} {'status':<12} {'start':>7} {'time':>8} {'cpu':>4}  detail")
+    for r in sorted(results, key=lambda r: -r.seconds):
+        start = f"{r.started:.2f}s" if r.seconds else "-"
+        print(f"{r.name:<16} {r.status:<12} {start:>7} {r.seconds:>7.2f}s {r.cpus or '-':>4}  {r.detail}")
+    share = f", parallelism {busy / wall:.2f}x" if wall > 0 and busy else ""
+    print(f"wall {wall:.2f}s, node time {busy:.2f}s{share}")
+
+
+# ── CLI ─────────────────────────────────────────────────────────────
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build generated assets as a dependency graph.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="show nodes, dependencies and whether they are up to date")
+    b = sub.add_parser("build", help="build targets (default: all nodes)")
+    b.add_argument("targets", nargs="*", metavar="NODE")
+    b.add_argument("--cpus", type=int, default=os.cpu_count() or 1,
+                   help="CPU budget shared by concurrently running nodes (default: CPU count)")
+    b.add_argument("--force", action="store_true", help="rebuild even when keys match")
+    b.add_argument("--dry-run", action="store_true", help="report what would be built")
+    b.add_argument("--report", metavar="FILE", help="also write the timing report as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    nodes = node_map(NODES)
+
+    if args.command == "list":
+        state = load_state()
+        keys: Dict[str, str] = {}
+        for name in topo_order(nodes, list(nodes)):
+            node = nodes[name]
+            keys[name] = node_key(node, nodes, keys)
+            fresh = state.get(name) == keys[name] and outputs_present(node)
+            deps = f" <- {', '.join(node.deps)}" if node.deps else ""
+            print(f"{'ok   ' if fresh else 'stale'} {name}{deps}")
+            print(f"      {node.description}")
+        return 0
+
+    unknown = [t for t in args.targets if t not in nodes]
+    if unknown:
+        print(f"unknown node(s): {', '.join(unknown)}; see `assets.py list`", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    results = build(nodes, args.targets or list(nodes), max(1, args.cpus),
+                    force=args.force, dry_run=args.dry_run)
+    wall = time.perf_counter() - start
+    print_report(results, wall)
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({"wall_seconds": wall, "cpus": args.cpus,
+                       "nodes": [r.__dict__ for r in results]}, f, indent=2)
+            f.write("\n")
+    return 1 if any(r.status == "failed" for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the pure-Python rasterizer in generate_slot_symbols.py.
+
+Times each drawing primitive at the sizes the badge painters actually use,
+and (with --suite painters/all) every painter in PAINTERS end to end. Each
+case reports ops/sec and megapixels/sec; results are appended to a JSON
+history and compared with the previous run from the same machine using a
+Mann-Whitney U test on the per-sample timings, so a speedup or regression is
+only called when it is statistically distinguishable from noise.
+
+Dependency-free like the generator itself.
+
+Usage:
+  python3 scripts/bench_slot_symbols.py                       # primitives
+  python3 scripts/bench_slot_symbols.py --suite all --filter glow
+  python3 scripts/bench_slot_symbols.py --fail-on-regression 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import generate_slot_symbols as gss  # noqa: E402
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+HISTORY_PATH = os.path.join(ROOT, "scripts", ".cache", "bench-slot-symbols.json")
+HISTORY_LIMIT = 50
+
+S = gss.SUPERSAMPLE
+W, H = gss.WIDTH, gss.HEIGHT
+
+
+@dataclass
+class Case:
+    name: str
+    suite: str
+    setup: Callable[[], Callable[[], None]]  # returns the timed operation
+    pixels: int  # pixels touched per operation
+    calls: int = 1  # primitive calls per operation
+
+
+# ── Cases ───────────────────────────────────────────────────────────
+
+def _blend_batch() -> Callable[[], None]:
+    buf = gss.new_buffer((20, 20, 30, 255))
+    coords = [(x, y) for y in range(200, 300) for x in range(200, 300)]
+    color = (250, 200, 80, 180)
+
+    def op() -> None:
+        for x, y in coords:
+            gss.blend_pixel(buf, x, y, color)
+
+    return op
+
+
+def _on_buffer(draw: Callable[[bytearray], None]) -> Callable[[], Callable[[], None]]:
+    def setup() -> Callable[[], None]:
+        buf = gss.new_buffer((20, 20, 30, 255))
+        return lambda: draw(buf)
+
+    return setup
+
+
+def _downsample() -> Callable[[], None]:
+    buf = gss.new_buffer((120, 80, 200, 255))
+    return lambda: gss.downsample(buf, W, H, S)
+
+
+def _painter(filename: str) -> Callable[[], Callable[[], None]]:
+    accent, glyph = gss.PAINTERS[filename]
+    return lambda: (lambda: gss.paint_symbol(accent, glyph))
+
+
+def polygon_area(points: Sequence[gss.Point]) -> int:
+    return int(abs(sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2)
+                       in zip(points, list(points[1:]) + [points[0]]))) / 2)
+
+
+def rr_area(w: float, h: float, r: float) -> int:
+    return int(w * h - (4 - math.pi) * r * r)
+
+
+# Sizes mirror draw_badge_base / the painters at SUPERSAMPLE scale.
+BADGE = (48 * S, 34 * S, 416 * S, 444 * S, 86 * S)
+STAR = gss.star_points(256 * S, 256 * S, 150 * S, 62 * S)
+BOLT = [(x * S, y * S) for x, y in gss.BOLT]
+
+
+def build_cases() -> List[Case]:
+    x, y, w, h, r = BADGE
+    cases = [
+        Case("blend_pixel", "primitives", _blend_batch, 100 * 100, calls=100 * 100),
+        Case("draw_rr_solid/badge", "primitives",
+             _on_buffer(lambda b: gss.draw_rr_solid(b, x, y, w, h, r, (0, 0, 0, 68))),
+             rr_area(w, h, r)),
+        Case("draw_rr_vgradient/badge", "primitives",
+             _on_buffer(lambda b: gss.draw_rr_vgradient(b, x, y, w, h, r, (90, 60, 20, 255),
+                                                        (20, 10, 5, 255))),
+             rr_area(w, h, r)),
+        Case("draw_rr_vgradient/gloss", "primitives",
+             _on_buffer(lambda b: gss.draw_rr_vgradient(b, x + 18 * S, y + 20 * S, w - 36 * S,
+                                                        h * 0.38, r - 18 * S,
+                                                        (255, 255, 255, 86), (255, 255, 255, 0))),
+             rr_area(w - 36 * S, h * 0.38, r - 18 * S)),
+        Case("draw_radial_glow/162", "primitives",
+             _on_buffer(lambda b: gss.draw_radial_glow(b, W / 2, H / 2, 162 * S, (255, 200, 80, 90))),
+             int(math.pi * (162 * S) ** 2)),
+        Case("draw_radial_glow/48", "primitives",
+             _on_buffer(lambda b: gss.draw_radial_glow(b, W / 2, H / 2, 48 * S, (255, 200, 80, 90))),
+             int(math.pi * (48 * S) ** 2)),
+        Case("draw_circle/8", "primitives",
+             _on_buffer(lambda b: gss.draw_circle(b, W / 2, H / 2, 8 * S, (255, 255, 255, 80))),
+             int(math.pi * (8 * S) ** 2)),
+        Case("draw_polygon/star", "primitives",
+             _on_buffer(lambda b: gss.draw_polygon(b, STAR, (255, 216, 90, 220))),
+             polygon_area(STAR)),
+        Case("draw_polygon/bolt", "primitives",
+             _on_buffer(lambda b: gss.draw_polygon(b, BOLT, (255, 216, 90, 220))),
+             polygon_area(BOLT)),
+        Case("downsample/x2", "primitives", _downsample, W * H),
+    ]
+    for filename in gss.PAINTERS:
+        cases.append(Case(f"paint/{filename[:-4]}", "painters", _painter(filename), W * H))
+    return cases
+
+
+# ── Timing ──────────────────────────────────────────────────────────
+
+def measure(case: Case, samples: int, min_time: float) -> Tuple[List[float], int]:
+    """Seconds per operation for each sample, and operations per sample."""
+    op = case.setup()
+    start = time.perf_counter()
+    op()  # warm-up, also calibrates the batch size
+    once = time.perf_counter() - start
+    number = max(1, math.ceil(min_time / max(once, 1e-9)))
+
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        timings.append((time.perf_counter() - start) / number)
+    return timings, number
+
+
+# ── Statistics ──────────────────────────────────────────────────────
+
+@lru_cache(maxsize=None)
+def _u_count(n1: int, n2: int, u: int) -> int:
+    """Number of orderings of n1 + n2 untied values whose U statistic is u."""
+    if u < 0 or u > n1 * n2:
+        return 0
+    if n1 == 0 or n2 == 0:
+        return 1 if u == 0 else 0
+    return _u_count(n1 - 1, n2, u - n2) + _u_count(n1, n2 - 1, u)
+
+
+def mann_whitney_p(a: Sequence[float], b: Sequence[float]) -> float:
+    """Two-sided Mann-Whitney U p-value (exact for small untied samples)."""
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    ranked = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    ranks = [0.0] * len(ranked)
+    ties = []
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2.0 + 1.0
+        ties.append(j - i + 1)
+        i = j + 1
+    r1 = sum(rank for rank, (_v, group) in zip(ranks, ranked) if group == 0)
+    u1 = r1 - n1 * (n1 + 1) / 2.0
+    u = min(u1, n1 * n2 - u1)
+
+    if all(t == 1 for t in ties) and n1 * n2 <= 400:
+        total = math.comb(n1 + n2, n1)
+        tail = sum(_u_count(n1, n2, k) for k in range(int(u) + 1))
+        return min(1.0, 2.0 * tail / total)
+
+    n = n1 + n2
+    tie_term = sum(t ** 3 - t for t in ties) / (n * (n - 1))
+    sigma = math.sqrt(n1 * n2 / 12.0 * ((n + 1) - tie_term))
+    if sigma == 0:
+        return 1.0
+    z = (abs(u1 - n1 * n2 / 2.0) - 0.5) / sigma
+    return min(1.0, 2.0 * (1.0 - statistics.NormalDist().cdf(z)))
+
+
+def min_p_value(n1: int, n2: int) -> float:
+    """Smallest two-sided p the exact test can give for these sample sizes."""
+    return min(1.0, 2.0 / math.comb(n1 + n2, n1))
+
+
+# ── History ─────────────────────────────────────────────────────────
+
+def machine_key() -> str:
+    return f"{platform.python_implementation()} {platform.python_version()} " \
+           f"{platform.system()} {platform.machine()} {os.cpu_count()}cpu"
+
+
+def git_revision() -> Optional[str]:
+    proc = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                          capture_output=True, text=True)
+    return proc.stdout.strip() if proc.returncode == 0 else None
+
+
+def load_history(path: str) -> Dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {"runs": []}
+
+
+def baseline_for(history: Dict, machine: str) -> Optional[Dict]:
+    for run in reversed(history["runs"]):
+        if run["machine"] == machine:
+            return run
+    return None
+
+
+def save_history(path: str, history: Dict) -> None:
+    history["runs"] = history["runs"][-HISTORY_LIMIT:]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(history, f, indent=1)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+# ── CLI ─────────────────────────────────────────────────────────────
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark generate_slot_symbols primitives.")
+    parser.add_argument("--suite", choices=("primitives", "painters", "all"), default="primitives",
+                        help="painters take ~20 s per sample each (default: primitives)")
+    parser.add_argument("--filter", default="", help="only cases whose name contains this")
+    parser.add_argument("--samples", type=int, default=None,
+                        help="samples per case (default: 7 for primitives, 5 for painters)")
+    parser.add_argument("--min-time", type=float, default=0.1,
+                        help="minimum seconds per sample; fast ops are batched (default: 0.1)")
+    parser.add_argument("--history", default=HISTORY_PATH)
+    parser.add_argument("--no-save", action="store_true", help="do not append this run")
+    parser.add_argument("--alpha", type=float, default=0.05,
+                        help="significance level for calling a change (default: 0.05)")
+    parser.add_argument("--fail-on-regression", type=float, default=None, metavar="PCT",
+                        help="exit 1 if any case is significantly slower by more than PCT%%")
+    args = parser.parse_args(argv)
+    if args.samples is not None and min_p_value(args.samples, args.samples) >= args.alpha:
+        # With this few samples no difference can ever reach --alpha.
+        parser.error(f"--samples {args.samples} cannot reach --alpha {args.alpha}; use more samples")
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    cases = [c for c in build_cases()
+             if (args.suite == "all" or c.suite == args.suite) and args.filter in c.name]
+    if not cases:
+        print("no cases selected", file=sys.stderr)
+        return 2
+
+    history = load_history(args.history)
+    machine = machine_key()
+    baseline = baseline_for(history, machine)
+    base_cases = baseline["cases"] if baseline else {}
+    if baseline:
+        print(f"baseline: {baseline['timestamp']} ({baseline.get('git') or 'unknown rev'})")
+    else:
+        print(f"no baseline for {machine}; recording one")
+
+    print(f"{'case':<26} {'ops/s':>11} {'Mpx/s':>8} {'spread':>7} {'vs base':>8} {'p':>7}  verdict")
+    results: Dict[str, Dict] = {}
+    regressions = []
+    for case in cases:
+        samples = args.samples or (7 if case.suite == "primitives" else 5)
+        timings, number = measure(case, samples, args.min_time)
+        median = statistics.median(timings)
+        spread = (max(timings) - min(timings)) / median if median else 0.0
+        results[case.name] = {
+            "samples": timings,
+            "batch": number,
+            "ops_per_sec": case.calls / median,
+            "mpix_per_sec": case.pixels / median / 1e6,
+        }
+
+        change = p = ""
+        verdict = "new"
+        previous = base_cases.get(case.name)
+        if previous:
+            prev_median = statistics.median(previous["samples"])
+            delta = prev_median / median - 1.0  # >0 means faster now
+            pvalue = mann_whitney_p(previous["samples"], timings)
+            change, p = f"{delta:+.1%}", f"{pvalue:.3f}"
+            if min_p_value(len(previous["samples"]), len(timings)) >= args.alpha:
+                verdict = "too few samples"  # e.g. a baseline recorded with fewer
+            elif pvalue >= args.alpha:
+                verdict = "same"
+            else:
+                verdict = "faster" if delta > 0 else "SLOWER"
+                if delta < 0 and args.fail_on_regression is not None \
+                        and -delta * 100 > args.fail_on_regression:
+                    regressions.append(case.name)
+        print(f"{case.name:<26} {case.calls / median:>11.4g} {case.pixels / median / 1e6:>8.3f} "
+              f"{spread:>6.1%} {change:>8} {p:>7}  {verdict}")
+
+    if not args.no_save:
+        history["runs"].append({
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "git": git_revision(),
+            "machine": machine,
+            # Carry over cases this run skipped so filtered runs do not drop baselines.
+            "cases": {**base_cases, **results},
+        })
+        save_history(args.history, history)
+
+    if regressions:
+        print(f"regressions over {args.fail_on_regression}%: {', '.join(regressions)}",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,34 @@
 #!/usr/bin/env python3
-"""Generate a 2048x2048 top-down European roulette wheel PNG.
+"""Generate a top-down roulette wheel PNG (2048x2048 by default).
 
 All numbers face outward from the centre (top of text toward centre).
+
+Every pocket is identical up to rotation and colour, so one pocket wedge is
+painted per colour and one fret is painted once; the copies are stamped
+around the wheel with an affine rotation. Geometry is authored at 2048 px and
+scaled for `--size`, so 1024 / 4096 variants cost proportionally.
+
+With `--layers` the wheel is also written as three sprites plus a JSON
+metadata file, so the client only rotates the pocket ring:
+
+  rim   static background + gold outer rim
+  hub   static ball track, deflectors, cone and turret
+  ring  rotating pockets, frets, apron diamonds and numbers
+
+Layers are listed bottom-to-top in the metadata; compositing them in that
+order reproduces the flattened PNG. The rim and hub do not depend on the
+pocket layout, so the European and American variants share them.
 """
 
+import argparse
+import json
 import math
+import os
+from functools import lru_cache
+
 from PIL import Image, ImageDraw, ImageFont
 
-SIZE = 2048
+SIZE = 2048  # design size — every radius / width below is authored at this size
 CX, CY = SIZE // 2, SIZE // 2
 
 # European wheel order
@@ -16,8 +37,22 @@ WHEEL_ORDER = [
     5, 24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26,
 ]
 
+# American wheel order — matches backend/src/engine/americanRouletteConfig.ts,
+# where 00 is represented as -1.
+DOUBLE_ZERO = -1
+AMERICAN_WHEEL_ORDER = [
+    0, 28, 9, 26, 30, 11, 7, 20, 32, 17, 5, 22, 34, 15, 3, 24, 36, 13, 1,
+    DOUBLE_ZERO, 27, 10, 25, 29, 12, 8, 19, 31, 18, 6, 21, 33, 16, 4, 23, 35, 14, 2,
+]
+
 RED_NUMBERS = {1,3,5,7,9,12,14,16,18,19,21,23,25,27,30,32,34,36}
 
+# Output file prefix and pocket order per variant
+VARIANTS = {
+    "european": ("wheel-topdown", WHEEL_ORDER),
+    "american": ("wheel-topdown-american", AMERICAN_WHEEL_ORDER),
+}
+
 SEGMENTS = len(WHEEL_ORDER)  # 37
 SEG_DEG = 360.0 / SEGMENTS
 
@@ -41,6 +76,8 @@ R_TURRET_MID   = 110    # turret middle ring
 R_TURRET_INNER = 70     # turret inner
 R_TURRET_CAP   = 35     # turret center cap
 
+FRET_HALF_PX = 8  # half-width of each fret in pixels (~16px total)
+
 # Colours
 GOLD       = (200, 160, 78)
 GOLD_DARK  = (140, 110, 50)
@@ -49,6 +86,7 @@ RED        = (180, 40, 35)
 BLACK      = (25, 25, 40)
 GREEN      = (39, 174, 96)
 WHITE      = (255, 255, 255)
+CLEAR      = (0, 0, 0, 0)       # punches transparent holes in a layer
 BROWN_DARK  = (50, 28, 12)
 BROWN_MID   = (85, 50, 25)
 BROWN_LIGHT = (115, 70, 35)
@@ -69,185 +107,289 @@ FRET_SHADOW      = (15, 12, 8)      # deep shadow next to fret
 FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
 FONT_SIZE = 52
 
+OUT_DIR = os.path.join(os.path.dirname(__file__), "..", "frontend", "public", "assets", "roulette", "pro")
+
 def pocket_color(n: int) -> tuple:
-    if n == 0:
+    if n in (0, DOUBLE_ZERO):
         return GREEN
     return RED if n in RED_NUMBERS else BLACK
 
+def pocket_label(n: int) -> str:
+    return "00" if n == DOUBLE_ZERO else str(n)
+
+def pocket_color_name(n: int) -> str:
+    return {GREEN: "green", RED: "red", BLACK: "black"}[pocket_color(n)]
+
 def darken(color: tuple, amount: int) -> tuple:
     return tuple(max(0, c - amount) for c in color)
 
 def lighten(color: tuple, amount: int) -> tuple:
     return tuple(min(255, c + amount) for c in color)
 
-def radial_point(cx, cy, r, angle_rad):
-    return (cx + r * math.cos(angle_rad), cy + r * math.sin(angle_rad))
+# ── Shared trig tables ──────────────────────────────────────────────
+
+@lru_cache(maxsize=None)
+def ring_table(count: int, start_deg: float) -> tuple:
+    """(angle_deg, cos, sin) for `count` evenly spaced angles from `start_deg`."""
+    out = []
+    for i in range(count):
+        deg = start_deg + i * 360.0 / count
+        rad = math.radians(deg)
+        out.append((deg, math.cos(rad), math.sin(rad)))
+    return tuple(out)
+
+@lru_cache(maxsize=None)
+def arc_table(start_deg: float, end_deg: float) -> tuple:
+    """(cos, sin) pairs along an arc, sampled at the density `draw_segment` uses."""
+    steps = max(8, int(abs(end_deg - start_deg) * 2))
+    out = []
+    for i in range(steps + 1):
+        angle = math.radians(start_deg + (end_deg - start_deg) * i / steps)
+        out.append((math.cos(angle), math.sin(angle)))
+    return tuple(out)
+
+# ── Drawing primitives ──────────────────────────────────────────────
 
-def draw_fret_polygon(draw, cx, cy, r_inner, r_outer, angle_rad, half_width_px):
-    """Draw a fret as a filled trapezoid polygon centered on angle_rad."""
-    perp = angle_rad + math.pi / 2
+def fret_polygon(cx, cy, r_inner, r_outer, angle_rad, half_width_px):
+    """Corners of a fret trapezoid centered on angle_rad."""
+    ca, sa = math.cos(angle_rad), math.sin(angle_rad)
+    # Perpendicular (angle + 90°) is (-sin, cos)
+    px, py = -sa * half_width_px, ca * half_width_px
     # 4 corners: inner-left, inner-right, outer-right, outer-left
-    il = (cx + r_inner * math.cos(angle_rad) - half_width_px * math.cos(perp),
-          cy + r_inner * math.sin(angle_rad) - half_width_px * math.sin(perp))
-    ir = (cx + r_inner * math.cos(angle_rad) + half_width_px * math.cos(perp),
-          cy + r_inner * math.sin(angle_rad) + half_width_px * math.sin(perp))
-    oR = (cx + r_outer * math.cos(angle_rad) + half_width_px * math.cos(perp),
-          cy + r_outer * math.sin(angle_rad) + half_width_px * math.sin(perp))
-    ol = (cx + r_outer * math.cos(angle_rad) - half_width_px * math.cos(perp),
-          cy + r_outer * math.sin(angle_rad) - half_width_px * math.sin(perp))
-    return [il, ir, oR, ol]
-
-def draw_circle(draw: ImageDraw.Draw, cx: int, cy: int, r: int, fill=None, outline=None, width=1):
+    return [
+        (cx + r_inner * ca - px, cy + r_inner * sa - py),
+        (cx + r_inner * ca + px, cy + r_inner * sa + py),
+        (cx + r_outer * ca + px, cy + r_outer * sa + py),
+        (cx + r_outer * ca - px, cy + r_outer * sa - py),
+    ]
+
+def draw_circle(draw: ImageDraw.Draw, cx: float, cy: float, r: float, fill=None, outline=None, width=1):
     bbox = [cx - r, cy - r, cx + r, cy + r]
     draw.ellipse(bbox, fill=fill, outline=outline, width=width)
 
-def draw_segment(draw: ImageDraw.Draw, cx: int, cy: int, r_outer: int, r_inner: int,
+def draw_segment(draw: ImageDraw.Draw, cx: float, cy: float, r_outer: float, r_inner: float,
                  start_deg: float, end_deg: float, fill):
     """Draw a filled arc segment (annular wedge) by polygon approximation."""
-    points = []
-    steps = max(8, int(abs(end_deg - start_deg) * 2))
-
-    # Outer arc
-    for i in range(steps + 1):
-        angle = math.radians(start_deg + (end_deg - start_deg) * i / steps)
-        points.append((cx + r_outer * math.cos(angle), cy + r_outer * math.sin(angle)))
-
-    # Inner arc (reversed)
-    for i in range(steps, -1, -1):
-        angle = math.radians(start_deg + (end_deg - start_deg) * i / steps)
-        points.append((cx + r_inner * math.cos(angle), cy + r_inner * math.sin(angle)))
-
+    arc = arc_table(start_deg, end_deg)
+    points = [(cx + r_outer * c, cy + r_outer * s) for c, s in arc]
+    points.extend((cx + r_inner * c, cy + r_inner * s) for c, s in reversed(arc))
     draw.polygon(points, fill=fill)
 
-def main():
-    img = Image.new("RGBA", (SIZE, SIZE), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    font = ImageFont.truetype(FONT_PATH, FONT_SIZE)
-
-    # Background circle (black)
-    draw_circle(draw, CX, CY, R_OUTER_RIM + 20, fill=BG)
-
-    # Gold outer rim
-    draw_circle(draw, CX, CY, R_OUTER_RIM, fill=GOLD)
-    draw_circle(draw, CX, CY, R_OUTER_RIM - 8, fill=GOLD_DARK)
-    draw_circle(draw, CX, CY, R_POCKET_OUTER, fill=BG)
-
-    # ── POCKET CELLS ──
-    # Each pocket has two zones:
-    #   Back wall (outer): colored, holds the number
-    #   Floor (inner): much darker — concave basin where ball sits
-    # Then thick gold frets separate each pocket.
-
-    FRET_HALF_PX = 8  # half-width of each fret in pixels (~16px total)
-
-    for i, number in enumerate(WHEEL_ORDER):
-        start_deg = 270 + i * SEG_DEG - SEG_DEG / 2
-        end_deg = start_deg + SEG_DEG
-        color = pocket_color(number)
-
+class WheelCanvas:
+    """An RGBA canvas plus the design-to-output scale factor.
+
+    All public helpers take radii / widths in design (2048 px) units.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.k = size / SIZE
+        self.cx = self.cy = size // 2
+        self.img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        self.draw = ImageDraw.Draw(self.img)
+
+    def px(self, v: float) -> float:
+        return v * self.k
+
+    def width(self, w: int) -> int:
+        return max(1, round(w * self.k))
+
+    def circle(self, r: float, fill=None, outline=None, width=1):
+        draw_circle(self.draw, self.cx, self.cy, self.px(r), fill=fill, outline=outline,
+                    width=self.width(width))
+
+    def polygon(self, points, fill):
+        """Polygon given in design units relative to the wheel centre."""
+        self.draw.polygon([(self.cx + x * self.k, self.cy + y * self.k) for x, y in points], fill=fill)
+
+# ── Stamps ──────────────────────────────────────────────────────────
+
+class Stamp:
+    """A ring element painted once, pointing straight up (270°).
+
+    `anchor` is the wheel centre expressed in tile pixel coordinates; it
+    usually lies well below the tile, so the tile itself stays small.
+    """
+
+    def __init__(self, tile: Image.Image, anchor: tuple):
+        self.tile = tile
+        self.anchor = anchor
+
+def new_stamp(k: float, r_inner: float, r_outer: float, half_deg: float, paint) -> Stamp:
+    """Allocate a tile bounding the annular wedge [r_inner, r_outer] x ±half_deg
+    around 270° and let `paint(draw, ax, ay)` fill it in output pixels."""
+    pad = 4
+    r_in, r_out = r_inner * k, r_outer * k
+    half = math.radians(half_deg)
+    w = int(math.ceil(2 * (r_out * math.sin(half) + pad)))
+    h = int(math.ceil(r_out - r_in * math.cos(half) + 2 * pad))
+    ax, ay = w / 2, r_out + pad
+    tile = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    paint(ImageDraw.Draw(tile), ax, ay)
+    return Stamp(tile, (ax, ay))
+
+def stamp(canvas: WheelCanvas, st: Stamp, cos_a: float, sin_a: float):
+    """Composite `st` about the wheel centre so it points along (cos_a, sin_a).
+
+    The direction comes from a shared `ring_table`, so placing a stamp never
+    recomputes trig per vertex.
+    """
+    # Rotation from straight up (270°): cos(a - 270) = -sin a, sin(a - 270) = cos a
+    rc, rs = -sin_a, cos_a
+    tile, (ax, ay) = st.tile, st.anchor
+    cx, cy = canvas.cx, canvas.cy
+    w, h = tile.size
+    xs, ys = [], []
+    for u, v in ((0, 0), (w, 0), (0, h), (w, h)):
+        x, y = u - ax, v - ay
+        xs.append(cx + rc * x - rs * y)
+        ys.append(cy + rs * x + rc * y)
+    ox, oy = int(math.floor(min(xs))), int(math.floor(min(ys)))
+    ow, oh = int(math.ceil(max(xs))) - ox, int(math.ceil(max(ys))) - oy
+    # Inverse rotation: output pixel (x, y) samples tile (u, v). NEAREST keeps
+    # the hard polygon edges the direct-draw renderer produced.
+    data = (
+        rc, rs, rc * (ox - cx) + rs * (oy - cy) + ax,
+        -rs, rc, -rs * (ox - cx) + rc * (oy - cy) + ay,
+    )
+    out = tile.transform((ow, oh), Image.AFFINE, data, resample=Image.NEAREST)
+    canvas.img.alpha_composite(out, (ox, oy))
+
+@lru_cache(maxsize=None)
+def pocket_stamp(size: int, color: tuple, seg_deg: float) -> Stamp:
+    """One pocket cell of `color`: back wall, floor, concavity bands, shadows."""
+    k = size / SIZE
+    start_deg = 270 - seg_deg / 2
+    end_deg = start_deg + seg_deg
+
+    def paint(draw, ax, ay):
         # ── Back wall (number area) ──
-        draw_segment(draw, CX, CY, R_POCKET_OUTER, R_POCKET_FLOOR,
+        draw_segment(draw, ax, ay, R_POCKET_OUTER * k, R_POCKET_FLOOR * k,
                      start_deg, end_deg, fill=color)
 
         # ── Pocket floor (ball basin) — significantly darker ──
-        floor_base = darken(color, 80)
-        draw_segment(draw, CX, CY, R_POCKET_FLOOR, R_POCKET_INNER,
-                     start_deg, end_deg, fill=floor_base)
+        draw_segment(draw, ax, ay, R_POCKET_FLOOR * k, R_POCKET_INNER * k,
+                     start_deg, end_deg, fill=darken(color, 80))
 
         # Floor-to-wall transition: gradient bands for concavity
         for band_i in range(4):
             t = band_i / 4.0
-            band_r_outer = R_POCKET_FLOOR + int((R_POCKET_OUTER - R_POCKET_FLOOR) * t * 0.25)
-            band_r_inner = R_POCKET_FLOOR - int((R_POCKET_FLOOR - R_POCKET_INNER) * (1.0 - t) * 0.3)
             band_color = darken(color, int(80 * (1.0 - t * 0.5)))
-            draw_segment(draw, CX, CY, R_POCKET_FLOOR + 5 - band_i * 2,
-                         R_POCKET_FLOOR - 10 + band_i * 3,
+            draw_segment(draw, ax, ay, (R_POCKET_FLOOR + 5 - band_i * 2) * k,
+                         (R_POCKET_FLOOR - 10 + band_i * 3) * k,
                          start_deg, end_deg, fill=band_color)
 
         # ── Pocket inner shadow (deepest part of basin) ──
-        deep_shadow = darken(color, 110)
-        draw_segment(draw, CX, CY, R_POCKET_INNER + 18, R_POCKET_INNER,
-                     start_deg, end_deg, fill=deep_shadow)
+        draw_segment(draw, ax, ay, (R_POCKET_INNER + 18) * k, R_POCKET_INNER * k,
+                     start_deg, end_deg, fill=darken(color, 110))
 
         # ── Shadow strips along fret edges inside pocket ──
         fret_edge_shadow = darken(color, 95)
-        shadow_deg = SEG_DEG * 0.12
-        # Left edge
-        draw_segment(draw, CX, CY, R_POCKET_OUTER, R_POCKET_INNER,
+        shadow_deg = seg_deg * 0.12
+        draw_segment(draw, ax, ay, R_POCKET_OUTER * k, R_POCKET_INNER * k,
                      start_deg, start_deg + shadow_deg, fill=fret_edge_shadow)
-        # Right edge
-        draw_segment(draw, CX, CY, R_POCKET_OUTER, R_POCKET_INNER,
+        draw_segment(draw, ax, ay, R_POCKET_OUTER * k, R_POCKET_INNER * k,
                      end_deg - shadow_deg, end_deg, fill=fret_edge_shadow)
 
-    # ── GOLD FRETS — thick polygon dividers ──
-    for i in range(SEGMENTS):
-        angle_deg = 270 + i * SEG_DEG - SEG_DEG / 2
-        angle_rad = math.radians(angle_deg)
-        perp = angle_rad + math.pi / 2
+    return new_stamp(k, R_POCKET_INNER, R_POCKET_OUTER, seg_deg / 2, paint)
 
-        # Extend frets slightly past pocket band
-        r_in = R_POCKET_INNER - 3
-        r_out = R_POCKET_OUTER + 3
+@lru_cache(maxsize=None)
+def fret_stamp(size: int) -> Stamp:
+    """One thick gold divider: shadow halo, body, highlight and dark half."""
+    k = size / SIZE
+    up = math.radians(270)
+    # Extend frets slightly past pocket band
+    r_in = R_POCKET_INNER - 3
+    r_out = R_POCKET_OUTER + 3
 
+    def paint(draw, ax, ay):
         # Shadow halo behind fret (wider, very dark)
-        shadow_pts = draw_fret_polygon(draw, CX, CY, r_in, r_out,
-                                        angle_rad, FRET_HALF_PX + 4)
-        draw.polygon(shadow_pts, fill=FRET_SHADOW)
-
+        draw.polygon(fret_polygon(ax, ay, r_in * k, r_out * k, up, (FRET_HALF_PX + 4) * k),
+                     fill=FRET_SHADOW)
         # Main gold fret body
-        body_pts = draw_fret_polygon(draw, CX, CY, r_in, r_out,
-                                      angle_rad, FRET_HALF_PX)
-        draw.polygon(body_pts, fill=FRET_GOLD)
-
+        draw.polygon(fret_polygon(ax, ay, r_in * k, r_out * k, up, FRET_HALF_PX * k),
+                     fill=FRET_GOLD)
         # Bright highlight on left half of fret
-        hl_pts = draw_fret_polygon(draw, CX, CY, r_in + 2, r_out - 2,
-                                    angle_rad, FRET_HALF_PX)
-        # Shift highlight points to one side
-        dx_hl = -3 * math.cos(perp)
-        dy_hl = -3 * math.sin(perp)
-        hl_shifted = [(x + dx_hl, y + dy_hl) for x, y in hl_pts]
-        # Clip: only draw the left half by using a narrow polygon
-        hl_narrow = draw_fret_polygon(draw, CX, CY, r_in + 4, r_out - 4,
-                                       angle_rad - 0.002, FRET_HALF_PX * 0.45)
-        draw.polygon(hl_narrow, fill=FRET_GOLD_BRIGHT)
-
+        draw.polygon(fret_polygon(ax, ay, (r_in + 4) * k, (r_out - 4) * k, up - 0.002,
+                                  FRET_HALF_PX * 0.45 * k), fill=FRET_GOLD_BRIGHT)
         # Dark shadow on right half of fret
-        dk_narrow = draw_fret_polygon(draw, CX, CY, r_in + 4, r_out - 4,
-                                       angle_rad + 0.002, FRET_HALF_PX * 0.45)
-        draw.polygon(dk_narrow, fill=FRET_GOLD_DARK)
+        draw.polygon(fret_polygon(ax, ay, (r_in + 4) * k, (r_out - 4) * k, up + 0.002,
+                                  FRET_HALF_PX * 0.45 * k), fill=FRET_GOLD_DARK)
+
+    half_deg = math.degrees(math.atan2(FRET_HALF_PX + 4, r_in))
+    return new_stamp(k, r_in, r_out, half_deg, paint)
+
+# ── Wheel stages ────────────────────────────────────────────────────
+
+def draw_rim(canvas: WheelCanvas):
+    # Background circle (black)
+    canvas.circle(R_OUTER_RIM + 20, fill=BG)
+
+    # Gold outer rim
+    canvas.circle(R_OUTER_RIM, fill=GOLD)
+    canvas.circle(R_OUTER_RIM - 8, fill=GOLD_DARK)
+    # The pocket ring layer brings its own black backing
+    canvas.circle(R_POCKET_OUTER, fill=CLEAR)
+
+    # Outer gold ring final stroke
+    canvas.circle(R_OUTER_RIM, outline=GOLD, width=5)
+
+def draw_pockets(canvas: WheelCanvas, order: list):
+    canvas.circle(R_POCKET_OUTER, fill=BG)
+
+    # ── POCKET CELLS ──
+    # Each pocket has two zones:
+    #   Back wall (outer): colored, holds the number
+    #   Floor (inner): much darker — concave basin where ball sits
+    # Then thick gold frets separate each pocket.
+    seg_deg = 360.0 / len(order)
+    for (_deg, ca, sa), number in zip(ring_table(len(order), 270.0), order):
+        stamp(canvas, pocket_stamp(canvas.size, pocket_color(number), seg_deg), ca, sa)
+
+    # ── GOLD FRETS — thick polygon dividers ──
+    fret = fret_stamp(canvas.size)
+    for _deg, ca, sa in ring_table(len(order), 270 - seg_deg / 2):
+        stamp(canvas, fret, ca, sa)
 
     # ── Inner gold ring at pocket floor boundary ──
-    draw_circle(draw, CX, CY, R_POCKET_INNER + 2, outline=FRET_GOLD_DARK, width=5)
-    draw_circle(draw, CX, CY, R_POCKET_INNER, outline=FRET_GOLD, width=3)
+    canvas.circle(R_POCKET_INNER + 2, outline=FRET_GOLD_DARK, width=5)
+    canvas.circle(R_POCKET_INNER, outline=FRET_GOLD, width=3)
 
     # ── Outer pocket rim accent ──
-    draw_circle(draw, CX, CY, R_POCKET_OUTER, outline=FRET_GOLD_DARK, width=3)
+    canvas.circle(R_POCKET_OUTER, outline=FRET_GOLD_DARK, width=3)
 
+def draw_apron(canvas: WheelCanvas):
     # ── INNER WALL / APRON ──
-    draw_circle(draw, CX, CY, R_INNER_WALL, fill=BROWN_DARK)
-    draw_circle(draw, CX, CY, R_INNER_WALL, outline=FRET_GOLD_DARK, width=3)
+    canvas.circle(R_INNER_WALL, fill=BROWN_DARK)
+    canvas.circle(R_INNER_WALL, outline=FRET_GOLD_DARK, width=3)
+    # Everything inside the apron belongs to the hub layer
+    canvas.circle(R_BALL_TRACK_O, fill=CLEAR)
 
+def draw_ball_track(canvas: WheelCanvas):
     # ── BALL TRACK — chrome ring where ball rolls ──
     # Outer chrome rim
-    draw_circle(draw, CX, CY, R_BALL_TRACK_O, fill=CHROME_DARK)
+    canvas.circle(R_BALL_TRACK_O, fill=CHROME_DARK)
     # Main track surface — polished chrome
-    draw_circle(draw, CX, CY, R_BALL_TRACK_O - 4, fill=CHROME)
+    canvas.circle(R_BALL_TRACK_O - 4, fill=CHROME)
     # Highlight band (upper part of track catches light)
-    draw_circle(draw, CX, CY, R_BALL_TRACK_O - 8, fill=CHROME_LIGHT)
+    canvas.circle(R_BALL_TRACK_O - 8, fill=CHROME_LIGHT)
     # Middle track
-    draw_circle(draw, CX, CY, R_DEFLECTOR_R + 8, fill=CHROME)
+    canvas.circle(R_DEFLECTOR_R + 8, fill=CHROME)
     # Lower track (darker, shadow)
-    draw_circle(draw, CX, CY, R_DEFLECTOR_R - 8, fill=CHROME_DARK)
+    canvas.circle(R_DEFLECTOR_R - 8, fill=CHROME_DARK)
     # Inner chrome rim
-    draw_circle(draw, CX, CY, R_BALL_TRACK_I + 6, fill=CHROME_SHADOW)
-    draw_circle(draw, CX, CY, R_BALL_TRACK_I, fill=CHROME_DARK)
+    canvas.circle(R_BALL_TRACK_I + 6, fill=CHROME_SHADOW)
+    canvas.circle(R_BALL_TRACK_I, fill=CHROME_DARK)
 
     # ── 8 DIAMOND DEFLECTORS on ball track ──
-    # 4 vertical (taller) + 4 horizontal (wider), alternating every 45°
-    for di in range(8):
-        d_angle = math.radians(di * 45)
-        dcx = CX + R_DEFLECTOR_R * math.cos(d_angle)
-        dcy = CY + R_DEFLECTOR_R * math.sin(d_angle)
+    # 4 vertical (taller) + 4 horizontal (wider), alternating every 45°.
+    # Not stamped: the highlight offset is fixed in screen space (toward the
+    # light), so the deflectors are not rotation-invariant.
+    for di, (_deg, ca, sa) in enumerate(ring_table(8, 0.0)):
+        dcx = R_DEFLECTOR_R * ca
+        dcy = R_DEFLECTOR_R * sa
+        # Perpendicular (angle + 90°) is (-sin, cos)
+        pa, pb = -sa, ca
 
         # Alternating: tall/narrow vs wide/short
         if di % 2 == 0:
@@ -259,59 +401,31 @@ def main():
             radial_size = 18
             tangent_size = 22
 
-        # Diamond points: radial direction and perpendicular
-        perp = d_angle + math.pi / 2
-        pts_shadow = [
-            (dcx + (radial_size + 3) * math.cos(d_angle),
-             dcy + (radial_size + 3) * math.sin(d_angle)),
-            (dcx + (tangent_size + 3) * math.cos(perp),
-             dcy + (tangent_size + 3) * math.sin(perp)),
-            (dcx - (radial_size + 3) * math.cos(d_angle),
-             dcy - (radial_size + 3) * math.sin(d_angle)),
-            (dcx - (tangent_size + 3) * math.cos(perp),
-             dcy - (tangent_size + 3) * math.sin(perp)),
-        ]
-        draw.polygon(pts_shadow, fill=CHROME_SHADOW)
+        def diamond(rs, ts, off=0.0):
+            return [
+                (dcx + rs * ca - off, dcy + rs * sa - off),
+                (dcx + ts * pa - off, dcy + ts * pb - off),
+                (dcx - rs * ca - off, dcy - rs * sa - off),
+                (dcx - ts * pa - off, dcy - ts * pb - off),
+            ]
 
+        canvas.polygon(diamond(radial_size + 3, tangent_size + 3), fill=CHROME_SHADOW)
         # Main body
-        pts_body = [
-            (dcx + radial_size * math.cos(d_angle),
-             dcy + radial_size * math.sin(d_angle)),
-            (dcx + tangent_size * math.cos(perp),
-             dcy + tangent_size * math.sin(perp)),
-            (dcx - radial_size * math.cos(d_angle),
-             dcy - radial_size * math.sin(d_angle)),
-            (dcx - tangent_size * math.cos(perp),
-             dcy - tangent_size * math.sin(perp)),
-        ]
-        draw.polygon(pts_body, fill=CHROME)
-
+        canvas.polygon(diamond(radial_size, tangent_size), fill=CHROME)
         # Highlight (smaller, offset toward light)
-        hl_size_r = radial_size * 0.55
-        hl_size_t = tangent_size * 0.55
-        hl_off = 2
-        pts_hl = [
-            (dcx + hl_size_r * math.cos(d_angle) - hl_off,
-             dcy + hl_size_r * math.sin(d_angle) - hl_off),
-            (dcx + hl_size_t * math.cos(perp) - hl_off,
-             dcy + hl_size_t * math.sin(perp) - hl_off),
-            (dcx - hl_size_r * math.cos(d_angle) - hl_off,
-             dcy - hl_size_r * math.sin(d_angle) - hl_off),
-            (dcx - hl_size_t * math.cos(perp) - hl_off,
-             dcy - hl_size_t * math.sin(perp) - hl_off),
-        ]
-        draw.polygon(pts_hl, fill=CHROME_LIGHT)
+        canvas.polygon(diamond(radial_size * 0.55, tangent_size * 0.55, off=2), fill=CHROME_LIGHT)
 
     # Ball track edge rings
-    draw_circle(draw, CX, CY, R_BALL_TRACK_O, outline=CHROME_SHADOW, width=3)
-    draw_circle(draw, CX, CY, R_BALL_TRACK_I, outline=CHROME_SHADOW, width=3)
+    canvas.circle(R_BALL_TRACK_O, outline=CHROME_SHADOW, width=3)
+    canvas.circle(R_BALL_TRACK_I, outline=CHROME_SHADOW, width=3)
 
+def draw_cone(canvas: WheelCanvas):
     # ── CONE — polished wood with gradient depth ──
     # The cone slopes from ball track down to turret, creating depth
     # Multiple concentric rings simulate the sloped surface
 
     # Outer cone base
-    draw_circle(draw, CX, CY, R_CONE_OUTER, fill=BROWN_DARK)
+    canvas.circle(R_CONE_OUTER, fill=BROWN_DARK)
 
     # Gradient rings from outer to inner (light → dark → light → dark)
     cone_rings = [
@@ -338,49 +452,50 @@ def main():
     ]
     for r, color in cone_rings:
         if r > 0:
-            draw_circle(draw, CX, CY, r, fill=color)
+            canvas.circle(r, fill=color)
 
     # Gold accent rings on cone
-    draw_circle(draw, CX, CY, R_CONE_OUTER - 3, outline=GOLD_DARK, width=2)
-    draw_circle(draw, CX, CY, R_CONE_RING1, outline=GOLD_DARK, width=2)
-    draw_circle(draw, CX, CY, R_CONE_RING2 - 1, outline=GOLD_DARK, width=1)
-    draw_circle(draw, CX, CY, R_CONE_RING3, outline=GOLD_DARK, width=1)
+    canvas.circle(R_CONE_OUTER - 3, outline=GOLD_DARK, width=2)
+    canvas.circle(R_CONE_RING1, outline=GOLD_DARK, width=2)
+    canvas.circle(R_CONE_RING2 - 1, outline=GOLD_DARK, width=1)
+    canvas.circle(R_CONE_RING3, outline=GOLD_DARK, width=1)
 
+def draw_turret(canvas: WheelCanvas):
     # ── TURRET — decorative gold center cap ──
     # Outer turret ring
-    draw_circle(draw, CX, CY, R_TURRET_OUTER, fill=TURRET_DARK)
-    draw_circle(draw, CX, CY, R_TURRET_OUTER - 4, fill=TURRET_GOLD)
-    draw_circle(draw, CX, CY, R_TURRET_OUTER, outline=TURRET_DARK, width=3)
+    canvas.circle(R_TURRET_OUTER, fill=TURRET_DARK)
+    canvas.circle(R_TURRET_OUTER - 4, fill=TURRET_GOLD)
+    canvas.circle(R_TURRET_OUTER, outline=TURRET_DARK, width=3)
 
     # Middle turret ring (raised)
-    draw_circle(draw, CX, CY, R_TURRET_MID, fill=TURRET_DARK)
-    draw_circle(draw, CX, CY, R_TURRET_MID - 4, fill=TURRET_BRIGHT)
-    draw_circle(draw, CX, CY, R_TURRET_MID, outline=TURRET_DARK, width=2)
+    canvas.circle(R_TURRET_MID, fill=TURRET_DARK)
+    canvas.circle(R_TURRET_MID - 4, fill=TURRET_BRIGHT)
+    canvas.circle(R_TURRET_MID, outline=TURRET_DARK, width=2)
 
     # Inner turret
-    draw_circle(draw, CX, CY, R_TURRET_INNER, fill=TURRET_GOLD)
-    draw_circle(draw, CX, CY, R_TURRET_INNER, outline=TURRET_DARK, width=2)
+    canvas.circle(R_TURRET_INNER, fill=TURRET_GOLD)
+    canvas.circle(R_TURRET_INNER, outline=TURRET_DARK, width=2)
 
     # Center cap
-    draw_circle(draw, CX, CY, R_TURRET_CAP, fill=TURRET_BRIGHT)
-    draw_circle(draw, CX, CY, R_TURRET_CAP, outline=TURRET_DARK, width=2)
-    draw_circle(draw, CX, CY, R_TURRET_CAP - 10, fill=TURRET_GOLD)
+    canvas.circle(R_TURRET_CAP, fill=TURRET_BRIGHT)
+    canvas.circle(R_TURRET_CAP, outline=TURRET_DARK, width=2)
+    canvas.circle(R_TURRET_CAP - 10, fill=TURRET_GOLD)
 
+def draw_apron_diamonds(canvas: WheelCanvas, count: int):
     # ── Small gold diamonds on apron (between pockets and ball track) ──
-    for i in range(SEGMENTS):
-        angle_deg = 270 + i * SEG_DEG
-        angle_rad = math.radians(angle_deg)
-        dx = CX + (R_INNER_WALL - 6) * math.cos(angle_rad)
-        dy = CY + (R_INNER_WALL - 6) * math.sin(angle_rad)
-        diamond_size = 7
-        pts = [
-            (dx + diamond_size * math.cos(angle_rad), dy + diamond_size * math.sin(angle_rad)),
-            (dx + diamond_size * math.cos(angle_rad + math.pi/2), dy + diamond_size * math.sin(angle_rad + math.pi/2)),
-            (dx + diamond_size * math.cos(angle_rad + math.pi), dy + diamond_size * math.sin(angle_rad + math.pi)),
-            (dx + diamond_size * math.cos(angle_rad - math.pi/2), dy + diamond_size * math.sin(angle_rad - math.pi/2)),
-        ]
-        draw.polygon(pts, fill=GOLD)
-
+    diamond_size = 7
+    r = R_INNER_WALL - 6
+    for _deg, ca, sa in ring_table(count, 270.0):
+        dx, dy = r * ca, r * sa
+        # Radial (±cos, ±sin) and tangential (∓sin, ±cos) tips
+        canvas.polygon([
+            (dx + diamond_size * ca, dy + diamond_size * sa),
+            (dx - diamond_size * sa, dy + diamond_size * ca),
+            (dx - diamond_size * ca, dy - diamond_size * sa),
+            (dx + diamond_size * sa, dy - diamond_size * ca),
+        ], fill=GOLD)
+
+def draw_numbers(canvas: WheelCanvas, order: list):
     # Draw numbers — all facing outward (top of text toward rim).
     # This is the industry standard for both physical and digital roulette
     # wheels.  The wheel rotates during play so consistent radial orientation
@@ -390,18 +505,17 @@ def main():
     # Text "up" starts at 270° (screen-up).  After rotate(θ), text top
     # points to screen direction (270 - θ) mod 360 (CW from right).
     # Outward direction = angle_deg, so θ = 270 - angle_deg.
+    font = ImageFont.truetype(FONT_PATH, max(1, round(FONT_SIZE * canvas.k)))
+    pad = canvas.width(30)
+    r = canvas.px(R_NUMBER_CENTER)
 
-    for i, number in enumerate(WHEEL_ORDER):
-        angle_deg = 270 + i * SEG_DEG
-        angle_rad = math.radians(angle_deg)
-
-        text = str(number)
+    for (angle_deg, ca, sa), number in zip(ring_table(len(order), 270.0), order):
+        text = pocket_label(number)
         rotation = (270 - angle_deg) % 360
 
         bbox = font.getbbox(text)
         tw = bbox[2] - bbox[0]
         th = bbox[3] - bbox[1]
-        pad = 30
         tmp_size = int(math.hypot(tw, th)) + pad * 2
         tmp = Image.new("RGBA", (tmp_size, tmp_size), (0, 0, 0, 0))
         tmp_draw = ImageDraw.Draw(tmp)
@@ -411,20 +525,157 @@ def main():
 
         tmp_rot = tmp.rotate(rotation, resample=Image.BICUBIC, expand=False)
 
-        nx = CX + R_NUMBER_CENTER * math.cos(angle_rad)
-        ny = CY + R_NUMBER_CENTER * math.sin(angle_rad)
+        nx = canvas.cx + r * ca
+        ny = canvas.cy + r * sa
         paste_x = int(nx - tmp_rot.width / 2)
         paste_y = int(ny - tmp_rot.height / 2)
 
-        img.paste(tmp_rot, (paste_x, paste_y), tmp_rot)
-
-    # Outer gold ring final stroke
-    draw_circle(draw, CX, CY, R_OUTER_RIM, outline=GOLD, width=5)
-
-    # Save
-    out_path = "/home/ubuntu/workspace/cv/slotsone/frontend/public/assets/roulette/pro/wheel-topdown-2048.png"
-    img.save(out_path, "PNG")
-    print(f"Saved {out_path} ({SIZE}x{SIZE})")
+        canvas.img.paste(tmp_rot, (paste_x, paste_y), tmp_rot)
+
+# ── Layers ──────────────────────────────────────────────────────────
+
+# name -> (inner radius, outer radius, rotates), bottom-to-top, design units
+LAYERS = {
+    "rim": (R_POCKET_OUTER, R_OUTER_RIM + 20, False),
+    "hub": (0, R_BALL_TRACK_O, False),
+    # Frets overhang the pocket band by 3 px; apron diamonds reach 3 px into the track
+    "ring": (R_BALL_TRACK_O - 3, R_POCKET_OUTER + 3, True),
+}
+
+@lru_cache(maxsize=None)
+def static_layers(size: int) -> tuple:
+    """(rim, hub) full-size canvases — shared by every wheel variant."""
+    rim = WheelCanvas(size)
+    draw_rim(rim)
+
+    hub = WheelCanvas(size)
+    draw_ball_track(hub)
+    draw_cone(hub)
+    draw_turret(hub)
+    return rim.img, hub.img
+
+def ring_layer(size: int, order: list) -> Image.Image:
+    ring = WheelCanvas(size)
+    draw_pockets(ring, order)
+    draw_apron(ring)
+    draw_apron_diamonds(ring, len(order))
+    draw_numbers(ring, order)
+    return ring.img
+
+def render_layers(size: int = SIZE, order: list = WHEEL_ORDER) -> dict:
+    """Full-size layer canvases keyed by name, bottom-to-top."""
+    rim, hub = static_layers(size)
+    return {"rim": rim, "hub": hub, "ring": ring_layer(size, order)}
+
+def flatten(layers: dict) -> Image.Image:
+    img = None
+    for layer in layers.values():
+        img = layer.copy() if img is None else Image.alpha_composite(img, layer)
+    return img
+
+def render_wheel(size: int = SIZE, order: list = WHEEL_ORDER) -> Image.Image:
+    return flatten(render_layers(size, order))
+
+def crop_box(size: int, outer_radius: float) -> tuple:
+    """Square box centred on the wheel centre, so a cropped sprite can be
+    anchored at 0.5 and rotated in place."""
+    c = size // 2
+    half = min(c, int(math.ceil(outer_radius * size / SIZE)) + 1)
+    return (c - half, c - half, c + half, c + half)
+
+def wheel_metadata(size: int, order: list, prefix: str) -> dict:
+    k = size / SIZE
+    layers = []
+    for name, (r_in, r_out, rotates) in LAYERS.items():
+        x0, y0, x1, y1 = crop_box(size, r_out)
+        # Static layers are shared by every variant, so they use one file name
+        owner = prefix if rotates else VARIANTS["european"][0]
+        layers.append({
+            "name": name,
+            "file": f"{owner}-{size}-{name}.png",
+            "x": x0,
+            "y": y0,
+            "width": x1 - x0,
+            "height": y1 - y0,
+            "inner_radius": round(r_in * k, 2),
+            "outer_radius": round(r_out * k, 2),
+            "rotates": rotates,
+        })
+    seg_deg = 360.0 / len(order)
+    return {
+        "size": size,
+        "center": [size // 2, size // 2],
+        # Screen-space degrees, clockwise from +x (y points down): 270 = 12 o'clock.
+        "angle_convention": "clockwise_from_positive_x",
+        "pocket_span_deg": seg_deg,
+        "radii": {
+            "pocket_outer": round(R_POCKET_OUTER * k, 2),
+            "pocket_floor": round(R_POCKET_FLOOR * k, 2),
+            "pocket_inner": round(R_POCKET_INNER * k, 2),
+            "number_center": round(R_NUMBER_CENTER * k, 2),
+            "ball_track_outer": round(R_BALL_TRACK_O * k, 2),
+            "ball_track_inner": round(R_BALL_TRACK_I * k, 2),
+        },
+        "layers": layers,
+        "pockets": [
+            {
+                "index": i,
+                "number": number,
+                "label": pocket_label(number),
+                "color": pocket_color_name(number),
+                "angle_deg": round(deg % 360.0, 6),
+            }
+            for i, ((deg, _c, _s), number) in enumerate(zip(ring_table(len(order), 270.0), order))
+        ],
+    }
+
+def write_wheel(out_dir: str, size: int, variant: str, with_layers: bool, written: set):
+    prefix, order = VARIANTS[variant]
+    layers = render_layers(size, order)
+
+    out_path = os.path.join(out_dir, f"{prefix}-{size}.png")
+    flatten(layers).save(out_path, "PNG")
+    print(f"Saved {out_path} ({size}x{size})")
+    if not with_layers:
+        return
+
+    meta = wheel_metadata(size, order, prefix)
+    for entry in meta["layers"]:
+        box = (entry["x"], entry["y"], entry["x"] + entry["width"], entry["y"] + entry["height"])
+        path = os.path.join(out_dir, entry["file"])
+        if path in written:
+            continue
+        layers[entry["name"]].crop(box).save(path, "PNG")
+        written.add(path)
+        print(f"Saved {path} ({entry['width']}x{entry['height']})")
+
+    meta_path = os.path.join(out_dir, f"{prefix}-{size}.json")
+    with open(meta_path, "w") as f:
+        json.dump({"variant": variant, **meta}, f, indent=2)
+        f.write("\n")
+    print(f"Saved {meta_path}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render the top-down roulette wheel PNG.")
+    parser.add_argument("--size", type=int, default=SIZE,
+                        help=f"output edge length in pixels (default {SIZE}; e.g. 1024, 4096)")
+    parser.add_argument("--variant", choices=[*VARIANTS, "all"], default="european",
+                        help="pocket layout to render (default european)")
+    parser.add_argument("--layers", action="store_true",
+                        help="also write rim / hub / ring sprites and a JSON metadata file")
+    parser.add_argument("--out-dir", default=OUT_DIR,
+                        help="output directory (default: frontend/public/assets/roulette/pro)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    out_dir = os.path.abspath(args.out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+
+    variants = list(VARIANTS) if args.variant == "all" else [args.variant]
+    written = set()
+    for variant in variants:
+        write_wheel(out_dir, args.size, variant, args.layers, written)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Generate a multi-channel signed distance field (MTSDF) atlas of the slot
+symbol glyphs.
+
+The glyph shapes are the outer (stroke) silhouettes the painters in
+generate_slot_symbols.py draw, in the same 512px design units, described as
+small CSG trees of rectangles, circles and polygons. Each atlas texel stores:
+  RGB  per-channel pseudo-distances to edge-coloured polygon outlines, so the
+       median of the three keeps corners sharp at any magnification;
+  A    the true signed distance, for soft effects (glow, shadow, outline).
+
+Texels whose bilinearly interpolated median would disagree in sign with the
+true shape (the classic MSDF "clash" artifacts) fall back to the true
+distance in all channels.
+
+Output:
+  frontend/public/symbols/msdf/glyphs.png   RGBA atlas
+  frontend/public/symbols/msdf/glyphs.json  layout + distance range
+
+A client renders a glyph with the usual MSDF shader:
+  sd = median(r, g, b) - 0.5;  alpha = clamp(sd * screenPxRange + 0.5, 0, 1)
+where screenPxRange = distanceRange * (on-screen size / cell size).
+
+Requires numpy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import generate_slot_symbols as gss  # noqa: E402
+from generate_slot_symbols import Point, star_points, write_png  # noqa: E402
+
+OUT_DIR = os.path.join(os.path.dirname(__file__), "..", "frontend", "public", "symbols", "msdf")
+CELL = 64
+DISTANCE_RANGE = 6.0
+
+# Edge colours as channel masks (R, G, B). Adjacent edges never share a
+# colour, so at every corner at least one channel sees only one edge.
+MAGENTA = (True, False, True)
+YELLOW = (True, True, False)
+CYAN = (False, True, True)
+WHITE = (True, True, True)
+
+
+# ── Shapes ──────────────────────────────────────────────────────────
+
+def rect(x0: float, y0: float, x1: float, y1: float) -> Tuple:
+    return ("poly", [(x0, y0), (x1, y0), (x1, y1), (x0, y1)])
+
+
+def circle(cx: float, cy: float, r: float) -> Tuple:
+    return ("circle", cx, cy, r)
+
+
+def poly(points: Sequence[Point]) -> Tuple:
+    return ("poly", list(points))
+
+
+def union(*shapes: Tuple) -> Tuple:
+    return ("union", list(shapes))
+
+
+def subtract(shape: Tuple, hole: Tuple) -> Tuple:
+    return ("subtract", shape, hole)
+
+
+# Silhouettes of the stroke layer in paint_10/j/q/k/a/wild and paint_star,
+# built from the outline constants those painters draw.
+GLYPHS: Dict[str, Tuple] = {
+    "10": subtract(union(rect(*gss.TEN_STEM), rect(*gss.TEN_FLAG), circle(*gss.TEN_RING)), circle(*gss.TEN_HOLE)),
+    "J": subtract(union(rect(*gss.J_STEM), rect(*gss.J_FOOT), circle(*gss.J_HOOK)), circle(*gss.J_HOLE)),
+    "Q": subtract(union(circle(*gss.Q_RING), poly(gss.Q_TAIL)), circle(*gss.Q_HOLE)),
+    "K": union(rect(*gss.K_STEM), poly(gss.K_UPPER), poly(gss.K_LOWER)),
+    "A": union(subtract(poly(gss.A_OUTER), poly(gss.A_INNER)), rect(*gss.A_BAR)),
+    "W": poly(gss.W_OUTLINE),
+    "star": poly(star_points(*gss.STAR)),
+    "bolt": poly(gss.BOLT),
+}
+
+
+def bounds(shape: Tuple) -> Tuple[float, float, float, float]:
+    kind = shape[0]
+    if kind == "circle":
+        _, cx, cy, r = shape
+        return cx - r, cy - r, cx + r, cy + r
+    if kind == "poly":
+        xs, ys = zip(*shape[1])
+        return min(xs), min(ys), max(xs), max(ys)
+    if kind == "subtract":
+        return bounds(shape[1])
+    boxes = [bounds(s) for s in shape[1]]
+    return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+            max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+
+# ── Distance fields (positive inside) ───────────────────────────────
+
+def edge_colors(count: int) -> List[Tuple[bool, bool, bool]]:
+    colors = [MAGENTA if i % 2 == 0 else YELLOW for i in range(count)]
+    if count % 2 == 1:
+        colors[-1] = CYAN  # would otherwise match the first edge
+    return colors
+
+
+def polygon_field(points: Sequence[Point], px: np.ndarray, py: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-channel pseudo-distances (3, N) and true signed distance (N)."""
+    pts = np.asarray(points, dtype=np.float64)
+    area = np.sum(pts[:, 0] * np.roll(pts[:, 1], -1) - np.roll(pts[:, 0], -1) * pts[:, 1])
+    if area < 0:
+        pts = pts[::-1]  # interior on the positive side of every edge
+    a = pts[:, None, :]
+    b = np.roll(pts, -1, axis=0)[:, None, :]
+    p = np.stack([px, py], axis=-1)[None, :, :]
+
+    ab = b - a
+    ap = p - a
+    length = np.maximum(np.hypot(ab[..., 0], ab[..., 1]), 1e-12)
+    t = np.clip((ap[..., 0] * ab[..., 0] + ap[..., 1] * ab[..., 1]) / length ** 2, 0.0, 1.0)
+    closest = a + ab * t[..., None]
+    true_dist = np.hypot(p[..., 0] - closest[..., 0], p[..., 1] - closest[..., 1])  # (E, N)
+    line_dist = (ab[..., 0] * ap[..., 1] - ab[..., 1] * ap[..., 0]) / length        # signed
+
+    # Even-odd inside test for the true distance sign.
+    ay, by = a[..., 1], b[..., 1]
+    crosses = (ay > p[..., 1]) != (by > p[..., 1])
+    x_at = a[..., 0] + (p[..., 1] - ay) * ab[..., 0] / np.where(ab[..., 1] == 0, 1e-12, ab[..., 1])
+    inside = (np.count_nonzero(crosses & (p[..., 0] < x_at), axis=0) % 2) == 1
+    sdf = np.where(inside, 1.0, -1.0) * true_dist.min(axis=0)
+
+    # Edges meeting at a vertex are equally near to points beyond it; like
+    # msdfgen, prefer the edge the point is more orthogonal to.
+    ortho = np.abs(line_dist) / np.maximum(true_dist, 1e-12)
+    key = true_dist - 1e-6 * ortho
+
+    colors = np.asarray(edge_colors(len(pts)))  # (E, 3)
+    channels = np.empty((3, px.size))
+    columns = np.arange(px.size)
+    for c in range(3):
+        masked = np.where(colors[:, c][:, None], key, np.inf)
+        nearest = masked.argmin(axis=0)
+        channels[c] = line_dist[nearest, columns]
+    return channels, sdf
+
+
+def field(shape: Tuple, px: np.ndarray, py: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    kind = shape[0]
+    if kind == "circle":
+        _, cx, cy, r = shape
+        sdf = r - np.hypot(px - cx, py - cy)
+        return np.broadcast_to(sdf, (3, px.size)).copy(), sdf
+    if kind == "poly":
+        return polygon_field(shape[1], px, py)
+    # CSG takes each texel's channels from whichever operand decides its true
+    # distance; combining channels independently would mix pseudo-distances
+    # of unrelated edges and break the median.
+    if kind == "union":
+        parts = [field(s, px, py) for s in shape[1]]
+        sdfs = np.stack([d for _, d in parts])
+        pick = sdfs.argmax(axis=0)
+        channels = np.stack([c for c, _ in parts])[pick, :, np.arange(px.size)].T
+        return channels, sdfs.max(axis=0)
+    if kind == "subtract":
+        (ca, da), (cb, db) = field(shape[1], px, py), field(shape[2], px, py)
+        hole = -db < da
+        return np.where(hole, -cb, ca), np.where(hole, -db, da)
+    raise ValueError(f"unknown shape {kind!r}")
+
+
+def median3(c: np.ndarray) -> np.ndarray:
+    return np.maximum(np.minimum(c[0], c[1]), np.minimum(np.maximum(c[0], c[1]), c[2]))
+
+
+# ── Glyph rendering ─────────────────────────────────────────────────
+
+def render_glyph(shape: Tuple, origin: Tuple[float, float], scale: float, cell: int,
+                 distance_range: float) -> Tuple[np.ndarray, int]:
+    """(cell, cell, 4) float field in texel units, and texels corrected."""
+    ox, oy = origin
+    idx = (np.arange(cell) + 0.5) / scale
+    gx, gy = np.meshgrid(ox + idx, oy + idx)
+    channels, sdf = field(shape, gx.ravel(), gy.ravel())
+    channels = channels.reshape(3, cell, cell) * scale
+    sdf = sdf.reshape(cell, cell) * scale
+
+    # Clash correction: compare the median of bilinearly interpolated
+    # channels with the true sign at texel midpoints (2x grid).
+    half = (np.arange(2 * cell - 1) / 2 + 0.5) / scale
+    hx, hy = np.meshgrid(ox + half, oy + half)
+    _, fine = field(shape, hx.ravel(), hy.ravel())
+    fine = fine.reshape(2 * cell - 1, 2 * cell - 1)
+
+    up = np.empty((3, 2 * cell - 1, 2 * cell - 1))
+    up[:, ::2, ::2] = channels
+    up[:, 1::2, ::2] = (channels[:, :-1] + channels[:, 1:]) / 2
+    up[:, :, 1::2] = (up[:, :, :-1:2] + up[:, :, 2::2]) / 2
+    clash = (np.sign(median3(up)) != np.sign(fine)) & (np.abs(fine) > 0.02)
+    # Mark every texel that contributes to a clashing sample.
+    bad = np.zeros((cell, cell), dtype=bool)
+    ys, xs = np.nonzero(clash)
+    for dy in (0, 1):
+        for dx in (0, 1):
+            bad[np.minimum((ys + dy) // 2, cell - 1), np.minimum((xs + dx) // 2, cell - 1)] = True
+    channels[:, bad] = sdf[bad]
+
+    out = np.concatenate([channels, sdf[None]], axis=0).transpose(1, 2, 0)
+    return np.clip(0.5 + out / distance_range, 0.0, 1.0), int(bad.sum())
+
+
+def build_atlas(cell: int, distance_range: float) -> Tuple[np.ndarray, Dict]:
+    names = list(GLYPHS)
+    boxes = {name: bounds(GLYPHS[name]) for name in names}
+    pad = distance_range  # design-space margin so the field is not clipped
+    extent = max(max(b[2] - b[0], b[3] - b[1]) for b in boxes.values())
+    scale = (cell - 2 * pad) / extent  # texels per design unit, shared by all glyphs
+
+    columns = int(np.ceil(np.sqrt(len(names))))
+    rows = int(np.ceil(len(names) / columns))
+    atlas = np.zeros((rows * cell, columns * cell, 4))
+    glyphs = []
+    for i, name in enumerate(names):
+        x0, y0, x1, y1 = boxes[name]
+        # Centre the glyph's box in its cell.
+        origin = ((x0 + x1) / 2 - cell / 2 / scale, (y0 + y1) / 2 - cell / 2 / scale)
+        tile, corrected = render_glyph(GLYPHS[name], origin, scale, cell, distance_range)
+        row, col = divmod(i, columns)
+        atlas[row * cell:(row + 1) * cell, col * cell:(col + 1) * cell] = tile
+        glyphs.append({
+            "name": name,
+            "atlasBounds": {"left": col * cell, "top": row * cell,
+                            "right": (col + 1) * cell, "bottom": (row + 1) * cell},
+            "planeBounds": {"left": origin[0], "top": origin[1],
+                            "right": origin[0] + cell / scale, "bottom": origin[1] + cell / scale},
+            "correctedTexels": corrected,
+        })
+
+    meta = {
+        "atlas": {
+            "type": "mtsdf",
+            "distanceRange": distance_range,
+            "cellSize": cell,
+            "width": atlas.shape[1],
+            "height": atlas.shape[0],
+            "yOrigin": "top",
+            "designUnits": 512,
+        },
+        "glyphs": glyphs,
+    }
+    return atlas, meta
+
+
+# ── Preview ─────────────────────────────────────────────────────────
+
+def sample_bilinear(tex: np.ndarray, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    h, w = tex.shape[:2]
+    x = np.clip(u - 0.5, 0, w - 1)
+    y = np.clip(v - 0.5, 0, h - 1)
+    x0, y0 = np.floor(x).astype(int), np.floor(y).astype(int)
+    x1, y1 = np.minimum(x0 + 1, w - 1), np.minimum(y0 + 1, h - 1)
+    fx, fy = (x - x0)[..., None], (y - y0)[..., None]
+    top = tex[y0, x0] * (1 - fx) + tex[y0, x1] * fx
+    bottom = tex[y1, x0] * (1 - fx) + tex[y1, x1] * fx
+    return top * (1 - fy) + bottom * fy
+
+
+def render_preview(atlas: np.ndarray, meta: Dict, magnify: int) -> Tuple[np.ndarray, Dict[str, float]]:
+    """Decode the atlas like the client shader would, at `magnify`x, and
+    measure agreement (IoU) with the exact shapes at that resolution."""
+    rng = meta["atlas"]["distanceRange"]
+    h, w = atlas.shape[:2]
+    coords = (np.arange(h * magnify) + 0.5) / magnify, (np.arange(w * magnify) + 0.5) / magnify
+    v, u = np.meshgrid(*coords, indexing="ij")
+    texel = sample_bilinear(atlas, u, v)
+    sd = median3(np.moveaxis(texel[..., :3], -1, 0)) - 0.5
+    alpha = np.clip(sd * rng * magnify + 0.5, 0.0, 1.0)
+
+    iou = {}
+    for g in meta["glyphs"]:
+        box, plane = g["atlasBounds"], g["planeBounds"]
+        sl = (slice(box["top"] * magnify, box["bottom"] * magnify),
+              slice(box["left"] * magnify, box["right"] * magnify))
+        n = (box["right"] - box["left"]) * magnify
+        step = (plane["right"] - plane["left"]) / n
+        gx, gy = np.meshgrid(plane["left"] + (np.arange(n) + 0.5) * step,
+                             plane["top"] + (np.arange(n) + 0.5) * step)
+        _, exact = field(GLYPHS[g["name"]], gx.ravel(), gy.ravel())
+        truth = exact.reshape(n, n) > 0
+        got = alpha[sl] >= 0.5
+        iou[g["name"]] = float((truth & got).sum() / max(1, (truth | got).sum()))
+
+    rgba = np.zeros(alpha.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = 255
+    rgba[..., 3] = (alpha * 255).round().astype(np.uint8)
+    return rgba, iou
+
+
+# ── CLI ─────────────────────────────────────────────────────────────
+
+def to_bytes(px: np.ndarray) -> bytearray:
+    if px.dtype != np.uint8:
+        px = (px * 255).round().astype(np.uint8)
+    return bytearray(np.ascontiguousarray(px).tobytes())
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate the MTSDF glyph atlas for slot symbols.")
+    parser.add_argument("--cell", type=int, default=CELL, help=f"texels per glyph cell (default: {CELL})")
+    parser.add_argument("--range", type=float, default=DISTANCE_RANGE, dest="distance_range",
+                        help=f"distance range in texels (default: {DISTANCE_RANGE:g})")
+    parser.add_argument("--out-dir", default=OUT_DIR)
+    parser.add_argument("--preview", type=int, default=0, metavar="N",
+                        help="also decode the atlas at Nx into glyphs-preview.png and report IoU")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+    start = time.perf_counter()
+    atlas, meta = build_atlas(args.cell, args.distance_range)
+    elapsed = time.perf_counter() - start
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    png_path = os.path.abspath(os.path.join(args.out_dir, "glyphs.png"))
+    write_png(png_path, to_bytes(atlas), atlas.shape[1], atlas.shape[0])
+    with open(os.path.join(args.out_dir, "glyphs.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+        f.write("\n")
+    print(f"wrote {png_path} ({atlas.shape[1]}x{atlas.shape[0]}, "
+          f"{len(meta['glyphs'])} glyphs, {os.path.getsize(png_path) / 1024:.1f} KiB) in {elapsed:.2f}s")
+
+    if args.preview:
+        preview, iou = render_preview(atlas, meta, args.preview)
+        path = os.path.abspath(os.path.join(args.out_dir, "glyphs-preview.png"))
+        write_png(path, to_bytes(preview), preview.shape[1], preview.shape[0])
+        print(f"wrote {path}")
+        for name, value in iou.items():
+            print(f"  {name:<5} IoU {value:.4f}")
+
+
+if __name__ == "__main__":
+    main()
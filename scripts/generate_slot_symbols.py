@@ -27,6 +27,8 @@ OUT_DIR = os.path.join(os.path.dirname(__file__), "..", "frontend", "public", "s
 Color = Tuple[int, int, int, int]
 Rgb = Tuple[int, int, int]
 Point = Tuple[float, float]
+Rect = Tuple[float, float, float, float]  # x0, y0, x1, y1
+Circle = Tuple[float, float, float]  # cx, cy, r
 
 
 def clamp(v: float, lo: int = 0, hi: int = 255) -> int:
@@ -352,6 +354,46 @@ def build_theme(accent: Rgb) -> Theme:
     )
 
 
+# Lightning bolt over the WILD badge, in 512px design units.
+BOLT: List[Point] = [(246, 134), (214, 220), (252, 220), (216, 326), (298, 212), (258, 212), (288, 134)]
+
+# Stroke-layer outlines of the glyphs in 512px design units. The painters
+# draw (and offset for shadows) these; generate_msdf_atlas.py builds its
+# silhouettes from the same values.
+TEN_STEM: Rect = (146, 122, 198, 376)
+TEN_FLAG: Rect = (130, 140, 194, 182)
+TEN_RING: Circle = (306, 246, 93)
+TEN_HOLE: Circle = (306, 246, 45)
+J_STEM: Rect = (286, 118, 344, 320)
+J_FOOT: Rect = (206, 300, 344, 354)
+J_HOOK: Circle = (218, 300, 57)
+J_HOLE: Circle = (218, 300, 26)
+Q_RING: Circle = (256, 232, 100)
+Q_HOLE: Circle = (256, 232, 49)
+Q_TAIL: List[Point] = [(300, 300), (378, 388), (334, 410), (258, 324)]
+K_STEM: Rect = (148, 116, 206, 390)
+K_UPPER: List[Point] = [(210, 252), (368, 112), (398, 152), (252, 290)]
+K_LOWER: List[Point] = [(208, 248), (398, 390), (360, 430), (250, 296)]
+A_OUTER: List[Point] = [(256, 98), (378, 394), (134, 394)]
+A_INNER: List[Point] = [(256, 176), (320, 338), (192, 338)]
+A_BAR: Rect = (186, 262, 326, 306)
+W_OUTLINE: List[Point] = [(98, 142), (142, 382), (184, 236), (224, 382), (268, 142), (230, 142), (184, 316), (138, 142)]
+STAR: Tuple[float, float, float, float] = (256, 236, 118, 49)  # cx, cy, outer_r, inner_r
+
+
+def scale_rect(r: Rect, s: float, d: float = 0) -> Rect:
+    """Design-unit rect to buffer pixels at scale `s`, offset by `d` (shadows)."""
+    return r[0] * s + d, r[1] * s + d, r[2] * s + d, r[3] * s + d
+
+
+def scale_circle(c: Circle, s: float, d: float = 0) -> Circle:
+    return c[0] * s + d, c[1] * s + d, c[2] * s
+
+
+def scale_points(points: Sequence[Point], s: float, d: float = 0) -> List[Point]:
+    return [(x * s + d, y * s + d) for x, y in points]
+
+
 def star_points(cx: float, cy: float, outer_r: float, inner_r: float, points: int = 5) -> List[Point]:
     out: List[Point] = []
     step = math.pi / points
@@ -363,13 +405,19 @@ def star_points(cx: float, cy: float, outer_r: float, inner_r: float, points: in
     return out
 
 
-def draw_badge_base(buf: bytearray, theme: Theme) -> Dict[str, float]:
+def badge_panel() -> Dict[str, float]:
     s = SUPERSAMPLE
     x = 48 * s
     y = 34 * s
     w = 416 * s
     h = 444 * s
-    r = 86 * s
+    return {"x": x, "y": y, "w": w, "h": h, "r": 86 * s, "cx": x + w * 0.5, "cy": y + h * 0.48}
+
+
+def draw_badge_under(buf: bytearray, theme: Theme, panel: Dict[str, float]) -> None:
+    """Drop shadows and the badge body: everything below the centre glow."""
+    s = SUPERSAMPLE
+    x, y, w, h, r = panel["x"], panel["y"], panel["w"], panel["h"], panel["r"]
 
     draw_rr_solid(buf, x + 10 * s, y + 14 * s, w, h, r, (0, 0, 0, 68))
     draw_rr_solid(buf, x + 14 * s, y + 18 * s, w, h, r, (0, 0, 0, 34))
@@ -386,9 +434,16 @@ def draw_badge_base(buf: bytearray, theme: Theme) -> Dict[str, float]:
         rgba(theme.inner_bottom),
     )
 
-    cx = x + w * 0.5
-    cy = y + h * 0.48
-    draw_radial_glow(buf, cx, cy, 162 * s, rgba(theme.glow, 90))
+
+def draw_badge_glow(buf: bytearray, theme: Theme, panel: Dict[str, float]) -> None:
+    draw_radial_glow(buf, panel["cx"], panel["cy"], 162 * SUPERSAMPLE, rgba(theme.glow, 90))
+
+
+def draw_badge_over(buf: bytearray, theme: Theme, panel: Dict[str, float]) -> None:
+    """Gloss, bottom shade and sparkles drawn above the centre glow."""
+    s = SUPERSAMPLE
+    x, y, w, h, r = panel["x"], panel["y"], panel["w"], panel["h"], panel["r"]
+
     draw_rr_vgradient(
         buf,
         x + 18 * s,
@@ -413,7 +468,13 @@ def draw_badge_base(buf: bytearray, theme: Theme) -> Dict[str, float]:
     for px, py in ((x + 74 * s, y + 88 * s), (x + w - 88 * s, y + 108 * s), (x + w - 68 * s, y + h - 100 * s)):
         draw_circle(buf, px, py, 8 * s, (255, 255, 255, 80))
 
-    return {"x": x, "y": y, "w": w, "h": h, "r": r, "cx": cx, "cy": cy}
+
+def draw_badge_base(buf: bytearray, theme: Theme) -> Dict[str, float]:
+    panel = badge_panel()
+    draw_badge_under(buf, theme, panel)
+    draw_badge_glow(buf, theme, panel)
+    draw_badge_over(buf, theme, panel)
+    return panel
 
 
 def paint_10(buf: bytearray, theme: Theme, panel: Dict[str, float]) -> None:
@@ -424,17 +485,17 @@ def paint_10(buf: bytearray, theme: Theme, panel: Dict[str, float]) -> None:
     shadow = (0, 0, 0, 138)
     hole = rgba(darken(theme.inner_bottom, 0.28))
 
-    draw_rect(buf, 146 * s + d, 122 * s + d, 198 * s + d, 376 * s + d, shadow)
-    draw_circle(buf, 306 * s + d, 246 * s + d, 93 * s, shadow)
+    draw_rect(buf, *scale_rect(TEN_STEM, s, d), shadow)
+    draw_circle(buf, *scale_circle(TEN_RING, s, d), shadow)
 
-    draw_rect(buf, 146 * s, 122 * s, 198 * s, 376 * s, stroke)
-    draw_rect(buf, 130 * s, 140 * s, 194 * s, 182 * s, stroke)
-    draw_circle(buf, 306 * s, 246 * s, 93 * s, stroke)
+    draw_rect(buf, *scale_rect(TEN_STEM, s), stroke)
+    draw_rect(buf, *scale_rect(TEN_FLAG, s), stroke)
+    draw_circle(buf, *scale_circle(TEN_RING, s), stroke)
 
     draw_rect(buf, 154 * s, 130 * s, 190 * s, 368 * s, main)
     draw_rect(buf, 138 * s, 148 * s, 186 * s, 174 * s, main)
     draw_circle(buf, 306 * s, 246 * s, 82 * s, main)
-    draw_circle(buf, 306 * s, 246 * s, 45 * s, hole)
+    draw_circle(buf, *scale_circle(TEN_HOLE, s), hole)
     draw_circle(buf, 280 * s, 220 * s, 22 * s, (255, 255, 255, 96))
 
 
@@ -446,18 +507,18 @@ def paint_j(buf: bytearray, theme: Theme, panel: Dict[str, float]) -> None:
     shadow = (0, 0, 0, 136)
     hole = rgba(darken(theme.inner_bottom, 0.24))
 
-    draw_rect(buf, 286 * s + d, 118 * s + d, 344 * s + d, 320 * s + d, shadow)
-    draw_rect(buf, 206 * s + d, 300 * s + d, 344 * s + d, 354 * s + d, shadow)
-    draw_circle(buf, 218 * s + d, 300 * s + d, 57 * s, shadow)
+    draw_rect(buf, *scale_rect(J_STEM, s, d), shadow)
+    draw_rect(buf, *scale_rect(J_FOOT, s, d), shadow)
+    draw_circle(buf, *scale_circle(J_HOOK, s, d), shadow)
 
-    draw_rect(buf, 286 * s, 118 * s, 344 * s, 320 * s, stroke)
-    draw_rect(buf, 206 * s, 300 * s, 344 * s, 354 * s, stroke)
-    draw_circle(buf, 218 * s, 300 * s, 57 * s, stroke)
+    draw_rect(buf, *scale_rect(J_STEM, s), stroke)
+    draw_rect(buf, *scale_rect(J_FOOT, s), stroke)
+    draw_circle(buf, *scale_circle(J_HOOK, s), stroke)
 
     draw_rect(buf, 295 * s, 127 * s, 335 * s, 312 * s, main)
     draw_rect(buf, 215 * s, 309 * s, 335 * s, 345 * s, main)
     draw_circle(buf, 218 * s, 300 * s, 46 * s, main)
-    draw_circle(buf, 218 * s, 300 * s, 26 * s, hole)
+    draw_circle(buf, *scale_circle(J_HOLE, s), hole)
     draw_circle(buf, 244 * s, 228 * s, 24 * s, (255, 255, 255, 96))
 
 
@@ -469,16 +530,14 @@ def paint_q(buf: bytearray, theme: Theme, panel: Dict[str, float]) -> None:
     shadow = (0, 0, 0, 138)
     hole = rgba(darken(theme.inner_bottom, 0.24))
 
-    draw_circle(buf, 256 * s + d, 232 * s + d, 100 * s, shadow)
-    tail_shadow = [(300 + 7, 300 + 7), (378 + 7, 388 + 7), (334 + 7, 410 + 7), (258 + 7, 324 + 7)]
-    draw_polygon(buf, [(x * s, y * s) for x, y in tail_shadow], shadow)
+    draw_circle(buf, *scale_circle(Q_RING, s, d), shadow)
+    draw_polygon(buf, scale_points(Q_TAIL, s, d), shadow)
 
-    draw_circle(buf, 256 * s, 232 * s, 100 * s, stroke)
-    tail_stroke = [(300, 300), (378, 388), (334, 410), (258, 324)]
-    draw_polygon(buf, [(x * s, y * s) for x, y in tail_stroke], stroke)
+    draw_circle(buf, *scale_circle(Q_RING, s), stroke)
+    draw_polygon(buf, scale_points(Q_TAIL, s), stroke)
 
     draw_circle(buf, 256 * s, 232 * s, 88 * s, main)
-    draw_circle(buf, 256 * s, 232 * s, 49 * s, hole)
+    draw_circle(buf, *scale_circle(Q_HOLE, s), hole)
     tail_main = [(304, 304), (366, 380), (336, 394), (274, 318)]
     draw_polygon(buf, [(x * s, y * s) for x, y in tail_main], main)
     draw_circle(buf, 228 * s, 204 * s, 22 * s, (255, 255, 255, 96))
@@ -491,17 +550,13 @@ def paint_k(buf: bytearray, theme: Theme, panel: Dict[str, float]) -> None:
     stroke = (171, 88, 123, 255)
     shadow = (0, 0, 0, 142)
 
-    draw_rect(buf, 148 * s + d, 116 * s + d, 206 * s + d, 390 * s + d, shadow)
-    upper_shadow = [(210 + 7, 252 + 7), (368 + 7, 112 + 7), (398 + 7, 152 + 7), (252 + 7, 290 + 7)]
-    lower_shadow = [(208 + 7, 248 + 7), (398 + 7, 390 + 7), (360 + 7, 430 + 7), (250 + 7, 296 + 7)]
-    draw_polygon(buf, [(x * s, y * s) for x, y in upper_shadow], shadow)
-    draw_polygon(buf, [(x * s, y * s) for x, y in lower_shadow], shadow)
+    draw_rect(buf, *scale_rect(K_STEM, s, d), shadow)
+    draw_polygon(buf, scale_points(K_UPPER, s, d), shadow)
+    draw_polygon(buf, scale_points(K_LOWER, s, d), shadow)
 
-    draw_rect(buf, 148 * s, 116 * s, 206 * s, 390 * s, stroke)
-    upper_stroke = [(210, 252), (368, 112), (398, 152), (252, 290)]
-    lower_stroke = [(208, 248), (398, 390), (360, 430), (250, 296)]
-    draw_polygon(buf, [(x * s, y * s) for x, y in upper_stroke], stroke)
-    draw_polygon(buf, [(x * s, y * s) for x, y in lower_stroke], stroke)
+    draw_rect(buf, *scale_rect(K_STEM, s), stroke)
+    draw_polygon(buf, scale_points(K_UPPER, s), stroke)
+    draw_polygon(buf, scale_points(K_LOWER, s), stroke)
 
     draw_rect(buf, 157 * s, 125 * s, 197 * s, 381 * s, main)
     upper_main = [(220, 252), (358, 128), (382, 160), (258, 278)]
@@ -519,14 +574,11 @@ def paint_a(buf: bytearray, theme: Theme, panel: Dict[str, float]) -> None:
     shadow = (0, 0, 0, 140)
     hole = rgba(darken(theme.inner_bottom, 0.24))
 
-    outer_shadow = [(256 + 7, 98 + 7), (378 + 7, 394 + 7), (134 + 7, 394 + 7)]
-    draw_polygon(buf, [(x * s, y * s) for x, y in outer_shadow], shadow)
+    draw_polygon(buf, scale_points(A_OUTER, s, d), shadow)
 
-    outer_stroke = [(256, 98), (378, 394), (134, 394)]
-    inner_stroke = [(256, 176), (320, 338), (192, 338)]
-    draw_polygon(buf, [(x * s, y * s) for x, y in outer_stroke], stroke)
-    draw_polygon(buf, [(x * s, y * s) for x, y in inner_stroke], hole)
-    draw_rect(buf, 186 * s, 262 * s, 326 * s, 306 * s, stroke)
+    draw_polygon(buf, scale_points(A_OUTER, s), stroke)
+    draw_polygon(buf, scale_points(A_INNER, s), hole)
+    draw_rect(buf, *scale_rect(A_BAR, s), stroke)
 
     outer_main = [(256, 112), (364, 384), (148, 384)]
     inner_main = [(256, 190), (308, 332), (204, 332)]
@@ -538,8 +590,9 @@ def paint_a(buf: bytearray, theme: Theme, panel: Dict[str, float]) -> None:
 
 def paint_star(buf: bytearray, theme: Theme, panel: Dict[str, float]) -> None:
     s = SUPERSAMPLE
-    cx = 256 * s
-    cy = 236 * s
+    cx = STAR[0] * s
+    cy = STAR[1] * s
+    outer_r, inner_r = STAR[2], STAR[3]
     d = 7 * s
     shadow = (0, 0, 0, 146)
     stroke = (174, 126, 26, 255)
@@ -549,8 +602,8 @@ def paint_star(buf: bytearray, theme: Theme, panel: Dict[str, float]) -> None:
     draw_circle(buf, cx, cy, 126 * s, rgba(lighten(theme.accent, 0.35), 72))
     draw_circle(buf, cx + d, cy + d, 92 * s, shadow)
 
-    p_shadow = star_points(cx + d, cy + d, 118 * s, 49 * s)
-    p_stroke = star_points(cx, cy, 118 * s, 49 * s)
+    p_shadow = star_points(cx + d, cy + d, outer_r * s, inner_r * s)
+    p_stroke = star_points(cx, cy, outer_r * s, inner_r * s)
     p_main = star_points(cx, cy, 108 * s, 44 * s)
     p_inner = star_points(cx, cy, 62 * s, 25 * s)
 
@@ -600,21 +653,11 @@ def paint_wild(buf: bytearray, theme: Theme, panel: Dict[str, float]) -> None:
     shadow = (0, 0, 0, 144)
     hole = rgba(darken(theme.inner_bottom, 0.22))
 
-    w_shadow = [
-        (98 + 7, 142 + 7),
-        (142 + 7, 382 + 7),
-        (184 + 7, 236 + 7),
-        (224 + 7, 382 + 7),
-        (268 + 7, 142 + 7),
-        (230 + 7, 142 + 7),
-        (184 + 7, 316 + 7),
-        (138 + 7, 142 + 7),
-    ]
-    w_stroke = [(98, 142), (142, 382), (184, 236), (224, 382), (268, 142), (230, 142), (184, 316), (138, 142)]
+    d = 7 * s
     w_main = [(110, 154), (146, 368), (184, 252), (220, 368), (256, 154), (228, 154), (184, 300), (140, 154)]
 
-    draw_polygon(buf, [(x * s, y * s) for x, y in w_shadow], shadow)
-    draw_polygon(buf, [(x * s, y * s) for x, y in w_stroke], stroke)
+    draw_polygon(buf, scale_points(W_OUTLINE, s, d), shadow)
+    draw_polygon(buf, scale_points(W_OUTLINE, s), stroke)
     draw_polygon(buf, [(x * s, y * s) for x, y in w_main], fill)
 
     draw_rect(buf, (280 + 7) * s, (142 + 7) * s, (322 + 7) * s, (382 + 7) * s, shadow)
@@ -633,15 +676,10 @@ def paint_wild(buf: bytearray, theme: Theme, panel: Dict[str, float]) -> None:
     draw_circle(buf, 392 * s, 262 * s, 61 * s, fill)
     draw_circle(buf, 392 * s, 262 * s, 34 * s, hole)
 
-    bolt = [(246, 134), (214, 220), (252, 220), (216, 326), (298, 212), (258, 212), (288, 134)]
-    draw_polygon(buf, [(x * s, y * s) for x, y in bolt], (255, 216, 90, 220))
-
+    draw_polygon(buf, [(x * s, y * s) for x, y in BOLT], (255, 216, 90, 220))
 
-def paint_symbol(accent: Rgb, glyph: str) -> bytearray:
-    buf = new_buffer()
-    theme = build_theme(accent)
-    panel = draw_badge_base(buf, theme)
 
+def paint_glyph(buf: bytearray, theme: Theme, panel: Dict[str, float], glyph: str) -> None:
     if glyph == "10":
         paint_10(buf, theme, panel)
     elif glyph == "J":
@@ -661,9 +699,31 @@ def paint_symbol(accent: Rgb, glyph: str) -> bytearray:
     else:
         raise ValueError(f"Unknown glyph {glyph}")
 
+
+def paint_symbol(accent: Rgb, glyph: str) -> bytearray:
+    buf = new_buffer()
+    theme = build_theme(accent)
+    panel = draw_badge_base(buf, theme)
+    paint_glyph(buf, theme, panel, glyph)
     return downsample(buf, WIDTH, HEIGHT, SUPERSAMPLE)
 
 
+def paint_layers(accent: Rgb, glyph: str) -> Tuple[bytearray, bytearray]:
+    """The symbol split around the centre glow, each layer on transparent.
+
+    Compositing over(glow, under) and then `over` on top gives paint_symbol's
+    result, so animations can redraw just the glow between the two.
+    """
+    theme = build_theme(accent)
+    panel = badge_panel()
+    under = new_buffer()
+    draw_badge_under(under, theme, panel)
+    over = new_buffer()
+    draw_badge_over(over, theme, panel)
+    paint_glyph(over, theme, panel, glyph)
+    return downsample(under, WIDTH, HEIGHT, SUPERSAMPLE), downsample(over, WIDTH, HEIGHT, SUPERSAMPLE)
+
+
 PAINTERS = {
     "10.png": ((74, 222, 128), "10"),
     "j.png": ((96, 165, 250), "J"),
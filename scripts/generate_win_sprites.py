@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Generate animated win-highlight sprite sheets for the slot symbols.
+
+Each frame is the symbol from generate_slot_symbols.py with its centre glow
+(draw_badge_glow) pulsing: the glow's intensity rises and falls over one
+loop while its colour moves from the theme glow towards white. Only the glow
+changes between frames, so every symbol is painted once as two static
+layers (paint_layers: badge body below the glow, gloss + glyph above it) and
+each frame just composites a new glow between them.
+
+The pure-Python painter is the slow part (~20s per symbol), so the layers are
+cached in scripts/.cache/win-sprites, keyed by the painter source and the
+symbol's accent/glyph. With a warm cache, 8 symbols x 24 frames take a few
+seconds; a cold cache paints the layers in parallel across --jobs processes.
+
+Output, per symbol (Pixi spritesheet JSON with an `animations` entry):
+  frontend/public/symbols/win/<name>.png
+  frontend/public/symbols/win/<name>.json
+
+Usage:
+  python3 scripts/generate_win_sprites.py
+  python3 scripts/generate_win_sprites.py --only wild scatter --frames 32 --cell 192
+
+Requires numpy and pillow.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:  # reported in main()
+    np = None
+    Image = None
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import generate_slot_symbols as gss  # noqa: E402
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+OUT_DIR = os.path.join(ROOT, "frontend", "public", "symbols", "win")
+CACHE_DIR = os.path.join(ROOT, "scripts", ".cache", "win-sprites")
+GLOW_RADIUS = 162  # draw_badge_glow, in 512px design units
+GLOW_ALPHA = 90
+PADDING = 2
+
+
+# ── Layer cache ─────────────────────────────────────────────────────
+
+def layer_key(accent: gss.Rgb, glyph: str) -> str:
+    h = hashlib.sha256()
+    with open(gss.__file__, "rb") as f:
+        h.update(f.read())
+    h.update(f"{accent}|{glyph}".encode())
+    return h.hexdigest()[:16]
+
+
+def layer_path(name: str, accent: gss.Rgb, glyph: str) -> str:
+    return os.path.join(CACHE_DIR, f"{name}-{layer_key(accent, glyph)}.npz")
+
+
+def paint_to_cache(name: str, accent: gss.Rgb, glyph: str) -> Tuple[str, float]:
+    """Paint both static layers of one symbol (runs in a worker process)."""
+    start = time.perf_counter()
+    under, over = gss.paint_layers(accent, glyph)
+    shape = (gss.OUT_SIZE, gss.OUT_SIZE, 4)
+    path = layer_path(name, accent, glyph)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = path + ".tmp.npz"
+    np.savez_compressed(tmp,
+                        under=np.frombuffer(bytes(under), np.uint8).reshape(shape),
+                        over=np.frombuffer(bytes(over), np.uint8).reshape(shape))
+    os.replace(tmp, path)
+    return name, time.perf_counter() - start
+
+
+def ensure_layers(symbols: Dict[str, Tuple[gss.Rgb, str]], jobs: int, force: bool) -> None:
+    stale = {name: spec for name, spec in symbols.items()
+             if force or not os.path.isfile(layer_path(name, *spec))}
+    if not stale:
+        return
+    print(f"painting layers for {len(stale)} symbol(s) on {jobs} process(es)...")
+    with ProcessPoolExecutor(max_workers=max(1, min(jobs, len(stale)))) as pool:
+        futures = [pool.submit(paint_to_cache, name, *spec) for name, spec in stale.items()]
+        for future in futures:
+            name, seconds = future.result()
+            print(f"  {name}: {seconds:.1f}s")
+
+
+def load_layers(name: str, accent: gss.Rgb, glyph: str, cell: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Cached layers as premultiplied float32 in 0..1, box-filtered to `cell`."""
+    with np.load(layer_path(name, accent, glyph)) as data:
+        layers = [data["under"], data["over"]]
+    factor = gss.OUT_SIZE // cell
+    out = []
+    for px in layers:
+        px = px.astype(np.float32) / 255.0
+        px[..., :3] *= px[..., 3:4]
+        px = px.reshape(cell, factor, cell, factor, 4).mean(axis=(1, 3))
+        out.append(px)
+    return out[0], out[1]
+
+
+# ── Frames ──────────────────────────────────────────────────────────
+
+def glow_falloff(cell: int) -> "np.ndarray":
+    """draw_radial_glow's (1 - d/r)^2 profile around the badge centre."""
+    panel = gss.badge_panel()
+    scale = cell / (gss.OUT_SIZE * gss.SUPERSAMPLE)
+    cx, cy = panel["cx"] * scale, panel["cy"] * scale
+    radius = GLOW_RADIUS * cell / gss.OUT_SIZE
+    ys, xs = np.mgrid[0:cell, 0:cell].astype(np.float32) + 0.5
+    t = np.hypot(xs - cx, ys - cy) / radius
+    return np.where(t < 1.0, (1.0 - t) ** 2, 0.0).astype(np.float32)[..., None]
+
+
+def pulse(i: int, frames: int) -> float:
+    """0 -> 1 -> 0 over one loop, easing in and out."""
+    return 0.5 - 0.5 * math.cos(2.0 * math.pi * i / frames)
+
+
+def render_frames(under: "np.ndarray", over: "np.ndarray", theme: gss.Theme,
+                  args: argparse.Namespace) -> List["np.ndarray"]:
+    # frame = over + (1 - over.a) * (glow + (1 - glow.a) * under), with
+    # glow = falloff * alpha_i * colour_i. Everything but alpha_i/colour_i is
+    # fixed per symbol, so it is folded once and each frame is two array ops.
+    keep = 1.0 - over[..., 3:4]
+    base = over + keep * under
+    shaped = glow_falloff(under.shape[0]) * keep
+    shaped_under = shaped * under
+
+    frames = []
+    for i in range(args.frames):
+        p = pulse(i, args.frames)
+        alpha = min(1.0, GLOW_ALPHA / 255.0 * (1.0 + args.intensity * p))
+        rgb = gss.rgb_mix(theme.glow, (255, 255, 255), args.whiten * p)
+        colour = np.array([c / 255.0 for c in rgb] + [1.0], dtype=np.float32)
+        px = base + alpha * (shaped * colour - shaped_under)
+
+        a = px[..., 3:4]
+        straight = np.where(a > 0, px[..., :3] / np.maximum(a, 1e-6), 0.0)
+        frames.append(np.clip(np.concatenate([straight, a], axis=-1) * 255.0 + 0.5, 0, 255)
+                      .astype(np.uint8))
+    return frames
+
+
+# ── Sheets ──────────────────────────────────────────────────────────
+
+def write_sheet(name: str, frames: List["np.ndarray"], cell: int, fps: int) -> str:
+    columns = math.ceil(math.sqrt(len(frames)))
+    rows = math.ceil(len(frames) / columns)
+    step = cell + PADDING * 2
+    sheet = np.zeros((rows * step, columns * step, 4), dtype=np.uint8)
+    entries = {}
+    names = []
+    for i, frame in enumerate(frames):
+        x = (i % columns) * step + PADDING
+        y = (i // columns) * step + PADDING
+        sheet[y:y + cell, x:x + cell] = frame
+        key = f"{name}-win-{i:02d}"
+        names.append(key)
+        entries[key] = {
+            "frame": {"x": x, "y": y, "w": cell, "h": cell},
+            "rotated": False,
+            "trimmed": False,
+            "spriteSourceSize": {"x": 0, "y": 0, "w": cell, "h": cell},
+            "sourceSize": {"w": cell, "h": cell},
+        }
+
+    os.makedirs(OUT_DIR, exist_ok=True)
+    png = os.path.join(OUT_DIR, f"{name}.png")
+    Image.fromarray(sheet, "RGBA").save(png, "PNG", compress_level=6)
+    meta = {
+        "frames": entries,
+        "animations": {f"{name}-win": names},
+        "meta": {
+            "image": f"{name}.png",
+            "format": "RGBA8888",
+            "size": {"w": int(sheet.shape[1]), "h": int(sheet.shape[0])},
+            "scale": cell / gss.OUT_SIZE,
+            "fps": fps,
+        },
+    }
+    with open(os.path.join(OUT_DIR, f"{name}.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+        f.write("\n")
+    return png
+
+
+# ── CLI ─────────────────────────────────────────────────────────────
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate win-highlight sprite sheets.")
+    parser.add_argument("--only", nargs="+", metavar="NAME",
+                        help="symbols to generate (file stems, e.g. wild scatter)")
+    parser.add_argument("--frames", type=int, default=24, help="frames per loop (default: 24)")
+    parser.add_argument("--fps", type=int, default=30, help="playback rate written to meta (default: 30)")
+    parser.add_argument("--cell", type=int, default=256,
+                        help=f"frame size in px; must divide {gss.OUT_SIZE} (default: 256)")
+    parser.add_argument("--intensity", type=float, default=1.6,
+                        help="extra glow alpha at the pulse peak, as a multiple of the base (default: 1.6)")
+    parser.add_argument("--whiten", type=float, default=0.55,
+                        help="how far the glow colour moves towards white at the peak (default: 0.55)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="processes for painting uncached layers")
+    parser.add_argument("--force", action="store_true", help="repaint cached layers")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    if np is None:
+        print("numpy and pillow are required: pip install numpy pillow", file=sys.stderr)
+        return 2
+    if args.cell <= 0 or gss.OUT_SIZE % args.cell:
+        print(f"--cell must divide {gss.OUT_SIZE}", file=sys.stderr)
+        return 2
+    if args.frames < 1:
+        print("--frames must be positive", file=sys.stderr)
+        return 2
+
+    symbols = {os.path.splitext(filename)[0]: spec for filename, spec in gss.PAINTERS.items()}
+    if args.only:
+        unknown = sorted(set(args.only) - set(symbols))
+        if unknown:
+            print(f"unknown symbol(s): {', '.join(unknown)}; choose from {', '.join(symbols)}",
+                  file=sys.stderr)
+            return 2
+        symbols = {name: spec for name, spec in symbols.items() if name in args.only}
+
+    start = time.perf_counter()
+    ensure_layers(symbols, args.jobs, args.force)
+    painted = time.perf_counter()
+
+    for name, (accent, glyph) in symbols.items():
+        under, over = load_layers(name, accent, glyph, args.cell)
+        frames = render_frames(under, over, gss.build_theme(accent), args)
+        print(f"wrote {os.path.relpath(write_sheet(name, frames, args.cell, args.fps), ROOT)}")
+
+    done = time.perf_counter()
+    print(f"{len(symbols)} symbol(s) x {args.frames} frames at {args.cell}px: "
+          f"layers {painted - start:.1f}s, frames + sheets {done - painted:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Golden-image regression check for generated assets.
+
+Compares each generated PNG in the working tree against its reference: by
+default the version committed at HEAD, so the goldens are simply the assets
+in git and "updating the goldens" means committing the regenerated files.
+
+Two vectorized metrics, both on premultiplied RGBA so colour hidden under
+transparent pixels is ignored:
+  * per-channel tolerance: the share of pixels with any channel off by more
+    than --tolerance must stay under --max-outliers;
+  * SSIM on tiles of a downscaled copy: the worst tile must stay above
+    --min-ssim, which catches structural changes a small per-pixel budget
+    would let through.
+
+Failures write a side-by-side reference | candidate | heatmap PNG.
+
+Usage:
+  python3 scripts/assets.py build wheel
+  python3 scripts/golden_images.py check [wheel slot-symbols ...] [--ref HEAD~1]
+  python3 scripts/golden_images.py check --ref-dir /tmp/old-assets
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import io
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:  # reported in main()
+    np = None
+    Image = None
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from assets import NODES, ROOT  # noqa: E402
+
+DIFF_DIR = os.path.join(ROOT, "scripts", ".cache", "golden-diffs")
+SSIM_SIZE = 256
+SSIM_TILE = 8
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+
+
+@dataclass
+class Comparison:
+    path: str
+    ok: bool
+    max_diff: int = 0
+    outliers: float = 0.0
+    ssim_min: float = 1.0
+    ssim_mean: float = 1.0
+    detail: str = ""
+    measured: bool = False  # pixel metrics computed (not identical, same size)
+
+
+# ── Asset discovery ─────────────────────────────────────────────────
+
+def asset_paths(node_names: Sequence[str]) -> Dict[str, List[str]]:
+    """Repo-relative PNG paths produced by each asset-graph node.
+
+    A path is listed once, under the first node that declares it; in-place
+    steps such as compress re-declare their dependency's outputs.
+    """
+    groups: Dict[str, List[str]] = {}
+    claimed: Set[str] = set()
+    for node in NODES:
+        if node_names and node.name not in node_names:
+            continue
+        paths: List[str] = []
+        for out in node.outputs:
+            full = os.path.join(ROOT, out)
+            if out.endswith(".png") and os.path.isfile(full):
+                paths.append(out)
+            elif os.path.isdir(full):
+                paths += [os.path.relpath(p, ROOT) for p in glob.glob(os.path.join(full, "*.png"))]
+        paths = sorted(set(paths) - claimed)
+        claimed.update(paths)
+        if paths:
+            groups[node.name] = paths
+    return groups
+
+
+def read_reference(path: str, ref: str, ref_dir: Optional[str]) -> Optional[bytes]:
+    if ref_dir is not None:
+        try:
+            with open(os.path.join(ref_dir, path), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+    proc = subprocess.run(["git", "show", f"{ref}:{path}"], cwd=ROOT, capture_output=True)
+    return proc.stdout if proc.returncode == 0 else None
+
+
+# ── Metrics ─────────────────────────────────────────────────────────
+
+def load_premultiplied(data: bytes) -> "np.ndarray":
+    with Image.open(io.BytesIO(data)) as im:
+        px = np.asarray(im.convert("RGBA"), dtype=np.float32)
+    px[..., :3] *= px[..., 3:4] / 255.0
+    return px
+
+
+def downscale(px: "np.ndarray", size: int) -> "np.ndarray":
+    """Box-filter to at most `size` on the long edge (whole factors only)."""
+    factor = max(1, max(px.shape[:2]) // size)
+    h, w = (px.shape[0] // factor) * factor, (px.shape[1] // factor) * factor
+    px = px[:h, :w]
+    return px.reshape(h // factor, factor, w // factor, factor, -1).mean(axis=(1, 3))
+
+
+def tile_ssim(a: "np.ndarray", b: "np.ndarray", tile: int = SSIM_TILE) -> "np.ndarray":
+    """SSIM per non-overlapping tile, averaged over channels."""
+    h, w = (a.shape[0] // tile) * tile, (a.shape[1] // tile) * tile
+    shape = (h // tile, tile, w // tile, tile, a.shape[2])
+    ta = a[:h, :w].reshape(shape)
+    tb = b[:h, :w].reshape(shape)
+    mu_a = ta.mean(axis=(1, 3))
+    mu_b = tb.mean(axis=(1, 3))
+    var_a = ta.var(axis=(1, 3))
+    var_b = tb.var(axis=(1, 3))
+    cov = (ta * tb).mean(axis=(1, 3)) - mu_a * mu_b
+    ssim = ((2 * mu_a * mu_b + SSIM_C1) * (2 * cov + SSIM_C2)) / (
+        (mu_a ** 2 + mu_b ** 2 + SSIM_C1) * (var_a + var_b + SSIM_C2))
+    return ssim.mean(axis=-1)
+
+
+def heatmap(diff: "np.ndarray") -> "np.ndarray":
+    """Black -> red -> yellow -> white by per-pixel max channel difference."""
+    t = np.clip(diff / 64.0, 0.0, 1.0)
+    rgb = np.stack([np.clip(t * 3, 0, 1), np.clip(t * 3 - 1, 0, 1), np.clip(t * 3 - 2, 0, 1)], -1)
+    return (rgb * 255).astype(np.uint8)
+
+
+def write_diff(path: str, ref: "np.ndarray", cand: "np.ndarray", diff: "np.ndarray",
+               out_dir: str) -> str:
+    def flat(px):
+        # Composite over dark grey so alpha-only changes stay visible.
+        return np.clip(px[..., :3] + (255 - px[..., 3:4]) * 0.1, 0, 255).astype(np.uint8)
+
+    strip = np.concatenate([flat(ref), flat(cand), heatmap(diff)], axis=1)
+    target = os.path.join(out_dir, path.replace(os.sep, "__"))
+    os.makedirs(out_dir, exist_ok=True)
+    Image.fromarray(strip).save(target, "PNG")
+    return target
+
+
+def compare(path: str, ref_bytes: bytes, args: argparse.Namespace) -> Comparison:
+    with open(os.path.join(ROOT, path), "rb") as f:
+        cand_bytes = f.read()
+    if cand_bytes == ref_bytes:
+        return Comparison(path, True, detail="identical")
+
+    ref = load_premultiplied(ref_bytes)
+    cand = load_premultiplied(cand_bytes)
+    if ref.shape != cand.shape:
+        return Comparison(path, False, detail=f"size {ref.shape[1]}x{ref.shape[0]} -> "
+                                              f"{cand.shape[1]}x{cand.shape[0]}")
+
+    diff = np.abs(ref - cand).max(axis=-1)
+    outliers = float((diff > args.tolerance).mean())
+    ssim = tile_ssim(downscale(ref, SSIM_SIZE), downscale(cand, SSIM_SIZE))
+    result = Comparison(path, True, int(diff.max()), outliers, float(ssim.min()), float(ssim.mean()),
+                        measured=True)
+
+    problems = []
+    if outliers > args.max_outliers:
+        problems.append(f"{outliers:.3%} pixels over tolerance")
+    if result.ssim_min < args.min_ssim:
+        problems.append(f"worst tile SSIM {result.ssim_min:.4f}")
+    if problems:
+        result.ok = False
+        result.detail = "; ".join(problems)
+        if not args.no_diffs:
+            result.detail += f" -> {os.path.relpath(write_diff(path, ref, cand, diff, args.diff_dir))}"
+    return result
+
+
+# ── CLI ─────────────────────────────────────────────────────────────
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare generated assets with their goldens.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    check = sub.add_parser("check", help="compare working-tree assets with references")
+    check.add_argument("nodes", nargs="*", metavar="NODE",
+                       help="asset-graph nodes to check (default: all)")
+    check.add_argument("--ref", default="HEAD", help="git revision holding the goldens")
+    check.add_argument("--ref-dir", default=None,
+                       help="read goldens from this directory (repo-relative layout) instead of git")
+    check.add_argument("--tolerance", type=float, default=8.0,
+                       help="per-channel difference (0-255) a pixel may have (default: 8)")
+    check.add_argument("--max-outliers", type=float, default=0.005,
+                       help="share of pixels allowed over tolerance (default: 0.005)")
+    check.add_argument("--min-ssim", type=float, default=0.95,
+                       help="minimum SSIM of any downscaled tile (default: 0.95)")
+    check.add_argument("--diff-dir", default=DIFF_DIR)
+    check.add_argument("--no-diffs", action="store_true", help="skip writing heatmaps")
+    check.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    if np is None:
+        print("numpy and pillow are required: pip install numpy pillow", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    jobs = []
+    missing = []
+    for node, paths in asset_paths(args.nodes).items():
+        for path in paths:
+            ref = read_reference(path, args.ref, args.ref_dir)
+            if ref is None:
+                missing.append(path)
+            else:
+                jobs.append((path, ref))
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = list(pool.map(lambda job: compare(job[0], job[1], args), jobs))
+
+    for r in results:
+        status = "ok  " if r.ok else "FAIL"
+        metrics = "" if not r.measured else (
+            f"max {r.max_diff:3d}  over {r.outliers:7.3%}  ssim {r.ssim_min:.4f}/{r.ssim_mean:.4f}  ")
+        print(f"{status} {r.path}  {metrics}{r.detail}")
+    for path in missing:
+        print(f"new  {path}  (no golden)")
+
+    failed = sum(not r.ok for r in results)
+    print(f"{len(results)} compared, {failed} failed, {len(missing)} without golden "
+          f"in {time.perf_counter() - start:.2f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())